@@ -0,0 +1,275 @@
+"""
+크롤링 실행 API
+
+크롤러(BeautifulSoup/lxml/httpx)를 사용하므로 APP_MODE 가 all/crawler 일 때만 등록합니다.
+"""
+
+import json
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from app.config import get_settings
+from app.database import get_db
+from app.models import CrawlJob, CrawlJobItem, CrawlWorker
+from app.services.crawl_jobs import ACTIVE_STATUSES, enqueue_job, job_summary
+from app.services.crawl_service import CrawlService
+from app.services.quality_gate import quality_gate
+from app.crawler import SmartRatioCrawler, check_jungsi_pages_open
+
+router = APIRouter()
+settings = get_settings()
+
+# ============ 크롤링 API ============
+# 크롤링은 작업 큐(app/services/crawl_jobs.py)에 넣고 바로 응답합니다.
+# 같은 작업이 이미 대기/실행 중이면 새로 만들지 않고 그 작업 ID를 돌려줍니다.
+
+def _queued(job: CrawlJob, created: bool, message: str) -> dict:
+    return {
+        "status": "queued" if created else "already_queued",
+        "job_id": job.id,
+        "job_status": job.status,
+        "message": message if created else "같은 크롤링 작업이 이미 대기/실행 중입니다"
+    }
+
+
+@router.post("/crawl/university", status_code=202)
+async def crawl_single_university(
+    url: str,
+    admission_type: str = "정시",
+    year: int = 2026,
+    db: AsyncSession = Depends(get_db)
+):
+    """단일 대학 크롤링 작업 추가 (진행 상황: /crawl/jobs/{job_id})"""
+    job, created = await enqueue_job(db, "university", admission_type, year, url=url)
+    return _queued(job, created, "단일 대학 크롤링 작업을 추가했습니다")
+
+
+@router.post("/crawl/all", status_code=202)
+async def crawl_all_universities(
+    admission_type: str = "정시",
+    year: int = 2026,
+    db: AsyncSession = Depends(get_db)
+):
+    """모든 대학 크롤링 작업 추가 (진행 상황: /crawl/jobs/{job_id})"""
+    job, created = await enqueue_job(db, "all", admission_type, year)
+    return _queued(job, created, "전체 크롤링 작업을 추가했습니다")
+
+
+@router.get("/crawl/jobs")
+async def list_crawl_jobs(
+    status: Optional[str] = Query(None, description="pending/running/done/failed"),
+    limit: int = Query(20, ge=1, le=100),
+    db: AsyncSession = Depends(get_db)
+):
+    """최근 크롤링 작업 목록"""
+    query = select(CrawlJob).order_by(CrawlJob.id.desc()).limit(limit)
+    if status:
+        query = query.where(CrawlJob.status == status)
+    jobs = (await db.execute(query)).scalars().all()
+    return [job_summary(job) for job in jobs]
+
+
+@router.get("/crawl/jobs/{job_id}")
+async def get_crawl_job(
+    job_id: int,
+    include_items: bool = Query(False, description="대학별 항목 포함"),
+    db: AsyncSession = Depends(get_db)
+):
+    """크롤링 작업 진행 상황"""
+    job = await db.get(CrawlJob, job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="작업을 찾을 수 없습니다")
+    result = job_summary(job)
+    if include_items:
+        items = (
+            await db.execute(
+                select(CrawlJobItem).where(CrawlJobItem.job_id == job_id).order_by(CrawlJobItem.id)
+            )
+        ).scalars().all()
+        result["items"] = [
+            {
+                "university_code": item.university_code,
+                "name": item.name,
+                "ratio_url": item.ratio_url,
+                "status": item.status,
+                "owner": item.owner,
+                "updated_at": item.updated_at
+            }
+            for item in items
+        ]
+    return result
+
+
+@router.get("/crawl/workers")
+async def list_crawl_workers(db: AsyncSession = Depends(get_db)):
+    """크롤러 노드 목록 (살아 있는 노드끼리 작업의 대학을 나눠 크롤링)"""
+    alive = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(seconds=settings.crawl_job_lease_seconds)
+    workers = (await db.execute(select(CrawlWorker).order_by(CrawlWorker.node_id))).scalars().all()
+    return [
+        {
+            "node_id": worker.node_id,
+            "started_at": worker.started_at,
+            "heartbeat_at": worker.heartbeat_at,
+            "alive": worker.heartbeat_at is not None and worker.heartbeat_at >= alive
+        }
+        for worker in workers
+    ]
+
+
+@router.get("/crawl/quarantine")
+async def get_quarantine(db: AsyncSession = Depends(get_db)):
+    """품질 검사로 격리된 크롤링 결과 목록 (어느 크롤러 프로세스가 격리했든 DB 에서 조회)"""
+    return [
+        {
+            "university_code": row.page_code,
+            "university_name": row.university_name,
+            "reasons": json.loads(row.reasons or "{}"),
+            "previous_rows": row.previous_rows,
+            "count": row.count,
+            "first_at": row.first_at,
+            "last_at": row.last_at
+        }
+        for row in await quality_gate.entries(db)
+    ]
+
+
+@router.post("/crawl/quarantine/{university_code}/release")
+async def release_quarantine(
+    university_code: str,
+    apply: bool = True,
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    격리된 결과 처리 (university_code: 격리 목록의 페이지 코드)
+
+    - apply=true: 품질 검사 없이 저장 (격리 항목 삭제와 같은 트랜잭션)
+    - apply=false: 폐기
+    """
+    entry = await quality_gate.release(db, university_code)
+    if not entry:
+        raise HTTPException(status_code=404, detail="격리된 결과가 없습니다")
+    if not apply:
+        await db.commit()
+        return {"status": "discarded", "university_code": university_code}
+
+    university = await CrawlService(db).save_university_ratio(entry.ratio_data)
+    await db.commit()
+    return {
+        "status": "applied",
+        "university_code": university_code,
+        "university_id": university.id
+    }
+
+
+# ============ SmartRatio API ============
+
+@router.get("/smartratio/universities")
+async def get_smartratio_universities():
+    """
+    SmartRatio 페이지에서 대학 목록 조회
+
+    Returns:
+        대학 목록 (이름, 지역, 상태, URL 등)
+    """
+    crawler = SmartRatioCrawler()
+    universities = await crawler.fetch_university_list()
+
+    return [
+        {
+            "name": univ.name,
+            "region": univ.region,
+            "admission_type": univ.admission_type,
+            "period_start": univ.period_start,
+            "period_end": univ.period_end,
+            "status": univ.status.value,
+            "ratio_url": univ.ratio_url,
+            "univ_code": univ.univ_code,
+            "url_type": univ.url_type,
+        }
+        for univ in universities
+    ]
+
+
+@router.get("/smartratio/check-availability")
+async def check_availability():
+    """
+    정시 경쟁률 페이지 오픈 여부 확인
+
+    Returns:
+        is_open: 페이지 오픈 여부
+        checked_at: 확인 시간
+        message: 상태 메시지
+    """
+    is_open = await check_jungsi_pages_open()
+
+    return {
+        "is_open": is_open,
+        "checked_at": datetime.now().isoformat(),
+        "message": "페이지가 오픈되었습니다!" if is_open else "아직 준비 중입니다.",
+        "next_check_recommended": None if is_open else "1분 후 재확인 권장"
+    }
+
+
+@router.get("/smartratio/discover-urls")
+async def discover_available_urls(
+    limit: int = Query(10, le=100, description="확인할 대학 수")
+):
+    """
+    활성화된 경쟁률 페이지 URL 탐색
+
+    Returns:
+        대학별 활성화된 URL 목록
+    """
+    crawler = SmartRatioCrawler()
+    universities = await crawler.fetch_university_list()
+
+    # 지정된 수만큼 확인
+    available = await crawler.discover_available_urls(universities[:limit])
+
+    return {
+        "total_checked": min(limit, len(universities)),
+        "available_count": len(available),
+        "universities": [
+            {
+                "name": univ.name,
+                "ratio_url": univ.ratio_url,
+                "univ_code": univ.univ_code,
+                "status": univ.status.value
+            }
+            for univ in available
+        ]
+    }
+
+
+@router.post("/smartratio/crawl-all", status_code=202)
+async def crawl_all_from_smartratio(
+    admission_type: str = "정시",
+    year: int = 2026,
+    delay: float = Query(0.0, ge=0.0, le=5.0, description="요청 작업자별 대학 사이 딜레이(초)"),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    SmartRatio 페이지의 모든 대학 크롤링 작업 추가
+
+    1. SmartRatio에서 대학 목록 수집
+    2. 활성화된 URL 탐색
+    3. 전체 크롤링 실행 (한 세대로 게시)
+    """
+    job, created = await enqueue_job(db, "smartratio", admission_type, year, delay=delay)
+    return _queued(job, created, "SmartRatio 전체 크롤링 작업을 추가했습니다")
+
+
+@router.get("/smartratio/crawl-progress")
+async def get_crawl_progress(db: AsyncSession = Depends(get_db)):
+    """
+    마지막 SmartRatio 크롤링 작업 진행 상황
+    """
+    latest_id = select(func.max(CrawlJob.id)).where(CrawlJob.kind == "smartratio").scalar_subquery()
+    job = (await db.execute(select(CrawlJob).where(CrawlJob.id == latest_id))).scalar_one_or_none()
+    if not job:
+        return {"is_running": False, "job_id": None}
+    return {"is_running": job.status in ACTIVE_STATUSES, **job_summary(job)}
@@ -1,12 +1,17 @@
-from fastapi import APIRouter, Depends, HTTPException, Query, BackgroundTasks
+"""
+조회 API (읽기 전용)
+
+크롤러 의존성(BeautifulSoup/lxml/httpx)을 불러오지 않으므로 APP_MODE=api 인
+읽기 전용 복제본은 이 라우터만 등록합니다. 크롤링 실행 API 는 app/api/crawl_routes.py.
+"""
+
+from collections import OrderedDict
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func, and_, or_
-from sqlalchemy.orm import selectinload
+from sqlalchemy import bindparam, select, func, and_, or_
 from typing import Optional
-from datetime import datetime
-import asyncio
 
-from app.database import get_db
+from app.database import StatementCache, get_db, get_snapshot_db, snapshot_session
 from app.models import University, Admission, Department, RatioHistory, CrawlLog
 from app.schemas import (
     UniversityResponse,
@@ -17,22 +22,19 @@ from app.schemas import (
     CrawlStatusResponse,
     RatioHistoryResponse
 )
-from app.services.crawl_service import CrawlService
-from app.crawler import SmartRatioCrawler, check_jungsi_pages_open
+from app.services.crawl_log import last_cycle
+from app.services.fast_json import dumps, group_by, rows_to_dicts, schema_columns
+from app.services.generation import current_generation, generation_watcher
+from app.services.organized import (
+    GROUPS,
+    OrganizedSlice,
+    choose_encoding,
+    organized_dataset
+)
+from app.services.response_cache import response_cache
 
 router = APIRouter()
 
-# 크롤링 상태 저장용 (메모리)
-crawl_state = {
-    "is_running": False,
-    "progress": 0,
-    "total": 0,
-    "current_university": "",
-    "results": {"success": 0, "failed": 0, "skipped": 0},
-    "started_at": None,
-    "logs": []
-}
-
 
 # ============ 대학 관련 API ============
 
@@ -40,7 +42,7 @@ crawl_state = {
 async def get_universities(
     region: Optional[str] = None,
     type: Optional[str] = None,
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_snapshot_db)
 ):
     """대학 목록 조회"""
     stmt = select(University)
@@ -56,42 +58,96 @@ async def get_universities(
 
 
 @router.get("/universities/{university_id}", response_model=UniversityDetailResponse)
-async def get_university(
-    university_id: int,
-    db: AsyncSession = Depends(get_db)
-):
-    """대학 상세 정보 조회 (전형 및 학과 포함)"""
-    stmt = (
-        select(University)
-        .options(
-            selectinload(University.admissions)
-            .selectinload(Admission.departments)
-        )
-        .where(University.id == university_id)
+async def get_university(request: Request, university_id: int):
+    """
+    대학 상세 정보 조회 (전형 및 학과 포함)
+
+    ORM 객체 그래프 대신 대학/전형/학과를 컬럼 단위로 3번 조회해 스키마 모양의 dict 로
+    묶고 한 번에 인코딩합니다 (app/services/fast_json.py).
+    본문과 br/gzip 압축본은 데이터 세대별로 캐시하고, 같은 대학의 동시 요청은
+    조회 1회로 합칩니다 (app/services/response_cache.py).
+    """
+    return await response_cache.respond(
+        request, "university", {"university_id": university_id},
+        lambda: _university_body(university_id)
     )
-    result = await db.execute(stmt)
-    university = result.scalar_one_or_none()
 
-    if not university:
-        raise HTTPException(status_code=404, detail="대학을 찾을 수 없습니다")
 
-    return university
+async def _university_body(university_id: int) -> bytes:
+    async with snapshot_session() as db:
+        university = (
+            await db.execute(
+                select(*schema_columns(UniversityDetailResponse, University, exclude=("admissions",)))
+                .where(University.id == university_id)
+            )
+        ).one_or_none()
+
+        if university is None:
+            raise HTTPException(status_code=404, detail="대학을 찾을 수 없습니다")
+
+        admissions = rows_to_dicts(
+            await db.execute(
+                select(*schema_columns(AdmissionResponse, Admission, exclude=("departments",)))
+                .where(Admission.university_id == university_id)
+                .order_by(Admission.id)
+            )
+        )
+        departments = group_by(
+            rows_to_dicts(
+                await db.execute(
+                    select(*schema_columns(DepartmentResponse, Department))
+                    .join(Admission, Admission.id == Department.admission_id)
+                    .where(Admission.university_id == university_id, Department.removed_at.is_(None))
+                    .order_by(Department.id)
+                )
+            ),
+            "admission_id"
+        )
+
+        payload = university._asdict()
+        payload["admissions"] = [
+            {**admission, "departments": departments.get(admission["id"], [])}
+            for admission in admissions
+        ]
+        return dumps(payload)
 
 
 # ============ 경쟁률 조회 API ============
 
 @router.get("/competition-rates", response_model=list[CompetitionRateResponse])
 async def get_competition_rates(
+    request: Request,
     university_name: Optional[str] = Query(None, description="대학명 (부분 검색)"),
     department_name: Optional[str] = Query(None, description="학과명 (부분 검색)"),
     admission_type: Optional[str] = Query(None, description="수시/정시"),
     min_rate: Optional[float] = Query(None, description="최소 경쟁률"),
     max_rate: Optional[float] = Query(None, description="최대 경쟁률"),
     limit: int = Query(100, le=10000),
-    offset: int = Query(0),
-    db: AsyncSession = Depends(get_db)
+    offset: int = Query(0)
 ):
-    """경쟁률 검색"""
+    """
+    경쟁률 검색 (최대 10,000행, 빠른 직렬화 경로)
+
+    응답은 데이터 세대별로 캐시하고, 같은 조건의 동시 요청은 조회 1회로 합칩니다
+    (app/services/response_cache.py).
+    """
+    # 빈 문자열 검색어는 조건 없음과 같음
+    params = {
+        "university_name": university_name or None,
+        "department_name": department_name or None,
+        "admission_type": admission_type or None,
+        "min_rate": min_rate,
+        "max_rate": max_rate,
+        "limit": limit,
+        "offset": offset
+    }
+    return await response_cache.respond(
+        request, "competition-rates", params, lambda: _competition_rates_body(**params)
+    )
+
+
+def _competition_rates_stmt(filters: frozenset[str]):
+    """경쟁률 검색 조회문 (있는 조건만 where, 값은 bindparam)"""
     stmt = (
         select(
             University.name.label("university_name"),
@@ -110,54 +166,45 @@ async def get_competition_rates(
         )
         .join(Admission, University.id == Admission.university_id)
         .join(Department, Admission.id == Department.admission_id)
+        .where(Department.removed_at.is_(None))
     )
 
     # 필터 적용
-    if university_name:
-        stmt = stmt.where(University.name.contains(university_name))
-    if department_name:
-        stmt = stmt.where(Department.name.contains(department_name))
-    if admission_type:
-        stmt = stmt.where(Admission.admission_type == admission_type)
-    if min_rate is not None:
-        stmt = stmt.where(Department.competition_rate >= min_rate)
-    if max_rate is not None:
-        stmt = stmt.where(Department.competition_rate <= max_rate)
-
-    stmt = stmt.order_by(
+    if "university_name" in filters:
+        stmt = stmt.where(University.name.contains(bindparam("university_name")))
+    if "department_name" in filters:
+        stmt = stmt.where(Department.name.contains(bindparam("department_name")))
+    if "admission_type" in filters:
+        stmt = stmt.where(Admission.admission_type == bindparam("admission_type"))
+    if "min_rate" in filters:
+        stmt = stmt.where(Department.competition_rate >= bindparam("min_rate"))
+    if "max_rate" in filters:
+        stmt = stmt.where(Department.competition_rate <= bindparam("max_rate"))
+
+    return stmt.order_by(
         University.name,
         Admission.admission_name,
         Department.name
-    ).offset(offset).limit(limit)
+    ).offset(bindparam("offset")).limit(bindparam("limit"))
 
-    result = await db.execute(stmt)
-    rows = result.all()
 
-    return [
-        CompetitionRateResponse(
-            university_name=row.university_name,
-            university_code=row.university_code,
-            admission_type=row.admission_type,
-            admission_name=row.admission_name,
-            campus=row.campus,
-            department_name=row.department_name,
-            detail=row.detail,
-            recruit_count=row.recruit_count,
-            apply_count=row.apply_count,
-            competition_rate=row.competition_rate,
-            additional_recruit=row.additional_recruit,
-            actual_competition_rate=row.actual_competition_rate,
-            updated_at=row.updated_at
-        )
-        for row in rows
-    ]
+# 조건 조합별 조회문 (최대 32개)
+_competition_rates_stmts = StatementCache(_competition_rates_stmt)
+
+
+async def _competition_rates_body(**params) -> bytes:
+    stmt = _competition_rates_stmts.get(params)
+    # 응답 스키마 필드 순서 그대로의 SQL 행을 바로 인코딩 (pydantic 객체 생성/재검증 생략)
+    async with snapshot_session() as db:
+        result = await db.execute(stmt, StatementCache.bind(params))
+        return dumps(rows_to_dicts(result))
 
 
 @router.get("/departments/{department_id}/history", response_model=list[RatioHistoryResponse])
 async def get_ratio_history(
     department_id: int,
     limit: int = Query(50, le=200),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_snapshot_db)
 ):
     """학과 경쟁률 변동 이력 조회"""
     stmt = (
@@ -170,48 +217,111 @@ async def get_ratio_history(
     return result.scalars().all()
 
 
-# ============ 통계 API ============
+# ============ 군별 정리 데이터 API ============
 
-@router.get("/statistics/summary")
-async def get_statistics_summary(
-    admission_type: Optional[str] = None,
-    db: AsyncSession = Depends(get_db)
+@router.get("/organized")
+async def get_organized_data(
+    request: Request,
+    gun: Optional[str] = Query(None, description="가군/나군/다군/기타"),
+    region: Optional[str] = Query(None, description="지역 (예: 서울, 경기)"),
+    university: Optional[str] = Query(None, description="대학명 (부분 일치)"),
+    min_rate: Optional[float] = Query(None, ge=0),
+    max_rate: Optional[float] = Query(None, ge=0),
+    admission_type: str = "정시",
+    year: int = 2026,
+    db: AsyncSession = Depends(get_snapshot_db)
 ):
-    """전체 통계 요약"""
+    """
+    군별 정리 데이터 (organized_with_chuhap.json 과 같은 구조)
+
+    데이터 버전별로 캐시된 gzip/brotli 본문을 그대로 보내고,
+    ETag 가 같으면 304 를 반환합니다.
+    """
+    if gun and gun not in GROUPS:
+        raise HTTPException(status_code=400, detail=f"gun must be one of {', '.join(GROUPS)}")
+
+    view = OrganizedSlice(
+        gun=gun,
+        region=region,
+        university=university,
+        min_rate=min_rate,
+        max_rate=max_rate
+    )
+    encoding = choose_encoding(request.headers.get("accept-encoding"))
+    version, body = await organized_dataset.get(db, view, encoding, admission_type, year)
+
+    etag = f'"{version}-{view.digest}"'
+    headers = {
+        "ETag": etag,
+        "Cache-Control": "public, max-age=60",
+        "Vary": "Accept-Encoding",
+        "X-Data-Version": version
+    }
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    if encoding != "identity":
+        headers["Content-Encoding"] = encoding
+
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+# ============ 통계 API ============
+
+# 데이터 세대별 통계 집계 캐시 ((세대, 입시구분) -> 집계, LRU)
+# 세대는 크롤링 사이클 게시 때만 바뀌므로 그 사이에는 집계 쿼리 없이 응답
+# 입시구분은 요청 값 그대로라 임의 값으로 캐시가 커지지 않도록 개수를 제한
+_SUMMARY_CACHE_SIZE = 32
+_summary_cache: OrderedDict[tuple[int, Optional[str]], dict] = OrderedDict()
+
+
+def _summary_stmts(filters: frozenset[str]) -> tuple:
+    """통계 집계 조회문 (대학 수, 전형 수, 학과 수, 경쟁률 평균/최고/최저)"""
     # 대학 수
-    univ_count = await db.execute(select(func.count(University.id)))
+    univ_stmt = select(func.count(University.id))
 
     # 전형 수
     adm_stmt = select(func.count(Admission.id))
-    if admission_type:
-        adm_stmt = adm_stmt.where(Admission.admission_type == admission_type)
-    adm_count = await db.execute(adm_stmt)
+    if "admission_type" in filters:
+        adm_stmt = adm_stmt.where(Admission.admission_type == bindparam("admission_type"))
 
     # 학과 수
-    dept_stmt = select(func.count(Department.id))
-    if admission_type:
-        dept_stmt = dept_stmt.join(Admission).where(Admission.admission_type == admission_type)
-    dept_count = await db.execute(dept_stmt)
+    dept_stmt = select(func.count(Department.id)).where(Department.removed_at.is_(None))
+    if "admission_type" in filters:
+        dept_stmt = dept_stmt.join(Admission).where(Admission.admission_type == bindparam("admission_type"))
 
     # 평균/최고/최저 경쟁률
     rate_stmt = select(
         func.avg(Department.competition_rate),
         func.max(Department.competition_rate),
         func.min(Department.competition_rate).filter(Department.competition_rate > 0)
-    )
-    if admission_type:
-        rate_stmt = rate_stmt.join(Admission).where(Admission.admission_type == admission_type)
-    rate_result = await db.execute(rate_stmt)
-    avg_rate, max_rate, min_rate = rate_result.one()
-
-    # 마지막 크롤링 시간
-    last_crawl = await db.execute(
-        select(CrawlLog.crawled_at)
-        .where(CrawlLog.status == "success")
-        .order_by(CrawlLog.crawled_at.desc())
-        .limit(1)
-    )
-    last_crawl_time = last_crawl.scalar_one_or_none()
+    ).where(Department.removed_at.is_(None))
+    if "admission_type" in filters:
+        rate_stmt = rate_stmt.join(Admission).where(Admission.admission_type == bindparam("admission_type"))
+
+    return univ_stmt, adm_stmt, dept_stmt, rate_stmt
+
+
+_summary_stmt_sets = StatementCache(_summary_stmts)
+
+# 마지막 크롤링 시간
+_last_crawl_stmt = (
+    select(CrawlLog.crawled_at)
+    .where(CrawlLog.status == "success")
+    .order_by(CrawlLog.crawled_at.desc())
+    .limit(1)
+)
+
+
+async def _summary_counts(db: AsyncSession, admission_type: Optional[str]) -> dict:
+    """대학/전형/학과 수 및 경쟁률 집계"""
+    params = {"admission_type": admission_type or None}
+    univ_stmt, adm_stmt, dept_stmt, rate_stmt = _summary_stmt_sets.get(params)
+    params = StatementCache.bind(params)
+
+    univ_count = await db.execute(univ_stmt)
+    adm_count = await db.execute(adm_stmt, params)
+    dept_count = await db.execute(dept_stmt, params)
+    avg_rate, max_rate, min_rate = (await db.execute(rate_stmt, params)).one()
 
     return {
         "university_count": univ_count.scalar_one(),
@@ -220,17 +330,38 @@ async def get_statistics_summary(
         "average_competition_rate": round(avg_rate or 0, 2),
         "max_competition_rate": round(max_rate or 0, 2),
         "min_competition_rate": round(min_rate or 0, 2),
-        "last_crawled_at": last_crawl_time
     }
 
 
-@router.get("/statistics/top-competition")
-async def get_top_competition(
+@router.get("/statistics/summary")
+async def get_statistics_summary(
     admission_type: Optional[str] = None,
-    limit: int = Query(20, le=100),
-    db: AsyncSession = Depends(get_db)
+    db: AsyncSession = Depends(get_snapshot_db)
 ):
-    """경쟁률 상위 학과"""
+    """전체 통계 요약 (한 데이터 세대 기준, 세대별 캐시)"""
+    generation = generation_watcher.generation
+    counts = _summary_cache.get((generation, admission_type))
+    if counts is not None:
+        _summary_cache.move_to_end((generation, admission_type))
+    else:
+        generation = await current_generation(db)
+        counts = {"data_generation": generation, **await _summary_counts(db, admission_type)}
+        # 세대 게시 없이 스크립트로 바뀐 DB(세대 0)는 캐시하지 않음
+        if generation:
+            for key in [key for key in _summary_cache if key[0] < generation]:
+                del _summary_cache[key]
+            _summary_cache[(generation, admission_type)] = counts
+            if len(_summary_cache) > _SUMMARY_CACHE_SIZE:
+                _summary_cache.popitem(last=False)
+
+    # 마지막 크롤링 시간 (변경이 없는 사이클은 세대를 만들지 않으므로 매번 조회)
+    last_crawl = await db.execute(_last_crawl_stmt)
+
+    return {**counts, "last_crawled_at": last_crawl.scalar_one_or_none()}
+
+
+def _top_competition_stmt(filters: frozenset[str]):
+    """경쟁률 상위 학과 조회문"""
     stmt = (
         select(
             University.name.label("university_name"),
@@ -242,14 +373,27 @@ async def get_top_competition(
         )
         .join(Admission, University.id == Admission.university_id)
         .join(Department, Admission.id == Department.admission_id)
-        .where(Department.competition_rate > 0)
+        .where(Department.competition_rate > 0, Department.removed_at.is_(None))
     )
 
-    if admission_type:
-        stmt = stmt.where(Admission.admission_type == admission_type)
+    if "admission_type" in filters:
+        stmt = stmt.where(Admission.admission_type == bindparam("admission_type"))
+
+    return stmt.order_by(Department.competition_rate.desc()).limit(bindparam("limit"))
+
+
+_top_competition_stmts = StatementCache(_top_competition_stmt)
 
-    stmt = stmt.order_by(Department.competition_rate.desc()).limit(limit)
-    result = await db.execute(stmt)
+
+@router.get("/statistics/top-competition")
+async def get_top_competition(
+    admission_type: Optional[str] = None,
+    limit: int = Query(20, le=100),
+    db: AsyncSession = Depends(get_snapshot_db)
+):
+    """경쟁률 상위 학과"""
+    params = {"admission_type": admission_type or None, "limit": limit}
+    result = await db.execute(_top_competition_stmts.get(params), StatementCache.bind(params))
 
     return [
         {
@@ -264,79 +408,21 @@ async def get_top_competition(
     ]
 
 
-# ============ 크롤링 API ============
-
-@router.post("/crawl/university")
-async def crawl_single_university(
-    url: str,
-    admission_type: str = "정시",
-    year: int = 2026,
-    background_tasks: BackgroundTasks = None,
-    db: AsyncSession = Depends(get_db)
-):
-    """단일 대학 크롤링"""
-    service = CrawlService(db)
-
-    try:
-        university = await service.crawl_and_save(url, admission_type, year)
-        if university:
-            return {
-                "status": "success",
-                "message": f"{university.name} 크롤링 완료",
-                "university_id": university.id
-            }
-        return {
-            "status": "skipped",
-            "message": "경쟁률 데이터를 찾을 수 없습니다"
-        }
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
-
-
-@router.post("/crawl/all")
-async def crawl_all_universities(
-    admission_type: str = "정시",
-    year: int = 2026,
-    background_tasks: BackgroundTasks = None,
-    db: AsyncSession = Depends(get_db)
-):
-    """모든 대학 크롤링 (백그라운드)"""
-    service = CrawlService(db)
-
-    # 백그라운드에서 실행
-    async def run_crawl():
-        return await service.crawl_all_universities(admission_type, year)
-
-    background_tasks.add_task(run_crawl)
-
-    return {
-        "status": "started",
-        "message": "백그라운드에서 크롤링을 시작합니다"
-    }
-
+# ============ 크롤링 상태 API ============
 
 @router.get("/crawl/status", response_model=CrawlStatusResponse)
 async def get_crawl_status(db: AsyncSession = Depends(get_db)):
-    """크롤링 상태 조회"""
-    # 최근 크롤링 로그
-    stmt = (
-        select(CrawlLog)
-        .order_by(CrawlLog.crawled_at.desc())
-        .limit(1)
-    )
-    result = await db.execute(stmt)
-    last_log = result.scalar_one_or_none()
-
-    # 통계
-    univ_count = await db.execute(select(func.count(University.id)))
-    dept_count = await db.execute(select(func.count(Department.id)))
+    """크롤링 상태 조회 (마지막 크롤링 사이클 요약, 캐시)"""
+    cycle = await last_cycle.get(db)
+    if cycle is None:
+        return CrawlStatusResponse(status="unknown", message="크롤링 기록 없음")
 
     return CrawlStatusResponse(
-        status=last_log.status if last_log else "unknown",
-        message=last_log.message if last_log else "크롤링 기록 없음",
-        last_crawled_at=last_log.crawled_at if last_log else None,
-        total_universities=univ_count.scalar_one(),
-        total_departments=dept_count.scalar_one()
+        status=cycle.status,
+        message=cycle.message,
+        last_crawled_at=cycle.finished_at,
+        total_universities=cycle.total_universities,
+        total_departments=cycle.total_departments
     )
 
 
@@ -366,184 +452,3 @@ async def get_crawl_logs(
         }
         for log in result.scalars().all()
     ]
-
-
-# ============ SmartRatio API ============
-
-@router.get("/smartratio/universities")
-async def get_smartratio_universities():
-    """
-    SmartRatio 페이지에서 대학 목록 조회
-
-    Returns:
-        대학 목록 (이름, 지역, 상태, URL 등)
-    """
-    crawler = SmartRatioCrawler()
-    universities = await crawler.fetch_university_list()
-
-    return [
-        {
-            "name": univ.name,
-            "region": univ.region,
-            "admission_type": univ.admission_type,
-            "period_start": univ.period_start,
-            "period_end": univ.period_end,
-            "status": univ.status.value,
-            "ratio_url": univ.ratio_url,
-            "univ_code": univ.univ_code,
-        }
-        for univ in universities
-    ]
-
-
-@router.get("/smartratio/check-availability")
-async def check_availability():
-    """
-    정시 경쟁률 페이지 오픈 여부 확인
-
-    Returns:
-        is_open: 페이지 오픈 여부
-        checked_at: 확인 시간
-        message: 상태 메시지
-    """
-    is_open = await check_jungsi_pages_open()
-
-    return {
-        "is_open": is_open,
-        "checked_at": datetime.now().isoformat(),
-        "message": "페이지가 오픈되었습니다!" if is_open else "아직 준비 중입니다.",
-        "next_check_recommended": None if is_open else "1분 후 재확인 권장"
-    }
-
-
-@router.get("/smartratio/discover-urls")
-async def discover_available_urls(
-    limit: int = Query(10, le=100, description="확인할 대학 수")
-):
-    """
-    활성화된 경쟁률 페이지 URL 탐색
-
-    Returns:
-        대학별 활성화된 URL 목록
-    """
-    crawler = SmartRatioCrawler()
-    universities = await crawler.fetch_university_list()
-
-    # 지정된 수만큼 확인
-    available = await crawler.discover_available_urls(universities[:limit])
-
-    return {
-        "total_checked": min(limit, len(universities)),
-        "available_count": len(available),
-        "universities": [
-            {
-                "name": univ.name,
-                "ratio_url": univ.ratio_url,
-                "univ_code": univ.univ_code,
-                "status": univ.status.value
-            }
-            for univ in available
-        ]
-    }
-
-
-@router.post("/smartratio/crawl-all")
-async def crawl_all_from_smartratio(
-    background_tasks: BackgroundTasks,
-    admission_type: str = "정시",
-    year: int = 2026,
-    delay: float = Query(1.0, ge=0.5, le=5.0, description="요청 간 딜레이(초)"),
-    db: AsyncSession = Depends(get_db)
-):
-    """
-    SmartRatio 페이지의 모든 대학 크롤링 (백그라운드)
-
-    1. SmartRatio에서 대학 목록 수집
-    2. 활성화된 URL 탐색
-    3. 전체 크롤링 실행
-    """
-    global crawl_state
-
-    if crawl_state["is_running"]:
-        return {
-            "status": "already_running",
-            "message": "이미 크롤링이 진행 중입니다",
-            "progress": crawl_state["progress"],
-            "total": crawl_state["total"]
-        }
-
-    async def run_full_crawl():
-        global crawl_state
-        crawl_state["is_running"] = True
-        crawl_state["started_at"] = datetime.now()
-        crawl_state["logs"] = []
-        crawl_state["results"] = {"success": 0, "failed": 0, "skipped": 0}
-
-        try:
-            # 1. 대학 목록 수집
-            crawler = SmartRatioCrawler()
-            crawl_state["logs"].append("대학 목록 수집 중...")
-            universities = await crawler.fetch_university_list()
-            crawl_state["total"] = len(universities)
-
-            # 2. 활성화된 URL 탐색
-            crawl_state["logs"].append(f"{len(universities)}개 대학 URL 확인 중...")
-            available = await crawler.discover_available_urls(universities)
-
-            if not available:
-                crawl_state["logs"].append("활성화된 페이지가 없습니다.")
-                return
-
-            crawl_state["logs"].append(f"{len(available)}개 대학 페이지 활성화 확인")
-
-            # 3. 크롤링 실행
-            service = CrawlService(db)
-            for i, univ in enumerate(available):
-                crawl_state["progress"] = i + 1
-                crawl_state["current_university"] = univ.name
-
-                try:
-                    if univ.ratio_url:
-                        result = await service.crawl_and_save(
-                            univ.ratio_url,
-                            admission_type,
-                            year
-                        )
-                        if result:
-                            crawl_state["results"]["success"] += 1
-                            crawl_state["logs"].append(f"✓ {univ.name} 완료")
-                        else:
-                            crawl_state["results"]["skipped"] += 1
-                except Exception as e:
-                    crawl_state["results"]["failed"] += 1
-                    crawl_state["logs"].append(f"✗ {univ.name} 실패: {str(e)[:50]}")
-
-                await asyncio.sleep(delay)
-
-        finally:
-            crawl_state["is_running"] = False
-            crawl_state["logs"].append("크롤링 완료")
-
-    background_tasks.add_task(run_full_crawl)
-
-    return {
-        "status": "started",
-        "message": "SmartRatio 전체 크롤링을 시작합니다",
-        "started_at": datetime.now().isoformat()
-    }
-
-
-@router.get("/smartratio/crawl-progress")
-async def get_crawl_progress():
-    """
-    현재 크롤링 진행 상황 조회
-    """
-    return {
-        "is_running": crawl_state["is_running"],
-        "progress": crawl_state["progress"],
-        "total": crawl_state["total"],
-        "current_university": crawl_state["current_university"],
-        "results": crawl_state["results"],
-        "started_at": crawl_state["started_at"].isoformat() if crawl_state["started_at"] else None,
-        "recent_logs": crawl_state["logs"][-10:]  # 최근 10개 로그
-    }
@@ -1,14 +1,95 @@
 from pydantic_settings import BaseSettings
 from functools import lru_cache
+from typing import Literal
 
 
 class Settings(BaseSettings):
     # Database
     database_url: str = "sqlite+aiosqlite:///./application_rate.db"
+    sqlite_wal: bool = True  # 크롤링 게시 중에도 조회가 막히지 않도록 WAL 모드 사용
 
     # Crawler Settings
     crawl_interval_minutes: int = 10
-    max_concurrent_requests: int = 5
+    max_concurrent_requests: int = 16  # 호스트별 동시 요청 상한 (적응형 창 크기의 최댓값)
+
+    # 헤드리스 브라우저 대체 경로 (JS 렌더링이 필요한 페이지만, playwright 필요)
+    browser_fallback_enabled: bool = False
+    browser_timeout_seconds: float = 30.0
+
+    # 크롤러 HTTP 재시도 / 서킷 브레이커 (app/crawler/http_client.py)
+    crawl_connect_timeout: float = 3.0
+    crawl_read_timeout: float = 10.0
+    crawl_retry_attempts: int = 3  # 첫 요청 포함 (연결/읽기 오류, 429, 5xx 만 재시도)
+    crawl_retry_base_delay: float = 0.5  # 지수 백오프 기준 (full jitter)
+    crawl_retry_max_delay: float = 8.0
+    crawl_breaker_failures: int = 5  # 호스트별 연속 실패가 이만큼이면 서킷 열림
+    crawl_breaker_reset_seconds: float = 30.0  # 열린 뒤 확인 요청까지 대기
+    crawl_cycle_budget_seconds: float = 480.0  # 크롤링 사이클 시간 예산 (0 이면 제한 없음)
+
+    # 호스트별 적응형 동시 요청 수 (AIMD, app/crawler/concurrency.py)
+    crawl_concurrency_initial: int = 2
+    crawl_concurrency_min: int = 1
+    crawl_concurrency_decrease: float = 0.5  # 과부하 신호 시 창 크기 배율
+    crawl_concurrency_sample_size: int = 20  # 증가 판단 단위 (응답 수)
+    crawl_latency_target: float = 1.0  # p95 응답 시간 목표 (초)
+    crawl_max_error_rate: float = 0.05  # 증가를 허용하는 최대 오류율
+
+    # 크롤링 사이클 파이프라인 (app/services/crawl_pipeline.py, 요청 작업자 수는 max_concurrent_requests)
+    crawl_parse_workers: int = 2  # 파싱 작업자 수 (스레드에서 파싱)
+    crawl_persist_batch: int = 8  # 저장 단계 1 트랜잭션당 최대 대학 수
+    crawl_queue_size: int = 32  # 단계 사이 큐 크기 (가득 차면 앞 단계가 대기)
+
+    # 크롤링 로그 (app/services/crawl_log.py)
+    crawl_log_batch_size: int = 100  # 이만큼 모이면 저장 (나머지는 세대 게시 트랜잭션에서)
+    crawl_status_cache_seconds: float = 5.0  # /crawl/status 마지막 사이클 캐시
+    crawl_log_retention_days: int = 7  # success/skipped 로그 보존 기간
+    crawl_log_failure_retention_days: int = 30  # failed/quarantined 로그 보존 기간
+    crawl_cycle_retention_days: int = 365  # 사이클 요약 보존 기간
+    crawl_log_retention_interval_minutes: int = 360
+
+    # 크롤링 작업 큐 (app/services/crawl_jobs.py)
+    crawl_job_poll_seconds: float = 5.0  # 다른 프로세스가 넣은 작업 확인 주기
+    crawl_job_heartbeat_seconds: float = 10.0  # 실행 중 작업 진행 상황/생존 신호 기록 주기
+    crawl_job_lease_seconds: float = 120.0  # 생존 신호가 이만큼 끊기면 작업/대학을 다른 노드가 이어서 실행
+    crawl_job_max_attempts: int = 3  # 재개를 포함한 최대 실행 횟수 (프로세스가 계속 죽는 작업 차단)
+    crawl_shard_vnodes: int = 64  # 노드별 해시 링 가상 노드 수 (여러 크롤러 노드가 대학을 나눔)
+
+    # 크롤링 사이클 검증 (crawler.js validateNewData 와 동일 기준)
+    crawl_min_universities: int = 100  # 최소 수집 대학 수
+    crawl_min_data_ratio: float = 0.7  # 직전 사이클 대비 최소 비율
+
+    # 대학별 데이터 품질 검사 (app/services/quality_gate.py, 저장 전 격리)
+    quality_gate_enabled: bool = True
+    quality_min_rows: int = 10  # 직전 모집단위 수가 이보다 적으면 검사 생략
+    quality_max_row_drop: float = 0.3  # 사라진 모집단위 최대 비율
+    quality_max_apply_decrease: float = 0.2  # 지원인원이 줄어든 모집단위 최대 비율
+    quality_max_zero_flood: float = 0.2  # 지원인원이 0 이 된 모집단위 최대 비율
+    quality_accept_after: int = 3  # 연속 격리 횟수가 이 값에 도달하면 실제 변경으로 보고 반영
+
+    # Ratio History (이력 병합/보존 정책)
+    history_coalesce_seconds: int = 300  # 이 시간 안의 연속 변동은 1건으로 병합
+    history_full_resolution_days: int = 7  # 전체 이력 유지 기간
+    history_hourly_resolution_days: int = 30  # 시간당 1건 유지 기간 (이후 일당 1건)
+    history_compaction_interval_minutes: int = 60
+
+    # 군별 정리 데이터셋 (/organized) 보강 파일: regionMapper/lastYearMapper/predictFinalRate 출력
+    organized_enrichment_path: str = "output/organized_with_prediction.json"
+
+    # 조회 응답 캐시/압축 (app/services/response_cache.py, 캐시하지 않는 응답은 GZipMiddleware)
+    response_cache_max_bytes: int = 64 * 1024 * 1024  # 원본 + 압축본 합계
+    response_compress_min_bytes: int = 500  # 이보다 작은 본문은 압축 안 함
+    response_coalescing_enabled: bool = True  # 같은 조회가 진행 중이면 그 결과를 함께 기다림
+
+    # 크롤링 후 정적 샤드 내보내기 (CDN/호스팅용, app/services/shard_export.py)
+    shard_export_enabled: bool = False
+    shard_export_dir: str = "frontend/public/data"
+
+    # 실행 모드: all (API + 크롤러), api (조회 전용 복제본), crawler (스케줄러 + 크롤링 API)
+    app_mode: Literal["all", "api", "crawler"] = "all"
+    # API 프로세스가 크롤러 워커의 새 데이터 세대를 확인하는 주기
+    generation_poll_seconds: float = 5.0
+    # 크롤러 워커 Prometheus 메트릭 포트 (0 이면 노출 안 함)
+    worker_metrics_port: int = 0
 
     # API Settings
     api_host: str = "0.0.0.0"
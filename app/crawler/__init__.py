@@ -1,19 +1,36 @@
-from app.crawler.ratio_crawler import RatioCrawler
-from app.crawler.university_list import UniversityListCrawler
-from app.crawler.smartratio_crawler import (
-    SmartRatioCrawler,
-    SmartRatioUniversity,
-    UniversityStatus,
-    get_jungsi_universities,
-    check_jungsi_pages_open
-)
-
-__all__ = [
-    "RatioCrawler",
-    "UniversityListCrawler",
-    "SmartRatioCrawler",
-    "SmartRatioUniversity",
-    "UniversityStatus",
-    "get_jungsi_universities",
-    "check_jungsi_pages_open"
-]
+"""
+크롤러 패키지
+
+BeautifulSoup/lxml/httpx 를 불러오는 비용이 크므로 하위 모듈은 처음 사용할 때 불러옵니다.
+(from app.crawler import RatioCrawler 처럼 기존 방식 그대로 사용 가능)
+"""
+
+import importlib
+
+# 공개 이름 -> 정의된 모듈
+_EXPORTS = {
+    "RatioCrawler": "app.crawler.ratio_crawler",
+    "UwayRatioCrawler": "app.crawler.uway_crawler",
+    "CustomRatioCrawler": "app.crawler.custom_crawler",
+    "UniversityListCrawler": "app.crawler.university_list",
+    "SmartRatioCrawler": "app.crawler.smartratio_crawler",
+    "SmartRatioUniversity": "app.crawler.smartratio_crawler",
+    "UniversityStatus": "app.crawler.smartratio_crawler",
+    "get_jungsi_universities": "app.crawler.smartratio_crawler",
+    "check_jungsi_pages_open": "app.crawler.smartratio_crawler",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
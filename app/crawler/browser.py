@@ -0,0 +1,87 @@
+"""
+헤드리스 브라우저 렌더링 (선택적 대체 경로)
+
+운영 크롤링은 httpx 로 정적 HTML을 받아 파싱하며, 이 모듈은 JS 렌더링 없이는
+표가 나타나지 않는 페이지에만 사용합니다.
+
+- settings.browser_fallback_enabled = True 일 때만 호출됨
+- playwright 는 선택 의존성 (pip install playwright && playwright install chromium)
+- 브라우저는 처음 호출될 때 한 번 띄우고 프로세스 종료 시까지 재사용
+"""
+
+import asyncio
+import importlib.util
+import logging
+from typing import Optional
+
+from app.config import get_settings
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+_playwright = None
+_browser = None
+_lock = asyncio.Lock()
+
+
+def is_available() -> bool:
+    """playwright 설치 여부 (모듈을 불러오지 않고 확인)"""
+    return importlib.util.find_spec("playwright") is not None
+
+
+async def _get_browser():
+    global _playwright, _browser
+    async with _lock:
+        if _browser is None:
+            try:
+                from playwright.async_api import async_playwright
+            except ImportError:
+                raise RuntimeError(
+                    "playwright 가 설치되지 않았습니다 (pip install playwright && playwright install chromium)"
+                )
+            _playwright = await async_playwright().start()
+            _browser = await _playwright.chromium.launch(headless=True)
+            logger.info("헤드리스 브라우저 시작")
+    return _browser
+
+
+async def render_page(
+    url: str,
+    headers: Optional[dict] = None,
+    timeout: Optional[float] = None
+) -> str:
+    """
+    페이지를 브라우저로 렌더링한 뒤 HTML 반환
+
+    Args:
+        url: 페이지 URL
+        headers: 추가 요청 헤더 (User-Agent 는 컨텍스트에 적용)
+        timeout: 로딩 제한 시간(초), 기본 settings.browser_timeout_seconds
+    """
+    if not settings.browser_fallback_enabled:
+        raise RuntimeError("브라우저 대체 경로가 비활성화되어 있습니다 (BROWSER_FALLBACK_ENABLED)")
+
+    headers = dict(headers or {})
+    user_agent = headers.pop("User-Agent", None)
+    timeout = timeout or settings.browser_timeout_seconds
+
+    browser = await _get_browser()
+    context = await browser.new_context(user_agent=user_agent, extra_http_headers=headers)
+    try:
+        page = await context.new_page()
+        await page.goto(url, wait_until="networkidle", timeout=timeout * 1000)
+        return await page.content()
+    finally:
+        await context.close()
+
+
+async def close_browser():
+    """브라우저 종료 (앱 종료 시)"""
+    global _playwright, _browser
+    async with _lock:
+        if _browser is not None:
+            await _browser.close()
+            _browser = None
+        if _playwright is not None:
+            await _playwright.stop()
+            _playwright = None
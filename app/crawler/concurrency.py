@@ -0,0 +1,160 @@
+"""
+호스트별 적응형 동시 요청 수 제어 (AIMD)
+
+고정된 동시 요청 수/요청 간 딜레이 대신 원 서버 상태에 맞춰 창(window) 크기를 조절합니다.
+- 증가(additive): crawl_concurrency_sample_size 건마다 p95 응답 시간과 오류율이
+  목표 이하이면 창 +1 (max_concurrent_requests 까지)
+- 감소(multiplicative): 429/5xx/연결 오류, 또는 p95 가 목표를 넘으면
+  창 × crawl_concurrency_decrease (crawl_concurrency_min 까지)
+
+감소 직전에 이미 보낸 요청들의 실패로 연달아 줄이지 않도록, 마지막 감소 이후에
+시작한 요청의 결과만 감소 근거로 씁니다 (TCP 혼잡 제어와 같은 방식).
+
+http_client.fetch 가 요청마다 limiter(host).slot() 으로 자리를 잡고 결과를 기록합니다.
+"""
+
+import asyncio
+import math
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Optional
+
+from app.config import get_settings
+from app.metrics import CRAWL_CONCURRENCY_DECREASES_TOTAL, CRAWL_CONCURRENCY_WINDOW
+
+settings = get_settings()
+
+
+class AdaptiveLimiter:
+    """호스트 1곳의 AIMD 동시 요청 제한"""
+
+    def __init__(self, host: str):
+        self.host = host
+        self.window = float(settings.crawl_concurrency_initial)
+        self.inflight = 0
+        self._waiters: deque[asyncio.Future] = deque()
+        self._latencies: list[float] = []
+        self._errors = 0
+        self._last_decrease = 0.0
+        CRAWL_CONCURRENCY_WINDOW.labels(host=host).set(self.limit)
+
+    @property
+    def limit(self) -> int:
+        """현재 허용 동시 요청 수"""
+        return max(int(self.window), 1)
+
+    async def acquire(self):
+        while self.inflight >= self.limit:
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            woken = False
+            try:
+                await waiter
+                woken = True
+            finally:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+                # _wake 가 자리를 넘긴(set_result) 뒤 실행 전에 취소되면 그 자리를 다음 대기자에게 넘김
+                if not woken and waiter.done() and not waiter.cancelled():
+                    self._wake()
+        self.inflight += 1
+
+    def release(self):
+        self.inflight -= 1
+        self._wake()
+
+    def _wake(self):
+        """빈 자리만큼 대기 중인 요청 깨움"""
+        free = self.limit - self.inflight
+        while free > 0 and self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                free -= 1
+
+    @asynccontextmanager
+    async def slot(self):
+        """
+        요청 1건의 자리
+
+        사용 예:
+            async with limiter.slot() as started:
+                response = await client.get(url)
+            limiter.record(started, time.monotonic() - started, overloaded=False)
+        """
+        await self.acquire()
+        try:
+            yield time.monotonic()
+        finally:
+            self.release()
+
+    def record(self, started: float, latency: float, overloaded: bool):
+        """
+        요청 결과 기록
+
+        Args:
+            started: 요청 시작 시각 (slot() 이 준 값)
+            latency: 응답까지 걸린 시간 (초)
+            overloaded: 429/5xx/연결 오류 여부
+        """
+        if overloaded and started >= self._last_decrease:
+            self._decrease("error")
+            return
+
+        self._latencies.append(latency)
+        self._errors += overloaded
+        if len(self._latencies) < settings.crawl_concurrency_sample_size:
+            return
+
+        p95 = percentile(self._latencies, 0.95)
+        error_rate = self._errors / len(self._latencies)
+        self._latencies.clear()
+        self._errors = 0
+        if p95 > settings.crawl_latency_target:
+            if started >= self._last_decrease:
+                self._decrease("latency")
+        elif error_rate <= settings.crawl_max_error_rate:
+            self._set_window(self.window + 1)
+
+    def _decrease(self, reason: str):
+        self._last_decrease = time.monotonic()
+        self._latencies.clear()
+        self._errors = 0
+        self._set_window(self.window * settings.crawl_concurrency_decrease)
+        CRAWL_CONCURRENCY_DECREASES_TOTAL.labels(host=self.host, reason=reason).inc()
+
+    def _set_window(self, window: float):
+        self.window = min(max(window, settings.crawl_concurrency_min), settings.max_concurrent_requests)
+        CRAWL_CONCURRENCY_WINDOW.labels(host=self.host).set(self.limit)
+        self._wake()
+
+
+def percentile(values: list[float], q: float) -> float:
+    """정렬 후 nearest-rank 백분위수"""
+    ordered = sorted(values)
+    return ordered[max(math.ceil(q * len(ordered)) - 1, 0)]
+
+
+_limiters: dict[str, AdaptiveLimiter] = {}
+
+
+def limiter(host: str) -> AdaptiveLimiter:
+    """호스트별 limiter (프로세스 전역)"""
+    item = _limiters.get(host)
+    if item is None:
+        item = _limiters[host] = AdaptiveLimiter(host)
+    return item
+
+
+def snapshot() -> dict[str, dict]:
+    """상태 조회용 {호스트: {window, inflight}}"""
+    return {host: {"window": item.limit, "inflight": item.inflight} for host, item in _limiters.items()}
+
+
+def reset(host: Optional[str] = None):
+    """limiter 초기화 (이벤트 루프가 바뀌어 대기 중 future 가 무효해진 경우 등)"""
+    if host is None:
+        _limiters.clear()
+    else:
+        _limiters.pop(host, None)
@@ -0,0 +1,40 @@
+"""
+대학 자체 경쟁률 페이지 크롤러 (진학사/유웨이 외 URL)
+
+crawler.js 는 custom URL 을 건너뛰었지만, 대부분 정적 HTML 표이므로
+진학사 구조(tableRatio2/3)를 먼저 시도하고, 없으면 모든 표에서
+모집단위/모집인원/지원인원/경쟁률 헤더를 찾아 파싱합니다.
+"""
+
+from typing import Optional
+from urllib.parse import urlparse
+
+from app.crawler.ratio_crawler import RatioCrawler, UniversityRatio
+from app.crawler.uway_crawler import UwayRatioCrawler
+
+
+class CustomRatioCrawler(RatioCrawler):
+    """헤더 기반 범용 경쟁률 표 크롤러"""
+
+    def __init__(self):
+        super().__init__()
+        self.headers.pop("Referer", None)
+        # 요약 테이블 위치가 정해져 있지 않으므로 모든 표를 검사
+        self.table_parser = UwayRatioCrawler(summary_tables=0)
+
+    def parse(
+        self,
+        html: str,
+        url: str,
+        admission_type: str = "정시",
+        year: int = 2026
+    ) -> Optional[UniversityRatio]:
+        """진학사 구조 -> 헤더 기반 범용 표 순서로 파싱"""
+        result = (
+            super().parse(html, url, admission_type, year)
+            or self.table_parser.parse(html, url, admission_type, year)
+        )
+        if result:
+            # 경로 끝부분(view.asp 등)은 대학마다 겹치므로 호스트를 대학 식별자로 사용
+            result.university_code = urlparse(url).netloc or result.university_code
+        return result
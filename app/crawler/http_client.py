@@ -0,0 +1,330 @@
+"""
+크롤러 공용 HTTP 계층 (타임아웃 / 재시도 / 호스트별 서킷 브레이커 / 사이클 시간 예산)
+
+모든 크롤러가 fetch() 로 요청하고, 프로세스 전역 AsyncClient 하나를 공유해
+같은 호스트 연결(TLS 포함)을 재사용합니다.
+
+- 동시 요청 수: 호스트별 AIMD 창 (app/crawler/concurrency.py)
+- 타임아웃: 연결 crawl_connect_timeout, 읽기 crawl_read_timeout (페이지 하나가 30초씩 슬롯을 잡지 않도록)
+- 재시도: 연결/읽기 오류, 429, 5xx 만 지수 백오프 + full jitter 로 재시도 (GET/HEAD 만, Retry-After 존중)
+- 서킷 브레이커: 호스트별로 재시도까지 실패한 요청이 crawl_breaker_failures 번 연속되면
+  crawl_breaker_reset_seconds 동안 요청을 보내지 않고 CircuitOpenError 로 즉시 실패,
+  이후 요청 1건으로 회복 여부 확인 (half-open)
+- 사이클 예산: cycle_budget() 블록 안에서는 남은 시간보다 긴 타임아웃/백오프를 쓰지 않고,
+  예산이 끝나면 CycleBudgetExceeded 로 즉시 실패
+"""
+
+import asyncio
+import random
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Optional
+from urllib.parse import urlparse
+
+import httpx
+
+from app.config import get_settings
+from app.crawler import concurrency
+from app.metrics import (
+    CRAWL_BREAKER_REJECTIONS_TOTAL,
+    CRAWL_BREAKER_STATE,
+    CRAWL_HTTP_RETRIES_TOTAL,
+    StageTimer,
+    record_http_response,
+    track_http_request,
+)
+
+settings = get_settings()
+
+RETRY_STATUS = frozenset({429, 500, 502, 503, 504})
+NOT_FOUND_STATUS = frozenset({404, 410})  # 페이지 없음 (실패가 아니라 데이터 없음으로 처리)
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD"})
+
+CLOSED = "closed"
+HALF_OPEN = "half_open"
+OPEN = "open"
+_STATE_VALUES = {CLOSED: 0, HALF_OPEN: 1, OPEN: 2}
+
+
+class CircuitOpenError(Exception):
+    """호스트 서킷이 열려 요청을 보내지 않음"""
+
+
+class CycleBudgetExceeded(Exception):
+    """크롤링 사이클 시간 예산 소진"""
+
+
+# ============ 서킷 브레이커 ============
+
+@dataclass
+class HostCircuit:
+    """호스트 1곳의 서킷 상태"""
+    host: str
+    state: str = CLOSED
+    failures: int = 0          # 연속 실패 수
+    opened_at: float = 0.0
+    probing: bool = False      # half-open 확인 요청 진행 중
+
+    def _set_state(self, state: str):
+        self.state = state
+        CRAWL_BREAKER_STATE.labels(host=self.host).set(_STATE_VALUES[state])
+
+    def allow(self, now: float) -> bool:
+        """요청 허용 여부 (열린 상태에서 reset 시간이 지나면 확인 요청 1건만 허용)"""
+        if self.state == CLOSED:
+            return True
+        if self.state == OPEN and now - self.opened_at >= settings.crawl_breaker_reset_seconds:
+            self._set_state(HALF_OPEN)
+        if self.state == HALF_OPEN and not self.probing:
+            self.probing = True
+            return True
+        return False
+
+    def record_success(self):
+        self.failures = 0
+        self.probing = False
+        if self.state != CLOSED:
+            self._set_state(CLOSED)
+
+    def record_failure(self, now: float):
+        self.failures += 1
+        self.probing = False
+        if self.state == HALF_OPEN or self.failures >= settings.crawl_breaker_failures:
+            self.opened_at = now
+            self._set_state(OPEN)
+
+
+class CircuitBreaker:
+    """호스트별 서킷 모음"""
+
+    def __init__(self):
+        self._circuits: dict[str, HostCircuit] = {}
+
+    def circuit(self, host: str) -> HostCircuit:
+        circuit = self._circuits.get(host)
+        if circuit is None:
+            circuit = self._circuits[host] = HostCircuit(host)
+        return circuit
+
+    def snapshot(self) -> dict[str, dict]:
+        """상태 조회용 {호스트: {state, failures}}"""
+        return {
+            host: {"state": circuit.state, "failures": circuit.failures}
+            for host, circuit in self._circuits.items()
+        }
+
+    def reset(self):
+        self._circuits.clear()
+
+
+breaker = CircuitBreaker()
+
+
+# ============ 사이클 시간 예산 ============
+
+_deadline: ContextVar[Optional[float]] = ContextVar("crawl_cycle_deadline", default=None)
+
+
+@contextmanager
+def cycle_budget(seconds: Optional[float]):
+    """
+    블록 안의 요청에 크롤링 사이클 마감 시각 적용 (seconds 가 0/None 이면 제한 없음)
+
+    사용 예:
+        with cycle_budget(settings.crawl_cycle_budget_seconds):
+            for univ in universities:
+                if budget_exhausted():
+                    break
+                ...
+    """
+    token = _deadline.set(time.monotonic() + seconds if seconds else None)
+    try:
+        yield
+    finally:
+        _deadline.reset(token)
+
+
+def budget_remaining() -> Optional[float]:
+    """남은 예산 (초, 예산이 없으면 None)"""
+    deadline = _deadline.get()
+    return None if deadline is None else deadline - time.monotonic()
+
+
+def budget_exhausted() -> bool:
+    remaining = budget_remaining()
+    return remaining is not None and remaining <= 0
+
+
+def _timeout(remaining: Optional[float]) -> httpx.Timeout:
+    """요청 타임아웃 (남은 예산보다 길지 않게)"""
+    connect, read = settings.crawl_connect_timeout, settings.crawl_read_timeout
+    if remaining is not None:
+        connect, read = min(connect, remaining), min(read, remaining)
+    return httpx.Timeout(connect=connect, read=read, write=read, pool=read)
+
+
+# ============ 공용 클라이언트 ============
+
+_client: Optional[httpx.AsyncClient] = None
+_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def get_client() -> httpx.AsyncClient:
+    """프로세스 전역 AsyncClient (이벤트 루프가 바뀌면 새로 만듦)"""
+    global _client, _client_loop
+    loop = asyncio.get_running_loop()
+    if _client is None or _client.is_closed or _client_loop is not loop:
+        _client = httpx.AsyncClient(
+            timeout=_timeout(None),
+            limits=httpx.Limits(
+                max_connections=settings.max_concurrent_requests * 4,
+                max_keepalive_connections=settings.max_concurrent_requests * 2
+            ),
+            follow_redirects=True
+        )
+        _client_loop = loop
+        concurrency.reset()
+    return _client
+
+
+async def close_client():
+    """공용 클라이언트 종료 (프로세스 종료 시)"""
+    global _client, _client_loop
+    if _client is not None and not _client.is_closed:
+        await _client.aclose()
+    _client, _client_loop = None, None
+
+
+def _retry_after(response: httpx.Response) -> Optional[float]:
+    """Retry-After 헤더 (초 또는 HTTP 날짜)"""
+    value = response.headers.get("retry-after")
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+def backoff_delay(attempt: int, retry_after: Optional[float] = None) -> float:
+    """attempt 번째 재시도 전 대기 시간 (full jitter, Retry-After 가 있으면 그 이상)"""
+    cap = settings.crawl_retry_max_delay
+    delay = random.uniform(0, min(cap, settings.crawl_retry_base_delay * (2 ** attempt)))
+    if retry_after is not None:
+        delay = max(delay, min(retry_after, cap))
+    return delay
+
+
+async def fetch(
+    url: str,
+    headers: Optional[dict] = None,
+    timer: Optional[StageTimer] = None,
+    method: str = "GET",
+    params: Optional[dict] = None
+) -> httpx.Response:
+    """
+    재시도 / 서킷 브레이커 / 사이클 예산을 적용한 요청
+
+    Returns:
+        응답 (4xx 는 재시도하지 않고 그대로 반환, 호출자가 raise_for_status)
+
+    Raises:
+        CircuitOpenError: 호스트 서킷이 열림
+        CycleBudgetExceeded: 사이클 예산 소진
+        httpx.TransportError / httpx.HTTPStatusError: 재시도까지 실패
+    """
+    host = urlparse(url).hostname or "unknown"
+    circuit = breaker.circuit(host)
+    if not circuit.allow(time.monotonic()):
+        CRAWL_BREAKER_REJECTIONS_TOTAL.labels(host=host).inc()
+        raise CircuitOpenError(f"서킷 열림: {host}")
+
+    # half-open 확인 요청은 재시도하지 않음 (회복 여부만 빠르게 판단)
+    retryable = method in IDEMPOTENT_METHODS and circuit.state == CLOSED
+    attempts = settings.crawl_retry_attempts if retryable else 1
+    client = get_client()
+    extensions = {"trace": timer.trace} if timer else None
+
+    host_limiter = concurrency.limiter(host)
+    probe = circuit.state != CLOSED
+
+    try:
+        for attempt in range(attempts):
+            retry_after = None
+            async with host_limiter.slot() as started:
+                # 자리를 기다리는 동안에도 예산이 줄어듦
+                remaining = budget_remaining()
+                if remaining is not None and remaining <= 0:
+                    raise CycleBudgetExceeded(f"사이클 예산 소진: {url}")
+
+                try:
+                    with track_http_request(url):
+                        if timer:
+                            timer.host = host
+                        response = await client.request(
+                            method, url,
+                            headers=headers,
+                            params=params,
+                            timeout=_timeout(remaining),
+                            extensions=extensions
+                        )
+                        record_http_response(host, response.status_code)
+                except httpx.TransportError as e:
+                    host_limiter.record(started, time.monotonic() - started, overloaded=True)
+                    reason = type(e).__name__
+                    error: Exception = e
+                except Exception:
+                    # 전송 오류가 아닌 예외(잘못된 URL/헤더, 응답 디코딩 등)도 호스트 실패로 기록
+                    circuit.record_failure(time.monotonic())
+                    raise
+                else:
+                    overloaded = response.status_code in RETRY_STATUS
+                    host_limiter.record(started, time.monotonic() - started, overloaded)
+                    if not overloaded:
+                        circuit.record_success()
+                        return response
+                    reason = str(response.status_code)
+                    retry_after = _retry_after(response)
+                    error = httpx.HTTPStatusError(
+                        f"HTTP {response.status_code}", request=response.request, response=response
+                    )
+
+            if attempt + 1 < attempts:
+                delay = backoff_delay(attempt, retry_after)
+                remaining = budget_remaining()
+                if remaining is None or delay < remaining:
+                    CRAWL_HTTP_RETRIES_TOTAL.labels(host=host, reason=reason).inc()
+                    await asyncio.sleep(delay)
+                    continue
+            break
+
+        circuit.record_failure(time.monotonic())
+        raise error
+    finally:
+        # 예산 소진/취소 등 어떤 예외로 끝나도 확인 요청 표시를 남기지 않음
+        # (남으면 half-open 에서 다음 확인 요청이 영원히 허용되지 않음)
+        if probe:
+            circuit.probing = False
+
+
+def raise_for_status(response: httpx.Response) -> bool:
+    """
+    응답 상태 확인
+
+    Returns:
+        True (정상) / False (404/410 - 페이지 없음)
+
+    Raises:
+        httpx.HTTPStatusError: 그 외 4xx/5xx
+    """
+    if response.status_code in NOT_FOUND_STATUS:
+        return False
+    response.raise_for_status()
+    return True
@@ -1,13 +1,16 @@
-import httpx
 from bs4 import BeautifulSoup, Tag
 import re
 import asyncio
 from typing import Optional
 from dataclasses import dataclass, field
 from datetime import datetime
+import logging
 from app.config import get_settings
+from app.crawler.http_client import fetch, raise_for_status
+from app.metrics import StageTimer
 
 settings = get_settings()
+logger = logging.getLogger(__name__)
 
 
 @dataclass
@@ -29,6 +32,7 @@ class AdmissionRatio:
     total_apply: int = 0
     total_rate: float = 0.0
     departments: list[DepartmentRatio] = field(default_factory=list)
+    gun: Optional[str] = None  # 가군/나군/다군 (표 제목 또는 행의 군 컬럼)
 
 
 @dataclass
@@ -40,6 +44,54 @@ class UniversityRatio:
     year: int = 2026
     admissions: list[AdmissionRatio] = field(default_factory=list)
     crawled_at: datetime = field(default_factory=datetime.now)
+    source_url: str = ""  # 크롤링한 경쟁률 페이지 URL
+    update_time: Optional[str] = None  # 페이지에 표시된 업데이트 시각
+
+    @property
+    def university_key(self) -> str:
+        """University.code 로 저장하는 대학 식별자"""
+        return university_key(self.university_code)
+
+
+def university_key(code: str) -> str:
+    """
+    페이지 코드 → 대학 식별자 (University.code)
+
+    진학사 코드(Ratio{code}.html)는 앞 4자리가 대학 코드,
+    그 외(유웨이 등)는 페이지 코드 전체를 사용합니다.
+    """
+    if code.isdigit():
+        return code[:4]
+    return code[:20]
+
+
+# 경쟁률 페이지 URL 유형 (crawler.js getUniversityList 와 동일 기준)
+URL_TYPE_JINHAK = "jinhak"
+URL_TYPE_UWAY = "uway"
+URL_TYPE_CUSTOM = "custom"
+
+
+def classify_ratio_url(url: str) -> str:
+    """경쟁률 페이지 URL 유형 판별 (jinhak / uway / custom)"""
+    if "addon.jinhakapply.com" in url or re.search(r"Ratio\d+\.html", url):
+        return URL_TYPE_JINHAK
+    if "uwayapply.com" in url:
+        return URL_TYPE_UWAY
+    return URL_TYPE_CUSTOM
+
+
+def page_code(url: str) -> str:
+    """
+    경쟁률 페이지 URL에서 페이지 코드 추출
+
+    - 진학사: .../Ratio{code}.html -> code
+    - 유웨이 등: 마지막 경로 부분 (없으면 URL 그대로)
+    """
+    match = re.search(r"Ratio(\d+)\.html", url)
+    if match:
+        return match.group(1)
+    last = url.split("?")[0].rstrip("/").rsplit("/", 1)[-1]
+    return last or url
 
 
 class RatioCrawler:
@@ -117,86 +169,24 @@ class RatioCrawler:
 
         return admissions
 
-    def _parse_detail_table(self, table: Tag) -> list[DepartmentRatio]:
-        """상세 테이블(tableRatio3)에서 학과별 데이터 추출 (rowspan 처리)"""
-        departments = []
-        rows = table.find_all("tr")
-
-        if not rows:
-            return departments
-
-        # 헤더 분석
-        header_row = rows[0]
-        headers = [th.get_text(strip=True).lower() for th in header_row.find_all(["th", "td"])]
-
-        # 캠퍼스 컬럼 존재 여부 확인
-        has_campus = any("캠퍼스" in h for h in headers)
-
-        # 현재 캠퍼스 (rowspan 처리용)
-        current_campus = None
-        campus_remaining_rows = 0
-
-        for row in rows[1:]:
-            cells = row.find_all(["td", "th"])
-            if not cells:
-                continue
-
-            # 합계 행 스킵
-            first_text = cells[0].get_text(strip=True)
-            if "합계" in first_text or "총계" in first_text or "소계" in first_text:
-                continue
-
-            try:
-                if has_campus:
-                    # rowspan 처리
-                    if campus_remaining_rows > 0:
-                        # 캠퍼스 셀이 병합되어 있어 현재 행에는 없음
-                        campus_remaining_rows -= 1
-                        # 셀 인덱스 조정 (캠퍼스 없이 시작)
-                        name_idx = 0
-                        recruit_idx = 1
-                        apply_idx = 2
-                        rate_idx = 3
-                    else:
-                        # 새 캠퍼스 시작
-                        campus_cell = cells[0]
-                        current_campus = campus_cell.get_text(strip=True)
-                        rowspan = campus_cell.get("rowspan")
-                        if rowspan:
-                            campus_remaining_rows = int(rowspan) - 1
-
-                        name_idx = 1
-                        recruit_idx = 2
-                        apply_idx = 3
-                        rate_idx = 4
-                else:
-                    # 캠퍼스 없음
-                    name_idx = 0
-                    recruit_idx = 1
-                    apply_idx = 2
-                    rate_idx = 3
-
-                # 데이터 추출
-                if len(cells) > rate_idx:
-                    dept = DepartmentRatio(
-                        campus=current_campus,
-                        name=cells[name_idx].get_text(strip=True),
-                        recruit_count=self._parse_number(cells[recruit_idx].get_text()),
-                        apply_count=self._parse_number(cells[apply_idx].get_text()),
-                        competition_rate=self._parse_rate(cells[rate_idx].get_text())
-                    )
-
-                    # 유효한 데이터만 추가
-                    if dept.name and dept.name not in ["합계", "총계", "소계"]:
-                        departments.append(dept)
-
-            except (IndexError, ValueError) as e:
-                continue
+    def _detail_heading(self, table: Tag) -> Optional[str]:
+        """상세 테이블 제목 (바로 앞 형제 요소, 없으면 앞쪽 h2~h4)"""
+        previous = table.find_previous_sibling()
+        if previous is not None and previous.name != "table":
+            text = previous.get_text(" ", strip=True)
+            if text and len(text) <= 100:
+                return text
+        heading = table.find_previous(["h2", "h3", "h4"])
+        return heading.get_text(" ", strip=True) if heading else None
+
+    def _parse_admissions(self, soup: BeautifulSoup, template_key: str = "") -> list[AdmissionRatio]:
+        """
+        전형별 데이터 추출
 
-        return departments
+        상세 테이블 구조(제목, 컬럼 역할)는 대학별로 한 번만 학습합니다 (table_schema.page_templates).
+        """
+        from app.crawler.table_schema import page_templates, extract_rows
 
-    def _parse_admissions(self, soup: BeautifulSoup) -> list[AdmissionRatio]:
-        """전형별 데이터 추출"""
         admissions = []
 
         # 1. 요약 테이블에서 전형명 목록 가져오기
@@ -205,87 +195,196 @@ class RatioCrawler:
         if summary_table:
             admission_summaries = self._parse_summary_table(summary_table)
 
-        # 2. 상세 테이블들에서 학과별 데이터 가져오기
-        detail_tables = soup.find_all("table", class_="tableRatio3")
+        # 2. 상세 테이블들에서 학과별 데이터 가져오기 (요약 테이블과 순서로 매칭)
+        detail_tables = page_templates.resolve(
+            template_key,
+            soup.find_all("table", class_="tableRatio3"),
+            lambda i, table: self._detail_heading(table)
+        )
 
-        # 전형 수와 테이블 수 매칭
         for i, summary in enumerate(admission_summaries):
-            if i < len(detail_tables):
-                departments = self._parse_detail_table(detail_tables[i])
-            else:
-                departments = []
-
-            admissions.append(AdmissionRatio(
-                admission_name=summary["name"],
-                total_recruit=summary["recruit"],
-                total_apply=summary["apply"],
-                total_rate=summary["rate"],
-                departments=departments
-            ))
+            if i >= len(detail_tables):
+                admissions.append(AdmissionRatio(
+                    admission_name=summary["name"],
+                    total_recruit=summary["recruit"],
+                    total_apply=summary["apply"],
+                    total_rate=summary["rate"]
+                ))
+                continue
+
+            template, rows = detail_tables[i]
+            for admission in extract_rows(template, rows, summary["name"]):
+                # 표 전체가 하나의 전형이면 요약 테이블 합계 사용
+                if admission.admission_name == summary["name"]:
+                    admission.total_recruit = summary["recruit"]
+                    admission.total_apply = summary["apply"]
+                    admission.total_rate = summary["rate"]
+                admissions.append(admission)
 
         # 요약 테이블이 없는 경우: 상세 테이블만 파싱
         if not admissions and detail_tables:
-            for i, table in enumerate(detail_tables):
-                departments = self._parse_detail_table(table)
-                if departments:
-                    admissions.append(AdmissionRatio(
-                        admission_name=f"전형 {i + 1}",
-                        departments=departments
-                    ))
+            for i, (template, rows) in enumerate(detail_tables):
+                admissions.extend(extract_rows(template, rows, None if template.heading else f"전형 {i + 1}"))
 
         return admissions
 
-    async def crawl(self, url: str, admission_type: str = "정시", year: int = 2026) -> Optional[UniversityRatio]:
+    def _decode(self, content: bytes) -> str:
+        """응답 바이트 디코딩 (UTF-8 우선, 실패 시 EUC-KR)"""
+        try:
+            return content.decode("utf-8")
+        except UnicodeDecodeError:
+            return content.decode("euc-kr", errors="ignore")
+
+    async def fetch_html(self, url: str, timer: StageTimer) -> Optional[str]:
         """
-        경쟁률 페이지 크롤링
+        페이지 요청 및 디코딩 (요청/디코딩 단계 시간 기록)
 
-        Args:
-            url: 경쟁률 페이지 URL
-            admission_type: 수시/정시
-            year: 학년도
+        Returns:
+            HTML 또는 None (404/410 - 페이지 없음)
+
+        Raises:
+            재시도까지 실패한 요청, 서킷 열림, 사이클 예산 소진 (http_client.fetch)
+        """
+        response = await fetch(url, headers=self.headers, timer=timer)
+        if not raise_for_status(response):
+            logger.warning(f"HTTP 오류 ({response.status_code}): {url}")
+            return None
+
+        with timer.stage("decode"):
+            return self._decode(response.content)
+
+    def parse(
+        self,
+        html: str,
+        url: str,
+        admission_type: str = "정시",
+        year: int = 2026
+    ) -> Optional[UniversityRatio]:
+        """
+        경쟁률 페이지 HTML 파싱
 
         Returns:
-            UniversityRatio 또는 None (실패 시)
+            UniversityRatio 또는 None (경쟁률 데이터 없음)
         """
-        async with httpx.AsyncClient(headers=self.headers, timeout=30.0) as client:
-            try:
-                response = await client.get(url)
-                response.raise_for_status()
+        soup = BeautifulSoup(html, "lxml")
 
-                content = response.content
-                try:
-                    html = content.decode("utf-8")
-                except UnicodeDecodeError:
-                    html = content.decode("euc-kr", errors="ignore")
+        university_name = self._extract_university_name(soup)
 
-                soup = BeautifulSoup(html, "lxml")
+        match = re.search(r"Ratio(\d+)\.html", url)
+        university_code = match.group(1) if match else ""
 
-                university_name = self._extract_university_name(soup)
+        admissions = self._parse_admissions(soup, university_code)
 
-                match = re.search(r"Ratio(\d+)\.html", url)
-                university_code = match.group(1) if match else ""
+        if not admissions:
+            return None
 
-                admissions = self._parse_admissions(soup)
+        return UniversityRatio(
+            university_name=university_name,
+            university_code=university_code,
+            admission_type=admission_type,
+            year=year,
+            admissions=admissions,
+            crawled_at=datetime.now(),
+            source_url=url
+        )
 
-                if not admissions:
-                    print(f"경쟁률 데이터를 찾을 수 없음: {url}")
-                    return None
+    def parse_page(
+        self,
+        html: str,
+        url: str,
+        admission_type: str = "정시",
+        year: int = 2026
+    ) -> tuple[Optional[UniversityRatio], list[str]]:
+        """
+        페이지 파싱
 
-                return UniversityRatio(
-                    university_name=university_name,
-                    university_code=university_code,
-                    admission_type=admission_type,
-                    year=year,
-                    admissions=admissions,
-                    crawled_at=datetime.now()
-                )
+        Returns:
+            (UniversityRatio 또는 None, 결과가 없을 때 이어서 받아 볼 조각 페이지 URL)
+        """
+        return self.parse(html, url, admission_type, year), []
 
-            except httpx.HTTPStatusError as e:
-                print(f"HTTP 오류 ({e.response.status_code}): {url}")
-                return None
-            except Exception as e:
-                print(f"크롤링 오류: {e} - {url}")
-                return None
+    async def parse_html(
+        self,
+        html: str,
+        url: str,
+        admission_type: str,
+        year: int,
+        timer: StageTimer
+    ) -> Optional[UniversityRatio]:
+        """
+        받은 HTML 파싱 (필요 시 조각 페이지까지)
+
+        파싱은 CPU 작업이므로 스레드에서 실행해 그동안 이벤트 루프가
+        다른 대학의 요청/DB 작업을 계속 처리하도록 합니다.
+        """
+        with timer.stage("parse"):
+            result, fragments = await asyncio.to_thread(self.parse_page, html, url, admission_type, year)
+
+        for fragment_url in fragments:
+            fragment = await self.fetch_html(fragment_url, timer)
+            if fragment is None:
+                continue
+            with timer.stage("parse"):
+                result = await asyncio.to_thread(self.parse, fragment, url, admission_type, year)
+            if result:
+                break
+
+        if not result:
+            logger.warning(f"경쟁률 데이터를 찾을 수 없음: {url}")
+        return result
+
+    async def crawl(
+        self,
+        url: str,
+        admission_type: str = "정시",
+        year: int = 2026,
+        timer: Optional[StageTimer] = None
+    ) -> Optional[UniversityRatio]:
+        """
+        경쟁률 페이지 크롤링
+
+        Args:
+            url: 경쟁률 페이지 URL
+            admission_type: 수시/정시
+            year: 학년도
+            timer: 단계별 소요 시간 기록기 (없으면 URL 코드로 생성)
+
+        Returns:
+            UniversityRatio 또는 None (페이지/경쟁률 데이터 없음)
+
+        Raises:
+            요청 실패 (재시도 후에도 실패, 서킷 열림, 사이클 예산 소진) - 호출자가 실패로 기록
+        """
+        timer = timer or StageTimer(page_code(url))
+
+        html = await self.fetch_html(url, timer)
+        if html is None:
+            return None
+        return await self.parse_html(html, url, admission_type, year, timer)
+
+    async def crawl_with_browser(
+        self,
+        url: str,
+        admission_type: str = "정시",
+        year: int = 2026,
+        timer: Optional[StageTimer] = None
+    ) -> Optional[UniversityRatio]:
+        """
+        헤드리스 브라우저로 렌더링한 HTML 파싱 (JS 렌더링이 필요한 페이지용 선택적 대체 경로)
+
+        settings.browser_fallback_enabled 가 켜져 있고 playwright 가 설치된 경우에만 사용합니다.
+        """
+        from app.crawler.browser import render_page
+
+        timer = timer or StageTimer(page_code(url))
+        try:
+            with timer.stage("render"):
+                html = await render_page(url, headers=self.headers)
+            with timer.stage("parse"):
+                return self.parse(html, url, admission_type, year)
+        except Exception as e:
+            logger.warning(f"브라우저 크롤링 오류: {e} - {url}")
+            return None
 
     async def crawl_multiple(
         self,
@@ -300,7 +399,11 @@ class RatioCrawler:
         results = []
 
         for url in urls:
-            result = await self.crawl(url, admission_type, year)
+            try:
+                result = await self.crawl(url, admission_type, year)
+            except Exception as e:
+                logger.warning(f"크롤링 오류: {e} - {url}")
+                result = None
             if result:
                 results.append(result)
             await asyncio.sleep(delay)
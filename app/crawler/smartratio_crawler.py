@@ -5,7 +5,6 @@ SmartRatio 메인 페이지 크롤러
 https://apply.jinhakapply.com/SmartRatio
 """
 
-import httpx
 from bs4 import BeautifulSoup
 import re
 import asyncio
@@ -13,10 +12,14 @@ from typing import Optional
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+import logging
 
 from app.config import get_settings
+from app.crawler.http_client import fetch
+from app.crawler.ratio_crawler import URL_TYPE_JINHAK, URL_TYPE_UWAY, classify_ratio_url, page_code
 
 settings = get_settings()
+logger = logging.getLogger(__name__)
 
 
 class UniversityStatus(str, Enum):
@@ -42,6 +45,7 @@ class SmartRatioUniversity:
     ratio_url: Optional[str] = None     # 경쟁률 페이지 URL
     univ_code: Optional[str] = None     # 대학 코드
     type_code: Optional[str] = None     # 전형 코드 (031=수시, 032=정시)
+    url_type: Optional[str] = None      # 경쟁률 페이지 유형 (jinhak/uway/custom)
 
     # onclick 파라미터
     onclick_params: dict = field(default_factory=dict)
@@ -134,17 +138,92 @@ class SmartRatioCrawler:
 
         return None
 
+    def parse_rate_links(self, html: str) -> list[SmartRatioUniversity]:
+        """
+        SmartRatio 페이지 HTML에서 대학 목록 추출 (crawler.js getUniversityList 와 동일)
+
+        - a.rate[data-link]: 오픈된 대학 (data-label 또는 링크 텍스트가 대학명)
+        - 링크 없이 '준비중' 표시된 항목: 준비중 대학
+        """
+        soup = BeautifulSoup(html, "lxml")
+        universities = []
+        added_names = set()
+
+        for link in soup.select("a.rate[data-link]"):
+            url = link.get("data-link", "").strip()
+            label = link.get("data-label") or link.get_text(strip=True)
+            name = label.replace(" 정시", "").strip()
+            if not url or not name or name in added_names:
+                continue
+            added_names.add(name)
+
+            url_type = classify_ratio_url(url)
+            univ = SmartRatioUniversity(
+                name=name,
+                status=UniversityStatus.OPEN,
+                ratio_url=url,
+                url_type=url_type
+            )
+            if url_type == URL_TYPE_JINHAK:
+                univ.onclick_params = self._extract_onclick_params(url)
+                univ.univ_code = univ.onclick_params.get("univ_code")
+                univ.type_code = univ.onclick_params.get("type_code")
+            elif url_type == URL_TYPE_UWAY:
+                univ.univ_code = page_code(url)
+            universities.append(univ)
+
+        for item in soup.select('li[class*="item"], .univ-item, main li'):
+            text = item.get_text()
+            if "준비중" not in text or not ("정시" in text or "모집" in text):
+                continue
+            name_el = item.select_one('[class*="name"], strong, b')
+            name = name_el.get_text(strip=True) if name_el else None
+            if name and name not in added_names:
+                added_names.add(name)
+                universities.append(SmartRatioUniversity(name=name, status=UniversityStatus.PREPARING))
+
+        return universities
+
+    async def fetch_rate_links(self) -> list[SmartRatioUniversity]:
+        """
+        SmartRatio 메인 페이지에서 실제 대학 목록/URL 추출
+
+        정적 HTML에 링크가 없으면 (SPA 렌더링) browser_fallback_enabled 인 경우에만
+        헤드리스 브라우저로 렌더링해 다시 시도합니다.
+        """
+        html = ""
+        try:
+            response = await fetch(self.base_url, headers=self.headers)
+            response.raise_for_status()
+            html = response.text
+        except Exception as e:
+            logger.warning(f"SmartRatio 페이지 요청 실패: {e}")
+
+        universities = self.parse_rate_links(html) if html else []
+        if not any(u.ratio_url for u in universities) and settings.browser_fallback_enabled:
+            from app.crawler.browser import render_page
+            try:
+                universities = self.parse_rate_links(await render_page(self.base_url, headers=self.headers))
+            except Exception as e:
+                logger.warning(f"SmartRatio 브라우저 렌더링 실패: {e}")
+
+        return universities
+
     async def fetch_university_list(self) -> list[SmartRatioUniversity]:
         """
         SmartRatio 메인 페이지에서 대학 목록 추출
 
-        Note: SmartRatio는 JavaScript SPA로 렌더링됨.
-        정적 HTML 파싱이 어려워 하드코딩된 대학 목록을 사용하고,
+        a.rate[data-link] 링크를 먼저 찾고, 페이지가 아직 열리지 않아
+        링크가 없으면 하드코딩된 대학 목록을 사용해
         페이지 오픈 시 실제 URL을 탐색하는 방식으로 동작.
 
         Returns:
             SmartRatioUniversity 리스트
         """
+        universities = await self.fetch_rate_links()
+        if any(u.ratio_url for u in universities):
+            return universities
+
         # 하드코딩된 정시 대학 목록 (SmartRatio 페이지 기반)
         # 실제 페이지 오픈 시 URL 탐색으로 보완
         jungsi_universities = [
@@ -283,44 +362,44 @@ class SmartRatioCrawler:
         Returns:
             True if page is accessible and has ratio data
         """
-        async with httpx.AsyncClient(headers=self.headers, timeout=10.0) as client:
-            try:
-                response = await client.get(url)
+        try:
+            response = await fetch(url, headers=self.headers)
 
-                if response.status_code != 200:
-                    return False
+            if response.status_code != 200:
+                return False
 
-                soup = BeautifulSoup(response.text, "lxml")
+            soup = BeautifulSoup(response.text, "lxml")
 
-                # 경쟁률 테이블 존재 여부 확인
-                has_ratio_table = (
-                    soup.find("table", class_="tableRatio2") or
-                    soup.find("table", class_="tableRatio3") or
-                    soup.find(text=re.compile(r"경쟁률|지원인원|모집인원"))
-                )
+            # 경쟁률 테이블 존재 여부 확인
+            has_ratio_table = (
+                soup.find("table", class_="tableRatio2") or
+                soup.find("table", class_="tableRatio3") or
+                soup.find(text=re.compile(r"경쟁률|지원인원|모집인원"))
+            )
 
-                return bool(has_ratio_table)
+            return bool(has_ratio_table)
 
-            except Exception as e:
-                return False
+        except Exception:
+            return False
 
     async def discover_available_urls(
         self,
         universities: list[SmartRatioUniversity],
-        max_concurrent: int = 5
+        max_concurrent: Optional[int] = None
     ) -> list[SmartRatioUniversity]:
         """
         대학 목록에서 접근 가능한 URL 찾기
 
         Args:
             universities: 대학 목록
-            max_concurrent: 동시 요청 수
+            max_concurrent: 동시 확인 대학 수 (기본 max_concurrent_requests,
+                실제 동시 요청 수는 호스트별 AIMD 창이 조절)
 
         Returns:
             URL이 확인된 대학 목록
         """
         available = []
-        semaphore = asyncio.Semaphore(max_concurrent)
+        semaphore = asyncio.Semaphore(max_concurrent or settings.max_concurrent_requests)
 
         async def check_single(univ: SmartRatioUniversity):
             async with semaphore:
@@ -0,0 +1,622 @@
+"""
+헤더 기반 경쟁률 표 추출기 (processData.js parseRow/parseHeading 이식)
+
+1. 헤더에서 컬럼 역할(캠퍼스/대학/군/전형/모집단위/전공/모집인원/지원인원/경쟁률)을
+   한 번만 판별해 TableLayout 으로 컴파일 (같은 헤더는 lru_cache 로 재사용)
+2. rowspan/colspan 을 펼쳐 모든 행을 헤더 폭과 같은 격자로 만든 뒤
+3. 컴파일된 인덱스로 셀을 잘라내기만 함 (행마다 다시 판별하지 않음)
+
+격자 폭이 헤더와 맞지 않거나 숫자 컬럼 검증에 실패한 행만
+parseRow 의 휴리스틱(뒤에서부터 숫자 컬럼 찾기, 슬로건 제외)으로 처리합니다.
+
+표 제목("가군 일반학생전형[수능] 경쟁률 현황")에서 군/전형명을 분리하고,
+행에 군/전형 컬럼이 있으면 행 값이 우선합니다.
+
+대학별로 학습한 구조(표 제목, 컬럼 역할, 병합 셀 여부)는 page_templates 에 캐시해
+다음 크롤링부터 헤더 서명 비교만 하고 바로 잘라냅니다.
+"""
+
+import logging
+import re
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from functools import lru_cache
+from typing import Callable, Iterator, Optional
+
+from bs4 import Tag
+
+from app.crawler.ratio_crawler import AdmissionRatio, DepartmentRatio
+from app.metrics import CRAWL_TEMPLATE_TOTAL
+
+logger = logging.getLogger(__name__)
+
+GUN_NAMES = ("가군", "나군", "다군")
+
+# 합계 행 판별
+SUMMARY_CELLS = ("총계", "소계", "합계")
+
+# 컬럼 역할 판별에서 제외할 부가 정보 컬럼 (홈페이지, 소개 등)
+_EXTRA_COLUMN_WORDS = ("홈페이지", "소개", "안내", "영상", "슬로건", "비고", "진로", "국책")
+
+_COUNT_RE = re.compile(r"^\d{1,3}(?:,\d{3})*$|^\d{1,7}$")
+_RATE_RE = re.compile(r"([\d.]+)\s*:\s*1")
+_CAMPUS_CITIES = ("서울", "대전", "논산", "부산", "천안", "세종", "인천", "광주", "대구")
+
+
+# ============ 값 판별 (processData.js 와 동일 기준) ============
+
+def parse_heading(heading: str) -> tuple[Optional[str], str]:
+    """
+    표 제목에서 군과 전형명 추출
+
+    예: "가군 일반학생전형[수능] 경쟁률 현황" -> ("가군", "일반학생전형[수능]")
+    """
+    heading = (heading or "").strip()
+    gun = next((g for g in GUN_NAMES if heading.startswith(g)), None)
+    rest = heading[len(gun):].strip() if gun else heading
+    end = rest.find("경쟁률")
+    if end > 0:
+        rest = rest[:end].strip()
+    return gun, rest
+
+
+def is_count(text: str) -> bool:
+    """모집/지원인원 형식 (콤마 허용 정수)"""
+    return bool(_COUNT_RE.match(text or ""))
+
+
+def is_rate(text: str) -> bool:
+    """경쟁률 형식 (예: '0.00 : 1')"""
+    return ":" in (text or "") and "1" in text
+
+
+def is_campus_like(text: Optional[str]) -> bool:
+    if not text:
+        return False
+    if any(word in text for word in ("캠퍼스", "본교", "교정", "분교")):
+        return True
+    return "[" in text and any(city in text for city in _CAMPUS_CITIES)
+
+
+def is_slogan(text: Optional[str]) -> bool:
+    """학과 소개 문구 등 설명문 여부"""
+    if not text:
+        return False
+    return len(text) > 50 or "!" in text or any(
+        word in text for word in ("양성", "전문가", "인재", "교육", "취업", "진로")
+    )
+
+
+def is_major_name(text: Optional[str]) -> bool:
+    if not text:
+        return False
+    return len(text) < 40 and (
+        any(word in text for word in ("학과", "학부", "전공", "교육과", "계열")) or text.endswith("과")
+    )
+
+
+def is_jeonhyung_like(text: Optional[str]) -> bool:
+    if not text or text.isdigit():
+        return False
+    if text.endswith(("학과", "학부", "전공", "과")):
+        return False
+    return any(word in text for word in ("전형", "수능", "정시", "수시", "특별", "우수자"))
+
+
+def parse_count(text: str) -> int:
+    cleaned = re.sub(r"[^\d]", "", text or "")
+    return int(cleaned) if cleaned else 0
+
+
+def parse_rate(text: str) -> Optional[float]:
+    match = _RATE_RE.search(text or "")
+    if match:
+        try:
+            return float(match.group(1))
+        except ValueError:
+            return None
+    return None
+
+
+# ============ 레이아웃 컴파일 ============
+
+@dataclass(frozen=True)
+class TableLayout:
+    """헤더에서 한 번 판별한 컬럼 역할 (-1: 없음)"""
+    headers: tuple[str, ...]
+    campus: int = -1
+    college: int = -1
+    gun: int = -1
+    jeonhyung: int = -1
+    unit: int = -1
+    major: int = -1
+    recruit: int = -1
+    apply: int = -1
+    rate: int = -1
+
+    @property
+    def width(self) -> int:
+        return len(self.headers)
+
+    @property
+    def complete(self) -> bool:
+        """헤더 인덱스만으로 행을 잘라낼 수 있는지"""
+        return self.unit >= 0 and self.recruit >= 0 and self.apply >= 0
+
+    @property
+    def signature(self) -> str:
+        """헤더 서명 (템플릿 식별용)"""
+        return "|".join(self.headers)
+
+
+def _is_extra(header: str) -> bool:
+    return any(word in header for word in _EXTRA_COLUMN_WORDS)
+
+
+@lru_cache(maxsize=512)
+def compile_layout(headers: tuple[str, ...]) -> TableLayout:
+    """헤더 목록 -> 컬럼 역할 (같은 헤더는 캐시 재사용)"""
+    roles: dict[str, int] = {}
+
+    def assign(role: str, index: int):
+        roles.setdefault(role, index)
+
+    for i, raw in enumerate(headers):
+        h = re.sub(r"\s+", "", raw)
+        if not h or _is_extra(h):
+            continue
+        if "모집인원" in h:
+            assign("recruit", i)
+        elif "지원인원" in h:
+            assign("apply", i)
+        elif "경쟁률" in h:
+            assign("rate", i)
+        elif "모집단위" in h:
+            assign("unit", i)
+        elif "캠퍼스" in h:
+            assign("campus", i)
+        elif h == "군":
+            assign("gun", i)
+        elif "전형" in h and "전형명" not in h and "전형요소" not in h:
+            assign("jeonhyung", i)
+        elif "대학" in h and "모집" not in h:
+            assign("college", i)
+        elif "unit" in roles and any(word in h for word in ("전공", "개설", "학과", "학부")):
+            # 모집단위 뒤의 세부 단위 (전공, 개설학과/전공, 학과·학부 등)
+            assign("major", i)
+
+    return TableLayout(headers=headers, **roles)
+
+
+# ============ 표 -> 격자 ============
+
+def _cell_text(cell: Tag) -> str:
+    return cell.get_text(" ", strip=True).replace("\xa0", " ")
+
+
+def _span(cell: Tag, attr: str) -> int:
+    try:
+        return max(int(cell.get(attr, 1)), 1)
+    except (TypeError, ValueError):
+        return 1
+
+
+def _row_cells(tr: Tag) -> list[Tag]:
+    """행의 셀 (tr 바로 아래 td/th 만, find_all 보다 빠름)"""
+    return [child for child in tr.children if child.name in ("td", "th")]
+
+
+def split_header(table: Tag) -> tuple[list[str], list[Tag]]:
+    """
+    (헤더, 데이터 행 tr 목록) 분리
+
+    헤더는 thead 의 첫 행, 없으면 th 로만 이루어진 첫 행입니다.
+    """
+    rows = table.find_all("tr")
+    header_row = None
+    skip = 0
+    thead = table.find("thead")
+    if thead and thead.find("tr"):
+        header_row = thead.find("tr")
+        skip = len(thead.find_all("tr"))
+    elif rows and rows[0].find("th") and not rows[0].find("td"):
+        header_row = rows[0]
+        skip = 1
+
+    headers: list[str] = []
+    if header_row is not None:
+        for cell in _row_cells(header_row):
+            headers.extend([_cell_text(cell)] * _span(cell, "colspan"))
+
+    return headers, rows[skip:]
+
+
+def has_spans(rows: list[Tag]) -> bool:
+    """데이터 행에 rowspan/colspan 병합 셀이 있는지"""
+    return any(
+        _span(cell, "rowspan") > 1 or _span(cell, "colspan") > 1
+        for tr in rows
+        for cell in _row_cells(tr)
+    )
+
+
+def expand_rows(rows: list[Tag], spans: bool = True) -> list[list[str]]:
+    """
+    데이터 행 -> 격자
+
+    spans=False 면 병합 셀 추적 없이 셀 텍스트만 읽습니다 (병합 없는 표의 빠른 경로).
+    """
+    if not spans:
+        return [[_cell_text(cell) for cell in _row_cells(tr)] for tr in rows]
+
+    grid: list[list[str]] = []
+    pending: dict[int, list] = {}  # 컬럼 -> [남은 행 수, 값]
+    for tr in rows:
+        row: list[str] = []
+        col = 0
+
+        def fill_pending():
+            nonlocal col
+            while col in pending:
+                remaining = pending[col]
+                row.append(remaining[1])
+                remaining[0] -= 1
+                if remaining[0] == 0:
+                    del pending[col]
+                col += 1
+
+        for cell in _row_cells(tr):
+            fill_pending()
+            text = _cell_text(cell)
+            rowspan = _span(cell, "rowspan")
+            for _ in range(_span(cell, "colspan")):
+                row.append(text)
+                if rowspan > 1:
+                    pending[col] = [rowspan - 1, text]
+                col += 1
+        fill_pending()
+        grid.append(row)
+
+    return grid
+
+
+def expand_table(table: Tag) -> tuple[list[str], list[list[str]]]:
+    """rowspan/colspan 을 펼쳐 (헤더, 데이터 행 목록) 반환"""
+    headers, rows = split_header(table)
+    return headers, expand_rows(rows)
+
+
+# ============ 행 추출 ============
+
+@dataclass
+class ExtractedRow:
+    """추출된 행 (행 단위 군/전형 포함)"""
+    gun: Optional[str]
+    jeonhyung: Optional[str]
+    department: DepartmentRatio
+
+
+def _department(
+    campus: Optional[str],
+    unit: str,
+    major: Optional[str],
+    college: Optional[str],
+    recruit_text: str,
+    apply_text: str,
+    rate_text: str
+) -> DepartmentRatio:
+    recruit = parse_count(recruit_text)
+    apply = parse_count(apply_text)
+    rate = parse_rate(rate_text)
+    if rate is None:
+        rate = round(apply / recruit, 2) if recruit else 0.0
+
+    name = unit
+    if major and major != unit and not is_slogan(major):
+        name = f"{unit}({major})"
+
+    return DepartmentRatio(
+        campus=campus or None,
+        name=name,
+        detail=college or None,
+        recruit_count=recruit,
+        apply_count=apply,
+        competition_rate=rate
+    )
+
+
+class TableExtractor:
+    """컴파일된 레이아웃으로 격자 행을 DepartmentRatio 로 변환"""
+
+    def __init__(self, layout: TableLayout):
+        self.layout = layout
+
+    def _slice(
+        self,
+        cells: list[str],
+        strict: bool = True
+    ) -> Optional[tuple[Optional[str], Optional[str], DepartmentRatio]]:
+        """
+        헤더 인덱스로 바로 잘라내기 (검증 실패 시 None)
+
+        strict=False 는 숫자 셀이 병합되어 비어 있는 행용 (parseRow 의 헤더 인덱스 경로):
+        모집/지원인원이 비어 있어도 허용하고, 값이 있으면 숫자여야 합니다.
+        """
+        layout = self.layout
+
+        def cell(index: int) -> str:
+            return cells[index] if 0 <= index < len(cells) else ""
+
+        recruit, apply = cell(layout.recruit), cell(layout.apply)
+        unit = cell(layout.unit)
+        if not unit or unit.isdigit():
+            return None
+        if strict and not (is_count(recruit) and is_count(apply)):
+            return None
+        if not strict and any(value and not is_count(value) for value in (recruit, apply)):
+            return None
+
+        campus = cell(layout.campus)
+        college = cell(layout.college)
+        if not campus and is_campus_like(college):
+            campus, college = college, ""
+
+        gun = cell(layout.gun)
+        jeonhyung = cell(layout.jeonhyung)
+        return (
+            gun if gun in GUN_NAMES else None,
+            jeonhyung if is_jeonhyung_like(jeonhyung) else None,
+            _department(campus, unit, cell(layout.major), college, recruit, apply, cell(layout.rate))
+        )
+
+    def _heuristic(self, cells: list[str]) -> Optional[tuple[Optional[str], DepartmentRatio]]:
+        """parseRow 휴리스틱: 뒤에서부터 경쟁률/지원인원/모집인원, 그 앞에서 모집단위"""
+        rate_idx = apply_idx = recruit_idx = -1
+        for i in range(len(cells) - 1, -1, -1):
+            if rate_idx < 0 and is_rate(cells[i]):
+                rate_idx = i
+            elif rate_idx >= 0 and apply_idx < 0 and is_count(cells[i]):
+                apply_idx = i
+            elif apply_idx >= 0 and is_count(cells[i]):
+                recruit_idx = i
+                break
+
+        if rate_idx < 0 or apply_idx < 0:
+            return None
+
+        text_end = recruit_idx if recruit_idx >= 0 else apply_idx
+        texts = [value for value in cells[:text_end] if value and value != "홈페이지"]
+
+        unit, campus = "", None
+        for predicate in (is_major_name, lambda v: len(v) < 50):
+            for i in range(len(texts) - 1, -1, -1):
+                if is_slogan(texts[i]) or not predicate(texts[i]):
+                    continue
+                unit = texts[i]
+                if i > 0 and is_campus_like(texts[i - 1]):
+                    campus = texts[i - 1]
+                break
+            if unit:
+                break
+
+        if not unit or unit.isdigit():
+            return None
+
+        jeonhyung = next((v for v in texts if is_jeonhyung_like(v)), None)
+        return jeonhyung, _department(
+            campus,
+            unit,
+            None,
+            None,
+            cells[recruit_idx] if recruit_idx >= 0 else "",
+            cells[apply_idx],
+            cells[rate_idx]
+        )
+
+    def extract(self, rows: list[list[str]]) -> Iterator[ExtractedRow]:
+        """격자 행 -> ExtractedRow (합계/빈 행 제외, 캠퍼스는 직전 행에서 상속)"""
+        current_campus: Optional[str] = None
+        current_gun: Optional[str] = None
+        fast = self.layout.complete
+
+        for cells in rows:
+            if not any(cells):
+                continue
+            if any(value in SUMMARY_CELLS or "소계" in value for value in cells):
+                continue
+
+            # 1. 격자 폭이 헤더와 같으면 인덱스로 잘라내기
+            sliced = self._slice(cells) if fast and len(cells) == self.layout.width else None
+            heuristic = None if sliced else self._heuristic(cells)
+            # 3. 숫자 셀이 병합된 행: 헤더 인덱스로 느슨하게
+            if not sliced and not heuristic and fast:
+                sliced = self._slice(cells, strict=False)
+
+            if sliced:
+                gun, jeonhyung, dept = sliced
+            elif heuristic:
+                # 2. 폭이 맞지 않는 행: 뒤에서부터 숫자 컬럼 찾기
+                gun = next((value for value in cells if value in GUN_NAMES), None)
+                jeonhyung, dept = heuristic
+            else:
+                continue
+
+            if dept.campus:
+                current_campus = dept.campus
+            else:
+                dept.campus = current_campus
+            if gun:
+                current_gun = gun
+
+            yield ExtractedRow(gun=gun or current_gun, jeonhyung=jeonhyung, department=dept)
+
+
+def clean_heading(heading: str) -> str:
+    """표 제목에서 '경쟁률 현황' 과 그 뒤 안내 문구([☞ 원서접수 바로가기] 등) 제거"""
+    return re.sub(r"\s*경쟁률\s*현황.*$", "", (heading or "").strip())
+
+
+# ============ 페이지 템플릿 캐시 ============
+
+@dataclass(frozen=True)
+class TableTemplate:
+    """상세 표 1개의 학습된 구조"""
+    layout: TableLayout
+    heading: str      # 표 제목 (군/전형명 추출용)
+    spans: bool       # 데이터 행에 병합 셀이 있는지 (없으면 병합 추적 생략)
+
+
+@dataclass(frozen=True)
+class PageTemplate:
+    """대학 페이지 1개의 학습된 구조 (fingerprint: 상세 표별 (헤더, 병합 셀 여부))"""
+    fingerprint: tuple[tuple[tuple[str, ...], bool], ...]
+    tables: tuple[TableTemplate, ...]
+
+
+class PageTemplateCache:
+    """
+    대학별 페이지 템플릿 캐시 (메모리)
+
+    모집 기간 동안 대학 페이지 구조는 바뀌지 않으므로, 첫 크롤링에서
+    표 제목 / 컬럼 역할 / 병합 셀 여부를 학습해 두고 이후에는
+    서명(표별 헤더 + 병합 셀 여부)만 비교한 뒤 바로 셀을 잘라냅니다.
+    병합 셀 여부도 서명에 넣어, 헤더는 같은데 나중에 병합 셀이 생긴 표를
+    병합 추적 없는 빠른 경로로 읽지 않도록 합니다.
+    서명이 달라지면 구조 변경으로 기록하고 다시 학습합니다.
+    파싱은 크롤링 파이프라인의 스레드에서도 실행되므로 저장/교체는 잠금 안에서 합니다.
+    """
+
+    def __init__(self, maxsize: int = 2048):
+        self.maxsize = maxsize
+        self._templates: dict[str, PageTemplate] = {}
+        self._lock = threading.Lock()
+        self.changed: dict[str, datetime] = {}  # 구조 변경이 감지된 대학 -> 감지 시각
+
+    def get(self, key: str) -> Optional[PageTemplate]:
+        return self._templates.get(key)
+
+    def invalidate(self, key: Optional[str] = None):
+        if key is None:
+            self._templates.clear()
+        else:
+            self._templates.pop(key, None)
+
+    def _learn(
+        self,
+        tables: list[Tag],
+        fingerprint: tuple[tuple[tuple[str, ...], bool], ...],
+        heading_for: Callable[[int, Tag], str]
+    ) -> PageTemplate:
+        return PageTemplate(
+            fingerprint=fingerprint,
+            tables=tuple(
+                TableTemplate(
+                    layout=compile_layout(headers),
+                    heading=heading_for(i, table) or "",
+                    spans=spans
+                )
+                for i, (table, (headers, spans)) in enumerate(zip(tables, fingerprint))
+            )
+        )
+
+    def resolve(
+        self,
+        key: str,
+        tables: list[Tag],
+        heading_for: Callable[[int, Tag], str]
+    ) -> list[tuple[TableTemplate, list[Tag]]]:
+        """
+        상세 표 목록 -> [(표 구조, 데이터 행)]
+
+        Args:
+            key: 대학 코드 (빈 값이면 캐시하지 않음)
+            tables: 상세 표 목록
+            heading_for: (순번, 표) -> 표 제목 (학습할 때만 호출)
+        """
+        split = [split_header(table) for table in tables]
+        fingerprint = tuple((tuple(headers), has_spans(rows)) for headers, rows in split)
+
+        template = self._templates.get(key) if key else None
+        if template and template.fingerprint == fingerprint:
+            CRAWL_TEMPLATE_TOTAL.labels(result="hit").inc()
+        else:
+            if template:
+                logger.warning(f"페이지 구조 변경 감지, 다시 학습: {key}")
+                self.changed[key] = datetime.now()
+                CRAWL_TEMPLATE_TOTAL.labels(result="changed").inc()
+            else:
+                CRAWL_TEMPLATE_TOTAL.labels(result="learned").inc()
+
+            template = self._learn(tables, fingerprint, heading_for)
+            if key:
+                with self._lock:
+                    if key not in self._templates and len(self._templates) >= self.maxsize:
+                        self._templates.pop(next(iter(self._templates)))
+                    self._templates[key] = template
+
+        return [(table, rows) for table, (_, rows) in zip(template.tables, split)]
+
+
+# 프로세스 전역 템플릿 캐시
+page_templates = PageTemplateCache()
+
+
+def extract_admissions(
+    table: Tag,
+    heading: str,
+    admission_name: Optional[str] = None
+) -> list[AdmissionRatio]:
+    """
+    상세 표 1개 -> 전형별 AdmissionRatio 목록 (템플릿 캐시 없이)
+
+    Args:
+        table: 상세 표
+        heading: 표 제목 (군/전형명 추출용)
+        admission_name: 전형명 (없으면 제목, 둘 다 '경쟁률 현황' 이후는 제거)
+    """
+    headers, rows = split_header(table)
+    template = TableTemplate(layout=compile_layout(tuple(headers)), heading=heading, spans=True)
+    return extract_rows(template, rows, admission_name)
+
+
+def extract_rows(
+    template: TableTemplate,
+    rows: list[Tag],
+    admission_name: Optional[str] = None
+) -> list[AdmissionRatio]:
+    """
+    학습된 표 구조로 데이터 행 추출
+
+    행의 군/전형 컬럼 값이 표 제목과 다르면 별도 전형으로 분리합니다
+    (예: 제목에 군이 없고 행마다 '나군'/'다군' 이 있는 표).
+    """
+    heading = template.heading or admission_name or ""
+    heading_gun, heading_jeonhyung = parse_heading(heading)
+    base_name = clean_heading(admission_name or heading)
+    if not heading_gun and admission_name:
+        heading_gun = parse_heading(admission_name)[0]
+
+    extractor = TableExtractor(template.layout)
+
+    groups: dict[str, AdmissionRatio] = {}
+    for row in extractor.extract(expand_rows(rows, template.spans)):
+        name = base_name
+        if row.gun and row.gun != heading_gun and row.gun not in name:
+            name = f"{row.gun} {name}"
+        if row.jeonhyung and row.jeonhyung != heading_jeonhyung and row.jeonhyung not in name:
+            name = f"{name} ({row.jeonhyung})"
+
+        admission = groups.get(name)
+        if admission is None:
+            admission = groups[name] = AdmissionRatio(admission_name=name, gun=row.gun or heading_gun)
+        admission.departments.append(row.department)
+
+    for admission in groups.values():
+        admission.total_recruit = sum(d.recruit_count for d in admission.departments)
+        admission.total_apply = sum(d.apply_count for d in admission.departments)
+        admission.total_rate = (
+            round(admission.total_apply / admission.total_recruit, 2) if admission.total_recruit else 0.0
+        )
+
+    return list(groups.values())
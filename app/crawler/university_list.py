@@ -1,12 +1,16 @@
-import httpx
 from bs4 import BeautifulSoup
 import re
 import asyncio
+import logging
 from typing import Optional
 from dataclasses import dataclass
 from app.config import get_settings
+from app.crawler.http_client import fetch
+from app.crawler.ratio_crawler import classify_ratio_url, page_code
+from app.crawler.smartratio_crawler import SmartRatioCrawler
 
 settings = get_settings()
+logger = logging.getLogger(__name__)
 
 
 @dataclass
@@ -16,6 +20,7 @@ class UniversityInfo:
     region: Optional[str] = None
     type: Optional[str] = None  # 4년제/전문대
     ratio_url: Optional[str] = None
+    url_type: Optional[str] = None  # jinhak/uway/custom
 
 
 class UniversityListCrawler:
@@ -46,31 +51,30 @@ class UniversityListCrawler:
         universities = []
 
         # 진학사 API 엔드포인트 (개발자 도구에서 확인 필요)
-        api_url = "https://apply.jinhakapply.com/SmartRatio/GetRatioList"
-
-        async with httpx.AsyncClient(headers=self.headers, timeout=30.0) as client:
-            try:
-                # API 호출 시도 (실제 파라미터는 확인 필요)
-                params = {
-                    "admission_type": admission_type,
-                    "page": 1,
-                    "pageSize": 500
-                }
-                response = await client.get(api_url, params=params)
-
-                if response.status_code == 200:
-                    data = response.json()
-                    # API 응답 구조에 맞게 파싱 (실제 구조 확인 필요)
-                    for item in data.get("list", []):
-                        universities.append(UniversityInfo(
-                            code=item.get("univ_code", ""),
-                            name=item.get("univ_name", ""),
-                            region=item.get("region", ""),
-                            type=item.get("univ_type", ""),
-                            ratio_url=item.get("ratio_url", "")
-                        ))
-            except Exception as e:
-                print(f"API 호출 실패: {e}")
+        api_url = f"{self.base_url}/GetRatioList"
+
+        try:
+            # API 호출 시도 (실제 파라미터는 확인 필요)
+            params = {
+                "admission_type": admission_type,
+                "page": 1,
+                "pageSize": 500
+            }
+            response = await fetch(api_url, headers=self.headers, params=params)
+
+            if response.status_code == 200:
+                data = response.json()
+                # API 응답 구조에 맞게 파싱 (실제 구조 확인 필요)
+                for item in data.get("list", []):
+                    universities.append(UniversityInfo(
+                        code=item.get("univ_code", ""),
+                        name=item.get("univ_name", ""),
+                        region=item.get("region", ""),
+                        type=item.get("univ_type", ""),
+                        ratio_url=item.get("ratio_url", "")
+                    ))
+        except Exception as e:
+            logger.warning(f"API 호출 실패: {e}")
 
         return universities
 
@@ -80,33 +84,45 @@ class UniversityListCrawler:
         """
         universities = []
 
-        async with httpx.AsyncClient(headers=self.headers, timeout=30.0) as client:
-            try:
-                response = await client.get(url)
-                response.raise_for_status()
-
-                soup = BeautifulSoup(response.text, "lxml")
-
-                # 대학 링크 패턴 찾기
-                # 예: href="https://addon.jinhakapply.com/RatioV1/RatioH/Ratio10030311.html"
-                links = soup.find_all("a", href=re.compile(r"Ratio\d+\.html"))
-
-                for link in links:
-                    href = link.get("href", "")
-                    name = link.get_text(strip=True)
-
-                    # URL에서 코드 추출
-                    match = re.search(r"Ratio(\d+)\.html", href)
-                    if match:
-                        code = match.group(1)
-                        universities.append(UniversityInfo(
-                            code=code,
-                            name=name,
-                            ratio_url=href
-                        ))
-
-            except Exception as e:
-                print(f"페이지 크롤링 실패: {e}")
+        try:
+            response = await fetch(url, headers=self.headers)
+            response.raise_for_status()
+
+            # SmartRatio 대학 링크 (a.rate[data-link], 진학사/유웨이/자체 URL)
+            for univ in SmartRatioCrawler().parse_rate_links(response.text):
+                if univ.ratio_url:
+                    universities.append(UniversityInfo(
+                        code=page_code(univ.ratio_url),
+                        name=univ.name,
+                        ratio_url=univ.ratio_url,
+                        url_type=univ.url_type
+                    ))
+            if universities:
+                return universities
+
+            soup = BeautifulSoup(response.text, "lxml")
+
+            # 대학 링크 패턴 찾기
+            # 예: href="https://addon.jinhakapply.com/RatioV1/RatioH/Ratio10030311.html"
+            links = soup.find_all("a", href=re.compile(r"Ratio\d+\.html"))
+
+            for link in links:
+                href = link.get("href", "")
+                name = link.get_text(strip=True)
+
+                # URL에서 코드 추출
+                match = re.search(r"Ratio(\d+)\.html", href)
+                if match:
+                    code = match.group(1)
+                    universities.append(UniversityInfo(
+                        code=code,
+                        name=name,
+                        ratio_url=href,
+                        url_type=classify_ratio_url(href)
+                    ))
+
+        except Exception as e:
+            logger.warning(f"페이지 크롤링 실패: {e}")
 
         return universities
 
@@ -143,24 +159,23 @@ class UniversityListCrawler:
         type_code = type_codes.get(admission_type, "032")
         universities = []
 
-        async with httpx.AsyncClient(headers=self.headers, timeout=10.0) as client:
-            for univ_code, univ_name in known_university_codes.items():
-                # URL 패턴 시도
-                for suffix in ["1", "2", ""]:
-                    url = f"{self.ratio_base}Ratio{univ_code}{type_code}{suffix}.html"
-                    try:
-                        response = await client.head(url)
-                        if response.status_code == 200:
-                            universities.append(UniversityInfo(
-                                code=f"{univ_code}{type_code}{suffix}",
-                                name=univ_name,
-                                ratio_url=url
-                            ))
-                            break
-                    except:
-                        continue
-
-                await asyncio.sleep(0.1)  # Rate limiting
+        for univ_code, univ_name in known_university_codes.items():
+            # URL 패턴 시도
+            for suffix in ["1", "2", ""]:
+                url = f"{self.ratio_base}Ratio{univ_code}{type_code}{suffix}.html"
+                try:
+                    response = await fetch(url, headers=self.headers, method="HEAD")
+                    if response.status_code == 200:
+                        universities.append(UniversityInfo(
+                            code=f"{univ_code}{type_code}{suffix}",
+                            name=univ_name,
+                            ratio_url=url
+                        ))
+                        break
+                except Exception:
+                    continue
+
+            await asyncio.sleep(0.1)  # Rate limiting
 
         return universities
 
@@ -168,12 +183,12 @@ class UniversityListCrawler:
         """
         대학 목록 조회 (여러 방법 시도)
         """
-        # 1. API 시도
-        universities = await self.fetch_university_list_from_api(admission_type)
+        # 1. SmartRatio 페이지 링크
+        universities = await self.fetch_universities_from_page(self.base_url)
 
-        # 2. API 실패 시 페이지 크롤링
+        # 2. 페이지에 링크가 없으면 API 시도
         if not universities:
-            universities = await self.fetch_universities_from_page(self.base_url)
+            universities = await self.fetch_university_list_from_api(admission_type)
 
         # 3. 그래도 없으면 URL 탐색
         if not universities:
@@ -0,0 +1,155 @@
+"""
+유웨이 경쟁률 페이지 크롤러
+
+https://ratio.uwayapply.com/{코드} 페이지는 서버에서 완성된 HTML로 내려오므로
+브라우저 없이 httpx 로 받아 그대로 파싱합니다.
+본문에 표가 없고 frame/iframe 으로 조각 페이지를 불러오는 경우에는
+같은 공용 클라이언트(http_client)로 조각 페이지를 받아 파싱합니다.
+"""
+
+from bs4 import BeautifulSoup, Tag
+from typing import Optional
+from datetime import datetime
+from urllib.parse import urljoin
+import logging
+
+from app.crawler.ratio_crawler import (
+    RatioCrawler,
+    AdmissionRatio,
+    UniversityRatio,
+    page_code
+)
+from app.crawler.table_schema import clean_heading, extract_rows, page_templates
+
+logger = logging.getLogger(__name__)
+
+UWAY_HOST = "ratio.uwayapply.com"
+
+
+def is_uway_url(url: str) -> bool:
+    """유웨이 경쟁률 페이지 URL 여부"""
+    return UWAY_HOST in (url or "")
+
+
+class UwayRatioCrawler(RatioCrawler):
+    """
+    유웨이 경쟁률 페이지 크롤러
+
+    페이지 구조:
+    - #UivImg[alt]: 대학명
+    - #ID_DateStr label: 업데이트 시각
+    - h3 .bul: 섹션 제목 (0: 전체, 1: 전형별 요약, 2~: 전형별 상세)
+    - table[0], table[1]: 전체/전형별 요약 (건너뜀)
+    - table[2~]: 전형별 상세 (thead 헤더, tbody 행, 대학 컬럼 rowspan)
+
+    상세 테이블 구조는 대학별로 한 번만 학습하고 (table_schema.page_templates)
+    table_schema.extract_rows 로 추출합니다.
+    """
+
+    def __init__(self, summary_tables: int = 2):
+        super().__init__()
+        self.headers["Referer"] = f"https://{UWAY_HOST}/"
+        self.summary_tables = summary_tables  # 앞쪽 요약 테이블 수 (상세 테이블 아님)
+
+    def _extract_university_name(self, soup: BeautifulSoup) -> str:
+        """페이지에서 대학명 추출 (로고 이미지 alt 우선)"""
+        logo = soup.select_one("#UivImg")
+        if logo and logo.get("alt"):
+            return logo["alt"].strip()
+
+        title = soup.find("title")
+        if title and title.get_text(strip=True):
+            return title.get_text(strip=True).split()[0]
+
+        return "Unknown University"
+
+    def _extract_update_time(self, soup: BeautifulSoup) -> Optional[str]:
+        label = soup.select_one("#ID_DateStr label")
+        return label.get_text(strip=True) if label else None
+
+    def _table_heading(self, table: Tag, index: int, section_headers: list[str]) -> str:
+        """상세 테이블의 전형명 (바로 앞 섹션 제목, 없으면 순서로 매칭)"""
+        heading = None
+        caption = table.find("caption")
+        previous = table.find_previous(["h2", "h3", "h4"])
+        if caption and caption.get_text(strip=True):
+            heading = caption.get_text(strip=True)
+        elif previous:
+            bullet = previous.select_one(".bul")
+            heading = (bullet or previous).get_text(strip=True)
+        if not heading and index < len(section_headers):
+            heading = section_headers[index]
+        return clean_heading(heading or f"전형 {index}")
+
+    def _parse_admissions(self, soup: BeautifulSoup, template_key: str = "") -> list[AdmissionRatio]:
+        """전형별 데이터 추출 (상세 테이블 기준, 헤더 기반 추출기 사용)"""
+        section_headers = []
+
+        def heading_for(i: int, table: Tag) -> str:
+            if not section_headers:
+                section_headers.extend(el.get_text(strip=True) for el in soup.select("h3 .bul"))
+            return self._table_heading(table, i + self.summary_tables, section_headers)
+
+        # 첫 번째(전체 경쟁률), 두 번째(전형별 요약) 테이블은 건너뜀
+        detail_tables = soup.find_all("table")[self.summary_tables:]
+        admissions = []
+        for template, rows in page_templates.resolve(template_key, detail_tables, heading_for):
+            admissions.extend(extract_rows(template, rows))
+
+        return admissions
+
+    def parse(
+        self,
+        html: str,
+        url: str,
+        admission_type: str = "정시",
+        year: int = 2026
+    ) -> Optional[UniversityRatio]:
+        """
+        유웨이 경쟁률 페이지 HTML 파싱
+
+        Returns:
+            UniversityRatio 또는 None (경쟁률 데이터 없음)
+        """
+        soup = BeautifulSoup(html, "lxml")
+        university_code = page_code(url)
+        # 유웨이 외 페이지(CustomRatioCrawler)는 경로 끝이 겹칠 수 있어 URL 전체로 템플릿 구분
+        admissions = self._parse_admissions(soup, university_code if is_uway_url(url) else url)
+
+        if not admissions:
+            return None
+
+        return UniversityRatio(
+            university_name=self._extract_university_name(soup),
+            university_code=university_code,
+            admission_type=admission_type,
+            year=year,
+            admissions=admissions,
+            crawled_at=datetime.now(),
+            source_url=url,
+            update_time=self._extract_update_time(soup)
+        )
+
+    def parse_page(
+        self,
+        html: str,
+        url: str,
+        admission_type: str = "정시",
+        year: int = 2026
+    ) -> tuple[Optional[UniversityRatio], list[str]]:
+        """본문에 표가 없으면 frame/iframe 조각 페이지 URL 도 함께 반환"""
+        result = self.parse(html, url, admission_type, year)
+        return result, ([] if result else self._fragment_urls(html, url))
+
+    def _fragment_urls(self, html: str, url: str) -> list[str]:
+        """본문이 frame/iframe 으로 불러오는 조각 페이지 URL (같은 호스트만)"""
+        soup = BeautifulSoup(html, "lxml")
+        urls = []
+        for frame in soup.find_all(["iframe", "frame"]):
+            src = frame.get("src")
+            if not src or src.startswith(("javascript:", "about:")):
+                continue
+            fragment_url = urljoin(url, src)
+            if is_uway_url(fragment_url) and fragment_url not in urls:
+                urls.append(fragment_url)
+        return urls
@@ -1,6 +1,13 @@
+from contextlib import asynccontextmanager
+from typing import Callable, Generic, TypeVar
+
+from sqlalchemy import event, text
+from sqlalchemy.engine.interfaces import CacheStats
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy.orm import declarative_base
 from app.config import get_settings
+from app.metrics import DB_STATEMENT_CACHE_TOTAL
+from app.migrations import run_migrations
 
 settings = get_settings()
 
@@ -10,6 +17,27 @@ engine = create_async_engine(
     future=True
 )
 
+
+if engine.dialect.name == "sqlite" and settings.sqlite_wal:
+    @event.listens_for(engine.sync_engine, "connect")
+    def _enable_wal(dbapi_connection, connection_record):
+        """WAL 모드: 쓰기 중에도 조회가 막히지 않고, 조회 트랜잭션은 시작 시점 스냅샷을 유지"""
+        cursor = dbapi_connection.cursor()
+        cursor.execute("PRAGMA journal_mode=WAL")
+        cursor.close()
+
+
+# 컴파일 캐시 결과 -> 메트릭 라벨 (그 외: 캐시 대상이 아닌 문장)
+_CACHE_RESULTS = {CacheStats.CACHE_HIT: "hit", CacheStats.CACHE_MISS: "miss"}
+
+
+@event.listens_for(engine.sync_engine, "after_cursor_execute")
+def _record_statement_cache(conn, cursor, statement, parameters, context, executemany):
+    """SQL 컴파일 캐시 적중 여부 기록 (미리 만든 조회문이 캐시를 계속 맞히는지 확인용)"""
+    if context is not None and context.compiled is not None:
+        DB_STATEMENT_CACHE_TOTAL.labels(result=_CACHE_RESULTS.get(context.cache_hit, "uncached")).inc()
+
+
 async_session = async_sessionmaker(
     engine,
     class_=AsyncSession,
@@ -22,6 +50,7 @@ Base = declarative_base()
 async def init_db():
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(run_migrations)
 
 
 async def get_db():
@@ -30,3 +59,78 @@ async def get_db():
             yield session
         finally:
             await session.close()
+
+
+@asynccontextmanager
+async def snapshot_session():
+    """
+    조회 전용 세션 (요청 동안 같은 데이터 세대를 봄)
+
+    크롤링 사이클은 변경을 한 트랜잭션으로 게시하므로(app/services/generation.py),
+    요청 시작 시 읽기 트랜잭션을 열어 두면 요청 안의 모든 조회가 같은 세대를 봅니다.
+    SQLite(WAL)는 BEGIN 이후 첫 조회 시점의 스냅샷을 트랜잭션이 끝날 때까지 유지합니다.
+    """
+    async with async_session() as session:
+        if engine.dialect.name == "sqlite":
+            await session.execute(text("BEGIN"))
+        else:
+            await session.connection(execution_options={"isolation_level": "REPEATABLE READ"})
+        yield session
+
+
+async def get_snapshot_db():
+    """
+    조회 전용 세션 의존성 (snapshot_session)
+
+    동시 요청을 합치는 라우트(app/services/response_cache.py)는 의존성 대신
+    실제로 조회하는 요청 1개만 snapshot_session 을 엽니다.
+    """
+    async with snapshot_session() as session:
+        yield session
+
+
+# ============ 미리 만든 조회문 ============
+
+StatementT = TypeVar("StatementT")
+
+
+class StatementCache(Generic[StatementT]):
+    """
+    조회 조건 조합별로 한 번만 만드는 조회문
+
+    조건에 따라 where 를 붙이는 select() 를 요청마다 새로 만들면 SQLAlchemy 가 매 실행마다
+    문장 구조를 훑어 컴파일 캐시 키를 다시 계산합니다. 값은 bindparam 으로 두고
+    "어떤 조건이 있는지"(값이 None 이 아닌 파라미터 이름) 조합별로 문장을 한 번만 만들어 두면
+    캐시 키가 문장 객체에 기억되어 바로 컴파일 캐시를 찾습니다.
+
+    사용 예:
+        def build(filters: frozenset[str]):
+            stmt = select(University)
+            if "region" in filters:
+                stmt = stmt.where(University.region == bindparam("region"))
+            return stmt
+
+        universities_stmt = StatementCache(build)
+        params = {"region": region}
+        await db.execute(universities_stmt.get(params), universities_stmt.bind(params))
+    """
+
+    def __init__(self, build: Callable[[frozenset[str]], StatementT]):
+        self._build = build
+        self._statements: dict[frozenset[str], StatementT] = {}
+
+    def __len__(self) -> int:
+        return len(self._statements)
+
+    @staticmethod
+    def bind(params: dict) -> dict:
+        """실행 파라미터 (값이 None 인 조건 제외)"""
+        return {name: value for name, value in params.items() if value is not None}
+
+    def get(self, params: dict) -> StatementT:
+        """params 중 값이 있는 조건 조합의 조회문 (처음이면 만들어 보관)"""
+        filters = frozenset(name for name, value in params.items() if value is not None)
+        statement = self._statements.get(filters)
+        if statement is None:
+            statement = self._statements[filters] = self._build(filters)
+        return statement
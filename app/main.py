@@ -1,34 +1,32 @@
-from fastapi import FastAPI
+"""
+API 서버
+
+APP_MODE 에 따라 등록하는 라우터와 스케줄러가 달라집니다.
+- all: 조회 API + 크롤링 API + 스케줄러 (기본)
+- api: 조회 API 만 (크롤러/스케줄러 모듈을 불러오지 않아 빨리 시작)
+- crawler: 크롤링 API + 스케줄러
+크롤러 관련 모듈은 해당 모드에서만 함수 안에서 불러옵니다.
+API 서버와 분리된 크롤러 프로세스는 app/worker.py (python -m app.worker) 를 사용합니다.
+"""
+
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from contextlib import asynccontextmanager
-from apscheduler.schedulers.asyncio import AsyncIOScheduler
-from apscheduler.triggers.interval import IntervalTrigger
+from prometheus_client import generate_latest, CONTENT_TYPE_LATEST
 import logging
+import time
 
 from app.config import get_settings
 from app.database import init_db, async_session
-from app.api.routes import router
-from app.services.crawl_service import CrawlService
+from app.metrics import API_REQUEST_SECONDS
+from app.services.generation import generation_watcher
 
 settings = get_settings()
-scheduler = AsyncIOScheduler()
 logger = logging.getLogger(__name__)
 
-
-async def scheduled_crawl():
-    """스케줄된 크롤링 작업"""
-    logger.info("[Scheduler] Starting crawl...")
-    async with async_session() as db:
-        service = CrawlService(db)
-        try:
-            result = await service.crawl_all_universities(
-                admission_type="정시",
-                year=2026,
-                delay=1.0
-            )
-            logger.info(f"[Scheduler] Crawl completed: {result}")
-        except Exception as e:
-            logger.error(f"[Scheduler] Crawl failed: {e}")
+SERVES_API = settings.app_mode in ("all", "api")
+RUNS_CRAWLER = settings.app_mode in ("all", "crawler")
 
 
 @asynccontextmanager
@@ -39,21 +37,29 @@ async def lifespan(app: FastAPI):
     await init_db()
     logger.info("[App] Database initialized")
 
-    # 스케줄러 설정
-    scheduler.add_job(
-        scheduled_crawl,
-        trigger=IntervalTrigger(minutes=settings.crawl_interval_minutes),
-        id="crawl_job",
-        name="Competition Rate Crawl",
-        replace_existing=True
-    )
-    scheduler.start()
-    logger.info(f"[App] Scheduler started (interval: {settings.crawl_interval_minutes} min)")
+    if SERVES_API:
+        # 크롤러 워커(app/worker.py)가 게시한 새 데이터 세대 감지
+        await generation_watcher.start(async_session)
+    if RUNS_CRAWLER:
+        from app.scheduler import start_scheduler
+        from app.services.crawl_jobs import job_runner
+        await job_runner.start()
+        start_scheduler()
 
     yield
 
     # 종료 시
-    scheduler.shutdown()
+    await generation_watcher.stop()
+    if RUNS_CRAWLER:
+        from app.scheduler import stop_scheduler
+        from app.crawler.http_client import close_client
+        from app.services.crawl_jobs import job_runner
+        stop_scheduler()
+        await job_runner.stop()
+        await close_client()
+    if RUNS_CRAWLER and settings.browser_fallback_enabled:
+        from app.crawler.browser import close_browser
+        await close_browser()
     logger.info("[App] Application Rate API stopped")
 
 
@@ -84,8 +90,33 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# 라우터 등록
-app.include_router(router, prefix="/api/v1", tags=["Competition Rate API"])
+# 응답 압축: 캐시된 조회 응답은 라우트에서 br/gzip 압축본을 보내고 (app/services/response_cache.py)
+# 나머지 응답만 여기서 gzip 압축 (Content-Encoding 이 이미 있으면 통과)
+app.add_middleware(GZipMiddleware, minimum_size=settings.response_compress_min_bytes)
+
+
+@app.middleware("http")
+async def record_request_latency(request: Request, call_next):
+    """API 라우트별 응답 시간 기록"""
+    start = time.perf_counter()
+    response = await call_next(request)
+    # 경로 파라미터별로 시계열이 늘어나지 않도록 라우트 템플릿 사용
+    route = request.scope.get("route")
+    API_REQUEST_SECONDS.labels(
+        method=request.method,
+        route=route.path if route else "unmatched",
+        status=str(response.status_code)
+    ).observe(time.perf_counter() - start)
+    return response
+
+
+# 라우터 등록 (실행 모드별)
+if SERVES_API:
+    from app.api.routes import router
+    app.include_router(router, prefix="/api/v1", tags=["Competition Rate API"])
+if RUNS_CRAWLER:
+    from app.api.crawl_routes import router as crawl_router
+    app.include_router(crawl_router, prefix="/api/v1", tags=["Crawl API"])
 
 
 @app.get("/")
@@ -95,6 +126,7 @@ async def root():
         "name": "Competition Rate API",
         "version": "1.0.0",
         "status": "running",
+        "mode": settings.app_mode,
         "docs": "/docs"
     }
 
@@ -103,3 +135,9 @@ async def root():
 async def health_check():
     """헬스 체크"""
     return {"status": "healthy"}
+
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Prometheus 메트릭"""
+    return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
@@ -0,0 +1,245 @@
+"""
+Prometheus 메트릭
+
+- 크롤링 단계별 소요 시간 (connect/tls/ttfb/download/decode/parse/diff/validate/db_write, 대학별)
+- 품질 검사 격리 사유
+- 페이지 템플릿 캐시 적중 / 구조 변경
+- 크롤러 HTTP 클라이언트 상태 (진행 중 요청 수, 신규 연결 수, 응답 상태 코드)
+- 스케줄러 지연 (예정 시각 대비 실제 실행 시각)
+- API 라우트별 응답 시간
+- 조회 응답 캐시 적중 / 동시 요청 합치기 (데이터 세대별 직렬화/압축 결과)
+- SQL 컴파일 캐시 적중
+
+/metrics 엔드포인트(app/main.py)에서 노출합니다.
+"""
+
+import time
+from contextlib import contextmanager
+from typing import Optional
+from urllib.parse import urlparse
+from prometheus_client import Counter, Gauge, Histogram
+
+# 크롤링 단계 버킷: 수 ms ~ 30s
+STAGE_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+CRAWL_STAGE_SECONDS = Histogram(
+    "crawl_stage_seconds",
+    "크롤링 단계별 소요 시간",
+    ["stage", "university"],
+    buckets=STAGE_BUCKETS,
+)
+
+CRAWL_CYCLE_SECONDS = Histogram(
+    "crawl_cycle_seconds",
+    "전체 크롤링 사이클 소요 시간",
+    buckets=(1, 5, 10, 30, 60, 120, 300, 600, 1200),
+)
+
+CRAWL_RESULTS_TOTAL = Counter(
+    "crawl_results_total",
+    "대학별 크롤링 결과 수",
+    ["status"],
+)
+
+CRAWL_QUALITY_REJECTIONS_TOTAL = Counter(
+    "crawl_quality_rejections_total",
+    "품질 검사로 격리된 크롤링 결과 수 (row_drop/apply_decrease/zero_flood)",
+    ["reason"],
+)
+
+CRAWL_TEMPLATE_TOTAL = Counter(
+    "crawl_template_total",
+    "페이지 템플릿 캐시 조회 결과 (hit/learned/changed)",
+    ["result"],
+)
+
+HTTP_INFLIGHT_REQUESTS = Gauge(
+    "crawler_http_inflight_requests",
+    "크롤러 HTTP 진행 중 요청 수",
+    ["host"],
+)
+
+HTTP_CONNECTIONS_OPENED = Counter(
+    "crawler_http_connections_opened_total",
+    "크롤러 HTTP 신규 연결 수",
+    ["host"],
+)
+
+HTTP_RESPONSES_TOTAL = Counter(
+    "crawler_http_responses_total",
+    "크롤러 HTTP 응답 수",
+    ["host", "status"],
+)
+
+CRAWL_HTTP_RETRIES_TOTAL = Counter(
+    "crawler_http_retries_total",
+    "크롤러 HTTP 재시도 수 (reason: 상태 코드 또는 오류 종류)",
+    ["host", "reason"],
+)
+
+CRAWL_BREAKER_STATE = Gauge(
+    "crawler_breaker_state",
+    "호스트별 서킷 상태 (0=closed, 1=half_open, 2=open)",
+    ["host"],
+)
+
+CRAWL_BREAKER_REJECTIONS_TOTAL = Counter(
+    "crawler_breaker_rejections_total",
+    "서킷이 열려 보내지 않은 요청 수",
+    ["host"],
+)
+
+CRAWL_CONCURRENCY_WINDOW = Gauge(
+    "crawler_concurrency_window",
+    "호스트별 적응형 동시 요청 수 (AIMD 창 크기)",
+    ["host"],
+)
+
+CRAWL_CONCURRENCY_DECREASES_TOTAL = Counter(
+    "crawler_concurrency_decreases_total",
+    "동시 요청 수 감소 횟수 (reason: error/latency)",
+    ["host", "reason"],
+)
+
+CRAWL_PIPELINE_QUEUE_DEPTH = Gauge(
+    "crawl_pipeline_queue_depth",
+    "크롤링 파이프라인 단계별 입력 큐 깊이",
+    ["stage"],
+)
+
+CRAWL_PIPELINE_ITEMS_TOTAL = Counter(
+    "crawl_pipeline_items_total",
+    "크롤링 파이프라인 단계별 처리 대학 수 (rate 로 단계별 처리량)",
+    ["stage"],
+)
+
+CRAWL_PIPELINE_BACKPRESSURE_SECONDS = Counter(
+    "crawl_pipeline_backpressure_seconds_total",
+    "다음 단계 큐가 가득 차 기다린 시간 (stage: 기다린 큐)",
+    ["stage"],
+)
+
+SCHEDULER_LAG_SECONDS = Histogram(
+    "scheduler_lag_seconds",
+    "스케줄 예정 시각 대비 실행 지연",
+    ["job"],
+    buckets=(0.01, 0.05, 0.1, 0.5, 1, 5, 10, 30, 60),
+)
+
+API_REQUEST_SECONDS = Histogram(
+    "api_request_seconds",
+    "API 라우트별 응답 시간",
+    ["method", "route", "status"],
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+)
+
+API_RESPONSE_CACHE_TOTAL = Counter(
+    "api_response_cache_total",
+    "조회 응답 캐시 결과 (hit/miss/coalesced: 진행 중인 조회를 함께 기다림/bypass: 세대 0 이라 캐시 안 함)",
+    ["route", "result"],
+)
+
+DB_STATEMENT_CACHE_TOTAL = Counter(
+    "db_statement_cache_total",
+    "SQL 컴파일 캐시 결과 (hit/miss/uncached)",
+    ["result"],
+)
+
+# httpcore trace 이벤트 → 단계명
+# (DNS 조회는 httpcore connect_tcp 내부에서 수행되므로 connect 에 포함)
+_TRACE_STAGES = {
+    "connect_tcp": "connect",
+    "start_tls": "tls",
+    "receive_response_headers": "ttfb",
+    "receive_response_body": "download",
+}
+
+
+class StageTimer:
+    """
+    크롤링 단계별 소요 시간 기록기 (대학 단위)
+
+    사용 예:
+        timer = StageTimer("10030321")
+        with timer.stage("parse"):
+            ...
+        timer.stages  # {"parse": 0.012, ...}
+    """
+
+    def __init__(self, university: str):
+        self.university = university
+        self.host: Optional[str] = None  # track_http_request 에서 설정
+        self.stages: dict[str, float] = {}
+        self._trace_started: dict[str, float] = {}
+        self._ttfb_started: Optional[float] = None
+
+    def record(self, stage: str, seconds: float):
+        """단계 소요 시간 누적 및 히스토그램 기록"""
+        self.stages[stage] = self.stages.get(stage, 0.0) + seconds
+        CRAWL_STAGE_SECONDS.labels(stage=stage, university=self.university).observe(seconds)
+
+    @contextmanager
+    def stage(self, name: str):
+        """with 블록 소요 시간을 name 단계로 기록"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    async def trace(self, event_name: str, info: dict):
+        """
+        httpx trace 확장 콜백
+
+        client.get(url, extensions={"trace": timer.trace}) 로 전달하면
+        connect / tls / ttfb / download 단계를 기록합니다.
+        """
+        # 예: "connection.connect_tcp.started", "http11.receive_response_body.complete"
+        _, _, rest = event_name.partition(".")
+        step, _, phase = rest.rpartition(".")
+        now = time.perf_counter()
+
+        if step in ("send_request_headers", "send_request_body") and phase == "started":
+            if self._ttfb_started is None:
+                self._ttfb_started = now
+            return
+
+        stage = _TRACE_STAGES.get(step)
+        if not stage:
+            return
+
+        if step == "receive_response_headers":
+            if phase == "complete" and self._ttfb_started is not None:
+                self.record(stage, now - self._ttfb_started)
+                self._ttfb_started = None
+            return
+
+        if phase == "started":
+            self._trace_started[step] = now
+        elif phase == "complete" and step in self._trace_started:
+            self.record(stage, now - self._trace_started.pop(step))
+            if step == "connect_tcp" and self.host:
+                record_connection_opened(self.host)
+
+    def summary(self) -> str:
+        """로그 메시지용 단계 요약 (예: 'connect 0.05s, ttfb 0.31s')"""
+        return ", ".join(f"{name} {seconds:.2f}s" for name, seconds in self.stages.items())
+
+
+@contextmanager
+def track_http_request(url: str):
+    """크롤러 HTTP 요청 진행 중 상태 기록"""
+    host = urlparse(url).hostname or "unknown"
+    HTTP_INFLIGHT_REQUESTS.labels(host=host).inc()
+    try:
+        yield host
+    finally:
+        HTTP_INFLIGHT_REQUESTS.labels(host=host).dec()
+
+
+def record_http_response(host: str, status_code: int):
+    HTTP_RESPONSES_TOTAL.labels(host=host, status=str(status_code)).inc()
+
+
+def record_connection_opened(host: str):
+    HTTP_CONNECTIONS_OPENED.labels(host=host).inc()
@@ -0,0 +1,232 @@
+"""
+경량 스키마 마이그레이션
+
+Alembic 없이 schema_migrations 테이블에 적용된 버전을 기록하고,
+아직 적용되지 않은 마이그레이션만 순서대로 실행합니다.
+
+- 테이블 생성은 기존처럼 Base.metadata.create_all 이 담당
+- 기존 DB에 필요한 컬럼 추가 / 인덱스 생성은 여기서 버전 단위로 관리
+- 인덱스는 CREATE INDEX IF NOT EXISTS 로 생성하므로 서비스 중에도 안전하게 적용
+"""
+
+from dataclasses import dataclass
+from typing import Callable, Collection, Optional
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+
+
+@dataclass(frozen=True)
+class Migration:
+    """단일 마이그레이션 정의"""
+    version: int
+    description: str
+    statements: tuple[str, ...] = ()
+    apply: Optional[Callable[[Connection], None]] = None
+
+
+def _column_names(conn: Connection, table: str) -> set[str]:
+    """테이블 컬럼명 조회 (SQLite PRAGMA)"""
+    result = conn.execute(text(f"PRAGMA table_info({table})"))
+    return {row[1] for row in result.fetchall()}
+
+
+def _add_column_if_not_exists(conn: Connection, table: str, column: str, ddl_type: str):
+    """컬럼이 없으면 추가"""
+    if column not in _column_names(conn, table):
+        conn.execute(text(f"ALTER TABLE {table} ADD COLUMN {column} {ddl_type}"))
+
+
+def _add_department_extra_columns(conn: Connection):
+    """추가모집/실질경쟁률 컬럼 (기존 import_excel_data.add_columns_if_not_exist)"""
+    _add_column_if_not_exists(conn, "departments", "additional_recruit", "INTEGER")
+    _add_column_if_not_exists(conn, "departments", "actual_competition_rate", "FLOAT")
+
+
+def _add_ratio_history_apply_delta(conn: Connection):
+    """이력 지원인원 변동량 컬럼"""
+    _add_column_if_not_exists(conn, "ratio_history", "apply_delta", "INTEGER")
+
+
+def _add_admission_gun(conn: Connection):
+    """전형 모집군 컬럼"""
+    _add_column_if_not_exists(conn, "admissions", "gun", "VARCHAR(10)")
+
+
+def _add_crawl_job_item_lease(conn: Connection):
+    """크롤링 작업 항목 노드 lease 컬럼"""
+    _add_column_if_not_exists(conn, "crawl_job_items", "owner", "VARCHAR(100)")
+    _add_column_if_not_exists(conn, "crawl_job_items", "lease_until", "DATETIME")
+
+
+def _add_admission_page_code(conn: Connection):
+    """전형 경쟁률 페이지 코드 컬럼"""
+    _add_column_if_not_exists(conn, "admissions", "page_code", "VARCHAR(20)")
+
+
+def _add_department_removed_at(conn: Connection):
+    """학과 삭제 표시 컬럼 (statements 는 apply 보다 먼저 실행되므로 인덱스도 컬럼 추가 뒤 여기서 생성)"""
+    _add_column_if_not_exists(conn, "departments", "removed_at", "DATETIME")
+    # 현재 모집단위(removed_at IS NULL)만 보는 통계 집계 / 경쟁률 상위·범위 검색
+    conn.execute(text(
+        "CREATE INDEX IF NOT EXISTS ix_department_removed_rate "
+        "ON departments (removed_at, competition_rate)"
+    ))
+
+
+# 버전 순서대로 나열 (이미 배포된 항목은 수정하지 말고 새 버전을 추가할 것)
+MIGRATIONS: list[Migration] = [
+    Migration(
+        version=1,
+        description="departments: additional_recruit, actual_competition_rate 컬럼 추가",
+        apply=_add_department_extra_columns,
+    ),
+    Migration(
+        version=2,
+        description="핫 쿼리 경로 인덱스 생성",
+        statements=(
+            # 크롤링 저장 시 학과 upsert 조회
+            "CREATE INDEX IF NOT EXISTS ix_department_admission_name_campus "
+            "ON departments (admission_id, name, campus)",
+            # 경쟁률 상위 학과 / 경쟁률 범위 검색
+            "CREATE INDEX IF NOT EXISTS ix_department_competition_rate "
+            "ON departments (competition_rate)",
+            # 학과별 경쟁률 변동 이력
+            "CREATE INDEX IF NOT EXISTS ix_ratio_history_department_recorded "
+            "ON ratio_history (department_id, recorded_at)",
+            # 상태별 최근 크롤링 로그
+            "CREATE INDEX IF NOT EXISTS ix_crawl_log_status_crawled "
+            "ON crawl_logs (status, crawled_at)",
+            # 대학 목록 / 경쟁률 검색 정렬
+            "CREATE INDEX IF NOT EXISTS ix_university_name "
+            "ON universities (name)",
+        ),
+    ),
+    Migration(
+        version=3,
+        description="ratio_history: apply_delta 컬럼 추가",
+        apply=_add_ratio_history_apply_delta,
+    ),
+    Migration(
+        version=4,
+        description="admissions: gun 컬럼 추가",
+        apply=_add_admission_gun,
+    ),
+    Migration(
+        version=5,
+        description="정리 데이터셋 버전 조회 인덱스",
+        statements=(
+            # /organized 데이터 버전 (대학 수 + 마지막 갱신 시각)
+            "CREATE INDEX IF NOT EXISTS ix_university_updated_at "
+            "ON universities (updated_at)",
+        ),
+    ),
+    Migration(
+        version=6,
+        description="크롤링 작업 분산 실행 (항목 lease 컬럼, 작업 중복 확인 인덱스)",
+        statements=(
+            # 같은 작업의 최근 실행 조회 (스케줄러 중복 방지)
+            "CREATE INDEX IF NOT EXISTS ix_crawl_job_dedupe_key "
+            "ON crawl_jobs (dedupe_key, id)",
+        ),
+        apply=_add_crawl_job_item_lease,
+    ),
+    Migration(
+        version=7,
+        description="admissions: page_code 컬럼 추가 (다중 페이지 대학의 페이지별 삭제 판정)",
+        apply=_add_admission_page_code,
+    ),
+    Migration(
+        version=8,
+        description="departments: removed_at 컬럼 추가 (사라진 학과는 이력과 함께 남기고 삭제 표시)",
+        apply=_add_department_removed_at,
+    ),
+    Migration(
+        version=9,
+        description="지역별 대학 목록 인덱스",
+        statements=(
+            # /universities?region= (지역 조건 + 이름순, ix_university_name 전체 순회 대신)
+            "CREATE INDEX IF NOT EXISTS ix_university_region_name "
+            "ON universities (region, name)",
+        ),
+    ),
+]
+
+
+def _ensure_version_table(conn: Connection):
+    conn.execute(text(
+        "CREATE TABLE IF NOT EXISTS schema_migrations ("
+        "version INTEGER PRIMARY KEY, "
+        "description VARCHAR(200), "
+        "applied_at DATETIME DEFAULT CURRENT_TIMESTAMP)"
+    ))
+
+
+def get_applied_versions(conn: Connection) -> set[int]:
+    """적용된 마이그레이션 버전 목록"""
+    _ensure_version_table(conn)
+    result = conn.execute(text("SELECT version FROM schema_migrations"))
+    return {row[0] for row in result.fetchall()}
+
+
+def run_migrations(conn: Connection, migrations: Optional[list[Migration]] = None) -> list[int]:
+    """
+    미적용 마이그레이션 실행
+
+    Args:
+        conn: 동기 Connection (AsyncConnection.run_sync 로 호출)
+        migrations: 실행할 마이그레이션 목록 (기본: MIGRATIONS)
+
+    Returns:
+        이번에 적용된 버전 목록
+    """
+    migrations = migrations if migrations is not None else MIGRATIONS
+    applied = get_applied_versions(conn)
+    newly_applied = []
+
+    for migration in sorted(migrations, key=lambda m: m.version):
+        if migration.version in applied:
+            continue
+
+        for statement in migration.statements:
+            conn.execute(text(statement))
+        if migration.apply:
+            migration.apply(conn)
+
+        conn.execute(
+            text("INSERT INTO schema_migrations (version, description) VALUES (:version, :description)"),
+            {"version": migration.version, "description": migration.description}
+        )
+        newly_applied.append(migration.version)
+
+    return newly_applied
+
+
+# ============ 쿼리 플랜 검사 ============
+
+def explain_query_plan(conn: Connection, statement: str, parameters=None) -> list[str]:
+    """EXPLAIN QUERY PLAN 결과의 detail 컬럼 목록"""
+    cursor = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters or ())
+    return [row[-1] for row in cursor.fetchall()]
+
+
+def find_unindexed_scans(plan: list[str], allowed_indexes: Collection[str] = ()) -> list[str]:
+    """
+    인덱스로 범위를 좁히지 못하는 테이블 풀스캔 단계 추출
+
+    SEARCH 단계는 항상 인덱스로 범위를 좁힙니다. SCAN 단계는
+    - 'USING COVERING INDEX': 테이블 행을 읽지 않는 인덱스 순회라 허용
+    - 'USING INDEX x': 인덱스 전체를 순회하며 행마다 테이블을 다시 읽는 풀스캔.
+      정렬 순서를 얻으려고 일부러 인덱스 순서로 읽는 경우만 allowed_indexes 에 넣어 허용
+    - 그 외: 인덱스 없는 풀스캔
+    """
+    scans = []
+    for detail in plan:
+        if not detail.startswith("SCAN ") or detail.startswith("SCAN CONSTANT ROW"):
+            continue
+        if "USING COVERING INDEX" in detail:
+            continue
+        index = detail.split("USING INDEX ", 1)[1].split()[0] if "USING INDEX " in detail else None
+        if index is not None and index in allowed_indexes:
+            continue
+        scans.append(detail)
+    return scans
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, UniqueConstraint, Index
+from sqlalchemy import Column, Integer, String, Float, DateTime, Boolean, ForeignKey, UniqueConstraint, Index, Text, text
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.database import Base
@@ -20,6 +20,12 @@ class University(Base):
     # Relationships
     admissions = relationship("Admission", back_populates="university", cascade="all, delete-orphan")
 
+    __table_args__ = (
+        Index('ix_university_name', 'name'),
+        Index('ix_university_updated_at', 'updated_at'),
+        Index('ix_university_region_name', 'region', 'name'),
+    )
+
 
 class Admission(Base):
     """전형 정보"""
@@ -29,7 +35,9 @@ class Admission(Base):
     university_id = Column(Integer, ForeignKey("universities.id"), nullable=False)
     admission_type = Column(String(20), nullable=False)  # 수시/정시/편입
     admission_name = Column(String(200), nullable=False)  # 전형명
+    gun = Column(String(10))  # 가군/나군/다군 (없으면 NULL)
     year = Column(Integer, nullable=False)  # 학년도 (예: 2026)
+    page_code = Column(String(20))  # 경쟁률 페이지 코드 (여러 페이지로 나뉜 대학, 기존 데이터는 NULL)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
     # Relationships
@@ -56,6 +64,7 @@ class Department(Base):
     competition_rate = Column(Float, default=0.0)  # 경쟁률
     additional_recruit = Column(Integer, nullable=True)  # 추가모집(충원합격순위)
     actual_competition_rate = Column(Float, nullable=True)  # 실질경쟁률
+    removed_at = Column(DateTime(timezone=True), nullable=True)  # 크롤링 결과에서 사라진 시각 (NULL 이면 현재 모집단위)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
@@ -65,6 +74,9 @@ class Department(Base):
 
     __table_args__ = (
         Index('ix_department_name', 'name'),
+        Index('ix_department_admission_name_campus', 'admission_id', 'name', 'campus'),
+        Index('ix_department_competition_rate', 'competition_rate'),
+        Index('ix_department_removed_rate', 'removed_at', 'competition_rate'),
     )
 
 
@@ -77,11 +89,16 @@ class RatioHistory(Base):
     recruit_count = Column(Integer, default=0)
     apply_count = Column(Integer, default=0)
     competition_rate = Column(Float, default=0.0)
+    apply_delta = Column(Integer, default=0)  # 직전 이력 대비 지원인원 변동
     recorded_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
 
     # Relationships
     department = relationship("Department", back_populates="history")
 
+    __table_args__ = (
+        Index('ix_ratio_history_department_recorded', 'department_id', 'recorded_at'),
+    )
+
 
 class CrawlLog(Base):
     """크롤링 로그"""
@@ -93,3 +110,131 @@ class CrawlLog(Base):
     message = Column(String(500))
     duration_seconds = Column(Float)
     crawled_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
+
+    __table_args__ = (
+        Index('ix_crawl_log_status_crawled', 'status', 'crawled_at'),
+    )
+
+
+class CrawlQuarantine(Base):
+    """
+    품질 검사로 격리된 크롤링 결과 (페이지당 1행, app/services/quality_gate.py)
+
+    API 서버와 크롤러 워커/노드가 같은 격리 목록과 연속 격리 횟수를 보도록 DB에 둡니다.
+    """
+    __tablename__ = "crawl_quarantine"
+
+    id = Column(Integer, primary_key=True)
+    page_code = Column(String(20), unique=True, nullable=False)  # 경쟁률 페이지 코드
+    university_name = Column(String(100))
+    reasons = Column(Text)  # 위반 항목 -> 설명 (JSON)
+    previous_rows = Column(Integer, default=0)
+    count = Column(Integer, default=1)  # 연속 격리 횟수
+    ratio_data = Column(Text, nullable=False)  # 크롤링 결과 (JSON, 수동 반영용)
+    first_at = Column(DateTime)
+    last_at = Column(DateTime, index=True)
+
+
+class CrawlCycle(Base):
+    """크롤링 사이클 요약 (사이클당 1행, /crawl/status 와 로그 보존 정책의 집계본)"""
+    __tablename__ = "crawl_cycles"
+
+    id = Column(Integer, primary_key=True)
+    started_at = Column(DateTime(timezone=True))
+    finished_at = Column(DateTime(timezone=True))
+    duration_seconds = Column(Float)
+    total = Column(Integer, default=0)
+    success = Column(Integer, default=0)
+    failed = Column(Integer, default=0)
+    skipped = Column(Integer, default=0)
+    quarantined = Column(Integer, default=0)
+    deferred = Column(Integer, default=0)
+    generation_id = Column(Integer)  # 게시한 데이터 세대 (변경 없으면 NULL)
+    valid = Column(Boolean, default=False)  # 사이클 검증 통과 여부
+    message = Column(String(500))
+    total_universities = Column(Integer, default=0)  # 사이클 종료 시점 DB 전체 대학 수
+    total_departments = Column(Integer, default=0)
+
+
+class DataGeneration(Base):
+    """데이터 세대 (크롤링 사이클 1회분 변경을 한 트랜잭션으로 게시한 기록, 최신 id 가 현재 세대)"""
+    __tablename__ = "data_generations"
+
+    id = Column(Integer, primary_key=True)
+    universities = Column(Integer, default=0)  # 변경된 대학 수
+    departments = Column(Integer, default=0)  # 변경된 모집단위 수
+    published_at = Column(DateTime(timezone=True), server_default=func.now())
+
+
+class CrawlJob(Base):
+    """
+    크롤링 작업 (API/스케줄러가 넣고 크롤러 프로세스의 JobRunner 가 처리, app/services/crawl_jobs.py)
+
+    같은 dedupe_key 의 대기/실행 중 작업은 하나만 존재합니다 (부분 UNIQUE 인덱스).
+    """
+    __tablename__ = "crawl_jobs"
+
+    id = Column(Integer, primary_key=True)
+    kind = Column(String(20), nullable=False)  # all / university / smartratio
+    admission_type = Column(String(20), nullable=False)
+    year = Column(Integer, nullable=False)
+    url = Column(String(500))  # university 작업의 경쟁률 페이지 URL
+    delay = Column(Float, default=0.0)  # 요청 작업자별 대학 사이 대기 시간 (초)
+    dedupe_key = Column(String(600), nullable=False)
+    status = Column(String(20), nullable=False, default="pending")  # pending/running/done/failed
+    owner = Column(String(100))  # 실행 중인 프로세스 (호스트:pid)
+    attempts = Column(Integer, default=0)  # 실행(재개 포함) 횟수
+    total = Column(Integer, default=0)
+    success = Column(Integer, default=0)
+    failed = Column(Integer, default=0)
+    skipped = Column(Integer, default=0)
+    quarantined = Column(Integer, default=0)
+    generation_id = Column(Integer)  # 마지막으로 게시한 데이터 세대
+    message = Column(String(500))
+    created_at = Column(DateTime(timezone=True))
+    started_at = Column(DateTime(timezone=True))
+    heartbeat_at = Column(DateTime(timezone=True))
+    finished_at = Column(DateTime(timezone=True))
+
+    items = relationship("CrawlJobItem", back_populates="job", cascade="all, delete-orphan")
+
+    __table_args__ = (
+        Index(
+            'uq_crawl_job_active', 'dedupe_key',
+            unique=True,
+            sqlite_where=text("status IN ('pending', 'running')"),
+            postgresql_where=text("status IN ('pending', 'running')")
+        ),
+        Index('ix_crawl_job_status', 'status', 'id'),
+        Index('ix_crawl_job_dedupe_key', 'dedupe_key', 'id'),
+    )
+
+
+class CrawlJobItem(Base):
+    """크롤링 작업의 대학 1곳 (게시까지 끝난 항목은 재개 시 건너뜀, 노드 간에는 lease 로 한 곳만 크롤링)"""
+    __tablename__ = "crawl_job_items"
+
+    id = Column(Integer, primary_key=True)
+    job_id = Column(Integer, ForeignKey("crawl_jobs.id"), nullable=False)
+    university_code = Column(String(20))
+    name = Column(String(100))
+    ratio_url = Column(String(500))
+    status = Column(String(20), nullable=False, default="pending")  # pending/success/failed/skipped/quarantined
+    owner = Column(String(100))  # 맡은 크롤러 노드 (끝난 뒤에도 남겨 분배 확인용)
+    lease_until = Column(DateTime(timezone=True))  # 이 시각까지 owner 만 크롤링 (노드가 죽으면 만료 후 재배정)
+    updated_at = Column(DateTime(timezone=True))
+
+    job = relationship("CrawlJob", back_populates="items")
+
+    __table_args__ = (
+        Index('ix_crawl_job_item_job_status', 'job_id', 'status'),
+    )
+
+
+class CrawlWorker(Base):
+    """크롤러 노드 (작업 실행기 생존 신호, 살아 있는 노드끼리 해시 링으로 대학을 나눔)"""
+    __tablename__ = "crawl_workers"
+
+    node_id = Column(String(100), primary_key=True)  # 호스트:pid
+    started_at = Column(DateTime(timezone=True))
+    heartbeat_at = Column(DateTime(timezone=True), index=True)
@@ -0,0 +1,125 @@
+"""
+크롤링 스케줄러
+
+크롤러 워커(app/worker.py)와 APP_MODE=all/crawler 인 API 서버가 함께 사용합니다.
+- crawl_job: crawl_interval_minutes 마다 전체 크롤링 작업을 작업 큐에 넣고 실행
+  (한 세대로 게시 → (선택) 샤드 내보내기, app/services/crawl_jobs.py)
+- history_compaction_job: 경쟁률 이력 보존 정책 적용
+- crawl_log_retention_job: 크롤링 로그/사이클 요약 보존 정책 적용
+"""
+
+import logging
+from datetime import datetime
+from typing import Optional
+
+from apscheduler.events import EVENT_JOB_SUBMITTED
+from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from apscheduler.triggers.interval import IntervalTrigger
+
+from app.config import get_settings
+from app.database import async_session
+from app.metrics import SCHEDULER_LAG_SECONDS
+from app.services.crawl_log import apply_log_retention
+from app.services.crawl_jobs import enqueue_job, job_runner
+from app.services.history_writer import compact_history
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+scheduler: Optional[AsyncIOScheduler] = None
+
+
+async def scheduled_crawl():
+    """
+    스케줄된 크롤링 작업
+
+    작업 큐에 전체 크롤링 작업을 넣고 (API 로 넣은 같은 작업이 대기/실행 중이면 그 작업을 씀)
+    이 프로세스에서 가져갈 수 있는 작업을 실행합니다. 샤드 내보내기는 작업 실행기가 합니다.
+    """
+    logger.info("[Scheduler] Starting crawl...")
+    try:
+        async with async_session() as db:
+            # 크롤러 노드마다 스케줄러가 돌므로, 다른 노드가 이번 주기에 이미 넣은 작업이 있으면 그대로 씀
+            job, created = await enqueue_job(
+                db, "all", admission_type="정시", year=2026,
+                min_interval=settings.crawl_interval_minutes * 60 * 0.9
+            )
+        logger.info(f"[Scheduler] Crawl job {job.id} {'queued' if created else 'already queued'}")
+        await job_runner.run_pending()
+    except Exception as e:
+        logger.error(f"[Scheduler] Crawl failed: {e}")
+
+
+async def scheduled_history_compaction():
+    """경쟁률 이력 보존 정책 적용"""
+    async with async_session() as db:
+        try:
+            stats = await compact_history(db)
+            logger.info(f"[Scheduler] History compaction completed: {stats}")
+        except Exception as e:
+            logger.error(f"[Scheduler] History compaction failed: {e}")
+
+
+async def scheduled_log_retention():
+    """크롤링 로그 보존 정책 적용"""
+    async with async_session() as db:
+        try:
+            stats = await apply_log_retention(db)
+            logger.info(f"[Scheduler] Crawl log retention completed: {stats}")
+        except Exception as e:
+            logger.error(f"[Scheduler] Crawl log retention failed: {e}")
+
+
+def record_scheduler_lag(event):
+    """스케줄 예정 시각 대비 실제 제출 시각 지연 기록"""
+    for scheduled_time in event.scheduled_run_times:
+        lag = (datetime.now(scheduled_time.tzinfo) - scheduled_time).total_seconds()
+        SCHEDULER_LAG_SECONDS.labels(job=event.job_id).observe(max(lag, 0.0))
+
+
+def start_scheduler(run_now: bool = False) -> AsyncIOScheduler:
+    """
+    크롤링 / 이력 정리 스케줄러 시작
+
+    Args:
+        run_now: 첫 크롤링을 주기를 기다리지 않고 바로 실행 (워커 시작 시)
+    """
+    global scheduler
+    scheduler = AsyncIOScheduler()
+    # next_run_time=None 은 일시정지를 뜻하므로 바로 실행할 때만 지정
+    first_run = {"next_run_time": datetime.now()} if run_now else {}
+    scheduler.add_job(
+        scheduled_crawl,
+        trigger=IntervalTrigger(minutes=settings.crawl_interval_minutes),
+        id="crawl_job",
+        name="Competition Rate Crawl",
+        replace_existing=True,
+        max_instances=1,
+        **first_run
+    )
+    scheduler.add_job(
+        scheduled_history_compaction,
+        trigger=IntervalTrigger(minutes=settings.history_compaction_interval_minutes),
+        id="history_compaction_job",
+        name="Ratio History Compaction",
+        replace_existing=True
+    )
+    scheduler.add_job(
+        scheduled_log_retention,
+        trigger=IntervalTrigger(minutes=settings.crawl_log_retention_interval_minutes),
+        id="crawl_log_retention_job",
+        name="Crawl Log Retention",
+        replace_existing=True
+    )
+    scheduler.add_listener(record_scheduler_lag, EVENT_JOB_SUBMITTED)
+    scheduler.start()
+    logger.info(f"[Scheduler] Started (interval: {settings.crawl_interval_minutes} min)")
+    return scheduler
+
+
+def stop_scheduler(wait: bool = False):
+    """스케줄러 종료 (wait=True 면 실행 중인 크롤링이 끝날 때까지 대기)"""
+    global scheduler
+    if scheduler:
+        scheduler.shutdown(wait=wait)
+        scheduler = None
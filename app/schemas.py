@@ -56,6 +56,7 @@ class AdmissionBase(BaseModel):
     admission_type: str
     admission_name: str
     year: int
+    gun: Optional[str] = None
 
 
 class AdmissionCreate(AdmissionBase):
@@ -79,6 +80,7 @@ class RatioHistoryResponse(BaseModel):
     recruit_count: int
     apply_count: int
     competition_rate: float
+    apply_delta: Optional[int] = None
     recorded_at: datetime
 
     class Config:
@@ -0,0 +1,647 @@
+"""
+크롤링 작업 큐 (DB 테이블 기반, 재시작 후 재개)
+
+크롤링 API/스케줄러는 작업을 crawl_jobs 에 넣고 바로 응답하며, 실제 크롤링은
+크롤러 프로세스(APP_MODE=all/crawler 의 API 서버, app/worker.py)의 JobRunner 가 합니다.
+
+- 작업 ID: 넣을 때 받은 id 로 /crawl/jobs/{id} 에서 진행 상황 조회
+- 중복 제거: 같은 종류/전형/학년도/URL 의 대기·실행 중 작업은 하나뿐 (부분 UNIQUE 인덱스),
+  같은 요청이 다시 오면 기존 작업을 돌려줌
+- 대학별 항목: 작업을 처음 실행할 때 대학 목록을 crawl_job_items 로 펼치고,
+  데이터 세대 게시가 끝난 대학만 결과 상태로 바꿈
+- 재개: 실행 중인 프로세스는 crawl_job_heartbeat_seconds 마다 생존 신호를 남기고,
+  crawl_job_lease_seconds 동안 끊기면 (프로세스 종료 등) 다른 프로세스나 재시작한 프로세스가
+  작업을 가져가 아직 pending 인 대학만 이어서 크롤링합니다. 정상 종료 시에는 바로 반납합니다.
+- 분산 실행: 크롤러 노드 여러 대가 같은 작업에 참여하면 살아 있는 노드의 해시 링으로
+  대학 코드를 나누고, 대학마다 lease 를 잡아 클러스터 전체에서 페이지를 한 번만 크롤링합니다
+  (JobRunner 참고). 노드마다 자기 몫을 한 세대로 게시하고, 마지막 노드가 작업 전체 집계로
+  사이클 검증/요약을 기록합니다.
+- 작업은 노드당 하나씩 순서대로 실행합니다 (SQLite 쓰기 경합 방지).
+
+사이클 시간 예산(crawl_cycle_budget_seconds)이 끝나 미룬 대학은 pending 으로 남고,
+같은 작업 안에서 다음 라운드(새 세대)로 이어서 크롤링합니다.
+"""
+
+import asyncio
+import logging
+import os
+import socket
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from sqlalchemy import and_, delete, func, insert, or_, select, update
+from sqlalchemy.engine import Row
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import get_settings
+from app.crawler.ratio_crawler import page_code, university_key
+from app.crawler.university_list import UniversityInfo
+from app.database import async_session
+from app.models import CrawlJob, CrawlJobItem, CrawlWorker
+from app.services.crawl_service import CrawlService
+from app.services.hash_ring import HashRing
+from app.services.shard_export import export_shards
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+JOB_KINDS = ("all", "university", "smartratio")
+
+PENDING = "pending"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+ACTIVE_STATUSES = (PENDING, RUNNING)
+
+# 작업/항목 결과 집계 컬럼 (CrawlPipeline.results 키와 같음)
+COUNTERS = ("success", "failed", "skipped", "quarantined")
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def dedupe_key(kind: str, admission_type: str, year: int, url: Optional[str] = None) -> str:
+    """같은 작업 판별 키 (요청 간 딜레이 등 실행 옵션은 제외)"""
+    return f"{kind}:{admission_type}:{year}:{url or ''}"
+
+
+# ============ 작업 넣기 / 조회 ============
+
+async def _active_job(db: AsyncSession, key: str) -> Optional[CrawlJob]:
+    return (
+        await db.execute(
+            select(CrawlJob).where(CrawlJob.dedupe_key == key, CrawlJob.status.in_(ACTIVE_STATUSES))
+        )
+    ).scalar_one_or_none()
+
+
+async def enqueue_job(
+    db: AsyncSession,
+    kind: str,
+    admission_type: str = "정시",
+    year: int = 2026,
+    url: Optional[str] = None,
+    delay: float = 0.0,
+    min_interval: float = 0.0
+) -> tuple[CrawlJob, bool]:
+    """
+    크롤링 작업 넣기
+
+    Args:
+        min_interval: 같은 작업을 이 시간(초) 안에 이미 넣었으면 새로 넣지 않음
+            (노드마다 도는 스케줄러가 사이클마다 한 번만 넣도록)
+
+    Returns:
+        (작업, 새로 만들었는지) - 같은 작업이 대기/실행 중이거나 min_interval 안에 넣었으면 그 작업과 False
+    """
+    if kind not in JOB_KINDS:
+        raise ValueError(f"알 수 없는 작업 종류: {kind}")
+
+    key = dedupe_key(kind, admission_type, year, url)
+    existing = await _active_job(db, key)
+    if existing:
+        return existing, False
+    if min_interval:
+        latest_id = select(func.max(CrawlJob.id)).where(CrawlJob.dedupe_key == key).scalar_subquery()
+        latest = (await db.execute(select(CrawlJob).where(CrawlJob.id == latest_id))).scalar_one_or_none()
+        if latest and latest.created_at and (_utcnow() - latest.created_at).total_seconds() < min_interval:
+            return latest, False
+
+    job = CrawlJob(
+        kind=kind,
+        admission_type=admission_type,
+        year=year,
+        url=url,
+        delay=delay,
+        dedupe_key=key,
+        status=PENDING,
+        created_at=_utcnow()
+    )
+    db.add(job)
+    try:
+        await db.commit()
+    except IntegrityError:
+        # 다른 요청/프로세스가 먼저 넣음
+        await db.rollback()
+        existing = await _active_job(db, key)
+        if existing:
+            return existing, False
+        raise
+
+    job_runner.notify()
+    return job, True
+
+
+def job_summary(job: CrawlJob) -> dict:
+    """진행 상황 응답"""
+    finished = sum(getattr(job, name) or 0 for name in COUNTERS)
+    total = job.total or 0
+    return {
+        "job_id": job.id,
+        "kind": job.kind,
+        "status": job.status,
+        "admission_type": job.admission_type,
+        "year": job.year,
+        "url": job.url,
+        "total": total,
+        "finished": finished,
+        "pending": max(total - finished, 0),
+        "progress": round(finished / total, 4) if total else 0.0,
+        **{name: getattr(job, name) or 0 for name in COUNTERS},
+        "generation_id": job.generation_id,
+        "attempts": job.attempts,
+        "message": job.message,
+        "created_at": job.created_at,
+        "started_at": job.started_at,
+        "heartbeat_at": job.heartbeat_at,
+        "finished_at": job.finished_at
+    }
+
+
+# ============ 작업 실행 ============
+
+class JobRunner:
+    """
+    크롤링 작업 실행기 (프로세스 = 크롤러 노드 1개)
+
+    - start(): 노드 등록 후 작업 확인 루프 시작 (같은 프로세스에서 넣은 작업은 바로,
+      다른 프로세스 것은 crawl_job_poll_seconds 마다 확인)
+    - run_pending(): 참여할 수 있는 작업을 실행 (워커 --once / 스케줄러에서 직접 호출)
+
+    노드 여러 대가 같은 작업에 참여하면 살아 있는 노드(crawl_workers)로 만든 해시 링에서
+    대학 코드가 자기에게 배정된 항목만 lease 를 잡아 크롤링하고, 자기 몫을 한 세대로 게시합니다.
+    노드가 들어오면 다음 배정부터 링이 나뉘고, 노드가 빠지면(정상 종료 시 바로, 비정상 종료 시
+    lease 만료 후) 남은 노드들이 그 몫을 이어받습니다. 항목 lease 는 조건부 UPDATE 로 잡으므로
+    노드마다 링을 다르게 보고 있는 순간에도 같은 페이지를 두 노드가 크롤링하지 않습니다.
+    """
+
+    def __init__(self):
+        self.owner = f"{socket.gethostname()}:{os.getpid()}"
+        self.current: Optional[int] = None
+        self._task: Optional[asyncio.Task] = None
+        self._wake = asyncio.Event()
+        self._lock = asyncio.Lock()
+
+    def notify(self):
+        """새 작업 알림 (같은 프로세스)"""
+        self._wake.set()
+
+    async def start(self):
+        await self.register()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        await self.unregister()
+
+    async def _run(self):
+        while True:
+            try:
+                await self.run_pending()
+            except Exception as e:
+                logger.error(f"[Jobs] 작업 실행 오류: {e}")
+            try:
+                await asyncio.wait_for(self._wake.wait(), settings.crawl_job_poll_seconds)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+
+    async def run_pending(self) -> int:
+        """대기/실행 중 작업에 순서대로 참여. Returns: 이 노드가 대학을 크롤링한 작업 수"""
+        ran = 0
+        async with self._lock:
+            await self.register()
+            async with async_session() as db:
+                job_ids = (
+                    await db.execute(
+                        select(CrawlJob.id)
+                        .where(CrawlJob.status.in_(ACTIVE_STATUSES))
+                        .order_by(CrawlJob.id)
+                        .limit(10)
+                    )
+                ).scalars().all()
+            for job_id in job_ids:
+                ran += await self._execute(job_id)
+        return ran
+
+    # ============ 노드 ============
+
+    async def register(self, db: Optional[AsyncSession] = None):
+        """노드 생존 신호 (없으면 등록)"""
+        if db is None:
+            async with async_session() as db:
+                return await self.register(db)
+        now = _utcnow()
+        await db.merge(CrawlWorker(node_id=self.owner, heartbeat_at=now))
+        await db.execute(
+            update(CrawlWorker)
+            .where(CrawlWorker.node_id == self.owner, CrawlWorker.started_at.is_(None))
+            .values(started_at=now)
+        )
+        await db.commit()
+
+    async def unregister(self):
+        """노드 제거 (다른 노드가 lease 만료를 기다리지 않고 바로 이 노드 몫을 나눠 가짐)"""
+        try:
+            async with async_session() as db:
+                await db.execute(delete(CrawlWorker).where(CrawlWorker.node_id == self.owner))
+                await db.commit()
+        except Exception as e:
+            logger.warning(f"[Jobs] 노드 제거 실패 (생존 신호가 끊긴 뒤 제외됨): {e}")
+
+    async def members(self, db: AsyncSession) -> list[str]:
+        """살아 있는 노드 (자기 자신 포함)"""
+        alive = _utcnow() - timedelta(seconds=settings.crawl_job_lease_seconds)
+        nodes = (
+            await db.execute(select(CrawlWorker.node_id).where(CrawlWorker.heartbeat_at >= alive))
+        ).scalars().all()
+        return sorted({*nodes, self.owner})
+
+    # ============ 작업 참여 ============
+
+    async def _take(self, db: AsyncSession, job_id: int) -> bool:
+        """대기 중이거나 모든 참여 노드의 생존 신호가 끊긴 작업을 맡음 (항목을 펼치는 노드)"""
+        now = _utcnow()
+        stale = now - timedelta(seconds=settings.crawl_job_lease_seconds)
+        result = await db.execute(
+            update(CrawlJob)
+            .where(
+                CrawlJob.id == job_id,
+                or_(
+                    CrawlJob.status == PENDING,
+                    and_(
+                        CrawlJob.status == RUNNING,
+                        or_(CrawlJob.heartbeat_at.is_(None), CrawlJob.heartbeat_at < stale)
+                    )
+                )
+            )
+            .values(
+                status=RUNNING,
+                owner=self.owner,
+                heartbeat_at=now,
+                started_at=func.coalesce(CrawlJob.started_at, now),
+                attempts=CrawlJob.attempts + 1
+            )
+        )
+        await db.commit()
+        return bool(result.rowcount)
+
+    async def _execute(self, job_id: int) -> int:
+        """작업 1건에 참여해 이 노드 몫을 크롤링하고, 남은 대학이 없으면 완료 처리. Returns: 크롤링 여부"""
+        async with async_session() as db:
+            took = await self._take(db, job_id)
+            job = await db.get(CrawlJob, job_id, populate_existing=True)
+            if job is None or job.status != RUNNING:
+                return 0
+            # 크롤링 중 세션 롤백(실패 대학 등)에 만료되지 않도록 분리 (작업 갱신은 UPDATE 문으로)
+            db.expunge(job)
+            if took and job.attempts > settings.crawl_job_max_attempts:
+                await self._finish(db, job_id, FAILED, f"최대 실행 횟수 초과 ({settings.crawl_job_max_attempts}회)")
+                return 0
+
+            self.current = job_id
+            service = CrawlService(db)
+            heartbeat = asyncio.create_task(self._heartbeat(job_id, service))
+            try:
+                if took:
+                    await self._ensure_items(db, service, job)
+                elif not await self._has_items(db, job_id):
+                    return 0  # 맡은 노드가 아직 항목을 펼치는 중
+                crawled = await self._run_shard(db, service, job)
+                await self._complete(db, service, job)
+                return crawled
+            except asyncio.CancelledError:
+                # 종료 중 - 잡고 있던 대학을 바로 반납 (취소된 세션의 연결은 쓸 수 없을 수 있으므로 새 세션으로)
+                heartbeat.cancel()
+                await self._release(job_id)
+                raise
+            except Exception as e:
+                await db.rollback()
+                logger.error(f"[Jobs] 작업 {job_id} 실패: {e}")
+                await self._release(job_id, keep_job=True)
+                await self._finish(db, job_id, FAILED, str(e))
+                return 0
+            finally:
+                heartbeat.cancel()
+                self.current = None
+
+    async def _heartbeat(self, job_id: int, service: CrawlService):
+        """
+        생존 신호 (크롤링 세션과 별도 세션)
+
+        노드/작업 생존 신호와 이 노드가 잡은 대학의 lease 를 연장하고,
+        작업 집계에는 게시가 끝난 항목 + 이 노드에서 진행 중인 라운드 결과를 씁니다.
+        """
+        while True:
+            await asyncio.sleep(settings.crawl_job_heartbeat_seconds)
+            now = _utcnow()
+            try:
+                async with async_session() as db:
+                    await db.execute(
+                        update(CrawlJobItem)
+                        .where(
+                            CrawlJobItem.job_id == job_id,
+                            CrawlJobItem.owner == self.owner,
+                            CrawlJobItem.status == PENDING,
+                            CrawlJobItem.lease_until.is_not(None)
+                        )
+                        .values(lease_until=now + timedelta(seconds=settings.crawl_job_lease_seconds))
+                    )
+                    counts = await self._item_counts(db, job_id)
+                    pipeline = service.pipeline
+                    if pipeline is not None:
+                        counts = {name: counts[name] + pipeline.results[name] for name in COUNTERS}
+                    await db.execute(
+                        update(CrawlJob)
+                        .where(CrawlJob.id == job_id, CrawlJob.status == RUNNING)
+                        .values(heartbeat_at=now, **counts)
+                    )
+                    await self.register(db)
+            except Exception as e:
+                logger.warning(f"[Jobs] 작업 {job_id} 생존 신호 기록 실패: {e}")
+
+    async def _release(self, job_id: int, keep_job: bool = False):
+        """
+        이 노드가 잡은 대학 lease 반납
+
+        keep_job=False (종료 중) 이면 작업 생존 신호도 지워, 다른 노드가 없을 때
+        재시작한 노드가 lease 만료를 기다리지 않고 바로 이어받게 합니다 (실행 횟수에 세지 않음).
+        """
+        try:
+            async with async_session() as db:
+                await db.execute(
+                    update(CrawlJobItem)
+                    .where(
+                        CrawlJobItem.job_id == job_id,
+                        CrawlJobItem.owner == self.owner,
+                        CrawlJobItem.status == PENDING
+                    )
+                    .values(owner=None, lease_until=None)
+                )
+                if not keep_job:
+                    await db.execute(
+                        update(CrawlJob)
+                        .where(CrawlJob.id == job_id, CrawlJob.status == RUNNING, CrawlJob.owner == self.owner)
+                        .values(heartbeat_at=None, attempts=CrawlJob.attempts - 1)
+                    )
+                await db.commit()
+        except Exception as e:
+            logger.warning(f"[Jobs] 작업 {job_id} 반납 실패 (lease 만료 후 재배정됨): {e}")
+
+    async def _finish(self, db: AsyncSession, job_id: int, status: str, message: str) -> bool:
+        """작업 종료 (실행 중일 때만, 여러 노드 중 한 곳만 성공)"""
+        now = _utcnow()
+        counts = await self._item_counts(db, job_id)
+        result = await db.execute(
+            update(CrawlJob)
+            .where(CrawlJob.id == job_id, CrawlJob.status == RUNNING)
+            .values(status=status, message=message[:500], finished_at=now, heartbeat_at=now, **counts)
+        )
+        await db.commit()
+        if result.rowcount:
+            logger.info(f"[Jobs] 작업 {job_id} {status}: {message}")
+        return bool(result.rowcount)
+
+    # ============ 샤드 크롤링 ============
+
+    async def _run_shard(self, db: AsyncSession, service: CrawlService, job: CrawlJob) -> int:
+        """
+        이 노드 몫의 대학을 라운드마다 한 세대로 게시 (예산이 끝나 미룬 대학은 다음 라운드)
+
+        라운드 결과는 작업 전체 중 라운드 몫(대학 수 비율)만큼 줄인 사이클 기준으로 검증한 뒤
+        게시하고, 통과하지 못하면 게시하지 않고 성공한 대학을 실패로 기록합니다.
+
+        Returns:
+            크롤링한 라운드가 있으면 1
+        """
+        crawled = 0
+        # 분리된 job 의 total 은 항목을 펼치기 전 값일 수 있으므로 DB 에서
+        total = (await db.execute(select(CrawlJob.total).where(CrawlJob.id == job.id))).scalar_one() or 0
+        while items := await self._claim_items(db, job.id):
+            crawled = 1
+            logger.info(f"[Jobs] 작업 {job.id}: 대학 {len(items)}곳 크롤링 ({self.owner})")
+            if job.kind == "university":
+                outcomes, generation_id = await self._crawl_single(service, job, items[0])
+            else:
+                results = await service.crawl_all_universities(
+                    job.admission_type,
+                    job.year,
+                    job.delay or 0.0,
+                    universities=[
+                        UniversityInfo(code=item.university_code, name=item.name, ratio_url=item.ratio_url)
+                        for item in items
+                    ],
+                    record=False,
+                    share=len(items) / max(total, len(items))
+                )
+                outcomes, generation_id = service.pipeline.outcomes, results.get("generation")
+                service.pipeline = None
+
+            await self._record_items(db, job.id, items, outcomes)
+            if generation_id:
+                await db.execute(
+                    update(CrawlJob)
+                    .where(
+                        CrawlJob.id == job.id,
+                        or_(CrawlJob.generation_id.is_(None), CrawlJob.generation_id < generation_id)
+                    )
+                    .values(generation_id=generation_id)
+                )
+            await db.commit()
+            if not outcomes:
+                raise RuntimeError(f"라운드에서 처리한 대학 없음 ({len(items)}개 남음)")
+        return crawled
+
+    async def _crawl_single(
+        self,
+        service: CrawlService,
+        job: CrawlJob,
+        item: Row
+    ) -> tuple[dict[str, str], Optional[int]]:
+        """단일 대학 (대학 1곳짜리 세대로 바로 게시)"""
+        try:
+            university = await service.crawl_and_save(item.ratio_url, job.admission_type, job.year)
+            status = "success" if university else "skipped"
+        except Exception as e:
+            logger.warning(f"[Jobs] 작업 {job.id} 크롤링 실패 ({item.ratio_url}): {e}")
+            status = "failed"
+        return {item.ratio_url: status}, None
+
+    async def _complete(self, db: AsyncSession, service: CrawlService, job: CrawlJob):
+        """남은 대학이 없으면 작업 완료 + (전체/SmartRatio) 사이클 검증·요약 기록, 샤드 내보내기"""
+        remaining = (
+            await db.execute(
+                select(func.count())
+                .select_from(CrawlJobItem)
+                .where(CrawlJobItem.job_id == job.id, CrawlJobItem.status == PENDING)
+            )
+        ).scalar_one()
+        if remaining:
+            return
+
+        counts = await self._item_counts(db, job.id)
+        total = (await db.execute(select(CrawlJob.total).where(CrawlJob.id == job.id))).scalar_one() or 0
+        message = (
+            f"성공 {counts['success']}/{total}, 실패 {counts['failed']}, "
+            f"격리 {counts['quarantined']}, 건너뜀 {counts['skipped']}"
+        )
+        if not await self._finish(db, job.id, DONE, message):
+            return  # 다른 노드가 먼저 완료 처리
+        if job.kind == "university":
+            return
+
+        generation_id = (
+            await db.execute(select(CrawlJob.generation_id).where(CrawlJob.id == job.id))
+        ).scalar_one()
+        started_at = job.started_at or _utcnow()
+        results = {"total": total, **counts, "deferred": 0, "generation": generation_id}
+        await service.complete_cycle(results, started_at, (_utcnow() - started_at).total_seconds())
+
+        if generation_id and settings.shard_export_enabled:
+            try:
+                export = await export_shards(db, admission_type=job.admission_type, year=job.year)
+                logger.info(f"[Jobs] Shard export completed: {export.summary()}")
+            except Exception as e:
+                logger.error(f"[Jobs] Shard export failed: {e}")
+
+    # ============ 작업 항목 ============
+
+    async def _ensure_items(self, db: AsyncSession, service: CrawlService, job: CrawlJob):
+        """처음 맡았으면 대학 목록을 항목으로 펼침 (재개 시에는 기존 항목 그대로)"""
+        if await self._has_items(db, job.id):
+            return
+
+        universities = await self._list_universities(service, job)
+        now = _utcnow()
+        rows, seen = [], set()
+        for univ in universities:
+            # 같은 페이지는 한 번만
+            if univ.ratio_url and univ.ratio_url in seen:
+                continue
+            seen.add(univ.ratio_url)
+            rows.append({
+                "job_id": job.id,
+                "university_code": univ.code,
+                "name": univ.name[:100],
+                "ratio_url": univ.ratio_url,
+                "status": PENDING if univ.ratio_url else "skipped",
+                "updated_at": now
+            })
+        if rows:
+            await db.execute(insert(CrawlJobItem), rows)
+        counts = await self._item_counts(db, job.id)
+        await db.execute(
+            update(CrawlJob).where(CrawlJob.id == job.id).values(total=len(rows), **counts)
+        )
+        await db.commit()
+
+    async def _has_items(self, db: AsyncSession, job_id: int) -> bool:
+        return (
+            await db.execute(select(CrawlJobItem.id).where(CrawlJobItem.job_id == job_id).limit(1))
+        ).first() is not None
+
+    async def _list_universities(self, service: CrawlService, job: CrawlJob) -> list[UniversityInfo]:
+        if job.kind == "university":
+            return [UniversityInfo(code=page_code(job.url), name=page_code(job.url), ratio_url=job.url)]
+        if job.kind == "smartratio":
+            # SmartRatio 대학 목록 중 경쟁률 페이지가 열린 대학만
+            from app.crawler import SmartRatioCrawler
+            crawler = SmartRatioCrawler()
+            available = await crawler.discover_available_urls(await crawler.fetch_university_list())
+            return [
+                UniversityInfo(
+                    code=univ.univ_code or page_code(univ.ratio_url),
+                    name=univ.name,
+                    ratio_url=univ.ratio_url
+                )
+                for univ in available
+            ]
+        return await service.univ_crawler.get_universities(job.admission_type)
+
+    async def _claim_items(self, db: AsyncSession, job_id: int) -> list[Row]:
+        """
+        해시 링에서 이 노드에 배정된 pending 대학의 lease 를 잡고, 이 노드가 잡고 있는 대학 반환
+
+        다른 노드가 lease 를 잡고 있는 대학은 건너뛰고, lease 가 만료된 대학(죽은 노드 몫)은
+        현재 링 기준으로 다시 배정합니다.
+        링이 바뀌면 다른 노드가 저장한 대학을 맡을 수 있으므로, 라운드마다 crawl_all_universities
+        (CrawlService.sync_state)가 상태 캐시를 DB의 현재 세대에 맞춘 뒤 diff 합니다.
+
+        Returns:
+            (id, university_code, name, ratio_url) 행 - 게시 실패로 세션이 롤백돼도 그대로 쓸 수 있도록
+            ORM 객체가 아닌 값으로 반환
+        """
+        now = _utcnow()
+        ring = HashRing(await self.members(db))
+        free = or_(CrawlJobItem.lease_until.is_(None), CrawlJobItem.lease_until < now)
+        rows = (
+            await db.execute(
+                select(CrawlJobItem.id, CrawlJobItem.ratio_url)
+                .where(CrawlJobItem.job_id == job_id, CrawlJobItem.status == PENDING, free)
+            )
+        ).all()
+        # 같은 대학의 페이지(전형별)는 한 세대에서 함께 저장되도록 대학 단위로 배정
+        mine = [row.id for row in rows if ring.node_for(university_key(page_code(row.ratio_url))) == self.owner]
+        if mine:
+            await db.execute(
+                update(CrawlJobItem)
+                .where(CrawlJobItem.id.in_(mine), CrawlJobItem.status == PENDING, free)
+                .values(owner=self.owner, lease_until=now + timedelta(seconds=settings.crawl_job_lease_seconds))
+            )
+            await db.commit()
+        return list((
+            await db.execute(
+                select(CrawlJobItem.id, CrawlJobItem.university_code, CrawlJobItem.name, CrawlJobItem.ratio_url)
+                .where(
+                    CrawlJobItem.job_id == job_id,
+                    CrawlJobItem.owner == self.owner,
+                    CrawlJobItem.status == PENDING,
+                    CrawlJobItem.lease_until > now
+                )
+                .order_by(CrawlJobItem.id)
+            )
+        ).all())
+
+    async def _item_counts(self, db: AsyncSession, job_id: int) -> dict[str, int]:
+        """결과 상태별 항목 수 (게시가 끝난 항목만)"""
+        rows = (
+            await db.execute(
+                select(CrawlJobItem.status, func.count())
+                .where(CrawlJobItem.job_id == job_id)
+                .group_by(CrawlJobItem.status)
+            )
+        ).all()
+        counts = dict(rows)
+        return {name: counts.get(name, 0) for name in COUNTERS}
+
+    async def _record_items(
+        self,
+        db: AsyncSession,
+        job_id: int,
+        items: list[Row],
+        outcomes: dict[str, str]
+    ):
+        """게시가 끝난 대학의 결과 기록 (미룬 대학은 lease 를 유지한 채 pending) + 작업 집계 갱신 (커밋은 호출자)"""
+        now = _utcnow()
+        updates = [
+            {"id": item.id, "status": outcomes[item.ratio_url], "lease_until": None, "updated_at": now}
+            for item in items
+            if item.ratio_url in outcomes
+        ]
+        if updates:
+            await db.execute(update(CrawlJobItem), updates)
+        counts = await self._item_counts(db, job_id)
+        await db.execute(
+            update(CrawlJob).where(CrawlJob.id == job_id).values(heartbeat_at=now, **counts)
+        )
+
+
+job_runner = JobRunner()
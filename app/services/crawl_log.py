@@ -0,0 +1,177 @@
+"""
+크롤링 로그 기록 / 사이클 요약 / 보존 정책
+
+기록:
+- CrawlLogWriter 는 대학별 로그를 메모리에 모았다가 crawl_log_batch_size 건마다,
+  또는 사이클 끝의 세대 게시 트랜잭션에서 한 번에 INSERT 합니다
+  (대학마다 로그 커밋 = fsync 하던 것을 없앰). 모으는 동안은 /crawl/logs 에 보이지 않습니다.
+- 사이클이 끝나면 crawl_cycles 에 요약 1행을 남깁니다.
+
+조회:
+- /crawl/status 는 last_cycle 캐시(마지막 사이클 요약)만 읽습니다. 같은 프로세스에서
+  사이클이 끝나면 바로 교체되고, 다른 프로세스(크롤러 워커)가 쓴 사이클은
+  crawl_status_cache_seconds 마다 PK 최댓값 1건을 다시 읽어 반영합니다.
+
+보존(retention):
+- success/skipped 로그: crawl_log_retention_days 일
+- failed/quarantined 로그: crawl_log_failure_retention_days 일 (원인 추적용으로 더 길게)
+- 사이클 요약: crawl_cycle_retention_days 일 (로그를 지운 뒤의 집계본)
+"""
+
+import logging
+import time
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import get_settings
+from app.metrics import CRAWL_RESULTS_TOTAL
+from app.models import CrawlCycle, CrawlLog
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+# 오래 보관하는 로그 상태
+FAILURE_STATUSES = ("failed", "quarantined")
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+class CrawlLogWriter:
+    """
+    크롤링 로그 버퍼
+
+    add() 는 메모리에만 쌓고, flush() 가 세션에 한 번에 INSERT 합니다 (커밋은 호출자).
+    """
+
+    def __init__(self):
+        self._pending: list[dict] = []
+
+    def add(self, university_code: str, status: str, message: str, duration_seconds: float):
+        self._pending.append({
+            "university_code": university_code,
+            "status": status,
+            "message": message[:500],
+            "duration_seconds": duration_seconds,
+            "crawled_at": _utcnow()
+        })
+        CRAWL_RESULTS_TOTAL.labels(status=status).inc()
+
+    @property
+    def pending(self) -> int:
+        return len(self._pending)
+
+    @property
+    def full(self) -> bool:
+        return len(self._pending) >= settings.crawl_log_batch_size
+
+    async def flush(self, db: AsyncSession) -> int:
+        """모은 로그 INSERT (커밋은 호출자). Returns: 기록한 건수"""
+        if not self._pending:
+            return 0
+        rows, self._pending = self._pending, []
+        await db.execute(insert(CrawlLog), rows)
+        return len(rows)
+
+
+@dataclass
+class LastCycle:
+    """/crawl/status 용 마지막 사이클 요약"""
+    status: str
+    message: str
+    finished_at: Optional[datetime]
+    total_universities: int
+    total_departments: int
+
+    @classmethod
+    def from_row(cls, cycle: CrawlCycle) -> "LastCycle":
+        if cycle.failed and not cycle.success:
+            status = "failed"
+        else:
+            status = "success" if cycle.valid else "partial"
+        return cls(
+            status=status,
+            message=cycle.message or "",
+            finished_at=cycle.finished_at,
+            total_universities=cycle.total_universities or 0,
+            total_departments=cycle.total_departments or 0
+        )
+
+
+class LastCycleCache:
+    """마지막 사이클 요약 캐시 (프로세스 전역)"""
+
+    def __init__(self):
+        self.value: Optional[LastCycle] = None
+        self.cycle_id = 0
+        self._loaded_at = 0.0
+
+    def set(self, cycle: CrawlCycle):
+        """캐시 교체 (같은 프로세스에서 사이클을 기록한 직후 또는 DB에서 다시 읽은 경우)"""
+        if cycle.id >= self.cycle_id:
+            self.cycle_id = cycle.id
+            self.value = LastCycle.from_row(cycle)
+            self._loaded_at = time.monotonic()
+
+    async def get(self, db: AsyncSession) -> Optional[LastCycle]:
+        if self._loaded_at and time.monotonic() - self._loaded_at < settings.crawl_status_cache_seconds:
+            return self.value
+        # max(id) 는 rowid 끝에서 바로 읽음 (ORDER BY ... LIMIT 1 은 SCAN 으로 잡힘)
+        latest_id = select(func.max(CrawlCycle.id)).scalar_subquery()
+        cycle = (
+            await db.execute(select(CrawlCycle).where(CrawlCycle.id == latest_id))
+        ).scalar_one_or_none()
+        self._loaded_at = time.monotonic()
+        if cycle is not None:
+            self.set(cycle)
+        return self.value
+
+
+last_cycle = LastCycleCache()
+
+
+async def apply_log_retention(db: AsyncSession, now: Optional[datetime] = None, batch_size: int = 5000) -> dict:
+    """
+    보존 기간이 지난 크롤링 로그/사이클 요약 삭제
+
+    쓰기 잠금을 오래 잡지 않도록 batch_size 행씩 지우고 커밋합니다.
+
+    Returns:
+        {"logs_deleted": n, "failure_logs_deleted": n, "cycles_deleted": n}
+    """
+    now = now or _utcnow()
+    log_cutoff = now - timedelta(days=settings.crawl_log_retention_days)
+    failure_cutoff = now - timedelta(days=settings.crawl_log_failure_retention_days)
+    cycle_cutoff = now - timedelta(days=settings.crawl_cycle_retention_days)
+
+    stats = {
+        "logs_deleted": await _delete_batched(
+            db, CrawlLog, CrawlLog.crawled_at < log_cutoff, CrawlLog.status.notin_(FAILURE_STATUSES),
+            batch_size=batch_size
+        ),
+        "failure_logs_deleted": await _delete_batched(
+            db, CrawlLog, CrawlLog.crawled_at < failure_cutoff, batch_size=batch_size
+        ),
+        "cycles_deleted": await _delete_batched(
+            db, CrawlCycle, CrawlCycle.finished_at < cycle_cutoff, batch_size=batch_size
+        ),
+    }
+    return stats
+
+
+async def _delete_batched(db: AsyncSession, model, *conditions, batch_size: int) -> int:
+    deleted = 0
+    while True:
+        ids = (
+            await db.execute(select(model.id).where(*conditions).order_by(model.id).limit(batch_size))
+        ).scalars().all()
+        if not ids:
+            return deleted
+        await db.execute(delete(model).where(model.id.in_(ids)))
+        await db.commit()
+        deleted += len(ids)
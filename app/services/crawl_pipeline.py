@@ -0,0 +1,248 @@
+"""
+크롤링 사이클 파이프라인 (fetch → parse → persist)
+
+대학 1곳씩 요청 → 파싱 → 저장을 순서대로 하면 저장하는 동안 네트워크가,
+요청을 기다리는 동안 DB가 놀게 됩니다. 사이클을 단계별 작업자로 나누고
+크기가 정해진 asyncio.Queue 로 연결해 단계들이 동시에 돌게 합니다.
+
+    대학 목록 ─▶ [fetch × max_concurrent_requests] ─▶ [parse × crawl_parse_workers]
+             ─▶ [persist × 1, crawl_persist_batch 곳씩 1 트랜잭션] ─▶ GenerationBuilder
+
+- 백프레셔: 큐가 차면 앞 단계의 put 이 기다리므로 DB가 밀려도 메모리에 쌓이는
+  페이지는 큐 크기(crawl_queue_size) × 단계 수를 넘지 않습니다.
+- persist 는 세션을 쓰므로 작업자 1개이며, 도착한 결과를 배치로 모아
+  diff/품질 검사를 처리하고 배치마다 한 번만 커밋합니다. 로그는 CrawlLogWriter 에
+  모였다가 crawl_log_batch_size 건마다 저장되고, 데이터와 남은 로그는 사이클이 끝난 뒤
+  CrawlService.publish_generation 이 한 세대로 게시합니다.
+- 단계별 큐 깊이 / 처리 건수 / 백프레셔 대기 시간을 메트릭으로 내보냅니다.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Optional
+
+from app.config import get_settings
+from app.crawler.http_client import CycleBudgetExceeded, budget_exhausted
+from app.crawler.ratio_crawler import RatioCrawler, UniversityRatio, page_code
+from app.metrics import (
+    CRAWL_PIPELINE_BACKPRESSURE_SECONDS,
+    CRAWL_PIPELINE_ITEMS_TOTAL,
+    CRAWL_PIPELINE_QUEUE_DEPTH,
+    StageTimer,
+)
+from app.services.generation import GenerationBuilder
+
+if TYPE_CHECKING:
+    from app.crawler.university_list import UniversityInfo
+    from app.services.crawl_service import CrawlService
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+# 단계 종료 신호
+_DONE = object()
+
+
+@dataclass
+class CrawlItem:
+    """파이프라인을 흐르는 대학 1곳"""
+    univ: "UniversityInfo"
+    crawler: RatioCrawler
+    timer: StageTimer
+    start_time: datetime = field(default_factory=datetime.now)
+    html: Optional[str] = None
+    ratio_data: Optional[UniversityRatio] = None
+    error: Optional[Exception] = None
+
+
+class StageQueue(asyncio.Queue):
+    """깊이/백프레셔를 기록하는 단계 입력 큐"""
+
+    def __init__(self, stage: str, maxsize: int):
+        super().__init__(maxsize)
+        self.stage = stage
+
+    async def put(self, item: Any):
+        if self.full():
+            start = time.perf_counter()
+            await super().put(item)
+            CRAWL_PIPELINE_BACKPRESSURE_SECONDS.labels(stage=self.stage).inc(time.perf_counter() - start)
+        else:
+            self.put_nowait(item)
+        CRAWL_PIPELINE_QUEUE_DEPTH.labels(stage=self.stage).set(self.qsize())
+
+    async def get(self) -> Any:
+        item = await super().get()
+        CRAWL_PIPELINE_QUEUE_DEPTH.labels(stage=self.stage).set(self.qsize())
+        return item
+
+
+class CrawlPipeline:
+    """
+    크롤링 사이클 1회분 파이프라인
+
+    사용 예:
+        pipeline = CrawlPipeline(service, "정시", 2026, generation)
+        await pipeline.run(universities)
+        pipeline.results  # {"success": .., "failed": .., ...}
+        pipeline.deferred  # 사이클 예산이 끝나 처리하지 못한 대학
+        pipeline.outcomes  # {ratio_url: success/failed/skipped/quarantined}
+    """
+
+    def __init__(
+        self,
+        service: "CrawlService",
+        admission_type: str,
+        year: int,
+        generation: GenerationBuilder,
+        delay: float = 0.0
+    ):
+        self.service = service
+        self.admission_type = admission_type
+        self.year = year
+        self.generation = generation
+        self.delay = delay
+        self.results = {"success": 0, "failed": 0, "skipped": 0, "quarantined": 0}
+        self.deferred: list["UniversityInfo"] = []
+        self.outcomes: dict[str, str] = {}
+
+    async def run(self, universities: list["UniversityInfo"]):
+        fetch_q = StageQueue("fetch", settings.crawl_queue_size)
+        parse_q = StageQueue("parse", settings.crawl_queue_size)
+        persist_q = StageQueue("persist", settings.crawl_queue_size)
+
+        fetch_workers = settings.max_concurrent_requests
+        parse_workers = settings.crawl_parse_workers
+
+        await asyncio.gather(
+            self._feed(universities, fetch_q, fetch_workers),
+            self._stage("fetch", fetch_q, parse_q, self._fetch, fetch_workers, parse_workers),
+            self._stage("parse", parse_q, persist_q, self._parse, parse_workers, 1),
+            self._persist(persist_q)
+        )
+
+    async def _feed(self, universities: list["UniversityInfo"], outbox: StageQueue, consumers: int):
+        """대학 목록 투입 (예산이 끝나면 남은 대학은 미룸)"""
+        for i, univ in enumerate(universities):
+            if budget_exhausted():
+                self.deferred.extend(universities[i:])
+                break
+            if not univ.ratio_url:
+                self.results["skipped"] += 1
+                continue
+            crawler = self.service.crawler_for(univ.ratio_url)
+            await outbox.put(CrawlItem(univ, crawler, StageTimer(page_code(univ.ratio_url))))
+        for _ in range(consumers):
+            await outbox.put(_DONE)
+
+    async def _stage(
+        self,
+        name: str,
+        inbox: StageQueue,
+        outbox: StageQueue,
+        handle: Callable[[CrawlItem], Awaitable[Optional[CrawlItem]]],
+        workers: int,
+        consumers: int
+    ):
+        """작업자 workers 개로 inbox → handle → outbox (모두 끝나면 다음 단계에 종료 신호)"""
+        async def worker():
+            while (item := await inbox.get()) is not _DONE:
+                item = await handle(item)
+                CRAWL_PIPELINE_ITEMS_TOTAL.labels(stage=name).inc()
+                if item is not None:
+                    await outbox.put(item)
+
+        await asyncio.gather(*(worker() for _ in range(workers)))
+        for _ in range(consumers):
+            await outbox.put(_DONE)
+
+    def _defer_on_budget(self, item: CrawlItem, error: Exception) -> bool:
+        """예산에 맞춰 잘린 요청이면 실패가 아니라 다음 사이클로 미룸"""
+        if isinstance(error, CycleBudgetExceeded) or budget_exhausted():
+            self.deferred.append(item.univ)
+            return True
+        return False
+
+    async def _fetch(self, item: CrawlItem) -> Optional[CrawlItem]:
+        if budget_exhausted():
+            self.deferred.append(item.univ)
+            return None
+        try:
+            item.html = await item.crawler.fetch_html(item.univ.ratio_url, item.timer)
+        except Exception as e:
+            if self._defer_on_budget(item, e):
+                return None
+            item.error = e
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        return item
+
+    async def _parse(self, item: CrawlItem) -> Optional[CrawlItem]:
+        if item.error or item.html is None:
+            return item
+        url = item.univ.ratio_url
+        try:
+            item.ratio_data = await item.crawler.parse_html(
+                item.html, url, self.admission_type, self.year, item.timer
+            )
+            if not item.ratio_data and settings.browser_fallback_enabled:
+                # JS 렌더링이 필요한 페이지만 브라우저로 재시도 (선택)
+                item.ratio_data = await item.crawler.crawl_with_browser(
+                    url, self.admission_type, self.year, timer=item.timer
+                )
+        except Exception as e:
+            if self._defer_on_budget(item, e):
+                return None
+            item.error = e
+        item.html = None  # persist 큐에서 기다리는 동안 원문을 붙잡지 않도록
+        return item
+
+    async def _persist(self, inbox: StageQueue):
+        """도착한 결과를 crawl_persist_batch 곳씩 모아 한 트랜잭션으로 처리"""
+        done = False
+        while not done:
+            batch = []
+            item = await inbox.get()
+            while item is not _DONE:
+                batch.append(item)
+                if len(batch) >= settings.crawl_persist_batch or inbox.empty():
+                    break
+                item = inbox.get_nowait()
+            done = item is _DONE
+            if batch:
+                await self._persist_batch(batch)
+                CRAWL_PIPELINE_ITEMS_TOTAL.labels(stage="persist").inc(len(batch))
+
+    async def _persist_batch(self, batch: list[CrawlItem]):
+        service = self.service
+        statuses = []
+        for item in batch:
+            url = item.univ.ratio_url
+            if item.error is None:
+                try:
+                    status = await service.record_result(
+                        url, item.ratio_data, self.generation, item.timer, item.start_time
+                    )
+                    statuses.append(status)
+                    continue
+                except Exception as e:
+                    item.error = e
+            logger.warning(f"크롤링 실패 ({item.univ.name}): {item.error}")
+            service.add_log(url, "failed", str(item.error), item.start_time)
+            statuses.append("failed")
+
+        try:
+            if service.logs.full:
+                await service.logs.flush(service.db)
+            # 쓴 것이 없으면 읽기 트랜잭션만 닫힘 (fsync 없음)
+            await service.db.commit()
+        except Exception as e:
+            await service.db.rollback()
+            logger.warning(f"크롤링 로그 저장 실패 ({len(batch)}개 대학): {e}")
+
+        for item, status in zip(batch, statuses):
+            self.results[status] += 1
+            self.outcomes[item.univ.ratio_url] = status
@@ -1,13 +1,89 @@
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, and_
-from sqlalchemy.orm import selectinload
-from datetime import datetime
-import asyncio
-from typing import Optional
+from sqlalchemy import select, and_, update, func
+from datetime import datetime, timezone
+import logging
+import time
+from typing import Awaitable, Callable, Optional
 
-from app.models import University, Admission, Department, RatioHistory, CrawlLog
+from app.models import University, Admission, Department, CrawlCycle, DataGeneration
 from app.crawler import RatioCrawler, UniversityListCrawler
-from app.crawler.ratio_crawler import UniversityRatio
+from app.config import get_settings
+from app.crawler.university_list import UniversityInfo
+from app.crawler.ratio_crawler import (
+    UniversityRatio,
+    URL_TYPE_UWAY,
+    URL_TYPE_CUSTOM,
+    classify_ratio_url,
+    page_code
+)
+from app.crawler.http_client import cycle_budget
+from app.crawler.uway_crawler import UwayRatioCrawler
+from app.crawler.custom_crawler import CustomRatioCrawler
+from app.metrics import StageTimer, CRAWL_CYCLE_SECONDS
+from app.services.crawl_log import CrawlLogWriter, last_cycle
+from app.services.crawl_pipeline import CrawlPipeline
+from app.services.generation import GenerationBuilder, current_generation, notify_generation
+from app.services.history_writer import history_writer
+from app.services.quality_gate import quality_gate
+from app.services.ratio_diff import (
+    ADDED,
+    CHANGED,
+    REMOVED,
+    DepartmentValues,
+    UniversityDelta,
+    UniversityState,
+    diff_university,
+    ratio_state
+)
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+# 변경 구독자 (캐시 무효화, 푸시 알림 등) - 커밋 후 UniversityDelta 로 호출
+DeltaSubscriber = Callable[[UniversityDelta], Awaitable[None]]
+delta_subscribers: list[DeltaSubscriber] = []
+
+
+def subscribe_deltas(subscriber: DeltaSubscriber):
+    """변경 구독자 등록"""
+    delta_subscribers.append(subscriber)
+
+
+# 직전 사이클에서 시간 예산이 모자라 미룬 대학 (다음 사이클에서 먼저 크롤링)
+_deferred_urls: set[str] = set()
+
+
+def validate_crawl_cycle(success_count: int, previous_count: int, share: float = 1.0) -> dict:
+    """
+    크롤링 사이클 결과 검증 (crawler.js validateNewData 와 동일 기준)
+
+    - 첫 사이클: 최소 대학 수(crawl_min_universities) 충족 여부
+    - 이후: 직전 사이클 대비 비율(crawl_min_data_ratio) 및 최소 대학 수
+
+    Args:
+        share: 사이클 중 이번에 게시할 몫의 비율 (작업 라운드 = 라운드 대학 수 / 작업 대학 수).
+            최소 대학 수와 직전 사이클 성공 수를 이 비율만큼 줄여 비교하므로,
+            라운드마다 통과하면 작업 전체도 같은 기준을 통과합니다.
+
+    Returns:
+        {"valid": bool, "reason": str, "ratio": float}
+    """
+    min_count = settings.crawl_min_universities * share
+    if previous_count == 0:
+        if success_count < min_count:
+            return {"valid": False, "reason": f"최소 대학 수 미달 ({success_count} < {min_count:g})", "ratio": 0.0}
+        return {"valid": True, "reason": "첫 크롤링 - 최소 대학 수 충족", "ratio": 1.0}
+
+    ratio = success_count / (previous_count * share)
+    if ratio < settings.crawl_min_data_ratio:
+        return {
+            "valid": False,
+            "reason": f"데이터 비율 미달: {ratio:.1%} < {settings.crawl_min_data_ratio:.0%}",
+            "ratio": ratio
+        }
+    if success_count < min_count:
+        return {"valid": False, "reason": f"최소 대학 수 미달 ({success_count} < {min_count:g})", "ratio": ratio}
+    return {"valid": True, "reason": f"검증 통과: {ratio:.1%} ({success_count}개 대학)", "ratio": ratio}
 
 
 class CrawlService:
@@ -16,102 +92,495 @@ class CrawlService:
     def __init__(self, db: AsyncSession):
         self.db = db
         self.ratio_crawler = RatioCrawler()
+        self.uway_crawler = UwayRatioCrawler()
+        self.custom_crawler = CustomRatioCrawler()
         self.univ_crawler = UniversityListCrawler()
+        self.logs = CrawlLogWriter()
+        self.pipeline: Optional[CrawlPipeline] = None  # 진행 중(또는 마지막) 사이클 파이프라인
+        # 진행 중인 사이클의 격리 키 (사이클 시작 때 한 번 읽음, 사이클 밖에서는 None)
+        self.quarantined: Optional[set[str]] = None
 
-    async def save_university_ratio(self, ratio_data: UniversityRatio) -> University:
+    def crawler_for(self, url: str) -> RatioCrawler:
+        """URL 유형별 경쟁률 페이지 크롤러"""
+        url_type = classify_ratio_url(url)
+        if url_type == URL_TYPE_UWAY:
+            return self.uway_crawler
+        if url_type == URL_TYPE_CUSTOM:
+            return self.custom_crawler
+        return self.ratio_crawler
+
+    async def sync_state(self):
         """
-        크롤링한 경쟁률 데이터를 DB에 저장
+        상태 캐시를 DB의 현재 세대에 맞춤 (크롤링 작업/라운드 시작 시)
 
-        Args:
-            ratio_data: 크롤링 결과
+        다른 노드나 프로세스가 그 사이 세대를 게시했으면 상태 캐시와 이력 기록 위치를 비워
+        이후 diff 가 DB에서 새로 읽은 상태를 기준으로 하게 합니다.
+        """
+        if ratio_state.sync(await current_generation(self.db)):
+            history_writer.forget()
+
+    async def _load_state(
+        self,
+        univ_code: str,
+        admission_type: str,
+        year: int
+    ) -> Optional[UniversityState]:
+        """
+        대학의 마지막 저장 상태 조회 (캐시 우선, 없으면 DB에서 한 번에 로드)
 
         Returns:
-            저장된 University 객체
+            UniversityState 또는 None (DB에 없는 신규 대학)
         """
-        # 1. 대학 정보 upsert
-        univ_code = ratio_data.university_code[:4]  # 대학 코드만 추출
-        stmt = select(University).where(University.code == univ_code)
-        result = await self.db.execute(stmt)
-        university = result.scalar_one_or_none()
+        scope = (admission_type, year)
+        state = ratio_state.get(univ_code)
+        if state and scope in state.departments:
+            return state
 
-        if not university:
+        if not state:
+            result = await self.db.execute(
+                select(University.id, University.name).where(University.code == univ_code)
+            )
+            row = result.one_or_none()
+            if not row:
+                return None
+
+            state = UniversityState(university_id=row.id, university_name=row.name)
+            result = await self.db.execute(
+                select(
+                    Admission.id,
+                    Admission.admission_type,
+                    Admission.year,
+                    Admission.admission_name,
+                    Admission.gun,
+                    Admission.page_code
+                )
+                .where(Admission.university_id == row.id)
+            )
+            for adm in result.all():
+                key = (adm.admission_type, adm.year, adm.admission_name)
+                state.admission_ids[key] = adm.id
+                state.admission_guns[key] = adm.gun
+                state.admission_pages[key] = adm.page_code
+
+        result = await self.db.execute(
+            select(
+                Department.id,
+                Admission.admission_name,
+                Department.campus,
+                Department.name,
+                Department.recruit_count,
+                Department.apply_count,
+                Department.competition_rate,
+                Department.detail
+            )
+            .join(Admission, Admission.id == Department.admission_id)
+            .where(and_(
+                Admission.university_id == state.university_id,
+                Admission.admission_type == admission_type,
+                Admission.year == year,
+                Department.removed_at.is_(None)
+            ))
+        )
+        state.departments[scope] = {
+            (row.admission_name, row.campus, row.name): (
+                row.id,
+                (row.recruit_count, row.apply_count, row.competition_rate, row.detail)
+            )
+            for row in result.all()
+        }
+
+        ratio_state.put(univ_code, state)
+        return state
+
+    async def diff_university_ratio(
+        self,
+        ratio_data: UniversityRatio
+    ) -> tuple[Optional[UniversityState], UniversityDelta]:
+        """크롤링 결과와 마지막 저장 상태 비교"""
+        state = await self._load_state(
+            ratio_data.university_key,
+            ratio_data.admission_type,
+            ratio_data.year
+        )
+        return state, diff_university(state, ratio_data)
+
+    async def _get_admission_id(
+        self,
+        state: UniversityState,
+        delta: UniversityDelta,
+        admission_name: str
+    ) -> int:
+        """전형 ID 조회 (없으면 생성)"""
+        key = (delta.admission_type, delta.year, admission_name)
+        admission_id = state.admission_ids.get(key)
+        if admission_id:
+            return admission_id
+
+        admission = Admission(
+            university_id=state.university_id,
+            admission_type=delta.admission_type,
+            admission_name=admission_name,
+            year=delta.year,
+            gun=delta.admission_guns.get(admission_name),
+            page_code=delta.page_code or None
+        )
+        self.db.add(admission)
+        await self.db.flush()
+
+        state.admission_ids[key] = admission.id
+        state.admission_pages[key] = admission.page_code
+        return admission.id
+
+    async def _write_delta(
+        self,
+        state: Optional[UniversityState],
+        delta: UniversityDelta,
+        ratio_url: Optional[str] = None
+    ) -> UniversityState:
+        """
+        변경 사항만 세션에 기록 (커밋은 publish_generation 에서)
+
+        - added: 학과 INSERT (같은 전형의 삭제 표시된 학과가 있으면 되살려 changed 로 기록)
+        - changed: 학과 UPDATE
+        - removed: 학과 삭제 표시 (removed_at, 이력은 그대로 유지)
+        - 모집군 변경: 전형 gun UPDATE
+        - 페이지 소속 변경: 전형 page_code UPDATE
+        - 지원인원 변동은 history_writer 로 RatioHistory 에 기록
+
+        Returns:
+            대학 상태 (신규 대학이면 새로 만든 상태)
+        """
+        if state is None:
             university = University(
-                code=univ_code,
-                name=ratio_data.university_name,
-                ratio_url=f"https://addon.jinhakapply.com/RatioV1/RatioH/Ratio{ratio_data.university_code}.html"
+                code=delta.university_code,
+                name=delta.university_name,
+                ratio_url=ratio_url
             )
             self.db.add(university)
             await self.db.flush()
-        else:
-            university.name = ratio_data.university_name
-            university.updated_at = datetime.now()
-
-        # 2. 전형별 데이터 저장
-        for adm_data in ratio_data.admissions:
-            # 전형 upsert
-            stmt = select(Admission).where(and_(
-                Admission.university_id == university.id,
-                Admission.admission_type == ratio_data.admission_type,
-                Admission.admission_name == adm_data.admission_name,
-                Admission.year == ratio_data.year
-            ))
-            result = await self.db.execute(stmt)
-            admission = result.scalar_one_or_none()
-
-            if not admission:
-                admission = Admission(
-                    university_id=university.id,
-                    admission_type=ratio_data.admission_type,
-                    admission_name=adm_data.admission_name,
-                    year=ratio_data.year
+            state = UniversityState(
+                university_id=university.id,
+                university_name=university.name
+            )
+        elif delta.has_changes:
+            await self.db.execute(
+                update(University)
+                .where(University.id == state.university_id)
+                .values(
+                    name=delta.university_name if delta.name_changed else state.university_name,
+                    updated_at=datetime.now()
                 )
-                self.db.add(admission)
-                await self.db.flush()
-
-            # 3. 학과별 데이터 저장
-            for dept_data in adm_data.departments:
-                # 기존 학과 찾기
-                stmt = select(Department).where(and_(
-                    Department.admission_id == admission.id,
-                    Department.name == dept_data.name,
-                    Department.campus == dept_data.campus
-                ))
-                result = await self.db.execute(stmt)
-                department = result.scalar_one_or_none()
-
-                if not department:
-                    department = Department(
-                        admission_id=admission.id,
-                        campus=dept_data.campus,
-                        name=dept_data.name,
-                        detail=dept_data.detail,
-                        recruit_count=dept_data.recruit_count,
-                        apply_count=dept_data.apply_count,
-                        competition_rate=dept_data.competition_rate
-                    )
-                    self.db.add(department)
-                    await self.db.flush()
-                else:
-                    # 경쟁률 변동 시 이력 기록
-                    if (department.apply_count != dept_data.apply_count or
-                            department.competition_rate != dept_data.competition_rate):
-                        history = RatioHistory(
-                            department_id=department.id,
-                            recruit_count=department.recruit_count,
-                            apply_count=department.apply_count,
-                            competition_rate=department.competition_rate
-                        )
-                        self.db.add(history)
-
-                    # 데이터 업데이트
-                    department.recruit_count = dept_data.recruit_count
-                    department.apply_count = dept_data.apply_count
-                    department.competition_rate = dept_data.competition_rate
-                    department.detail = dept_data.detail
-                    department.updated_at = datetime.now()
-
-        await self.db.commit()
-        return university
+            )
+
+        now = datetime.now()
+        added = [d for d in delta.departments if d.kind == ADDED]
+        changed = [d for d in delta.departments if d.kind == CHANGED]
+        removed = [d for d in delta.departments if d.kind == REMOVED]
+
+        # 1. 신규 학과 (다시 나타난 학과는 삭제 표시를 풀고 이력을 이어감)
+        added_admissions = [
+            (dept, await self._get_admission_id(state, delta, dept.admission_name)) for dept in added
+        ]
+        removed_before = await self._removed_departments(
+            {admission_id for _, admission_id in added_admissions}
+        )
+        new_departments = []
+        revived = []
+        for dept, admission_id in added_admissions:
+            entry = removed_before.get((admission_id, dept.campus, dept.name))
+            if entry:
+                dept.kind, dept.department_id, dept.old = CHANGED, entry[0], entry[1]
+                revived.append(dept)
+                continue
+            recruit_count, apply_count, competition_rate, detail = dept.new
+            department = Department(
+                admission_id=admission_id,
+                campus=dept.campus,
+                name=dept.name,
+                detail=detail,
+                recruit_count=recruit_count,
+                apply_count=apply_count,
+                competition_rate=competition_rate
+            )
+            self.db.add(department)
+            new_departments.append((dept, department))
+        if new_departments:
+            await self.db.flush()
+            for dept, department in new_departments:
+                dept.department_id = department.id
+
+        # 2. 변경된 학과
+        if changed or revived:
+            await self.db.execute(update(Department), [
+                {
+                    "id": dept.department_id,
+                    "recruit_count": dept.new[0],
+                    "apply_count": dept.new[1],
+                    "competition_rate": dept.new[2],
+                    "detail": dept.new[3],
+                    "removed_at": None,
+                    "updated_at": now
+                }
+                for dept in changed + revived
+            ])
+
+        # 3. 모집군이 바뀐 기존 전형 (신규 전형은 생성 시 반영)
+        gun_updates = [
+            {"id": state.admission_ids[key], "gun": delta.admission_guns[name]}
+            for name in delta.gun_changed
+            if (key := (delta.admission_type, delta.year, name)) in state.admission_ids
+        ]
+        if gun_updates:
+            await self.db.execute(update(Admission), gun_updates)
+
+        # 3-1. 이 페이지 소속이 된 기존 전형 (페이지 코드가 없던 기존 데이터 등)
+        page_updates = [
+            {"id": state.admission_ids[key], "page_code": delta.page_code}
+            for name in delta.page_claimed
+            if (key := (delta.admission_type, delta.year, name)) in state.admission_ids
+        ]
+        if page_updates:
+            await self.db.execute(update(Admission), page_updates)
+
+        # 4. 사라진 학과 (삭제하지 않고 표시만 - 경쟁률 변동 이력 보존)
+        if removed:
+            await self.db.execute(
+                update(Department)
+                .where(Department.id.in_([dept.department_id for dept in removed]))
+                .values(removed_at=now)
+            )
+
+        # 5. 지원인원 변동 이력
+        await history_writer.write(self.db, delta)
+
+        return state
+
+    async def _removed_departments(
+        self,
+        admission_ids: set[int]
+    ) -> dict[tuple[int, Optional[str], str], tuple[int, DepartmentValues]]:
+        """전형별 삭제 표시된 학과 {(admission_id, 캠퍼스, 모집단위명): (department_id, 값)}"""
+        if not admission_ids:
+            return {}
+        result = await self.db.execute(
+            select(
+                Department.id,
+                Department.admission_id,
+                Department.campus,
+                Department.name,
+                Department.recruit_count,
+                Department.apply_count,
+                Department.competition_rate,
+                Department.detail
+            )
+            .where(
+                Department.admission_id.in_(admission_ids),
+                Department.removed_at.is_not(None)
+            )
+            .order_by(Department.id)
+        )
+        return {
+            (row.admission_id, row.campus, row.name): (
+                row.id,
+                (row.recruit_count, row.apply_count, row.competition_rate, row.detail)
+            )
+            for row in result.all()
+        }
+
+    async def publish_generation(
+        self,
+        generation: GenerationBuilder,
+        timer: Optional[StageTimer] = None
+    ) -> Optional[int]:
+        """
+        모아 둔 변경을 한 트랜잭션으로 저장하고 새 데이터 세대로 게시
+
+        커밋 전까지 조회 쪽은 이전 세대를 그대로 봅니다.
+        변경 사항이 없으면 아무것도 쓰지 않습니다.
+
+        Returns:
+            새 세대 id 또는 None (변경 없음)
+        """
+        if not generation.has_changes:
+            return None
+
+        timer = timer or StageTimer("generation")
+        written = []
+        # 이번 세대에서 저장한 대학 상태 (같은 신규 대학의 다른 페이지는 이 상태에 이어서 저장)
+        states: dict[str, UniversityState] = {}
+        try:
+            with timer.stage("db_write"):
+                for item in generation.staged.values():
+                    if item.state is not None and not item.delta.has_changes:
+                        continue
+                    code = item.delta.university_code
+                    state = await self._write_delta(item.state or states.get(code), item.delta, item.ratio_url)
+                    states[code] = state
+                    written.append((state, item.delta))
+
+                # 쓰기 잠금을 잡은 뒤의 현재 세대 (캐시 기준 세대와 다르면 그 사이 다른 게시가 있었음)
+                previous_id = await current_generation(self.db)
+                record = DataGeneration(
+                    universities=len(states),
+                    departments=sum(len(delta.departments) for _, delta in written)
+                )
+                self.db.add(record)
+                # 버퍼의 크롤링 로그도 같은 트랜잭션으로 저장
+                await self.logs.flush(self.db)
+                await self.db.commit()
+        except Exception:
+            # 세션을 다시 쓸 수 있도록 롤백하고, 롤백된 ID가 캐시에 남지 않도록 상태를 비움
+            await self.db.rollback()
+            for code in generation.university_codes():
+                ratio_state.invalidate(code)
+            history_writer.forget()
+            raise
+
+        generation.generation_id = record.id
+        for state, delta in written:
+            ratio_state.apply(state, delta)
+            generation.university_ids[delta.university_code] = state.university_id
+            await self._notify(delta)
+        if not ratio_state.advance(previous_id, record.id):
+            history_writer.forget()
+        await notify_generation(record.id)
+
+        return record.id
+
+    async def persist_delta(
+        self,
+        state: Optional[UniversityState],
+        delta: UniversityDelta,
+        ratio_url: Optional[str] = None
+    ) -> University:
+        """대학 1곳의 변경만 바로 게시 (변경 사항이 없으면 아무것도 쓰지 않음)"""
+        generation = GenerationBuilder()
+        generation.stage(state, delta, ratio_url)
+        await self.publish_generation(generation)
+        return await self.db.get(University, generation.university_id(delta.university_code))
+
+    async def _notify(self, delta: UniversityDelta):
+        """변경 구독자 호출 (캐시 무효화, 알림 등)"""
+        if not delta.has_changes:
+            return
+        for subscriber in delta_subscribers:
+            try:
+                await subscriber(delta)
+            except Exception as e:
+                logger.warning(f"변경 구독자 오류 ({delta.university_code}): {e}")
+
+    async def save_university_ratio(self, ratio_data: UniversityRatio) -> University:
+        """
+        크롤링한 경쟁률 데이터를 DB에 저장 (변경분만)
+
+        Args:
+            ratio_data: 크롤링 결과
+
+        Returns:
+            저장된 University 객체
+        """
+        await self.sync_state()
+        state, delta = await self.diff_university_ratio(ratio_data)
+        return await self.persist_delta(state, delta, self._ratio_url(ratio_data))
+
+    def _ratio_url(self, ratio_data: UniversityRatio) -> str:
+        if ratio_data.source_url:
+            return ratio_data.source_url
+        return f"https://addon.jinhakapply.com/RatioV1/RatioH/Ratio{ratio_data.university_code}.html"
+
+    def add_log(self, university_code: str, status: str, message: str, start_time: datetime):
+        """크롤링 결과 로그를 버퍼에 추가 (세대 게시 또는 flush_logs 때 한 번에 저장)"""
+        self.logs.add(university_code, status, message, (datetime.now() - start_time).total_seconds())
+
+    async def flush_logs(self):
+        """버퍼의 크롤링 로그 저장"""
+        if await self.logs.flush(self.db):
+            await self.db.commit()
+
+    async def record_result(
+        self,
+        url: str,
+        ratio_data: Optional[UniversityRatio],
+        generation: GenerationBuilder,
+        timer: StageTimer,
+        start_time: datetime
+    ) -> str:
+        """
+        크롤링 결과를 diff/품질 검사 후 generation 에 모으고 로그 추가
+
+        Returns:
+            success / skipped / quarantined
+        """
+        if not ratio_data:
+            self.add_log(url, "skipped", "경쟁률 데이터 없음", start_time)
+            return "skipped"
+
+        with timer.stage("diff"):
+            state, delta = await self.diff_university_ratio(ratio_data)
+        with timer.stage("validate"):
+            verdict = await quality_gate.check(self.db, state, delta, ratio_data, self.quarantined)
+
+        if not verdict.accepted:
+            # 반쯤 빈 페이지 등 - 저장하지 않고 격리 (/crawl/quarantine)
+            self.add_log(
+                ratio_data.university_code, "quarantined",
+                f"품질 검사 격리: {verdict.summary()}", start_time
+            )
+            return "quarantined"
+
+        generation.stage(state, delta, self._ratio_url(ratio_data))
+
+        self.add_log(
+            ratio_data.university_code, "success",
+            f"크롤링 완료: {len(ratio_data.admissions)}개 전형, "
+            f"변경 {delta.summary()} ({timer.summary()})"
+            + (f" [연속 격리로 반영: {verdict.summary()}]" if verdict.forced else ""),
+            start_time
+        )
+        logger.info(f"[Crawl] {ratio_data.university_code} 완료 ({timer.summary()})")
+        return "success"
+
+    async def record_failure(self, url: str, error: Exception, start_time: datetime):
+        """실패 로그 추가 (진행 중이던 세션 트랜잭션은 롤백)"""
+        await self.db.rollback()
+        self.add_log(url, "failed", str(error), start_time)
+
+    async def fetch_ratio(
+        self,
+        url: str,
+        admission_type: str,
+        year: int,
+        timer: StageTimer
+    ) -> Optional[UniversityRatio]:
+        """경쟁률 페이지 요청/파싱 (JS 렌더링이 필요한 페이지만 브라우저로 재시도, 선택)"""
+        crawler = self.crawler_for(url)
+        ratio_data = await crawler.crawl(url, admission_type, year, timer=timer)
+        if not ratio_data and settings.browser_fallback_enabled:
+            ratio_data = await crawler.crawl_with_browser(url, admission_type, year, timer=timer)
+        return ratio_data
+
+    async def crawl_university(
+        self,
+        url: str,
+        admission_type: str,
+        year: int,
+        generation: GenerationBuilder
+    ) -> str:
+        """
+        단일 대학 크롤링 후 변경을 generation 에 모음 (게시는 publish_generation)
+
+        Returns:
+            success / skipped / quarantined (실패 시 예외)
+        """
+        start_time = datetime.now()
+        timer = StageTimer(page_code(url))
+
+        try:
+            ratio_data = await self.fetch_ratio(url, admission_type, year, timer)
+            return await self.record_result(url, ratio_data, generation, timer, start_time)
+        except Exception as e:
+            await self.record_failure(url, e, start_time)
+            raise
 
     async def crawl_and_save(
         self,
@@ -120,7 +589,7 @@ class CrawlService:
         year: int = 2026
     ) -> Optional[University]:
         """
-        단일 대학 크롤링 및 저장
+        단일 대학 크롤링 및 저장 (대학 1곳짜리 세대로 바로 게시)
 
         Args:
             url: 경쟁률 페이지 URL
@@ -130,91 +599,187 @@ class CrawlService:
         Returns:
             저장된 University 또는 None
         """
-        start_time = datetime.now()
-
+        await self.sync_state()
+        generation = GenerationBuilder()
         try:
-            ratio_data = await self.ratio_crawler.crawl(url, admission_type, year)
-
-            if ratio_data:
-                university = await self.save_university_ratio(ratio_data)
-
-                # 성공 로그
-                duration = (datetime.now() - start_time).total_seconds()
-                log = CrawlLog(
-                    university_code=ratio_data.university_code,
-                    status="success",
-                    message=f"크롤링 완료: {len(ratio_data.admissions)}개 전형",
-                    duration_seconds=duration
-                )
-                self.db.add(log)
-                await self.db.commit()
-
-                return university
-
-            # 데이터 없음 로그
-            log = CrawlLog(
-                university_code=url,
-                status="skipped",
-                message="경쟁률 데이터 없음",
-                duration_seconds=(datetime.now() - start_time).total_seconds()
-            )
-            self.db.add(log)
-            await self.db.commit()
+            status = await self.crawl_university(url, admission_type, year, generation)
+        finally:
+            if not generation.has_changes:
+                await self.flush_logs()
+        if status != "success":
             return None
 
-        except Exception as e:
-            # 실패 로그
-            log = CrawlLog(
-                university_code=url,
-                status="failed",
-                message=str(e)[:500],
-                duration_seconds=(datetime.now() - start_time).total_seconds()
-            )
-            self.db.add(log)
-            await self.db.commit()
-            raise
+        # 로그는 게시 트랜잭션에 함께 저장 (변경이 없으면 위에서 저장됨)
+        await self.publish_generation(generation, StageTimer(page_code(url)))
+        university_code = next(iter(generation.staged.values())).delta.university_code
+        return await self.db.get(University, generation.university_id(university_code))
 
     async def crawl_all_universities(
         self,
         admission_type: str = "정시",
         year: int = 2026,
-        delay: float = 1.0
+        delay: float = 0.0,
+        universities: Optional[list[UniversityInfo]] = None,
+        record: bool = True,
+        share: float = 1.0
     ) -> dict:
         """
-        모든 대학 크롤링
+        모든 대학 크롤링 (사이클 전체를 한 세대로 게시)
+
+        요청/파싱/저장 단계를 파이프라인(app/services/crawl_pipeline.py)으로 동시에 진행하며,
+        실제 동시 요청 수는 호스트별 AIMD 창(app/crawler/concurrency.py)이 조절합니다.
+        crawl_cycle_budget_seconds 안에 끝나지 않으면 남은 대학은 다음 사이클로 미루고
+        (results["deferred"]) 그때까지 모은 변경만 게시합니다.
+        모은 결과가 사이클 검증(validate_crawl_cycle)을 통과해야 게시하고, 통과하지 못하면
+        변경을 버리고 이전 세대를 유지합니다 (성공한 대학은 실패로 돌림).
+
+        Args:
+            delay: 요청 작업자별 대학 사이 대기 시간 (초, 기본 0)
+            universities: 크롤링할 대학 (기본: 대학 목록 페이지에서 조회, 크롤링 작업 재개 시 남은 대학만)
+            record: 사이클 요약 기록 여부 (여러 노드가 나눠 크롤링하는 작업은 False 로 두고
+                작업이 끝날 때 complete_cycle 로 한 번 기록)
+            share: 작업 전체 중 이번 대학 목록의 비율 (검증 기준을 이 몫만큼 줄임, validate_crawl_cycle)
 
         Returns:
-            결과 요약 dict
+            결과 요약 dict (대학별 결과는 self.pipeline.outcomes)
         """
+        cycle_start = time.perf_counter()
+        started_at = datetime.now(timezone.utc).replace(tzinfo=None)
+
         # 대학 목록 조회
-        universities = await self.univ_crawler.get_universities(admission_type)
+        if universities is None:
+            universities = await self.univ_crawler.get_universities(admission_type)
 
         results = {
             "total": len(universities),
             "success": 0,
             "failed": 0,
-            "skipped": 0
+            "skipped": 0,
+            "quarantined": 0,
+            "deferred": 0
         }
 
-        for univ in universities:
-            if not univ.ratio_url:
-                results["skipped"] += 1
-                continue
+        # 직전 사이클에서 미룬 대학부터 (예산이 계속 모자라도 같은 대학만 밀리지 않도록)
+        global _deferred_urls
+        universities.sort(key=lambda univ: univ.ratio_url not in _deferred_urls)
 
-            try:
-                university = await self.crawl_and_save(
-                    univ.ratio_url,
-                    admission_type,
-                    year
-                )
-                if university:
-                    results["success"] += 1
-                else:
-                    results["skipped"] += 1
-            except Exception as e:
-                print(f"크롤링 실패 ({univ.name}): {e}")
-                results["failed"] += 1
+        await self.sync_state()
+        generation = GenerationBuilder()
+        pipeline = self.pipeline = CrawlPipeline(self, admission_type, year, generation, delay)
+        self.quarantined = await quality_gate.quarantined_keys(self.db)
+        try:
+            with cycle_budget(settings.crawl_cycle_budget_seconds):
+                await pipeline.run(universities)
+        finally:
+            self.quarantined = None
+        results.update(pipeline.results)
+        deferred = pipeline.deferred
 
-            await asyncio.sleep(delay)
+        _deferred_urls = {univ.ratio_url for univ in deferred if univ.ratio_url}
+        if deferred:
+            results["deferred"] = len(deferred)
+            logger.warning(f"크롤링 사이클 시간 예산 소진: {len(deferred)}개 대학 다음 사이클로 미룸")
 
+        # 검증을 통과한 사이클만 게시 (crawler.js validateNewData -> safeDeploy 와 같은 순서)
+        results["validation"] = await self.validate_cycle(results["success"], share)
+        if results["validation"]["valid"]:
+            await self._publish_cycle(generation, pipeline, results)
+        else:
+            # 모은 변경은 버리고 이전 세대를 그대로 유지
+            logger.warning(
+                f"크롤링 사이클 검증 실패, 게시하지 않음 ({len(generation)}개 페이지): "
+                f"{results['validation']['reason']}"
+            )
+            results["generation"] = None
+            self._fail_successes(pipeline, results)
+
+        duration = time.perf_counter() - cycle_start
+        CRAWL_CYCLE_SECONDS.observe(duration)
+
+        if record:
+            await self._record_cycle(results, started_at, duration)
         return results
+
+    async def _publish_cycle(self, generation: GenerationBuilder, pipeline: CrawlPipeline, results: dict):
+        """사이클 세대 게시 (실패하면 성공한 대학을 실패로 돌림)"""
+        try:
+            results["generation"] = await self.publish_generation(generation)
+        except Exception as e:
+            # 이전 세대가 그대로 유지됨
+            logger.error(f"데이터 세대 게시 실패 ({len(generation)}개 페이지): {e}")
+            results["generation"] = None
+            self._fail_successes(pipeline, results)
+
+    @staticmethod
+    def _fail_successes(pipeline: CrawlPipeline, results: dict):
+        """게시하지 못한 사이클의 성공 대학을 실패로 돌림"""
+        results["failed"] += results["success"]
+        results["success"] = 0
+        for url, status in pipeline.outcomes.items():
+            if status == "success":
+                pipeline.outcomes[url] = "failed"
+
+    async def validate_cycle(self, success_count: int, share: float = 1.0) -> dict:
+        """
+        사이클 검증 (validate_crawl_cycle)
+
+        검증 기준은 마지막으로 검증을 통과한 사이클 요약이므로, 어느 노드가 검증하든 같습니다.
+        """
+        previous = (
+            await self.db.execute(
+                select(CrawlCycle.success)
+                .where(CrawlCycle.valid.is_(True))
+                .order_by(CrawlCycle.id.desc())
+                .limit(1)
+            )
+        ).scalar_one_or_none()
+        return validate_crawl_cycle(success_count, previous or 0, share)
+
+    async def complete_cycle(self, results: dict, started_at: datetime, duration: float):
+        """
+        여러 노드가 나눠 크롤링한 작업 전체의 검증 후 요약 기록 (results["validation"] 추가)
+
+        라운드마다 자기 몫만큼 줄인 기준으로 검증을 통과한 변경만 게시됐고,
+        여기서는 작업 전체 집계로 다시 검증해 다음 사이클의 기준(valid)을 남깁니다.
+        """
+        validation = results["validation"] = await self.validate_cycle(results["success"])
+        if not validation["valid"]:
+            logger.warning(f"크롤링 사이클 검증 실패: {validation['reason']}")
+
+        await self._record_cycle(results, started_at, duration)
+
+    async def _record_cycle(self, results: dict, started_at: datetime, duration: float):
+        """사이클 요약 1행 + 남은 로그 저장 후 /crawl/status 캐시 교체"""
+        try:
+            university_count = (await self.db.execute(select(func.count(University.id)))).scalar_one()
+            department_count = (await self.db.execute(
+                select(func.count(Department.id)).where(Department.removed_at.is_(None))
+            )).scalar_one()
+            cycle = CrawlCycle(
+                started_at=started_at,
+                finished_at=datetime.now(timezone.utc).replace(tzinfo=None),
+                duration_seconds=duration,
+                total=results["total"],
+                success=results["success"],
+                failed=results["failed"],
+                skipped=results["skipped"],
+                quarantined=results["quarantined"],
+                deferred=results["deferred"],
+                generation_id=results["generation"],
+                valid=results["validation"]["valid"],
+                message=(
+                    f"성공 {results['success']}/{results['total']}, 실패 {results['failed']}, "
+                    f"격리 {results['quarantined']}, 미룸 {results['deferred']} - "
+                    f"{results['validation']['reason']}"
+                )[:500],
+                total_universities=university_count,
+                total_departments=department_count
+            )
+            self.db.add(cycle)
+            await self.logs.flush(self.db)
+            await self.db.commit()
+        except Exception as e:
+            await self.db.rollback()
+            logger.error(f"크롤링 사이클 요약 저장 실패: {e}")
+            return
+        last_cycle.set(cycle)
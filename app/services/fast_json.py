@@ -0,0 +1,55 @@
+"""
+대용량 조회 응답의 빠른 직렬화 경로
+
+response_model 로 응답하면 핸들러가 만든 pydantic 객체를 FastAPI 가 다시 검증한 뒤
+직렬화합니다 (경쟁률 검색 10,000행이면 객체 생성 + 검증 2번 + 인코딩).
+여기서는 SQL 결과 튜플을 스키마 필드 순서의 dict 로 바로 옮기고 한 번에 JSON 바이트로
+인코딩합니다. 값은 DB 컬럼 그대로이므로 스키마와 같은 모양의 JSON 이 나옵니다.
+
+- orjson 이 있으면 사용 (UTC 시각은 pydantic 과 같은 "Z" 표기)
+- 없으면 pydantic-core 의 to_json (Rust 직렬화기, pydantic 과 같은 출력)
+
+라우트에는 문서(OpenAPI)용으로 response_model 을 그대로 두고 인코딩한 바이트를 Response 로
+반환합니다 (app/services/response_cache.py 가 세대별로 보관/압축).
+"""
+
+from typing import Iterable, Sequence
+
+from pydantic import BaseModel
+from pydantic_core import to_json
+
+try:
+    import orjson
+except ImportError:  # 선택 의존성: 없으면 pydantic-core 직렬화기 사용
+    orjson = None
+
+
+def dumps(payload) -> bytes:
+    """dict/list/datetime 을 JSON 바이트로 (한글 그대로)"""
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_UTC_Z)
+    return to_json(payload)
+
+
+def schema_columns(schema: type[BaseModel], model, exclude: Sequence[str] = ()) -> list:
+    """
+    응답 스키마 필드 순서대로 ORM 컬럼 목록 (select(*columns) 용)
+
+    스키마 필드명이 모델 컬럼명과 같은 경우에 사용합니다. 중첩 목록(exclude)은 따로 채웁니다.
+    """
+    return [getattr(model, name) for name in schema.model_fields if name not in exclude]
+
+
+def rows_to_dicts(result) -> list[dict]:
+    """SQL 결과(Result) -> 컬럼명(label) 키 dict 목록"""
+    keys = tuple(result.keys())
+    return [dict(zip(keys, row)) for row in result]
+
+
+def group_by(rows: Iterable[dict], key: str) -> dict:
+    """dict 목록을 key 값별 목록으로 (원래 순서 유지)"""
+    groups: dict = {}
+    for row in rows:
+        groups.setdefault(row[key], []).append(row)
+    return groups
+
@@ -0,0 +1,165 @@
+"""
+데이터 세대(generation) 게시
+
+대학별로 커밋하면 크롤링 사이클 도중의 조회가 옛 대학/새 대학을 섞어 보게 됩니다.
+사이클 동안에는 diff 결과(UniversityDelta)를 GenerationBuilder 에 모아 두고,
+사이클이 끝나면 CrawlService.publish_generation 이 모든 변경과 data_generations 행을
+한 트랜잭션으로 커밋합니다. 커밋 자체가 포인터 교체이므로 조회 쪽은
+이전 세대 전체 또는 새 세대 전체만 봅니다.
+
+- 현재 세대: data_generations 의 최신 id (current_generation)
+- 조회 요청은 get_snapshot_db 로 읽기 트랜잭션을 열어 요청 동안 한 세대에 고정
+- 변경 구독자는 대학별(delta_subscribers) 외에 세대당 1회(generation_subscribers) 호출
+
+크롤러가 별도 프로세스(app/worker.py)인 경우 API 프로세스는 GenerationWatcher 가
+현재 세대를 주기적으로 조회(PK 최댓값 1건)해 새 세대를 감지하고 같은 구독자를 호출합니다.
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Optional
+
+from sqlalchemy import select, func
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import get_settings
+from app.models import DataGeneration
+from app.services.ratio_diff import UniversityDelta, UniversityState
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+# 세대 구독자 (사이클 단위 캐시 무효화 등) - 새 데이터 세대가 게시/감지되면 세대 id 로 호출
+GenerationSubscriber = Callable[[int], Awaitable[None]]
+generation_subscribers: list[GenerationSubscriber] = []
+
+
+def subscribe_generations(subscriber: GenerationSubscriber):
+    """세대 구독자 등록"""
+    generation_subscribers.append(subscriber)
+
+
+async def notify_generation(generation_id: int):
+    """세대 구독자 호출 (세대당 1회)"""
+    for subscriber in generation_subscribers:
+        try:
+            await subscriber(generation_id)
+        except Exception as e:
+            logger.warning(f"세대 구독자 오류 ({generation_id}): {e}")
+
+
+@dataclass
+class StagedUniversity:
+    """게시 대기 중인 대학 1곳의 변경"""
+    state: Optional[UniversityState]  # None 이면 신규 대학
+    delta: UniversityDelta
+    ratio_url: Optional[str] = None
+
+
+@dataclass
+class GenerationBuilder:
+    """
+    크롤링 사이클 1회분 변경 모음
+
+    키는 페이지 코드입니다. 여러 페이지로 나뉜 대학(예: 11720771, 11720772)은
+    페이지마다 따로 모여 같은 세대에 함께 게시됩니다 (페이지별 diff 는 서로 겹치지 않음).
+    같은 페이지가 두 번 들어오면 나중 결과만 남깁니다
+    (둘 다 마지막 게시 상태 기준 diff 이므로 나중 것만 반영하면 됨).
+    """
+    staged: dict[str, StagedUniversity] = field(default_factory=dict)
+    # 게시 후 채워짐
+    generation_id: Optional[int] = None
+    university_ids: dict[str, int] = field(default_factory=dict)  # 대학 코드 -> university_id
+
+    def stage(self, state: Optional[UniversityState], delta: UniversityDelta, ratio_url: Optional[str] = None):
+        self.staged[delta.page_code or delta.university_code] = StagedUniversity(state, delta, ratio_url)
+
+    def university_codes(self) -> set[str]:
+        """게시 대기 중인 대학 코드 (여러 페이지인 대학은 1개)"""
+        return {item.delta.university_code for item in self.staged.values()}
+
+    def university_id(self, university_code: str) -> Optional[int]:
+        """게시 후 대학 id (신규 대학은 게시 때 생성됨)"""
+        if university_code in self.university_ids:
+            return self.university_ids[university_code]
+        for item in self.staged.values():
+            if item.delta.university_code == university_code and item.state:
+                return item.state.university_id
+        return None
+
+    @property
+    def has_changes(self) -> bool:
+        return any(item.state is None or item.delta.has_changes for item in self.staged.values())
+
+    def __len__(self) -> int:
+        return len(self.staged)
+
+
+# 크롤링 밖에서 DB를 직접 바꾼 스크립트(import_*.py)가 같은 트랜잭션에서 실행하는 SQL.
+# 새 세대를 남기면 실행 중인 API/크롤러 프로세스가 세대 번호로 변경을 감지해
+# 상태 캐시(ratio_state.sync)와 응답 캐시(generation_watcher 구독자)를 비웁니다.
+EXTERNAL_GENERATION_SQL = (
+    "INSERT INTO data_generations (universities, departments, published_at) "
+    "VALUES (:universities, :departments, CURRENT_TIMESTAMP)"
+)
+
+
+async def current_generation(db: AsyncSession) -> int:
+    """현재 게시된 세대 id (게시 기록이 없으면 0)"""
+    return (await db.execute(select(func.max(DataGeneration.id)))).scalar_one() or 0
+
+
+class GenerationWatcher:
+    """
+    현재 세대 추적 (프로세스 전역)
+
+    - 같은 프로세스에서 게시하면 publish_generation 이 notify_generation 으로 바로 알림
+    - 다른 프로세스(크롤러 워커)가 게시한 세대는 generation_poll_seconds 마다 조회해 감지
+    """
+
+    def __init__(self):
+        self.generation = 0
+        self._task: Optional[asyncio.Task] = None
+
+    async def observe(self, generation_id: int):
+        """세대 구독자 (같은 프로세스에서 게시한 세대 반영)"""
+        self.generation = max(self.generation, generation_id)
+
+    async def poll(self, session_factory) -> bool:
+        """DB의 현재 세대 조회, 새 세대면 구독자 호출. Returns: 새 세대 여부"""
+        async with session_factory() as db:
+            generation_id = await current_generation(db)
+        if generation_id <= self.generation:
+            return False
+        self.generation = generation_id
+        await notify_generation(generation_id)
+        return True
+
+    async def _run(self, session_factory):
+        while True:
+            try:
+                if await self.poll(session_factory):
+                    logger.info(f"[Generation] 새 데이터 세대 감지: {self.generation}")
+            except Exception as e:
+                logger.warning(f"[Generation] 세대 조회 실패: {e}")
+            await asyncio.sleep(settings.generation_poll_seconds)
+
+    async def start(self, session_factory):
+        """현재 세대를 읽고 주기 조회 시작"""
+        async with session_factory() as db:
+            self.generation = await current_generation(db)
+        self._task = asyncio.create_task(self._run(session_factory))
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+generation_watcher = GenerationWatcher()
+subscribe_generations(generation_watcher.observe)
@@ -0,0 +1,55 @@
+"""
+일관된 해싱(consistent hashing) 링
+
+크롤러 노드 여러 대가 대학 코드를 나눠 가질 때 사용합니다 (app/services/crawl_jobs.py).
+노드마다 가상 노드 crawl_shard_vnodes 개를 링에 올려, 노드가 들어오거나 빠질 때
+그 노드 몫의 대학만 다른 노드로 옮겨 가고 나머지 배정은 그대로 유지됩니다.
+"""
+
+import bisect
+import hashlib
+from typing import Iterable, Optional
+
+from app.config import get_settings
+
+settings = get_settings()
+
+
+def _hash(value: str) -> int:
+    # 프로세스마다 달라지는 hash() 대신 고정 해시 (노드끼리 같은 링을 계산해야 함)
+    return int.from_bytes(hashlib.blake2b(value.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+class HashRing:
+    """
+    사용 예:
+        ring = HashRing(["host-a:101", "host-b:202"])
+        ring.node_for("10010671")  # "host-b:202"
+    """
+
+    def __init__(self, nodes: Iterable[str], vnodes: Optional[int] = None):
+        vnodes = vnodes or settings.crawl_shard_vnodes
+        self.nodes = sorted(set(nodes))
+        points = sorted(
+            (_hash(f"{node}#{i}"), node)
+            for node in self.nodes
+            for i in range(vnodes)
+        )
+        self._keys = [key for key, _ in points]
+        self._owners = [node for _, node in points]
+
+    def node_for(self, key: str) -> Optional[str]:
+        """key 를 맡는 노드 (노드가 없으면 None)"""
+        if not self._keys:
+            return None
+        index = bisect.bisect(self._keys, _hash(key)) % len(self._keys)
+        return self._owners[index]
+
+    def shares(self, keys: Iterable[str]) -> dict[str, int]:
+        """노드별 배정 수 (분포 확인용)"""
+        counts = {node: 0 for node in self.nodes}
+        for key in keys:
+            node = self.node_for(key)
+            if node is not None:
+                counts[node] += 1
+        return counts
@@ -0,0 +1,224 @@
+"""
+경쟁률 변동 이력(RatioHistory) 기록 및 보존 정책
+
+기록:
+- 지원인원이 바뀐 경우에만 기록하고, 변동량은 apply_delta 에 저장
+- 행에는 그 시점의 값(모집/지원인원, 경쟁률)도 함께 남김. 변동량만 저장하고 조회 때
+  현재 값에서 거슬러 계산하면, 이력 없이 값을 바꾸는 가져오기 스크립트(import_*.py)나
+  학과 삭제 후 재생성이 한 번만 있어도 그 이전 이력이 모두 틀어지고, 병합으로 행을 지워도
+  행마다 값이 맞아야 하기 때문 (행 수는 병합/보존 정책으로 줄임)
+- 같은 학과의 마지막 이력이 coalesce 구간(history_coalesce_seconds) 안에 있으면
+  새 행을 만들지 않고 그 행을 갱신 (짧은 시간 내 연속 변동을 하나로 병합)
+
+보존(compaction):
+- 최근 history_full_resolution_days 일: 모든 이력 유지
+- 그 이후 history_hourly_resolution_days 일까지: 시간당 1건
+- 그보다 오래된 이력: 일당 1건
+병합 시 구간의 마지막 값을 남기고 apply_delta 는 합산합니다.
+학과 ID 단위로 나눠 처리하므로 메모리 사용량은 batch_size 에 비례합니다.
+"""
+
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+from sqlalchemy import select, insert, update, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import get_settings
+from app.models import RatioHistory
+from app.services.ratio_diff import ADDED, CHANGED, REMOVED, UniversityDelta
+
+settings = get_settings()
+
+
+@dataclass
+class _LastEntry:
+    """학과별 마지막으로 기록한 이력 행"""
+    history_id: int
+    recorded_at: datetime
+    apply_delta: int
+
+
+class HistoryWriter:
+    """
+    delta 기반 이력 기록기
+
+    persist 단계와 같은 트랜잭션 안에서 write() 를 호출합니다.
+    마지막 기록 위치는 메모리에만 유지하므로 재시작 직후에는 새 행으로 시작합니다.
+    """
+
+    def __init__(self, coalesce_seconds: Optional[int] = None):
+        self.coalesce_seconds = (
+            coalesce_seconds if coalesce_seconds is not None else settings.history_coalesce_seconds
+        )
+        self._last: dict[int, _LastEntry] = {}
+
+    async def write(self, db: AsyncSession, delta: UniversityDelta, now: Optional[datetime] = None):
+        """
+        delta 중 지원인원이 바뀐 학과만 이력 기록
+
+        Args:
+            db: persist 단계의 세션 (커밋은 호출자가 수행)
+            delta: diff 단계 결과 (added 는 department_id 가 채워진 상태여야 함)
+        """
+        now = now or datetime.now(timezone.utc).replace(tzinfo=None)
+        window = timedelta(seconds=self.coalesce_seconds)
+
+        inserts = []
+        coalesced = []
+
+        for dept in delta.departments:
+            if dept.kind == REMOVED:
+                self._last.pop(dept.department_id, None)
+                continue
+
+            old_apply = dept.old[1] if dept.kind == CHANGED else 0
+            apply_delta = (dept.new[1] or 0) - (old_apply or 0)
+            if apply_delta == 0:
+                continue
+
+            values = {
+                "recruit_count": dept.new[0],
+                "apply_count": dept.new[1],
+                "competition_rate": dept.new[2],
+            }
+
+            last = self._last.get(dept.department_id)
+            if dept.kind != ADDED and last and now - last.recorded_at < window:
+                last.apply_delta += apply_delta
+                coalesced.append({"id": last.history_id, "apply_delta": last.apply_delta, **values})
+            else:
+                inserts.append({
+                    "department_id": dept.department_id,
+                    "apply_delta": apply_delta,
+                    "recorded_at": now,
+                    **values
+                })
+
+        if coalesced:
+            await db.execute(update(RatioHistory), coalesced)
+
+        if inserts:
+            result = await db.execute(
+                insert(RatioHistory).returning(
+                    RatioHistory.id, RatioHistory.department_id, RatioHistory.apply_delta
+                ),
+                inserts
+            )
+            for history_id, department_id, apply_delta in result.all():
+                self._last[department_id] = _LastEntry(history_id, now, apply_delta)
+
+    def forget(self):
+        """마지막 기록 위치 초기화 (롤백 시)"""
+        self._last.clear()
+
+
+# 보존 구간별 버킷 (SQLite strftime 형식)
+_HOURLY_BUCKET = "%Y-%m-%d %H"
+_DAILY_BUCKET = "%Y-%m-%d"
+
+
+def _timestamp(value: Optional[datetime]) -> str:
+    """SQLite 저장 형식과 비교 가능한 문자열 (None 이면 하한 없음)"""
+    return value.strftime("%Y-%m-%d %H:%M:%S") if value else "0000-01-01 00:00:00"
+
+
+async def _compact_range(
+    db: AsyncSession,
+    department_ids: list[int],
+    bucket_format: str,
+    start: Optional[datetime],
+    end: datetime
+) -> int:
+    """지정 구간의 이력을 버킷당 1건으로 병합, 삭제된 행 수 반환"""
+    placeholders = ", ".join(f":d{i}" for i in range(len(department_ids)))
+    params = {f"d{i}": dept_id for i, dept_id in enumerate(department_ids)}
+    params.update({"fmt": bucket_format, "start": _timestamp(start), "end": _timestamp(end)})
+
+    range_filter = (
+        f"department_id IN ({placeholders}) "
+        "AND recorded_at >= :start AND recorded_at < :end"
+    )
+    result = await db.execute(text(
+        "SELECT department_id, strftime(:fmt, recorded_at) AS bucket, "
+        "MAX(id) AS keep_id, SUM(COALESCE(apply_delta, 0)) AS total_delta "
+        f"FROM ratio_history WHERE {range_filter} "
+        "GROUP BY department_id, bucket HAVING COUNT(*) > 1"
+    ), params)
+    buckets = result.all()
+    if not buckets:
+        return 0
+
+    deleted = 0
+    for department_id, bucket, keep_id, total_delta in buckets:
+        await db.execute(
+            text("UPDATE ratio_history SET apply_delta = :delta WHERE id = :id"),
+            {"delta": total_delta, "id": keep_id}
+        )
+        result = await db.execute(text(
+            "DELETE FROM ratio_history "
+            "WHERE department_id = :department_id AND strftime(:fmt, recorded_at) = :bucket "
+            "AND recorded_at >= :start AND recorded_at < :end AND id != :keep_id"
+        ), {
+            "department_id": department_id,
+            "fmt": bucket_format,
+            "bucket": bucket,
+            "start": params["start"],
+            "end": params["end"],
+            "keep_id": keep_id
+        })
+        deleted += result.rowcount
+
+    return deleted
+
+
+async def compact_history(
+    db: AsyncSession,
+    now: Optional[datetime] = None,
+    batch_size: int = 500
+) -> dict:
+    """
+    보존 정책에 따라 오래된 이력 병합
+
+    Args:
+        db: DB 세션 (배치마다 커밋)
+        now: 기준 시각 (UTC, 기본: 현재)
+        batch_size: 한 번에 처리할 학과 수
+
+    Returns:
+        {"hourly_deleted": n, "daily_deleted": n}
+    """
+    now = now or datetime.now(timezone.utc).replace(tzinfo=None)
+    full_cutoff = now - timedelta(days=settings.history_full_resolution_days)
+    hourly_cutoff = now - timedelta(days=settings.history_hourly_resolution_days)
+    stats = {"hourly_deleted": 0, "daily_deleted": 0}
+
+    last_id = 0
+    while True:
+        result = await db.execute(
+            select(RatioHistory.department_id)
+            .where(RatioHistory.department_id > last_id, RatioHistory.recorded_at < full_cutoff)
+            .group_by(RatioHistory.department_id)
+            .order_by(RatioHistory.department_id)
+            .limit(batch_size)
+        )
+        department_ids = list(result.scalars().all())
+        if not department_ids:
+            break
+
+        if hourly_cutoff < full_cutoff:
+            stats["hourly_deleted"] += await _compact_range(
+                db, department_ids, _HOURLY_BUCKET, hourly_cutoff, full_cutoff
+            )
+        stats["daily_deleted"] += await _compact_range(
+            db, department_ids, _DAILY_BUCKET, None, min(hourly_cutoff, full_cutoff)
+        )
+        await db.commit()
+
+        last_id = department_ids[-1]
+
+    return stats
+
+
+# 프로세스 전역 이력 기록기
+history_writer = HistoryWriter()
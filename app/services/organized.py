@@ -0,0 +1,375 @@
+"""
+군별 정리 데이터셋 (organized_with_chuhap.json 의 서버 버전)
+
+Node 파이프라인(processData → regionMapper → lastYearMapper → predictFinalRate)이
+만들던 정적 파일과 같은 구조를 DB에서 바로 만들어 제공합니다.
+
+    {"가군": [{대학명, 캠퍼스, 전형명, 모집단위, 모집인원, 지원인원, 경쟁률, 지역,
+               정원, 현재경쟁률, 작년추합, 증가율, 예상최종경쟁, 예상실질경쟁, ...}], "나군": [...], ...}
+
+- 모집인원/지원인원/경쟁률은 DB의 최신 값
+- 지역/작년추합/증가율은 엑셀 기반이라 Node 출력 파일(organized_enrichment_path)에서 읽고,
+  예상최종경쟁/예상실질경쟁은 predictFinalRate.js 와 같은 식으로 최신 경쟁률에서 다시 계산
+- 데이터 버전(대학 수 + 마지막 갱신 시각 + 보강 파일 수정 시각)이 같으면
+  조회/직렬화/압축 결과를 재사용
+"""
+
+import gzip
+import hashlib
+import json
+import logging
+import os
+import re
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+from sqlalchemy import select, func, and_
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import get_settings
+from app.models import University, Admission, Department
+
+try:
+    import brotli
+except ImportError:  # 선택 의존성: 없으면 gzip 만 사용
+    brotli = None
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+GROUPS = ("가군", "나군", "다군", "기타")
+
+# 보강 파일에서 가져오는 항목 (엑셀 기반이라 DB에 없음)
+_ENRICHMENT_FIELDS = ("지역", "_matchType", "작년추합", "_chuhapMatchType", "증가율", "_predictionType")
+
+
+# ============ 정규화 (regionMapper.js / lastYearMapper.js 와 동일) ============
+
+def normalize_university(name: Optional[str]) -> str:
+    name = re.sub(r"\s+", "", name or "")
+    return re.sub(r"대학(교)?$", "", name).lower()
+
+
+def normalize_department(name: Optional[str]) -> str:
+    name = re.sub(r"\s+", "", name or "")
+    name = re.sub(r"\[.*?\]", "", name)
+    return re.sub(r"\(.*?\)", "", name).lower()
+
+
+def _parse_rate(text) -> float:
+    match = re.search(r"([\d.]+)", str(text or ""))
+    try:
+        return float(match.group(1)) if match else 0.0
+    except ValueError:
+        return 0.0
+
+
+# ============ 보강 데이터 (지역 / 작년추합 / 증가율) ============
+
+@dataclass
+class Enrichment:
+    """Node 출력 파일에서 읽은 대학/모집단위별 보강 값"""
+    exact: dict[str, dict]           # 대학|군|모집단위 -> 보강 값
+    regions: dict[str, str]          # 대학 -> 지역
+    group_ratios: dict[str, float]   # 대학|군 -> 평균 증가율
+    univ_ratios: dict[str, float]    # 대학 -> 평균 증가율
+    overall_ratio: float = 1.0
+
+    def lookup(self, university: str, gun: str, department: str) -> dict:
+        """predictFinalRate.js 순서(exact -> group -> univ -> overall)로 보강 값 조회"""
+        univ = normalize_university(university)
+        exact = self.exact.get(f"{univ}|{gun}|{normalize_department(department)}")
+        if exact:
+            return exact
+
+        values = {"지역": self.regions.get(univ, "미분류"), "작년추합": 0, "_chuhapMatchType": None}
+        group_key = f"{univ}|{gun}"
+        if group_key in self.group_ratios:
+            values.update(증가율=self.group_ratios[group_key], _predictionType="group")
+        elif univ in self.univ_ratios:
+            values.update(증가율=self.univ_ratios[univ], _predictionType="univ")
+        else:
+            values.update(증가율=self.overall_ratio, _predictionType="overall")
+        values["_matchType"] = "univ" if univ in self.regions else None
+        return values
+
+
+def _mean(values: list[float]) -> float:
+    return sum(values) / len(values) if values else 1.0
+
+
+def build_enrichment(data: dict) -> Enrichment:
+    """Node 출력(군별 목록) -> Enrichment"""
+    exact: dict[str, dict] = {}
+    regions: dict[str, str] = {}
+    group_values: dict[str, list[float]] = {}
+    univ_values: dict[str, list[float]] = {}
+    all_values: list[float] = []
+
+    for gun in GROUPS:
+        for item in data.get(gun) or []:
+            univ = normalize_university(item.get("대학명"))
+            values = {field: item[field] for field in _ENRICHMENT_FIELDS if field in item}
+            values["증가율"] = _parse_rate(values.get("증가율", 1))
+            exact.setdefault(f"{univ}|{gun}|{normalize_department(item.get('모집단위'))}", values)
+
+            if item.get("지역") and item["지역"] != "미분류":
+                regions.setdefault(univ, item["지역"])
+            if item.get("_predictionType") != "overall":
+                group_values.setdefault(f"{univ}|{gun}", []).append(values["증가율"])
+                univ_values.setdefault(univ, []).append(values["증가율"])
+            all_values.append(values["증가율"])
+
+    return Enrichment(
+        exact=exact,
+        regions=regions,
+        group_ratios={key: _mean(values) for key, values in group_values.items()},
+        univ_ratios={key: _mean(values) for key, values in univ_values.items()},
+        overall_ratio=_mean(all_values),
+    )
+
+
+_enrichment_cache: dict[str, tuple[float, Enrichment]] = {}
+
+
+def load_enrichment(path: Optional[str] = None) -> tuple[float, Optional[Enrichment]]:
+    """보강 파일 로드 (수정 시각이 같으면 재사용). Returns: (수정 시각, Enrichment 또는 None)"""
+    path = path or settings.organized_enrichment_path
+    if not path or not os.path.exists(path):
+        return 0.0, None
+
+    mtime = os.path.getmtime(path)
+    cached = _enrichment_cache.get(path)
+    if cached and cached[0] == mtime:
+        return cached
+
+    try:
+        enrichment = build_enrichment(json.loads(Path(path).read_text(encoding="utf-8")))
+    except (OSError, ValueError) as e:
+        logger.warning(f"보강 파일 로드 실패: {path} - {e}")
+        return mtime, None
+
+    _enrichment_cache[path] = (mtime, enrichment)
+    return mtime, enrichment
+
+
+# ============ 항목 생성 ============
+
+def group_of(gun: Optional[str], admission_name: str) -> str:
+    """모집군 (gun 컬럼 이전에 저장된 전형은 전형명에서 추출, 없으면 기타)"""
+    if gun in GROUPS:
+        return gun
+    return next((group for group in GROUPS[:3] if group in (admission_name or "")), "기타")
+
+
+def make_entry(row, enrichment: Optional[Enrichment]) -> dict:
+    """DB 행 1개 -> 정리 데이터 항목 (processData.js 출력 + 보강/예측 필드)"""
+    recruit = row.recruit_count or 0
+    rate = row.competition_rate or 0.0
+    entry = {
+        "대학명": row.university_name,
+        "캠퍼스": row.campus or "",
+        "전형명": row.admission_name,
+        "모집단위": row.name,
+        "모집인원": str(recruit),
+        "지원인원": str(row.apply_count or 0),
+        "경쟁률": f"{rate:.2f} : 1",
+        "지역": row.region or "미분류",
+    }
+    if enrichment is None:
+        return entry
+
+    extra = enrichment.lookup(row.university_name, group_of(row.gun, row.admission_name), row.name)
+    entry.update(extra)
+    entry["지역"] = row.region or extra.get("지역") or "미분류"
+
+    # predictFinalRate.js: 예상최종 = 현재 경쟁률 x 증가율, 예상실질 = 예상지원 / (정원 + 작년추합)
+    ratio = extra.get("증가율", 1.0)
+    chuhap = extra.get("작년추합") or 0
+    predicted = rate * ratio
+    real = predicted * recruit / (recruit + chuhap) if recruit + chuhap > 0 else 0.0
+    entry.update({
+        "정원": recruit,
+        "현재경쟁률": entry["경쟁률"],
+        "작년추합": chuhap,
+        "증가율": f"{ratio:.2f}",
+        "예상최종경쟁": f"{predicted:.2f} : 1",
+        "예상최종경쟁값": predicted,
+        "예상실질경쟁": f"{real:.2f}",
+        "예상실질경쟁값": real,
+    })
+    return entry
+
+
+@dataclass(frozen=True)
+class OrganizedSlice:
+    """조회 조건 (모두 선택)"""
+    gun: Optional[str] = None
+    region: Optional[str] = None
+    university: Optional[str] = None
+    min_rate: Optional[float] = None
+    max_rate: Optional[float] = None
+
+    @property
+    def digest(self) -> str:
+        """ETag 용 조건 요약 (프로세스와 무관하게 같은 값)"""
+        return hashlib.sha1(repr(self).encode("utf-8")).hexdigest()[:12]
+
+    def matches(self, entry: dict, rate: float) -> bool:
+        if self.region and entry.get("지역") != self.region:
+            return False
+        if self.university and self.university not in entry["대학명"]:
+            return False
+        if self.min_rate is not None and rate < self.min_rate:
+            return False
+        if self.max_rate is not None and rate > self.max_rate:
+            return False
+        return True
+
+
+class OrganizedDataset:
+    """
+    군별 정리 데이터셋 캐시
+
+    데이터 버전이 바뀔 때만 DB에서 다시 만들고,
+    (버전, 조회 조건, 인코딩)별 압축 결과를 LRU 로 보관합니다.
+    """
+
+    def __init__(self, max_bodies: int = 256):
+        self.max_bodies = max_bodies
+        self.version: Optional[str] = None
+        self._groups: dict[str, list[tuple[dict, float]]] = {}
+        self._bodies: OrderedDict[tuple, bytes] = OrderedDict()
+
+    async def data_version(self, db: AsyncSession, admission_type: str, year: int) -> str:
+        """
+        대학 수 + 마지막 갱신 시각 + 보강 파일 수정 시각
+
+        크롤링 결과에 변경 사항이 있으면 University.updated_at 이 갱신되므로
+        대학 테이블(수백 행)만 보고 다른 프로세스의 저장도 감지합니다.
+        """
+        count, updated_at = (await db.execute(
+            select(func.count(University.id), func.max(University.updated_at))
+        )).one()
+        mtime, _ = load_enrichment()
+        stamp = int(updated_at.timestamp() * 1000) if updated_at else 0
+        raw = f"{admission_type}|{year}|{count}|{stamp}|{int(mtime)}"
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest()[:16]
+
+    async def _rebuild(self, db: AsyncSession, admission_type: str, year: int):
+        _, enrichment = load_enrichment()
+        result = await db.execute(
+            select(
+                University.name.label("university_name"),
+                University.region,
+                Admission.admission_name,
+                Admission.gun,
+                Department.campus,
+                Department.name,
+                Department.recruit_count,
+                Department.apply_count,
+                Department.competition_rate
+            )
+            .join(Admission, Admission.university_id == University.id)
+            .join(Department, Department.admission_id == Admission.id)
+            .where(and_(
+                Admission.admission_type == admission_type,
+                Admission.year == year,
+                Department.removed_at.is_(None)
+            ))
+            .order_by(University.name, Admission.id, Department.id)
+        )
+
+        groups: dict[str, list[tuple[dict, float]]] = {gun: [] for gun in GROUPS}
+        for row in result.all():
+            groups[group_of(row.gun, row.admission_name)].append(
+                (make_entry(row, enrichment), row.competition_rate or 0.0)
+            )
+        self._groups = groups
+
+    async def refresh(self, db: AsyncSession, admission_type: str = "정시", year: int = 2026) -> str:
+        """데이터 버전이 바뀌었으면 다시 만들기. Returns: 데이터 버전"""
+        version = await self.data_version(db, admission_type, year)
+        if version != self.version:
+            await self._rebuild(db, admission_type, year)
+            self.version = version
+            self._bodies.clear()
+        return version
+
+    @property
+    def entries(self) -> dict[str, list[dict]]:
+        """군별 전체 항목 (refresh 이후 호출)"""
+        return {gun: [entry for entry, _ in rows] for gun, rows in self._groups.items()}
+
+    def select(self, view: OrganizedSlice) -> dict[str, list[dict]]:
+        """조회 조건에 맞는 군별 항목 (refresh 이후 호출)"""
+        groups = [view.gun] if view.gun else list(GROUPS)
+        return {
+            gun: [entry for entry, rate in self._groups.get(gun, []) if view.matches(entry, rate)]
+            for gun in groups
+        }
+
+    async def get(
+        self,
+        db: AsyncSession,
+        view: OrganizedSlice,
+        encoding: str,
+        admission_type: str = "정시",
+        year: int = 2026
+    ) -> tuple[str, bytes]:
+        """
+        조회 조건에 맞는 직렬화/압축 결과
+
+        Returns:
+            (데이터 버전, 본문 바이트)
+        """
+        version = await self.refresh(db, admission_type, year)
+
+        key = (version, view, encoding)
+        body = self._bodies.get(key)
+        if body is not None:
+            self._bodies.move_to_end(key)
+            return version, body
+
+        body = compress(dumps(self.select(view)), encoding)
+
+        self._bodies[key] = body
+        if len(self._bodies) > self.max_bodies:
+            self._bodies.popitem(last=False)
+        return version, body
+
+
+# ============ 직렬화 / 압축 ============
+
+def dumps(payload) -> bytes:
+    """압축 JSON 직렬화 (한글 그대로)"""
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def choose_encoding(accept_encoding: Optional[str]) -> str:
+    """Accept-Encoding 에서 사용할 인코딩 선택 (br > gzip > identity)"""
+    accepted = {part.split(";")[0].strip().lower() for part in (accept_encoding or "").split(",")}
+    if brotli is not None and "br" in accepted:
+        return "br"
+    if "gzip" in accepted:
+        return "gzip"
+    return "identity"
+
+
+def compress(body: bytes, encoding: str, level: Optional[int] = None) -> bytes:
+    """
+    본문 압축 (level 미지정 시 응답용 기본값: br 5 / gzip 6)
+
+    gzip 헤더의 mtime 을 0 으로 고정해 같은 본문은 항상 같은 바이트가 됩니다.
+    """
+    if encoding == "br":
+        return brotli.compress(body, quality=5 if level is None else level)
+    if encoding == "gzip":
+        return gzip.compress(body, compresslevel=6 if level is None else level, mtime=0)
+    return body
+
+
+# 프로세스 전역 데이터셋 캐시
+organized_dataset = OrganizedDataset()
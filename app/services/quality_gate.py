@@ -0,0 +1,260 @@
+"""
+크롤링 데이터 품질 검사 (validate 단계)
+
+crawler.js safeDeploy/validateNewData 는 사이클이 끝난 뒤 임시 JSON 을 다시 읽어
+대학 수만 비교합니다. 여기서는 대학 1곳의 diff 결과(UniversityDelta)를
+메모리에 캐시된 마지막 상태(ratio_state)와 바로 비교해 저장 전에 걸러냅니다.
+직렬화/재로드 없이 delta 목록을 한 번 순회하므로 페이지당 수 μs 수준입니다
+(사이클 중에는 격리 키 목록을 사이클 시작 때 한 번 읽어 두므로, 격리 목록에 없는
+페이지가 통과하면 DB 를 조회하지 않음).
+
+검사 항목 (직전 모집단위 수 quality_min_rows 이상인 대학만):
+- row_drop: 사라진 모집단위 비율 > quality_max_row_drop (반쯤 빈 페이지)
+- apply_decrease: 지원인원이 줄어든 모집단위 비율 > quality_max_apply_decrease
+- zero_flood: 지원인원이 0 으로 떨어진 모집단위 비율 > quality_max_zero_flood
+
+통과하지 못한 결과는 저장하지 않고 격리(quarantine)합니다.
+같은 페이지가 quality_accept_after 회 연속 격리되면 실제 변경(모집단위 개편 등)으로 보고 통과시킵니다.
+격리된 결과는 /crawl/quarantine 에서 확인하고 수동으로 반영할 수 있습니다.
+
+격리 목록은 DB(crawl_quarantine)에 두므로 크롤링하는 프로세스(워커/노드)와
+/crawl/quarantine 을 받는 API 프로세스가 달라도 같은 목록과 연속 격리 횟수를 봅니다.
+기록은 크롤링 세션에 쓰고 커밋은 호출자(파이프라인 배치 커밋/세대 게시)가 합니다.
+DB 는 격리(불합격) 때와, 격리 목록에 있던 페이지가 통과해 항목을 지울 때만 씁니다.
+"""
+
+import dataclasses
+import json
+import logging
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import TYPE_CHECKING, Optional
+
+from sqlalchemy import delete, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import get_settings
+from app.metrics import CRAWL_QUALITY_REJECTIONS_TOTAL
+from app.models import CrawlQuarantine
+from app.services.ratio_diff import ADDED, CHANGED, REMOVED, UniversityDelta, UniversityState, page_departments
+
+if TYPE_CHECKING:
+    from app.crawler.ratio_crawler import UniversityRatio
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+ROW_DROP = "row_drop"
+APPLY_DECREASE = "apply_decrease"
+ZERO_FLOOD = "zero_flood"
+
+
+@dataclass
+class QualityVerdict:
+    """대학 1곳의 품질 검사 결과"""
+    accepted: bool
+    previous_rows: int = 0
+    # 위반 항목 -> 설명 (예: {"row_drop": "모집단위 52% 감소 (120 -> 58)"})
+    reasons: dict[str, str] = field(default_factory=dict)
+    forced: bool = False  # 연속 격리로 통과시킨 경우
+
+    def summary(self) -> str:
+        return "; ".join(self.reasons.values())
+
+
+@dataclass
+class QuarantineEntry:
+    """격리된 크롤링 결과"""
+    ratio_data: "UniversityRatio"
+    verdict: QualityVerdict
+    first_at: datetime
+    last_at: datetime
+    count: int = 1  # 연속 격리 횟수
+
+
+def check_delta(state: Optional[UniversityState], delta: UniversityDelta) -> QualityVerdict:
+    """
+    delta 를 마지막 상태와 비교해 품질 검사 (저장/알림 없음, 순수 함수)
+
+    직전 모집단위 수는 이 페이지 소속만 셉니다 (여러 페이지로 나뉜 대학).
+    신규 대학이거나 직전 모집단위 수가 적으면 항상 통과합니다.
+    """
+    previous_rows = len(page_departments(
+        state, delta.admission_type, delta.year, delta.page_code, delta.admission_guns
+    )) if state else 0
+    verdict = QualityVerdict(accepted=True, previous_rows=previous_rows)
+    if previous_rows < settings.quality_min_rows:
+        return verdict
+
+    added = removed = decreased = zeroed = 0
+    for dept in delta.departments:
+        if dept.kind == ADDED:
+            added += 1
+        elif dept.kind == REMOVED:
+            removed += 1
+        elif dept.kind == CHANGED:
+            old_apply, new_apply = dept.old[1], dept.new[1]
+            if new_apply < old_apply:
+                decreased += 1
+                if new_apply == 0:
+                    zeroed += 1
+
+    current_rows = previous_rows - removed + added
+    checks = (
+        (ROW_DROP, removed, settings.quality_max_row_drop,
+         f"모집단위 {removed / previous_rows:.0%} 감소 ({previous_rows} -> {current_rows})"),
+        (APPLY_DECREASE, decreased, settings.quality_max_apply_decrease,
+         f"지원인원 감소 {decreased}/{previous_rows}개 모집단위"),
+        (ZERO_FLOOD, zeroed, settings.quality_max_zero_flood,
+         f"지원인원 0 으로 초기화 {zeroed}/{previous_rows}개 모집단위"),
+    )
+    for reason, count, limit, message in checks:
+        if count / previous_rows > limit:
+            verdict.reasons[reason] = message
+    verdict.accepted = not verdict.reasons
+    return verdict
+
+
+def dump_ratio(ratio_data: "UniversityRatio") -> str:
+    """크롤링 결과 -> JSON (격리 보관용)"""
+    return json.dumps(dataclasses.asdict(ratio_data), ensure_ascii=False, default=str)
+
+
+def load_ratio(payload: str) -> "UniversityRatio":
+    """dump_ratio 의 역변환"""
+    from app.crawler.ratio_crawler import AdmissionRatio, DepartmentRatio, UniversityRatio
+
+    data = json.loads(payload)
+    data["crawled_at"] = datetime.fromisoformat(data["crawled_at"])
+    data["admissions"] = [
+        AdmissionRatio(**{**adm, "departments": [DepartmentRatio(**dept) for dept in adm["departments"]]})
+        for adm in data["admissions"]
+    ]
+    return UniversityRatio(**data)
+
+
+def _entry(row: CrawlQuarantine) -> QuarantineEntry:
+    return QuarantineEntry(
+        ratio_data=load_ratio(row.ratio_data),
+        verdict=QualityVerdict(
+            accepted=False, previous_rows=row.previous_rows or 0, reasons=json.loads(row.reasons or "{}")
+        ),
+        first_at=row.first_at,
+        last_at=row.last_at,
+        count=row.count
+    )
+
+
+class QualityGate:
+    """
+    품질 검사 + 격리 저장소 (DB crawl_quarantine)
+
+    키는 페이지 코드 (여러 페이지로 나뉜 대학은 페이지별로 격리). 통과하면 격리 항목을 지우고,
+    연속 격리 횟수가 quality_accept_after 에 도달하면 통과시킵니다.
+    격리 항목은 maxsize 개까지만 두고 마지막 격리가 오래된 것부터 지웁니다.
+    """
+
+    def __init__(self, maxsize: int = 512):
+        self.maxsize = maxsize
+
+    async def quarantined_keys(self, db: AsyncSession) -> set[str]:
+        """격리 중인 페이지 코드 (사이클 시작 때 한 번 읽어 check 에 넘김)"""
+        return set((await db.execute(select(CrawlQuarantine.page_code))).scalars().all())
+
+    async def check(
+        self,
+        db: AsyncSession,
+        state: Optional[UniversityState],
+        delta: UniversityDelta,
+        ratio_data: "UniversityRatio",
+        quarantined: Optional[set[str]] = None
+    ) -> QualityVerdict:
+        """
+        검사 후 통과 여부 반환 (불합격이면 격리, 커밋은 호출자)
+
+        Args:
+            quarantined: 사이클 시작 때 읽은 격리 키 (quarantined_keys, 이 검사 결과로 갱신).
+                있으면 통과한 페이지가 목록에 없을 때 DB 를 조회하지 않고, 없으면(단일 대학) 항상 조회
+        """
+        key = delta.page_code or delta.university_code
+        if not settings.quality_gate_enabled:
+            return QualityVerdict(accepted=True)
+
+        verdict = check_delta(state, delta)
+        if verdict.accepted:
+            if quarantined is None or key in quarantined:
+                entry = await self._get(db, key)
+                if entry is not None:
+                    await db.delete(entry)
+                if quarantined is not None:
+                    quarantined.discard(key)
+            return verdict
+
+        entry = await self._get(db, key)
+
+        now = datetime.now()
+        count = entry.count + 1 if entry else 1
+        if count >= settings.quality_accept_after:
+            logger.warning(f"[Quality] {key} {count}회 연속 격리 - 실제 변경으로 보고 반영: {verdict.summary()}")
+            if entry is not None:
+                await db.delete(entry)
+            if quarantined is not None:
+                quarantined.discard(key)
+            verdict.accepted = True
+            verdict.forced = True
+            return verdict
+
+        for reason in verdict.reasons:
+            CRAWL_QUALITY_REJECTIONS_TOTAL.labels(reason=reason).inc()
+        if entry is None:
+            entry = CrawlQuarantine(page_code=key, first_at=now)
+            db.add(entry)
+        entry.university_name = ratio_data.university_name[:100]
+        entry.reasons = json.dumps(verdict.reasons, ensure_ascii=False)
+        entry.previous_rows = verdict.previous_rows
+        entry.count = count
+        entry.ratio_data = dump_ratio(ratio_data)
+        entry.last_at = now
+        await db.flush()
+        await self._trim(db)
+        if quarantined is not None:
+            quarantined.add(key)
+        logger.warning(f"[Quality] {key} 격리 ({count}회): {verdict.summary()}")
+        return verdict
+
+    @staticmethod
+    async def _get(db: AsyncSession, key: str) -> Optional[CrawlQuarantine]:
+        return (
+            await db.execute(select(CrawlQuarantine).where(CrawlQuarantine.page_code == key))
+        ).scalar_one_or_none()
+
+    async def _trim(self, db: AsyncSession):
+        """maxsize 를 넘는 오래된 격리 항목 삭제"""
+        total = (await db.execute(select(func.count(CrawlQuarantine.id)))).scalar_one()
+        if total <= self.maxsize:
+            return
+        oldest = (
+            select(CrawlQuarantine.id)
+            .order_by(CrawlQuarantine.last_at)
+            .limit(total - self.maxsize)
+            .scalar_subquery()
+        )
+        await db.execute(delete(CrawlQuarantine).where(CrawlQuarantine.id.in_(oldest)))
+
+    async def entries(self, db: AsyncSession) -> list[CrawlQuarantine]:
+        """격리 항목 목록 (마지막 격리 순)"""
+        return list((
+            await db.execute(select(CrawlQuarantine).order_by(CrawlQuarantine.last_at))
+        ).scalars().all())
+
+    async def release(self, db: AsyncSession, page_code: str) -> Optional[QuarantineEntry]:
+        """격리 항목 꺼내기 (수동 반영/폐기용, 커밋은 호출자)"""
+        row = await self._get(db, page_code)
+        if row is None:
+            return None
+        entry = _entry(row)
+        await db.delete(row)
+        return entry
+
+
+quality_gate = QualityGate()
@@ -0,0 +1,307 @@
+"""
+경쟁률 변경 감지 (diff 단계)
+
+크롤링 결과(UniversityRatio)를 메모리에 캐시된 마지막 상태와 비교해
+실제로 바뀐 모집단위만 DepartmentDelta 로 만들어냅니다.
+
+- 추가(added): 새로 나타난 모집단위
+- 변경(changed): 모집인원/지원인원/경쟁률/세부정보가 달라진 모집단위
+- 삭제(removed): 페이지에서 사라진 모집단위
+- 전형의 모집군(가/나/다군)이 바뀐 경우 gun_changed 에 전형명 기록
+
+한 대학이 여러 페이지(예: 11720771, 11720772)로 나뉘면 대학 코드(앞 4자리)는 같고
+전형만 페이지별로 다릅니다. 삭제 판정은 크롤링한 페이지 소속 전형(admissions.page_code)의
+모집단위로만 한정하므로, 한 페이지를 크롤링해도 다른 페이지의 모집단위는 지워지지 않습니다.
+
+DB 저장, 이력 기록, 캐시 무효화, 알림 등 후속 단계는 모두 같은 delta 목록을 사용하므로
+변하지 않은 모집단위는 쓰기 비용이 없습니다.
+"""
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:  # 크롤러(bs4/lxml)는 조회 전용 프로세스에서 불러오지 않음
+    from app.crawler.ratio_crawler import UniversityRatio
+
+
+# (전형명, 캠퍼스, 모집단위명)
+DepartmentKey = tuple[str, Optional[str], str]
+# (모집인원, 지원인원, 경쟁률, 세부정보)
+DepartmentValues = tuple[int, int, float, Optional[str]]
+
+ADDED = "added"
+CHANGED = "changed"
+REMOVED = "removed"
+
+
+@dataclass
+class DepartmentDelta:
+    """모집단위 단위 변경 사항"""
+    kind: str                               # added / changed / removed
+    key: DepartmentKey
+    old: Optional[DepartmentValues] = None  # added 인 경우 None
+    new: Optional[DepartmentValues] = None  # removed 인 경우 None
+    department_id: Optional[int] = None     # added 인 경우 저장 후 채워짐
+
+    @property
+    def admission_name(self) -> str:
+        return self.key[0]
+
+    @property
+    def campus(self) -> Optional[str]:
+        return self.key[1]
+
+    @property
+    def name(self) -> str:
+        return self.key[2]
+
+    @property
+    def rate_changed(self) -> bool:
+        """지원인원 또는 경쟁률 변동 여부 (이력 기록 대상)"""
+        return (
+            self.kind == CHANGED
+            and (self.old[1] != self.new[1] or self.old[2] != self.new[2])
+        )
+
+
+@dataclass
+class UniversityDelta:
+    """대학 1곳의 크롤링 결과 변경 사항"""
+    university_code: str
+    university_name: str
+    admission_type: str
+    year: int
+    departments: list[DepartmentDelta] = field(default_factory=list)
+    name_changed: bool = False
+    # 전형명 -> 모집군 (이번 크롤링 결과 전체)
+    admission_guns: dict[str, Optional[str]] = field(default_factory=dict)
+    # 모집군이 바뀐 전형명
+    gun_changed: list[str] = field(default_factory=list)
+    # 크롤링한 페이지 코드 (다중 페이지 대학은 페이지별로 diff/게시)
+    page_code: str = ""
+    # 이 페이지 소속으로 새로 기록할 기존 전형명 (페이지 코드가 없거나 다른 페이지였던 전형)
+    page_claimed: list[str] = field(default_factory=list)
+
+    @property
+    def has_changes(self) -> bool:
+        return (
+            bool(self.departments) or self.name_changed
+            or bool(self.gun_changed) or bool(self.page_claimed)
+        )
+
+    def count(self, kind: str) -> int:
+        return sum(1 for delta in self.departments if delta.kind == kind)
+
+    def summary(self) -> str:
+        """로그 메시지용 요약 (예: '+2 ~5 -0')"""
+        return f"+{self.count(ADDED)} ~{self.count(CHANGED)} -{self.count(REMOVED)}"
+
+
+@dataclass
+class UniversityState:
+    """대학 1곳의 마지막으로 저장된 상태"""
+    university_id: int
+    university_name: str
+    # (입시구분, 학년도, 전형명) -> admission_id
+    admission_ids: dict[tuple[str, int, str], int] = field(default_factory=dict)
+    # (입시구분, 학년도, 전형명) -> 모집군
+    admission_guns: dict[tuple[str, int, str], Optional[str]] = field(default_factory=dict)
+    # (입시구분, 학년도, 전형명) -> 페이지 코드 (기존 데이터는 None)
+    admission_pages: dict[tuple[str, int, str], Optional[str]] = field(default_factory=dict)
+    # (입시구분, 학년도) -> {모집단위 키: (department_id, 값)}
+    departments: dict[tuple[str, int], dict[DepartmentKey, tuple[int, DepartmentValues]]] = field(
+        default_factory=dict
+    )
+
+
+def ratio_to_values(ratio_data: "UniversityRatio") -> dict[DepartmentKey, DepartmentValues]:
+    """크롤링 결과를 {모집단위 키: 값} dict 로 변환 (중복 키는 마지막 값 사용)"""
+    return {
+        (adm.admission_name, dept.campus, dept.name): (
+            dept.recruit_count,
+            dept.apply_count,
+            dept.competition_rate,
+            dept.detail,
+        )
+        for adm in ratio_data.admissions
+        for dept in adm.departments
+    }
+
+
+def page_departments(
+    state: UniversityState,
+    admission_type: str,
+    year: int,
+    page: str,
+    admission_names,
+) -> dict[DepartmentKey, tuple[int, DepartmentValues]]:
+    """
+    마지막 상태 중 이 페이지 소속 모집단위 (삭제 판정/품질 검사 범위)
+
+    전형의 페이지 코드가 같거나, 페이지 코드가 없는(기존 데이터) 전형 중 이번 결과에 있는 전형만 포함합니다.
+    """
+    scope = (admission_type, year)
+    return {
+        key: entry
+        for key, entry in state.departments.get(scope, {}).items()
+        if (owner := state.admission_pages.get((*scope, key[0]))) == page
+        or (owner is None and key[0] in admission_names)
+    }
+
+
+def diff_departments(
+    previous: dict[DepartmentKey, tuple[int, DepartmentValues]],
+    current: dict[DepartmentKey, DepartmentValues],
+    removable: Optional[dict[DepartmentKey, tuple[int, DepartmentValues]]] = None,
+) -> list[DepartmentDelta]:
+    """
+    이전 상태와 현재 값 비교
+
+    Args:
+        previous: {모집단위 키: (department_id, 값)}
+        current: {모집단위 키: 값}
+        removable: 삭제 판정 대상 (기본: previous 전체, 다중 페이지 대학은 이 페이지 소속만)
+
+    Returns:
+        변경된 모집단위 delta 목록 (변경 없으면 빈 리스트)
+    """
+    deltas = []
+
+    for key, values in current.items():
+        entry = previous.get(key)
+        if entry is None:
+            deltas.append(DepartmentDelta(kind=ADDED, key=key, new=values))
+        elif entry[1] != values:
+            deltas.append(DepartmentDelta(
+                kind=CHANGED, key=key, old=entry[1], new=values, department_id=entry[0]
+            ))
+
+    removable = previous if removable is None else removable
+    for key in removable.keys() - current.keys():
+        department_id, values = removable[key]
+        deltas.append(DepartmentDelta(
+            kind=REMOVED, key=key, old=values, department_id=department_id
+        ))
+
+    return deltas
+
+
+def diff_university(state: Optional[UniversityState], ratio_data: "UniversityRatio") -> UniversityDelta:
+    """
+    크롤링 결과와 마지막 상태 비교 (state 가 없으면 전체가 added)
+
+    추가/변경은 대학 전체 모집단위와 비교하고(전형이 다른 페이지로 옮겨간 경우 포함),
+    삭제는 이 페이지 소속 모집단위만 판정합니다.
+    """
+    scope = (ratio_data.admission_type, ratio_data.year)
+    page = ratio_data.university_code
+    guns = {adm.admission_name: adm.gun for adm in ratio_data.admissions}
+
+    if state:
+        # 다른 페이지도 있는 대학은 페이지마다 이름이 다름 (예: 홍익대학교(서울)/(세종)) - 처음 저장한 이름 유지
+        renamable = all(owner in (None, page) for owner in state.admission_pages.values())
+        previous = state.departments.get(scope, {})
+        owned = page_departments(state, ratio_data.admission_type, ratio_data.year, page, guns)
+        previous_guns = state.admission_guns
+        page_claimed = [
+            name for name in guns
+            if (key := (*scope, name)) in state.admission_ids and state.admission_pages.get(key) != page
+        ]
+    else:
+        renamable = False
+        previous = owned = {}
+        previous_guns = {}
+        page_claimed = []
+
+    gun_changed = [
+        name for name, gun in guns.items()
+        if gun and previous_guns.get((*scope, name)) != gun
+    ]
+
+    return UniversityDelta(
+        university_code=ratio_data.university_key,
+        university_name=ratio_data.university_name,
+        admission_type=ratio_data.admission_type,
+        year=ratio_data.year,
+        departments=diff_departments(previous, ratio_to_values(ratio_data), owned),
+        name_changed=renamable and state.university_name != ratio_data.university_name,
+        admission_guns=guns,
+        gun_changed=gun_changed,
+        page_code=page,
+        page_claimed=page_claimed,
+    )
+
+
+class RatioStateCache:
+    """
+    대학별 마지막 상태 캐시 (메모리)
+
+    키는 대학 코드(4자리). DB 커밋이 끝난 뒤에만 apply() 로 갱신합니다.
+
+    캐시 내용은 generation(데이터 세대 id) 기준입니다. 크롤링 작업(라운드)을 시작할 때
+    DB의 현재 세대와 비교해(sync) 다른 노드/프로세스가 그 사이 게시했으면 통째로 비우므로,
+    해시 링 재배정으로 다른 노드가 저장한 대학을 다시 맡아도 DB에서 새로 읽습니다.
+    같은 DB에 쓰는 다른 프로세스(APP_MODE=all 서버 + 워커)나 DB를 직접 바꾸는 스크립트
+    (import_*.py, EXTERNAL_GENERATION_SQL 로 세대를 남김)도 같은 방식으로 반영됩니다.
+    """
+
+    def __init__(self):
+        self._states: dict[str, UniversityState] = {}
+        self.generation = 0  # 캐시 내용이 반영한 마지막 데이터 세대
+
+    def sync(self, generation_id: int) -> bool:
+        """DB 현재 세대가 캐시 기준과 다르면 비움. Returns: 비웠는지"""
+        if generation_id == self.generation:
+            return False
+        self._states.clear()
+        self.generation = generation_id
+        return True
+
+    def advance(self, previous_id: int, generation_id: int) -> bool:
+        """
+        직접 게시한 세대 반영 (apply 후 호출)
+
+        게시 직전 세대(previous_id)가 캐시 기준과 같으면 캐시를 그대로 새 세대 기준으로 두고,
+        그 사이 다른 게시가 끼어들었으면 비웁니다. Returns: 캐시를 유지했는지
+        """
+        kept = previous_id == self.generation
+        if not kept:
+            self._states.clear()
+        self.generation = generation_id
+        return kept
+
+    def get(self, university_code: str) -> Optional[UniversityState]:
+        return self._states.get(university_code)
+
+    def put(self, university_code: str, state: UniversityState):
+        self._states[university_code] = state
+
+    def invalidate(self, university_code: Optional[str] = None):
+        if university_code is None:
+            self._states.clear()
+        else:
+            self._states.pop(university_code, None)
+
+    def apply(self, state: UniversityState, delta: UniversityDelta):
+        """저장이 끝난 delta 를 상태에 반영"""
+        if delta.name_changed:
+            state.university_name = delta.university_name
+        scope = (delta.admission_type, delta.year)
+        departments = state.departments.setdefault(scope, {})
+
+        for dept in delta.departments:
+            if dept.kind == REMOVED:
+                departments.pop(dept.key, None)
+            else:
+                departments[dept.key] = (dept.department_id, dept.new)
+
+        for name in delta.gun_changed:
+            state.admission_guns[(*scope, name)] = delta.admission_guns[name]
+        for name in delta.page_claimed:
+            state.admission_pages[(*scope, name)] = delta.page_code
+
+        self._states[delta.university_code] = state
+
+
+# 프로세스 전역 상태 캐시
+ratio_state = RatioStateCache()
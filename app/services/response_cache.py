@@ -0,0 +1,182 @@
+"""
+조회 응답 캐시 (데이터 세대별 직렬화/압축 결과 + 동시 요청 합치기)
+
+/competition-rates, /universities/{id} 응답은 같은 한글 문자열이 반복되는 JSON 이라
+br/gzip 으로 크게 줄지만, 요청마다 압축하면 같은 본문을 계속 다시 압축하게 됩니다.
+응답 본문을 (라우트, 조회 조건, 데이터 세대) 키로 보관하고 인코딩별 압축 결과를
+같은 항목에 함께 저장해, 데이터 세대당 조회/직렬화 1회, 인코딩당 압축 1회만 합니다.
+
+- 데이터 세대: generation_watcher.generation (크롤링 사이클 게시 때만 바뀜).
+  새 세대가 게시/감지되면 이전 세대 항목을 비움
+- 세대 0 (게시 기록 없이 스크립트로 바뀐 DB) 은 캐시하지 않음 (요청마다 만들고 압축)
+- 항목 크기(원본 + 압축본) 합계가 response_cache_max_bytes 를 넘으면 오래된 것부터 제거
+- response_compress_min_bytes 보다 작은 본문은 압축하지 않음
+
+동시 요청 합치기(single-flight):
+인기 학과 경쟁률이 바뀌면 같은 조회가 같은 순간에 수백 건 들어옵니다. 캐시에 없는 키를
+만드는 중이면 같은 키(라우트 + 정규화한 조회 조건 + 데이터 세대)의 요청은 새로 조회하지 않고
+진행 중인 작업 1개의 결과를 함께 기다립니다 (DB 조회/직렬화 1회). 세대 0 이라 캐시하지 않는
+경우에도 동시에 들어온 요청끼리는 합칩니다.
+- 작업은 요청과 분리된 태스크로 실행되므로 처음 요청한 클라이언트가 끊겨도 나머지는 결과를 받음
+- 작업이 실패하면(404 등) 기다리던 요청 모두 같은 예외를 받고, 다음 요청이 다시 시도
+- 합쳐지는 라우트는 DB 세션을 의존성으로 받지 않고 작업 안에서만 엽니다
+  (기다리는 요청마다 연결 풀의 연결을 잡지 않도록, app/database.py snapshot_session)
+
+캐시하지 않는 나머지 응답은 app/main.py 의 GZipMiddleware 가 gzip 으로 압축합니다
+(Content-Encoding 이 이미 있는 응답은 건드리지 않음).
+"""
+
+import asyncio
+import hashlib
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, Optional
+
+from fastapi import Request, Response
+
+from app.config import get_settings
+from app.metrics import API_RESPONSE_CACHE_TOTAL
+from app.services.generation import generation_watcher, subscribe_generations
+from app.services.organized import choose_encoding, compress
+
+settings = get_settings()
+
+
+@dataclass
+class CachedBody:
+    """응답 본문 1개 + 인코딩별 압축본"""
+    body: bytes
+    encoded: dict[str, bytes] = field(default_factory=dict)
+
+    @property
+    def size(self) -> int:
+        return len(self.body) + sum(len(data) for data in self.encoded.values())
+
+    def encode(self, encoding: str) -> tuple[str, bytes]:
+        """인코딩별 본문 (처음 요청된 인코딩만 압축). Returns: (실제 인코딩, 바이트)"""
+        if encoding == "identity" or len(self.body) < settings.response_compress_min_bytes:
+            return "identity", self.body
+        data = self.encoded.get(encoding)
+        if data is None:
+            data = self.encoded[encoding] = compress(self.body, encoding)
+        return encoding, data
+
+
+def normalize_params(params: dict) -> tuple:
+    """조회 조건 -> 캐시 키 (값 없는 조건 제외, 이름순)"""
+    return tuple(sorted((name, value) for name, value in params.items() if value is not None))
+
+
+class ResponseCache:
+    """
+    데이터 세대별 응답 본문 캐시 (프로세스 전역, 바이트 기준 LRU)
+
+    사용 예:
+        async def build() -> bytes:
+            async with snapshot_session() as db:
+                ...  # 조회 + 직렬화
+        return await response_cache.respond(request, "competition-rates", params, build)
+    """
+
+    def __init__(self, max_bytes: Optional[int] = None):
+        self.max_bytes = max_bytes or settings.response_cache_max_bytes
+        self.size = 0
+        self._entries: OrderedDict[tuple, CachedBody] = OrderedDict()
+        self._inflight: dict[tuple, asyncio.Task] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self):
+        self._entries.clear()
+        self.size = 0
+
+    async def drop_before(self, generation_id: int):
+        """세대 구독자: 새 세대가 게시되면 이전 세대 항목 제거"""
+        for key in [key for key in self._entries if key[1] < generation_id]:
+            self.size -= self._entries.pop(key).size
+
+    def _flight(self, key: tuple, build: Callable[[], Awaitable[bytes]]) -> tuple[asyncio.Task, bool]:
+        """
+        key 의 진행 중인 작업 (없으면 시작)
+
+        Returns:
+            (작업, 새로 시작했는지)
+        """
+        task = self._inflight.get(key)
+        if task is not None and settings.response_coalescing_enabled:
+            return task, False
+
+        async def run() -> CachedBody:
+            return CachedBody(await build())
+
+        task = asyncio.ensure_future(run())
+        self._inflight[key] = task
+
+        def done(finished: asyncio.Task):
+            if self._inflight.get(key) is finished:
+                del self._inflight[key]
+            if not finished.cancelled():
+                finished.exception()  # 기다리던 요청이 모두 끊긴 경우의 미확인 예외 경고 방지
+
+        task.add_done_callback(done)
+        return task, True
+
+    def _store(self, key: tuple, entry: CachedBody, previous_size: int = 0):
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        self.size += entry.size - previous_size
+        while self.size > self.max_bytes and len(self._entries) > 1:
+            _, evicted = self._entries.popitem(last=False)
+            self.size -= evicted.size
+
+    async def respond(
+        self,
+        request: Request,
+        route: str,
+        params: dict,
+        build: Callable[[], Awaitable[bytes]]
+    ) -> Response:
+        """
+        캐시된(또는 build 로 새로 만든, 진행 중이면 그 결과를 기다린) JSON 본문을
+        Accept-Encoding 에 맞춰 응답
+
+        ETag 가 같으면 304 를 반환합니다 (세대 0 은 ETag 없음).
+        """
+        version = generation_watcher.generation
+        key = (route, version, normalize_params(params))
+        headers = {"Vary": "Accept-Encoding"}
+        if version:
+            etag = f'"{version}-{hashlib.sha1(repr(key).encode("utf-8")).hexdigest()[:12]}"'
+            headers["ETag"] = etag
+            if request.headers.get("if-none-match") == etag:
+                return Response(status_code=304, headers=headers)
+
+        entry = self._entries.get(key) if version else None
+        if entry is not None:
+            API_RESPONSE_CACHE_TOTAL.labels(route=route, result="hit").inc()
+        else:
+            task, started = self._flight(key, build)
+            if not started:
+                result = "coalesced"
+            else:
+                result = "miss" if version else "bypass"
+            API_RESPONSE_CACHE_TOTAL.labels(route=route, result=result).inc()
+            # 이 요청이 취소돼도 작업은 계속 (함께 기다리는 요청이 있음)
+            entry = await asyncio.shield(task)
+
+        stored = self._entries.get(key)
+        previous_size = stored.size if stored is not None else 0
+        encoding, content = entry.encode(choose_encoding(request.headers.get("accept-encoding")))
+        # 만드는 동안 새 세대가 게시됐으면 지난 세대 항목은 보관하지 않음
+        if version and version == generation_watcher.generation:
+            self._store(key, entry, previous_size)
+
+        if encoding != "identity":
+            headers["Content-Encoding"] = encoding
+        return Response(content=content, media_type="application/json", headers=headers)
+
+
+# 프로세스 전역 응답 캐시
+response_cache = ResponseCache()
+subscribe_generations(response_cache.drop_before)
@@ -0,0 +1,208 @@
+"""
+정리 데이터셋 정적 내보내기 (CDN/호스팅용)
+
+crawler.js syncToFrontendAndDeploy 는 매 사이클 JSON 파일 전체를 frontend/public 에 복사하고
+호스팅 전체를 다시 배포합니다. 여기서는 같은 데이터를 잘게 나눈 샤드로 내보냅니다.
+
+    {out}/manifest.json                         샤드 목록 (짧게 캐시)
+    {out}/shards/{종류}-{이름 해시}.{내용 해시}.json    군별 / 지역별 / 대학별 샤드
+                                     .json.gz  사전 압축 (gzip_static 등)
+                                     .json.br  brotli 설치 시
+
+- 파일명에 내용 해시가 들어가므로 내용이 같으면 같은 파일 -> 다시 쓰지 않음
+- 새로 쓴 파일만 ExportResult.written 에 담아 업로드 대상으로 넘김
+- 샤드 목록이 그대로면 manifest 도 다시 쓰지 않음
+- 현재/직전 manifest 어디에도 없는 샤드는 삭제 (이전 manifest 를 받은 클라이언트 보호)
+
+사용법:
+    python -m app.services.shard_export --out frontend/public/data
+"""
+
+import argparse
+import asyncio
+import hashlib
+import json
+import logging
+import os
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import get_settings
+from app.services.organized import GROUPS, brotli, compress, dumps, organized_dataset
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+MANIFEST_NAME = "manifest.json"
+SHARD_DIR = "shards"
+
+# 정적 파일은 한 번 쓰고 계속 재사용하므로 최고 압축률 사용
+_ENCODINGS = (("gz", "gzip", 9), ("br", "br", 11))
+
+
+@dataclass
+class ExportResult:
+    """내보내기 결과"""
+    version: str
+    written: list[str] = field(default_factory=list)  # 새로 쓴 파일 (out 기준 상대 경로, 업로드 대상)
+    unchanged: int = 0                                 # 내용이 같아 재사용한 샤드 수
+    removed: list[str] = field(default_factory=list)  # 삭제한 오래된 파일
+    manifest_changed: bool = False
+
+    def summary(self) -> str:
+        return (
+            f"written {len(self.written)}, unchanged {self.unchanged}, "
+            f"removed {len(self.removed)}, manifest {'updated' if self.manifest_changed else 'same'}"
+        )
+
+
+def _short_hash(data: bytes, length: int) -> str:
+    return hashlib.sha256(data).hexdigest()[:length]
+
+
+def build_shards(groups: dict[str, list[dict]]) -> dict[str, dict[str, dict[str, list[dict]]]]:
+    """
+    군별 항목 -> {종류: {이름: 군별 항목}} (한 번 순회)
+
+    모든 샤드는 organized_with_chuhap.json 과 같은 {군: [항목]} 구조입니다.
+    """
+    shards: dict[str, dict[str, dict[str, list[dict]]]] = {"gun": {}, "region": {}, "university": {}}
+    for gun in GROUPS:
+        entries = groups.get(gun) or []
+        if entries:
+            shards["gun"][gun] = {gun: entries}
+        for entry in entries:
+            for kind, name in (("region", entry.get("지역") or "미분류"), ("university", entry["대학명"])):
+                shard = shards[kind].setdefault(name, {group: [] for group in GROUPS})
+                shard[gun].append(entry)
+    return shards
+
+
+def _write_atomic(path: Path, data: bytes):
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+def write_shard(out_dir: Path, kind: str, name: str, body: bytes, result: ExportResult) -> dict:
+    """
+    샤드 1개 쓰기 (같은 내용의 파일이 있으면 건너뜀)
+
+    Returns:
+        manifest 항목 {path, bytes, gz_bytes, br_bytes}
+    """
+    name_hash = _short_hash(name.encode("utf-8"), 8)
+    relative = f"{SHARD_DIR}/{kind}-{name_hash}.{_short_hash(body, 16)}.json"
+    path = out_dir / relative
+    item = {"path": relative, "bytes": len(body)}
+
+    if path.exists():
+        result.unchanged += 1
+        for suffix, _, _ in _ENCODINGS:
+            variant = path.with_name(f"{path.name}.{suffix}")
+            if variant.exists():
+                item[f"{suffix}_bytes"] = variant.stat().st_size
+        return item
+
+    _write_atomic(path, body)
+    result.written.append(relative)
+    for suffix, encoding, level in _ENCODINGS:
+        if encoding == "br" and brotli is None:
+            continue
+        compressed = compress(body, encoding, level)
+        _write_atomic(path.with_name(f"{path.name}.{suffix}"), compressed)
+        result.written.append(f"{relative}.{suffix}")
+        item[f"{suffix}_bytes"] = len(compressed)
+    return item
+
+
+def _manifest_paths(manifest: Optional[dict]) -> set[str]:
+    if not manifest:
+        return set()
+    return {item["path"] for shards in manifest.get("shards", {}).values() for item in shards.values()}
+
+
+def _prune(out_dir: Path, keep: set[str], result: ExportResult):
+    """현재/직전 manifest 에 없는 샤드 파일 삭제"""
+    shard_dir = out_dir / SHARD_DIR
+    for path in shard_dir.iterdir():
+        relative = f"{SHARD_DIR}/{path.name}"
+        base = relative
+        for suffix, _, _ in _ENCODINGS:
+            base = base.removesuffix(f".{suffix}")
+        if base not in keep:
+            path.unlink()
+            result.removed.append(relative)
+
+
+async def export_shards(
+    db: AsyncSession,
+    out_dir: Optional[str] = None,
+    admission_type: str = "정시",
+    year: int = 2026
+) -> ExportResult:
+    """정리 데이터셋을 샤드로 내보내기 (바뀐 샤드만 새 파일로 씀)"""
+    out = Path(out_dir or settings.shard_export_dir)
+    (out / SHARD_DIR).mkdir(parents=True, exist_ok=True)
+
+    version = await organized_dataset.refresh(db, admission_type, year)
+    result = ExportResult(version=version)
+
+    manifest_path = out / MANIFEST_NAME
+    previous = None
+    if manifest_path.exists():
+        try:
+            previous = json.loads(manifest_path.read_text(encoding="utf-8"))
+        except ValueError:
+            logger.warning(f"manifest 읽기 실패, 새로 작성: {manifest_path}")
+
+    shard_items: dict[str, dict[str, dict]] = {}
+    for kind, shards in build_shards(organized_dataset.entries).items():
+        shard_items[kind] = {}
+        for name in sorted(shards):
+            item = write_shard(out, kind, name, dumps(shards[name]), result)
+            item["count"] = sum(len(entries) for entries in shards[name].values())
+            shard_items[kind][name] = item
+
+    if not previous or previous.get("shards") != shard_items:
+        manifest = {
+            "version": version,
+            "admission_type": admission_type,
+            "year": year,
+            "generated_at": datetime.now().isoformat(timespec="seconds"),
+            "shards": shard_items,
+        }
+        _write_atomic(manifest_path, json.dumps(manifest, ensure_ascii=False, indent=1).encode("utf-8"))
+        result.written.append(MANIFEST_NAME)
+        result.manifest_changed = True
+
+    _prune(out, _manifest_paths({"shards": shard_items}) | _manifest_paths(previous), result)
+
+    logger.info(f"[Export] {out}: {result.summary()}")
+    return result
+
+
+async def _main(args: argparse.Namespace) -> int:
+    from app.database import init_db, async_session, engine
+
+    await init_db()
+    async with async_session() as db:
+        result = await export_shards(db, args.out, args.admission_type, args.year)
+    await engine.dispose()
+
+    print(f"[{result.version}] {result.summary()}")
+    for relative in result.written:
+        print(f"  + {relative}")
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="정리 데이터셋 샤드 내보내기")
+    parser.add_argument("--out", default=None, help="출력 디렉터리 (기본: SHARD_EXPORT_DIR)")
+    parser.add_argument("--admission-type", default="정시")
+    parser.add_argument("--year", type=int, default=2026)
+    raise SystemExit(asyncio.run(_main(parser.parse_args())))
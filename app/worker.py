@@ -0,0 +1,97 @@
+"""
+크롤러 워커 (API 서버와 분리된 프로세스)
+
+스케줄러와 크롤링 엔진만 실행하고 DB에 씁니다. API 서버는 APP_MODE=api 로 띄우면
+조회만 하고, 새 데이터는 GenerationWatcher 가 데이터 세대 번호로 감지합니다.
+크롤링 결과는 사이클 단위로 한 번에 게시하므로 워커가 중간에 종료되어도
+API 쪽은 이전 세대를 그대로 봅니다. 끝나지 않은 크롤링 작업은 다음 실행에서
+남은 대학부터 이어서 처리합니다 (app/services/crawl_jobs.py).
+
+사용법:
+    python -m app.worker            # 시작하자마자 1회 크롤링 후 crawl_interval_minutes 주기로 반복
+    python -m app.worker --once     # 크롤링 1회 후 종료 (cron 등 외부 스케줄러용)
+    python -m app.worker --no-initial-crawl  # 시작 시 크롤링 없이 작업 큐/주기만 따름 (노드 추가 시)
+    python run.py worker
+
+여러 대를 띄우면 같은 작업의 대학을 나눠 크롤링합니다 (app/services/crawl_jobs.py, 같은 DB 사용).
+APP_MODE=all/crawler 인 API 서버와 함께 띄워도 됩니다. 두 프로세스 모두 쓰지만
+상태 캐시는 라운드마다 데이터 세대로 DB와 맞추고(ratio_state.sync), 품질 검사 격리 목록은
+DB(crawl_quarantine)에 있으므로 API 서버의 /crawl/quarantine 에서 워커가 격리한 결과도 처리할 수 있습니다.
+"""
+
+import argparse
+import asyncio
+import logging
+import signal
+
+from prometheus_client import start_http_server
+
+from app.config import get_settings
+from app.crawler.http_client import close_client
+from app.database import init_db, engine
+from app.scheduler import scheduled_crawl, start_scheduler, stop_scheduler
+from app.services.crawl_jobs import job_runner
+
+settings = get_settings()
+logger = logging.getLogger(__name__)
+
+
+async def run_worker(once: bool = False, initial_crawl: bool = True) -> int:
+    """워커 실행 (종료 신호를 받을 때까지)"""
+    await init_db()
+    logger.info("[Worker] Database initialized")
+
+    if once:
+        await scheduled_crawl()
+        await job_runner.unregister()
+        await close_client()
+        await engine.dispose()
+        return 0
+
+    if settings.worker_metrics_port:
+        start_http_server(settings.worker_metrics_port)
+        logger.info(f"[Worker] Metrics on :{settings.worker_metrics_port}/metrics")
+
+    stopping = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        try:
+            loop.add_signal_handler(sig, stopping.set)
+        except NotImplementedError:  # Windows: KeyboardInterrupt 로 종료
+            pass
+
+    # API(APP_MODE=crawler/all)로 넣은 작업 + 이전 실행에서 끝나지 않은 작업 처리
+    await job_runner.start()
+    start_scheduler(run_now=initial_crawl)
+    try:
+        await stopping.wait()
+    finally:
+        stop_scheduler()
+        await job_runner.stop()
+        await close_client()
+        if settings.browser_fallback_enabled:
+            from app.crawler.browser import close_browser
+            await close_browser()
+        await engine.dispose()
+        logger.info("[Worker] Stopped")
+    return 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="경쟁률 크롤러 워커")
+    parser.add_argument("--once", action="store_true", help="크롤링 1회 후 종료")
+    parser.add_argument(
+        "--no-initial-crawl", action="store_true",
+        help="시작하자마자 크롤링하지 않음 (노드 추가 시, 작업 큐와 crawl_interval_minutes 주기만 따름)"
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+    try:
+        return asyncio.run(run_worker(args.once, initial_crawl=not args.no_initial_crawl))
+    except KeyboardInterrupt:
+        return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,165 @@
+# -*- coding: utf-8 -*-
+"""
+httpx 정적 HTML 크롤링 vs 헤드리스 브라우저 크롤링 비교
+
+같은 픽스처 대학 목록을 로컬 mock 서버로 재생하면서
+1. httpx 경로: RatioCrawler.crawl (운영 경로)
+2. 브라우저 경로: playwright 로 networkidle 까지 렌더링 후 같은 파서로 파싱
+   (crawler.js 와 같이 페이지 하나를 재사용하며 순차 방문)
+을 순차 실행해 처리량과 메모리(자식 프로세스 포함 RSS)를 비교합니다.
+
+playwright 가 설치되지 않은 환경에서는 브라우저 경로를 건너뜁니다.
+
+사용법:
+    python -m benchmarks.bench_browser --pages 20 --latency-ms 50
+"""
+import argparse
+import asyncio
+import io
+import os
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Optional
+
+sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+
+
+def _tree_rss_mb() -> Optional[float]:
+    """현재 프로세스와 모든 자손 프로세스의 RSS 합계 (Linux /proc 기준)"""
+    proc = Path("/proc")
+    if not proc.exists():
+        return None
+
+    parents: dict[int, int] = {}
+    rss: dict[int, int] = {}
+    for status in proc.glob("[0-9]*/status"):
+        try:
+            fields = dict(
+                line.split(":", 1) for line in status.read_text().splitlines() if ":" in line
+            )
+        except OSError:
+            continue
+        pid = int(status.parent.name)
+        parents[pid] = int(fields.get("PPid", "0").strip())
+        rss[pid] = int(fields.get("VmRSS", "0 kB").split()[0])
+
+    tree = {os.getpid()}
+    changed = True
+    while changed:
+        children = {pid for pid, ppid in parents.items() if ppid in tree} - tree
+        tree |= children
+        changed = bool(children)
+    return round(sum(rss.get(pid, 0) for pid in tree) / 1024, 1)
+
+
+def _summary(label: str, samples: list[float], elapsed: float, success: int, peak_rss: Optional[float]) -> dict:
+    samples = sorted(samples)
+    return {
+        "path": label,
+        "pages": len(samples),
+        "success": success,
+        "pages_per_second": round(len(samples) / elapsed, 2) if elapsed else 0.0,
+        "page_ms_p50": round(statistics.median(samples), 1) if samples else 0.0,
+        "page_ms_p95": round(samples[max(int(len(samples) * 0.95) - 1, 0)], 1) if samples else 0.0,
+        "peak_rss_mb": peak_rss,
+    }
+
+
+async def bench_httpx(urls: list[str]) -> dict:
+    from app.crawler.ratio_crawler import RatioCrawler
+
+    crawler = RatioCrawler()
+    samples, success, peak = [], 0, _tree_rss_mb()
+    start = time.perf_counter()
+    for url in urls:
+        page_start = time.perf_counter()
+        if await crawler.crawl(url):
+            success += 1
+        samples.append((time.perf_counter() - page_start) * 1000)
+        peak = max(peak or 0, _tree_rss_mb() or 0)
+    return _summary("httpx", samples, time.perf_counter() - start, success, peak)
+
+
+async def bench_browser(urls: list[str], timeout: float) -> Optional[dict]:
+    try:
+        from playwright.async_api import async_playwright
+    except ImportError:
+        print("[SKIP] playwright 미설치 - 브라우저 경로 생략 (pip install playwright && playwright install chromium)")
+        return None
+
+    from app.crawler.ratio_crawler import RatioCrawler
+
+    crawler = RatioCrawler()
+    samples, success, peak = [], 0, _tree_rss_mb()
+    start = time.perf_counter()
+    async with async_playwright() as playwright:
+        try:
+            browser = await playwright.chromium.launch(headless=True)
+        except Exception as e:
+            print(f"[SKIP] 브라우저 실행 실패 - 브라우저 경로 생략 (playwright install chromium): {e}")
+            return None
+        page = await browser.new_page()
+        for url in urls:
+            page_start = time.perf_counter()
+            try:
+                await page.goto(url, wait_until="networkidle", timeout=timeout * 1000)
+                if crawler.parse(await page.content(), url):
+                    success += 1
+            except Exception as e:
+                print(f"  [ERR] {url}: {e}")
+            samples.append((time.perf_counter() - page_start) * 1000)
+            peak = max(peak or 0, _tree_rss_mb() or 0)
+        await browser.close()
+    return _summary("browser", samples, time.perf_counter() - start, success, peak)
+
+
+async def run(args) -> list[dict]:
+    from benchmarks.fixtures import load_fixture_pages
+    from benchmarks.mock_server import MockRatioServer
+
+    pages = load_fixture_pages(args.pages)
+    if not pages:
+        print("픽스처 페이지가 없습니다 (benchmarks/fixtures 또는 output/latest_data.json 필요)")
+        return []
+
+    results = []
+    async with MockRatioServer(pages, latency=args.latency_ms / 1000, jitter=args.jitter_ms / 1000) as server:
+        urls = [f"{server.ratio_base_url}Ratio{code}.html" for code in pages]
+        print(f"[config] pages={len(urls)} latency={args.latency_ms}ms jitter={args.jitter_ms}ms")
+
+        results.append(await bench_httpx(urls))
+        browser = await bench_browser(urls, args.timeout)
+        if browser:
+            results.append(browser)
+    return results
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="httpx vs 헤드리스 브라우저 크롤링 비교")
+    parser.add_argument("--pages", type=int, default=20, help="사용할 페이지 수 (0=전체)")
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    parser.add_argument("--jitter-ms", type=float, default=20.0)
+    parser.add_argument("--timeout", type=float, default=30.0, help="브라우저 페이지 로딩 제한(초)")
+    args = parser.parse_args()
+
+    results = asyncio.run(run(args))
+    if not results:
+        return 1
+
+    print(f"\n{'='*72}")
+    keys = ["path", "pages", "success", "pages_per_second", "page_ms_p50", "page_ms_p95", "peak_rss_mb"]
+    print("  ".join(f"{k:>16s}" for k in keys))
+    for result in results:
+        print("  ".join(f"{str(result[k]):>16s}" for k in keys))
+
+    if len(results) == 2:
+        httpx_result, browser_result = results
+        speedup = httpx_result["pages_per_second"] / max(browser_result["pages_per_second"], 1e-9)
+        print(f"\nhttpx 경로 처리량: 브라우저 대비 {speedup:.1f}배")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+"""
+동시 요청 합치기(single-flight) 부하 테스트
+
+임시 DB에 합성 데이터를 넣고 같은 조회를 동시에 N건 보내면서 (ASGI 직접 호출)
+엔진에서 실제로 실행된 SELECT 수와 연 조회 세션 수를 셉니다.
+합치기를 켠 경우(app/services/response_cache.py)와 끈 경우
+(RESPONSE_COALESCING_ENABLED=false 와 같음)를 같은 동시성 단계별로 비교합니다.
+
+데이터 세대가 0 인 DB라 응답 캐시에는 남지 않으므로, 단계마다 순수하게
+"동시에 진행 중인 같은 조회" 만 합쳐집니다.
+
+확인 항목:
+- 합치기를 켜면 동시성이 늘어도 단계별 SELECT 수가 동시성 1 과 같은지
+- 모든 응답이 200 이고 본문이 같은지
+
+사용법:
+    python -m benchmarks.bench_coalescing
+    python -m benchmarks.bench_coalescing --levels 1,10,100,500
+"""
+import argparse
+import asyncio
+import io
+import os
+import sys
+import tempfile
+import time
+
+sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+
+# 인기 대학 경쟁률 조회 (요청 내용의 university_name 검색)
+ROUTES = [
+    ("/api/v1/competition-rates", {"university_name": "합성대학교0001"}),
+    ("/api/v1/universities/2", {}),
+]
+
+
+class QueryCounter:
+    """엔진에서 실행된 SELECT / 조회 세션(BEGIN) 수"""
+
+    def __init__(self, engine):
+        from sqlalchemy import event
+
+        self.selects = 0
+        self.sessions = 0
+        event.listen(engine.sync_engine, "before_cursor_execute", self._count)
+
+    def _count(self, conn, cursor, statement, parameters, context, executemany):
+        keyword = statement.lstrip()[:6].upper()
+        if keyword == "SELECT":
+            self.selects += 1
+        elif keyword == "BEGIN":
+            self.sessions += 1
+
+    def reset(self):
+        self.selects = self.sessions = 0
+
+
+async def burst(client, path: str, params: dict, concurrency: int) -> tuple[float, set]:
+    """같은 요청 concurrency 건 동시 전송. Returns: (소요 시간, 응답 (상태, 본문) 종류)"""
+    start = time.perf_counter()
+    responses = await asyncio.gather(*(client.get(path, params=params) for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    return elapsed, {(response.status_code, response.content) for response in responses}
+
+
+async def run(args) -> int:
+    import httpx
+    from benchmarks.fixtures import seed_synthetic_rates
+    from app.config import get_settings
+    from app.database import engine
+    from app.main import app
+    from app.services.response_cache import response_cache
+
+    settings = get_settings()
+    await seed_synthetic_rates(args.rows)
+    counter = QueryCounter(engine)
+    levels = [int(level) for level in args.levels.split(",")]
+
+    ok = True
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=120) as client:
+        for path, params in ROUTES:
+            print(f"\n{'='*60}\n  {path} {params}")
+            print(f"  {'':>6s} | {'합치기 켬':^24s} | {'합치기 끔':^24s}")
+            print(f"  {'동시성':>6s} | {'SELECT':>7s} {'세션':>6s} {'ms':>9s} | {'SELECT':>7s} {'세션':>6s} {'ms':>9s}")
+            baseline = None
+            for concurrency in levels:
+                row = []
+                for enabled in (True, False):
+                    settings.response_coalescing_enabled = enabled
+                    response_cache.clear()
+                    counter.reset()
+                    elapsed, bodies = await burst(client, path, params, concurrency)
+                    if len(bodies) != 1 or next(iter(bodies))[0] != 200:
+                        print(f"  [FAIL] 응답이 다름 또는 오류: {sorted(status for status, _ in bodies)}")
+                        ok = False
+                    row.append((counter.selects, counter.sessions, elapsed * 1000))
+                (on_selects, on_sessions, on_ms), (off_selects, off_sessions, off_ms) = row
+                baseline = on_selects if baseline is None else baseline
+                if on_selects != baseline:
+                    ok = False
+                print(
+                    f"  {concurrency:>6d} | {on_selects:>7d} {on_sessions:>6d} {on_ms:>9.1f}"
+                    f" | {off_selects:>7d} {off_sessions:>6d} {off_ms:>9.1f}"
+                )
+    settings.response_coalescing_enabled = True
+    await engine.dispose()
+
+    print("\n합치기를 켜면 동시성과 무관하게 SELECT 수가 동시성 1 과 같아야 합니다")
+    print(f"[{'OK' if ok else 'FAIL'}]")
+    return 0 if ok else 1
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="동시 요청 합치기 부하 테스트")
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--levels", default="1,10,50,100,200", help="동시 요청 수 (쉼표 구분)")
+    args = parser.parse_args()
+
+    # app 모듈 import 전에 임시 DB / 조회 전용 모드 지정
+    tmp_dir = tempfile.mkdtemp(prefix="bench_coalescing_")
+    os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{tmp_dir}/bench.db"
+    os.environ["APP_MODE"] = "api"
+    return asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,217 @@
+# -*- coding: utf-8 -*-
+"""
+크롤링 사이클 벤치마크
+
+픽스처 페이지(benchmarks/fixtures.py)를 로컬 mock 서버로 재생하면서
+CrawlService.crawl_all_universities 전체 사이클을 측정합니다.
+
+측정 항목:
+- 사이클별 처리량 (pages/s) - 1회차(cold: 전체 INSERT), 2회차 이후(warm: 변경 없음)
+- 페이지당 파싱 시간 (p50/p95, 네트워크 제외)
+- 페이지당 diff / DB 쓰기 시간 (crawl_stage_seconds 메트릭 합계)
+- 최대 메모리 (RSS)
+
+사용법:
+    python -m benchmarks.bench_crawl                     # baseline 과 비교
+    python -m benchmarks.bench_crawl --update-baseline   # baseline 갱신
+    python -m benchmarks.bench_crawl --latency-ms 200 --jitter-ms 100
+"""
+import argparse
+import asyncio
+import io
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+
+BASELINE_PATH = Path(__file__).resolve().parent / "baseline.json"
+
+# (항목, 높을수록 좋은지)
+COMPARED_METRICS = [
+    ("cold_pages_per_second", True),
+    ("warm_pages_per_second", True),
+    ("parse_ms_p50", False),
+    ("parse_ms_p95", False),
+    ("cold_db_write_ms_per_page", False),
+    ("warm_db_write_ms_per_page", False),
+]
+
+
+def _peak_rss_mb():
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    return round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1)
+
+
+def _stage_totals() -> dict[str, float]:
+    """crawl_stage_seconds 단계별 누적 합계"""
+    from app.metrics import CRAWL_STAGE_SECONDS
+
+    totals: dict[str, float] = {}
+    for metric in CRAWL_STAGE_SECONDS.collect():
+        for sample in metric.samples:
+            if sample.name.endswith("_sum"):
+                stage = sample.labels["stage"]
+                totals[stage] = totals.get(stage, 0.0) + sample.value
+    return totals
+
+
+def bench_parse(pages: dict[str, bytes], repeat: int) -> dict:
+    """페이지당 파싱 시간 (디코딩 포함, 네트워크/DB 제외)"""
+    from app.crawler.ratio_crawler import RatioCrawler
+
+    crawler = RatioCrawler()
+    samples = []
+    for _ in range(repeat):
+        for code, content in pages.items():
+            start = time.perf_counter()
+            crawler.parse(crawler._decode(content), f"Ratio{code}.html")
+            samples.append((time.perf_counter() - start) * 1000)
+
+    samples.sort()
+    return {
+        "parse_ms_p50": round(statistics.median(samples), 3),
+        "parse_ms_p95": round(samples[int(len(samples) * 0.95) - 1], 3),
+    }
+
+
+async def bench_cycles(pages: dict[str, bytes], latency: float, jitter: float, cycles: int) -> dict:
+    """mock 서버를 상대로 전체 크롤링 사이클 실행"""
+    from benchmarks.mock_server import MockRatioServer
+    from app.database import init_db, async_session, engine
+    from app.services.crawl_service import CrawlService
+
+    results = {}
+    async with MockRatioServer(pages, latency=latency, jitter=jitter) as server:
+        await init_db()
+
+        for cycle in range(cycles):
+            label = "cold" if cycle == 0 else "warm"
+            before = _stage_totals()
+
+            async with async_session() as db:
+                service = CrawlService(db)
+                service.univ_crawler.base_url = server.listing_url
+                start = time.perf_counter()
+                summary = await service.crawl_all_universities(delay=0)
+                elapsed = time.perf_counter() - start
+
+            after = _stage_totals()
+            crawled = max(summary["success"], 1)
+            stage_ms = {
+                stage: (after.get(stage, 0.0) - before.get(stage, 0.0)) * 1000 / crawled
+                for stage in after
+            }
+
+            print(
+                f"[cycle {cycle + 1} {label}] {summary} "
+                f"{elapsed:.2f}s, {summary['success'] / elapsed:.1f} pages/s"
+            )
+            print("    " + ", ".join(f"{k} {v:.2f}ms" for k, v in sorted(stage_ms.items())))
+
+            # warm 사이클은 마지막 회차 값을 사용
+            results[f"{label}_pages_per_second"] = round(summary["success"] / elapsed, 2)
+            results[f"{label}_db_write_ms_per_page"] = round(stage_ms.get("db_write", 0.0), 3)
+            results[f"{label}_diff_ms_per_page"] = round(stage_ms.get("diff", 0.0), 3)
+            results[f"{label}_success"] = summary["success"]
+
+        results["requests"] = server.request_count
+
+    await engine.dispose()
+    return results
+
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list[str]:
+    """baseline 대비 tolerance 이상 나빠진 항목"""
+    regressions = []
+    for name, higher_is_better in COMPARED_METRICS:
+        if name not in baseline or name not in results:
+            continue
+        base, value = baseline[name], results[name]
+        if not base:
+            continue
+        change = (value - base) / base
+        worse = -change if higher_is_better else change
+        if worse > tolerance:
+            regressions.append(f"{name}: {base} -> {value} ({change:+.0%})")
+    return regressions
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="크롤링 사이클 벤치마크")
+    parser.add_argument("--pages", type=int, default=0, help="사용할 페이지 수 (0=전체)")
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    parser.add_argument("--jitter-ms", type=float, default=20.0)
+    parser.add_argument("--cycles", type=int, default=2)
+    parser.add_argument("--parse-repeat", type=int, default=5)
+    parser.add_argument("--tolerance", type=float, default=0.25, help="허용 성능 저하 비율")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--update-baseline", action="store_true")
+    args = parser.parse_args()
+
+    # app 모듈 import 전에 임시 DB 지정 (픽스처 페이지 수가 적어도 사이클 검증을 통과해 게시되도록)
+    tmp_dir = tempfile.mkdtemp(prefix="bench_crawl_")
+    os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{tmp_dir}/bench.db"
+    os.environ["CRAWL_MIN_UNIVERSITIES"] = "1"
+
+    from benchmarks.fixtures import load_fixture_pages
+
+    pages = load_fixture_pages(args.pages)
+    if not pages:
+        print("픽스처 페이지가 없습니다 (benchmarks/fixtures 또는 output/latest_data.json 필요)")
+        return 1
+
+    config = {
+        "pages": len(pages),
+        "latency_ms": args.latency_ms,
+        "jitter_ms": args.jitter_ms,
+        "cycles": args.cycles,
+    }
+    print(f"[config] {config}")
+
+    results = bench_parse(pages, args.parse_repeat)
+    results.update(asyncio.run(bench_cycles(
+        pages, args.latency_ms / 1000, args.jitter_ms / 1000, args.cycles
+    )))
+    results["peak_rss_mb"] = _peak_rss_mb()
+
+    print(f"\n{'='*60}")
+    for key, value in results.items():
+        print(f"  {key:32s} {value}")
+
+    if args.update_baseline:
+        args.baseline.write_text(
+            json.dumps({"config": config, "results": results}, indent=2, ensure_ascii=False) + "\n",
+            encoding="utf-8"
+        )
+        print(f"\nbaseline 저장: {args.baseline}")
+        return 0
+
+    if not args.baseline.exists():
+        print("\nbaseline 없음 (--update-baseline 으로 생성)")
+        return 0
+
+    baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+    if baseline.get("config") != config:
+        print(f"\n[WARN] baseline 설정이 다릅니다: {baseline.get('config')}")
+
+    regressions = compare(results, baseline.get("results", {}), args.tolerance)
+    if regressions:
+        print(f"\n[REGRESSION] 허용치 {args.tolerance:.0%} 초과:")
+        for line in regressions:
+            print(f"  - {line}")
+        return 1
+
+    print(f"\n[OK] baseline 대비 허용치 {args.tolerance:.0%} 이내")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
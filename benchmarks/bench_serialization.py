@@ -0,0 +1,207 @@
+# -*- coding: utf-8 -*-
+"""
+대용량 조회 응답 직렬화 벤치마크
+
+임시 DB에 합성 데이터(기본 10,000 모집단위)를 넣고, 같은 앱에 이전 구현
+(pydantic 객체 생성 + response_model 재검증)을 /legacy 경로로 함께 올려
+현재 빠른 경로(SQL 행 -> dict -> JSON 바이트, app/services/fast_json.py)와 비교합니다.
+
+측정 항목:
+- /competition-rates?limit=10000 요청 처리량 (req/s, ASGI 직접 호출 - 네트워크 제외)
+- /universities/{id} (전형 N개 x 학과 M개를 가진 대학 1곳) 처리량
+- 직렬화만 (DB 제외): 10,000행 -> 응답 바이트 시간 (ms)
+- 두 경로 응답 JSON 이 같은지
+
+사용법:
+    python -m benchmarks.bench_serialization
+    python -m benchmarks.bench_serialization --rows 10000 --repeat 20
+"""
+import argparse
+import asyncio
+import io
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+
+def legacy_router():
+    """이전 구현 (pydantic 객체 생성 후 response_model 로 다시 검증/직렬화)"""
+    from fastapi import APIRouter, Depends, Query
+    from sqlalchemy import select
+    from sqlalchemy.ext.asyncio import AsyncSession
+    from sqlalchemy.orm import selectinload
+    from app.database import get_snapshot_db
+    from app.models import Admission, Department, University
+    from app.schemas import CompetitionRateResponse, UniversityDetailResponse
+
+    router = APIRouter()
+
+    @router.get("/legacy/universities/{university_id}", response_model=UniversityDetailResponse)
+    async def legacy_university(university_id: int, db: AsyncSession = Depends(get_snapshot_db)):
+        stmt = (
+            select(University)
+            .options(selectinload(University.admissions).selectinload(Admission.departments))
+            .where(University.id == university_id)
+        )
+        return (await db.execute(stmt)).scalar_one_or_none()
+
+    @router.get("/legacy/competition-rates", response_model=list[CompetitionRateResponse])
+    async def legacy_competition_rates(
+        limit: int = Query(100, le=10000),
+        db: AsyncSession = Depends(get_snapshot_db)
+    ):
+        stmt = (
+            select(
+                University.name.label("university_name"),
+                University.code.label("university_code"),
+                Admission.admission_type,
+                Admission.admission_name,
+                Department.campus,
+                Department.name.label("department_name"),
+                Department.detail,
+                Department.recruit_count,
+                Department.apply_count,
+                Department.competition_rate,
+                Department.additional_recruit,
+                Department.actual_competition_rate,
+                Department.updated_at
+            )
+            .join(Admission, University.id == Admission.university_id)
+            .join(Department, Admission.id == Department.admission_id)
+            .order_by(University.name, Admission.admission_name, Department.name)
+            .limit(limit)
+        )
+        rows = (await db.execute(stmt)).all()
+        return [CompetitionRateResponse(**row._asdict()) for row in rows]
+
+    return router
+
+
+async def bench_requests(client, path: str, params: dict, repeat: int) -> dict:
+    await client.get(path, params=params)  # 워밍업
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        response = await client.get(path, params=params)
+        samples.append(time.perf_counter() - start)
+        response.raise_for_status()
+    median = statistics.median(samples)
+    return {"ms_p50": round(median * 1000, 2), "req_per_second": round(1 / median, 1), "bytes": len(response.content)}
+
+
+def bench_encode(rows: list, repeat: int) -> dict:
+    """DB 제외 직렬화 시간: 이전(객체 생성 + 재검증 + 직렬화) vs 현재(dict + 인코딩)"""
+    from pydantic import TypeAdapter
+    from app.schemas import CompetitionRateResponse
+    from app.services.fast_json import dumps
+
+    adapter = TypeAdapter(list[CompetitionRateResponse])
+    keys = tuple(rows[0]._fields)
+
+    def legacy():
+        objects = [CompetitionRateResponse(**row._asdict()) for row in rows]
+        # FastAPI serialize_response 와 같은 순서: 검증 -> JSON 모드 dump -> JSONResponse 인코딩
+        validated = adapter.validate_python(objects, from_attributes=True)
+        return json.dumps(adapter.dump_python(validated, mode="json"), ensure_ascii=False).encode("utf-8")
+
+    def fast():
+        return dumps([dict(zip(keys, row)) for row in rows])
+
+    timings = {}
+    for name, func in (("legacy", legacy), ("fast", fast)):
+        samples = []
+        for _ in range(repeat):
+            start = time.perf_counter()
+            func()
+            samples.append(time.perf_counter() - start)
+        timings[f"encode_{name}_ms"] = round(statistics.median(samples) * 1000, 2)
+    return timings
+
+
+async def run(args) -> int:
+    import httpx
+    from sqlalchemy import select
+    from benchmarks.fixtures import seed_synthetic_rates
+    from app.database import async_session, engine
+    from app.main import app
+    from app.models import Admission, Department, University
+
+    university_id = await seed_synthetic_rates(args.rows)
+    app.include_router(legacy_router(), prefix="/api/v1")
+
+    async with async_session() as db:
+        rows = (await db.execute(
+            select(
+                University.name.label("university_name"), University.code.label("university_code"),
+                Admission.admission_type, Admission.admission_name, Department.campus,
+                Department.name.label("department_name"), Department.detail, Department.recruit_count,
+                Department.apply_count, Department.competition_rate, Department.additional_recruit,
+                Department.actual_competition_rate, Department.updated_at
+            )
+            .join(Admission, University.id == Admission.university_id)
+            .join(Department, Admission.id == Department.admission_id)
+            .limit(args.rows)
+        )).all()
+
+    results = {"rows": len(rows)}
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        params = {"limit": args.rows}
+        for name, path in (("legacy", "/api/v1/legacy/competition-rates"), ("fast", "/api/v1/competition-rates")):
+            for key, value in (await bench_requests(client, path, params, args.repeat)).items():
+                results[f"rates_{name}_{key}"] = value
+        for name, path in (("legacy", "/api/v1/legacy"), ("fast", "/api/v1")):
+            timing = await bench_requests(client, f"{path}/universities/{university_id}", {}, args.repeat * 5)
+            for key, value in timing.items():
+                results[f"university_{name}_{key}"] = value
+
+        same_rates = (
+            (await client.get("/api/v1/legacy/competition-rates", params=params)).json()
+            == (await client.get("/api/v1/competition-rates", params=params)).json()
+        )
+        same_university = (
+            (await client.get(f"/api/v1/legacy/universities/{university_id}")).json()
+            == (await client.get(f"/api/v1/universities/{university_id}")).json()
+        )
+    await engine.dispose()
+    results.update(bench_encode(rows, args.repeat))
+
+    print(f"\n{'='*60}")
+    print(f"  rows={results['rows']} repeat={args.repeat}")
+    print(f"  {'항목':32s} {'legacy':>10s} {'fast':>10s} {'배율':>7s}")
+    for label, legacy_key, fast_key in (
+        ("competition-rates req/s", "rates_legacy_req_per_second", "rates_fast_req_per_second"),
+        ("competition-rates ms p50", "rates_legacy_ms_p50", "rates_fast_ms_p50"),
+        ("universities/{id} req/s", "university_legacy_req_per_second", "university_fast_req_per_second"),
+        ("universities/{id} ms p50", "university_legacy_ms_p50", "university_fast_ms_p50"),
+        ("직렬화만 ms (DB 제외)", "encode_legacy_ms", "encode_fast_ms"),
+    ):
+        legacy, fast = results[legacy_key], results[fast_key]
+        ratio = (fast / legacy) if "req/s" in label else (legacy / fast)
+        print(f"  {label:32s} {legacy:>10} {fast:>10} {ratio:>6.1f}x")
+    print(f"  응답 동일: competition-rates={same_rates}, universities={same_university}")
+
+    ok = same_rates and same_university
+    print(f"\n[{'OK' if ok else 'FAIL'}]")
+    return 0 if ok else 1
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="대용량 조회 응답 직렬화 벤치마크")
+    parser.add_argument("--rows", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    # app 모듈 import 전에 임시 DB / 조회 전용 모드 지정
+    tmp_dir = tempfile.mkdtemp(prefix="bench_serialization_")
+    os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{tmp_dir}/bench.db"
+    os.environ["APP_MODE"] = "api"
+    return asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,165 @@
+# -*- coding: utf-8 -*-
+"""
+분산 크롤링(샤딩) 로컬 검증
+
+픽스처 페이지를 로컬 mock 서버로 재생하고, 같은 임시 DB를 쓰는 크롤러 워커
+(python -m app.worker) 여러 개를 띄워 전체 크롤링 작업 1건을 나눠 처리하게 합니다.
+
+확인 항목:
+- 작업 완료 여부와 소요 시간
+- 노드별 처리 대학 수 (해시 링 분배)
+- 페이지별 요청 수 (클러스터 전체에서 페이지당 1회인지)
+- --kill-after: 도중에 노드 1개를 SIGKILL 해 lease 만료 후 남은 노드가 이어받는지
+- --join-after: 도중에 노드를 추가 (진행 중 작업의 미룬/만료 대학과 다음 사이클부터 배정)
+
+사용법:
+    python -m benchmarks.bench_shards --workers 3
+    python -m benchmarks.bench_shards --workers 3 --kill-after 1.5
+"""
+import argparse
+import asyncio
+import io
+import os
+import signal
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+async def start_worker(env: dict, log_path: Path) -> asyncio.subprocess.Process:
+    log = open(log_path, "wb")
+    return await asyncio.create_subprocess_exec(
+        sys.executable, "-m", "app.worker", "--no-initial-crawl",
+        cwd=PROJECT_ROOT, env=env, stdout=log, stderr=asyncio.subprocess.STDOUT
+    )
+
+
+async def wait_for_workers(count: int, timeout: float = 30.0):
+    """워커가 모두 노드로 등록될 때까지 대기"""
+    from sqlalchemy import func, select
+    from app.database import async_session
+    from app.models import CrawlWorker
+
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        async with async_session() as db:
+            registered = (await db.execute(select(func.count()).select_from(CrawlWorker))).scalar_one()
+        if registered >= count:
+            return
+        await asyncio.sleep(0.2)
+    raise TimeoutError(f"워커 등록 대기 시간 초과 ({count}개)")
+
+
+async def run(args, tmp_dir: str) -> int:
+    from sqlalchemy import func, select
+    from benchmarks.fixtures import load_fixture_pages
+    from benchmarks.mock_server import MockRatioServer
+    from app.database import async_session, engine, init_db
+    from app.models import CrawlJob, CrawlJobItem
+    from app.services.crawl_jobs import ACTIVE_STATUSES, enqueue_job
+
+    pages = load_fixture_pages(args.pages)
+    if not pages:
+        print("픽스처 페이지가 없습니다 (benchmarks/fixtures 또는 output/latest_data.json 필요)")
+        return 1
+
+    await init_db()
+    async with MockRatioServer(pages, latency=args.latency_ms / 1000, jitter=args.jitter_ms / 1000) as server:
+        env = {
+            **os.environ,
+            "SMART_RATIO_URL": server.listing_url,
+            "CRAWL_INTERVAL_MINUTES": "600",
+            "CRAWL_MIN_UNIVERSITIES": "1",
+            "CRAWL_JOB_POLL_SECONDS": "0.5",
+            "CRAWL_JOB_HEARTBEAT_SECONDS": "1",
+            "CRAWL_JOB_LEASE_SECONDS": str(args.lease_seconds),
+            "WORKER_METRICS_PORT": "0",
+        }
+        workers = [
+            await start_worker(env, Path(tmp_dir) / f"worker{i}.log")
+            for i in range(args.workers)
+        ]
+        print(f"[config] pages={len(pages)} workers={args.workers} logs={tmp_dir}")
+        await wait_for_workers(args.workers)
+
+        async with async_session() as db:
+            job, _ = await enqueue_job(db, "all")
+        start = time.perf_counter()
+
+        killed = joined = False
+        status = None
+        while time.perf_counter() - start < args.timeout:
+            elapsed = time.perf_counter() - start
+            if args.kill_after and not killed and elapsed >= args.kill_after:
+                workers[0].send_signal(signal.SIGKILL)
+                killed = True
+                print(f"[{elapsed:.1f}s] worker0 SIGKILL")
+            if args.join_after and not joined and elapsed >= args.join_after:
+                workers.append(await start_worker(env, Path(tmp_dir) / f"worker{len(workers)}.log"))
+                joined = True
+                print(f"[{elapsed:.1f}s] worker{len(workers) - 1} 추가")
+            async with async_session() as db:
+                status = (await db.execute(select(CrawlJob.status).where(CrawlJob.id == job.id))).scalar_one()
+            if status not in ACTIVE_STATUSES:
+                break
+            await asyncio.sleep(0.2)
+        elapsed = time.perf_counter() - start
+
+        for worker in workers:
+            if worker.returncode is None:
+                worker.send_signal(signal.SIGTERM)
+        await asyncio.gather(*(worker.wait() for worker in workers))
+
+        async with async_session() as db:
+            job = await db.get(CrawlJob, job.id)
+            shares = (
+                await db.execute(
+                    select(CrawlJobItem.owner, func.count())
+                    .where(CrawlJobItem.job_id == job.id)
+                    .group_by(CrawlJobItem.owner)
+                )
+            ).all()
+    await engine.dispose()
+
+    page_requests = {path: n for path, n in server.path_counts.items() if path.startswith("/RatioV1/")}
+    duplicates = {path: n for path, n in page_requests.items() if n > 1}
+
+    print(f"\n{'='*60}")
+    print(f"  job {job.id}: {status} ({elapsed:.2f}s) - {job.message}")
+    print(f"  total {job.total}, success {job.success}, failed {job.failed}, attempts {job.attempts}")
+    for owner, count in sorted(shares, key=lambda row: str(row[0])):
+        print(f"  {str(owner):40s} {count}")
+    print(f"  pages requested {len(page_requests)}/{len(pages)}, duplicated {len(duplicates)}")
+
+    ok = status == "done" and len(page_requests) == len(pages)
+    if not args.kill_after and duplicates:
+        ok = False  # 노드를 죽이지 않았으면 페이지당 정확히 1회
+    print(f"\n[{'OK' if ok else 'FAIL'}]")
+    return 0 if ok else 1
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="분산 크롤링 로컬 검증")
+    parser.add_argument("--workers", type=int, default=3)
+    parser.add_argument("--pages", type=int, default=0, help="사용할 페이지 수 (0=전체)")
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    parser.add_argument("--jitter-ms", type=float, default=20.0)
+    parser.add_argument("--lease-seconds", type=float, default=5.0)
+    parser.add_argument("--kill-after", type=float, default=0.0, help="이 시간(초) 뒤 노드 1개 SIGKILL")
+    parser.add_argument("--join-after", type=float, default=0.0, help="이 시간(초) 뒤 노드 1개 추가")
+    parser.add_argument("--timeout", type=float, default=120.0)
+    args = parser.parse_args()
+
+    # app 모듈 import 전에 임시 DB 지정 (워커 프로세스도 같은 DB 사용)
+    tmp_dir = tempfile.mkdtemp(prefix="bench_shards_")
+    os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{tmp_dir}/bench.db"
+    return asyncio.run(run(args, tmp_dir))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,178 @@
+"""
+벤치마크용 경쟁률 페이지 픽스처
+
+- benchmarks/fixtures/Ratio{code}.html 에 저장된 원본 페이지가 있으면 그대로 사용
+- 없으면 output/latest_data.json (crawler.js 수집 결과)에서 진학사 페이지 구조
+  (tableRatio2 요약 + tableRatio3 상세)로 재구성
+
+조회 API 벤치마크용 합성 DB 데이터는 seed_synthetic_rates.
+
+원본 페이지 저장:
+    python -m benchmarks.fixtures record https://addon.jinhakapply.com/RatioV1/RatioH/Ratio10030321.html ...
+"""
+
+import asyncio
+import html
+import json
+import re
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+RAW_DIR = Path(__file__).resolve().parent / "fixtures"
+LATEST_DATA = ROOT / "output" / "latest_data.json"
+
+
+def _parse_int(text: str) -> int:
+    cleaned = re.sub(r"[^\d]", "", text or "")
+    return int(cleaned) if cleaned else 0
+
+
+def _cells(tag: str, values: list[str]) -> str:
+    return "".join(f"<{tag}>{html.escape(str(v))}</{tag}>" for v in values)
+
+
+def render_ratio_page(university: dict) -> str:
+    """crawler.js 수집 결과(대학 1곳)를 진학사 경쟁률 페이지 HTML로 재구성"""
+    name = university.get("university", "")
+    details = university.get("details") or []
+
+    summary_rows = []
+    detail_tables = []
+    for table in details:
+        heading = table.get("heading", "")
+        headers = table.get("headers") or ["모집단위", "모집인원", "지원인원", "경쟁률"]
+        rows = table.get("rows") or []
+
+        # 요약 행: 뒤에서 두 번째/세 번째 숫자 컬럼 합계
+        recruit = sum(_parse_int(row[-3]) for row in rows if len(row) >= 3)
+        apply = sum(_parse_int(row[-2]) for row in rows if len(row) >= 3)
+        rate = f"{apply / recruit:.2f} : 1" if recruit else "0.00 : 1"
+        summary_rows.append(f"<tr>{_cells('td', [heading, recruit, apply, rate])}</tr>")
+
+        body = "".join(f"<tr>{_cells('td', row)}</tr>" for row in rows)
+        detail_tables.append(
+            f"<h3>{html.escape(heading)}</h3>"
+            f'<table class="tableRatio3"><tr>{_cells("th", headers)}</tr>{body}</table>'
+        )
+
+    return (
+        "<!DOCTYPE html><html><head><meta charset=\"utf-8\">"
+        f"<title>{html.escape(name)} 경쟁률</title></head><body>"
+        f"<p>{html.escape(university.get('updateTime') or '')}</p>"
+        '<table class="tableRatio2">'
+        f"<tr>{_cells('th', ['전형명', '모집인원', '지원인원', '경쟁률'])}</tr>"
+        f"{''.join(summary_rows)}</table>"
+        f"{''.join(detail_tables)}</body></html>"
+    )
+
+
+def drop_last_row(content: bytes) -> bytes:
+    """마지막 상세 표의 마지막 모집단위 행 제거 (페이지에서 모집단위 1개가 사라진 경우)"""
+    text = content.decode("utf-8")
+    rows = list(re.finditer(r"<tr><td>.*?</tr>", text))
+    last = rows[-1]
+    return (text[:last.start()] + text[last.end():]).encode("utf-8")
+
+
+def load_fixture_pages(limit: int = 0) -> dict[str, bytes]:
+    """
+    벤치마크 페이지 로드
+
+    Returns:
+        {페이지 코드: HTML 바이트} (코드는 Ratio{code}.html 의 code)
+    """
+    pages: dict[str, bytes] = {}
+
+    if RAW_DIR.exists():
+        for path in sorted(RAW_DIR.glob("Ratio*.html")):
+            match = re.match(r"Ratio(\d+)\.html", path.name)
+            if match:
+                pages[match.group(1)] = path.read_bytes()
+
+    if not pages and LATEST_DATA.exists():
+        data = json.loads(LATEST_DATA.read_text(encoding="utf-8")).get("data", {})
+        for i, university in enumerate(data.values()):
+            if not university.get("details"):
+                continue
+            match = re.search(r"Ratio(\d+)\.html", university.get("url") or "")
+            code = match.group(1) if match else f"9{i:03d}0321"
+            pages[code] = render_ratio_page(university).encode("utf-8")
+
+    if limit:
+        pages = dict(list(pages.items())[:limit])
+    return pages
+
+
+# 합성 데이터: 대학 1곳의 전형/학과 수 (/universities/{id} 측정용)
+ADMISSIONS_PER_UNIVERSITY = 4
+DEPARTMENTS_PER_ADMISSION = 25
+
+
+async def seed_synthetic_rates(rows: int) -> int:
+    """
+    조회 API 벤치마크용 합성 데이터 INSERT (대학 rows/100곳 x 전형 4개 x 학과 25개)
+
+    app 모듈을 불러오므로 DATABASE_URL 을 임시 DB로 지정한 뒤 호출합니다.
+
+    Returns:
+        측정용 대학 id
+    """
+    from datetime import datetime
+    from sqlalchemy import insert
+    from app.database import async_session, init_db
+    from app.models import Admission, Department, University
+
+    await init_db()
+    per_university = ADMISSIONS_PER_UNIVERSITY * DEPARTMENTS_PER_ADMISSION
+    universities = max(1, rows // per_university)
+    now = datetime(2026, 1, 5, 12, 30, 15, 250000)
+
+    async with async_session() as db:
+        await db.execute(insert(University), [
+            {"id": u + 1, "code": f"{1000 + u}", "name": f"합성대학교{u:04d}", "region": "서울",
+             "type": "4년제", "created_at": now, "updated_at": now}
+            for u in range(universities)
+        ])
+        await db.execute(insert(Admission), [
+            {"id": u * ADMISSIONS_PER_UNIVERSITY + a + 1, "university_id": u + 1, "admission_type": "정시",
+             "admission_name": f"일반전형{a + 1} {'가나다'[a % 3]}군", "gun": f"{'가나다'[a % 3]}군", "year": 2026,
+             "created_at": now}
+            for u in range(universities) for a in range(ADMISSIONS_PER_UNIVERSITY)
+        ])
+        await db.execute(insert(Department), [
+            {"admission_id": a + 1, "campus": "본교", "name": f"학과{d:02d}", "detail": None,
+             "recruit_count": 10 + d, "apply_count": 37 + d * 3, "competition_rate": round((37 + d * 3) / (10 + d), 2),
+             "additional_recruit": d % 7 or None, "actual_competition_rate": None,
+             "created_at": now, "updated_at": now}
+            for a in range(universities * ADMISSIONS_PER_UNIVERSITY) for d in range(DEPARTMENTS_PER_ADMISSION)
+        ])
+        await db.commit()
+    return 1
+
+
+async def record_pages(urls: list[str]):
+    """실제 경쟁률 페이지를 benchmarks/fixtures 에 원본 그대로 저장"""
+    import httpx
+    from app.crawler.ratio_crawler import RatioCrawler
+
+    RAW_DIR.mkdir(exist_ok=True)
+    headers = RatioCrawler().headers
+    async with httpx.AsyncClient(headers=headers, timeout=30.0) as client:
+        for url in urls:
+            match = re.search(r"Ratio(\d+)\.html", url)
+            if not match:
+                print(f"[SKIP] {url}")
+                continue
+            response = await client.get(url)
+            response.raise_for_status()
+            (RAW_DIR / f"Ratio{match.group(1)}.html").write_bytes(response.content)
+            print(f"[OK] {url} ({len(response.content):,} bytes)")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 2 and sys.argv[1] == "record":
+        asyncio.run(record_pages(sys.argv[2:]))
+    else:
+        pages = load_fixture_pages()
+        print(f"{len(pages)} pages, {sum(len(p) for p in pages.values()):,} bytes")
@@ -0,0 +1,110 @@
+"""
+벤치마크용 로컬 경쟁률 사이트 (asyncio HTTP 서버)
+
+- GET /SmartRatio                       대학 목록 페이지 (a.rate[data-link] 링크)
+- GET /RatioV1/RatioH/Ratio{code}.html  경쟁률 페이지
+- 그 외                                 404
+
+모든 응답에 latency ± jitter 지연을 주입합니다 (seed 고정으로 재현 가능).
+"""
+
+import asyncio
+import random
+import re
+from typing import Optional
+
+
+class MockRatioServer:
+    """
+    사용 예:
+        async with MockRatioServer(pages, latency=0.05, jitter=0.02) as server:
+            server.listing_url  # http://127.0.0.1:{port}/SmartRatio
+    """
+
+    def __init__(
+        self,
+        pages: dict[str, bytes],
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        seed: int = 42,
+        host: str = "127.0.0.1",
+        port: int = 0
+    ):
+        self.pages = pages
+        self.latency = latency
+        self.jitter = jitter
+        self.host = host
+        self.port = port
+        self.request_count = 0
+        self.status_counts: dict[int, int] = {}
+        self.path_counts: dict[str, int] = {}  # 경로별 요청 수 (중복 크롤링 확인용)
+        self._random = random.Random(seed)
+        self._server: Optional[asyncio.base_events.Server] = None
+
+    @property
+    def base_url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    @property
+    def ratio_base_url(self) -> str:
+        return f"{self.base_url}/RatioV1/RatioH/"
+
+    @property
+    def listing_url(self) -> str:
+        return f"{self.base_url}/SmartRatio"
+
+    def _listing_page(self) -> bytes:
+        links = "".join(
+            f'<li><a class="rate" data-link="{self.ratio_base_url}Ratio{code}.html" '
+            f'data-label="{code} 정시">경쟁률</a></li>'
+            for code in self.pages
+        )
+        return f"<html><body><ul>{links}</ul></body></html>".encode("utf-8")
+
+    def _route(self, path: str) -> tuple[int, bytes]:
+        if path.rstrip("/") == "/SmartRatio":
+            return 200, self._listing_page()
+        match = re.fullmatch(r"/RatioV1/RatioH/Ratio(\d+)\.html", path)
+        if match and match.group(1) in self.pages:
+            return 200, self.pages[match.group(1)]
+        return 404, b"Not Found"
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            request_line = await reader.readline()
+            while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                pass
+
+            parts = request_line.decode("latin-1").split()
+            path = parts[1].split("?")[0] if len(parts) >= 2 else "/"
+            status, body = self._route(path)
+
+            delay = self.latency + self._random.uniform(-self.jitter, self.jitter)
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+            self.request_count += 1
+            self.status_counts[status] = self.status_counts.get(status, 0) + 1
+            self.path_counts[path] = self.path_counts.get(path, 0) + 1
+
+            reason = "OK" if status == 200 else "Not Found"
+            writer.write(
+                f"HTTP/1.1 {status} {reason}\r\n"
+                "Content-Type: text/html; charset=utf-8\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                "Connection: close\r\n\r\n".encode("latin-1") + body
+            )
+            await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def __aenter__(self) -> "MockRatioServer":
+        self._server = await asyncio.start_server(self._handle, self.host, self.port)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def __aexit__(self, *exc):
+        self._server.close()
+        await self._server.wait_closed()
@@ -0,0 +1,136 @@
+# -*- coding: utf-8 -*-
+"""
+크롤링 작업 사이클 검증 검사 (검증을 통과하지 못한 결과는 게시하지 않음)
+
+픽스처 페이지(benchmarks/fixtures.py)를 로컬 mock 서버로 재생하면서 임시 DB에 대해
+스케줄러/크롤링 API 와 같은 경로(crawl_jobs 작업 -> JobRunner)로 전체 크롤링 작업을 실행하고,
+단계마다 새 데이터 세대(data_generations) 게시 여부와 사이클 검증 결과를 확인합니다.
+
+1) 최소 대학 수(CRAWL_MIN_UNIVERSITIES)에 못 미치는 첫 사이클 -> 게시 안 함, 검증 실패 기록
+2) 최소 대학 수를 충족하는 사이클 -> 게시, 검증 통과 기록
+3) 대학 목록이 --keep 비율만큼 줄고 남은 페이지는 모집단위 1개씩 사라진 사이클
+   -> 직전 사이클 대비 비율 미달로 게시 안 함 (학과 수 그대로)
+
+사용법:
+    python check_cycle_validation.py
+    python check_cycle_validation.py --pages 40 --keep 0.25
+"""
+import argparse
+import asyncio
+import io
+import os
+import sys
+import tempfile
+
+sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+
+
+async def snapshot() -> dict:
+    """세대 수 / 학과 수 / 마지막 사이클 검증 결과"""
+    from sqlalchemy import func, select
+    from app.database import async_session
+    from app.models import CrawlCycle, DataGeneration, Department
+
+    async with async_session() as db:
+        cycle = (
+            await db.execute(select(CrawlCycle).order_by(CrawlCycle.id.desc()).limit(1))
+        ).scalar_one_or_none()
+        return {
+            "generations": (await db.execute(select(func.count()).select_from(DataGeneration))).scalar_one(),
+            "departments": (await db.execute(select(func.count()).select_from(Department))).scalar_one(),
+            "valid": cycle.valid if cycle else None,
+            "message": cycle.message if cycle else "",
+        }
+
+
+async def run_job() -> dict:
+    """전체 크롤링 작업 1건을 넣고 이 프로세스의 JobRunner 로 끝까지 실행"""
+    from app.database import async_session
+    from app.models import CrawlJob
+    from app.services.crawl_jobs import enqueue_job, job_runner, job_summary
+
+    async with async_session() as db:
+        job, _ = await enqueue_job(db, "all")
+    await job_runner.run_pending()
+    async with async_session() as db:
+        return job_summary(await db.get(CrawlJob, job.id))
+
+
+async def run(args) -> int:
+    from benchmarks.fixtures import drop_last_row, load_fixture_pages
+    from benchmarks.mock_server import MockRatioServer
+    from app.config import get_settings
+    from app.database import engine, init_db
+    from app.services.crawl_jobs import job_runner
+
+    settings = get_settings()
+    pages = load_fixture_pages(args.pages)
+    if not pages:
+        print("픽스처 페이지가 없습니다 (benchmarks/fixtures 또는 output/latest_data.json 필요)")
+        return 1
+    codes = list(pages)
+    kept = {code: drop_last_row(pages[code]) for code in codes[:max(1, int(len(codes) * args.keep))]}
+
+    # (단계, 제공 페이지, 최소 대학 수, 게시 기대)
+    steps = [
+        ("최소 대학 수 미달", pages, len(pages) + 1, False),
+        ("정상 사이클", pages, 1, True),
+        (f"대학 목록 {len(kept)}/{len(pages)}", kept, 1, False),
+    ]
+
+    await init_db()
+    failures = 0
+    async with MockRatioServer(dict(pages)) as server:
+        settings.smart_ratio_url = server.listing_url
+        for label, served, min_universities, publish in steps:
+            server.pages.clear()
+            server.pages.update(served)
+            settings.crawl_min_universities = min_universities
+
+            before = await snapshot()
+            job = await run_job()
+            after = await snapshot()
+
+            published = after["generations"] - before["generations"]
+            problems = []
+            if job["status"] != "done":
+                problems.append(f"작업 상태 {job['status']}: {job['message']}")
+            if publish and (published < 1 or not after["valid"]):
+                problems.append(f"검증 통과 사이클이 게시되지 않음 (세대 +{published}, 검증 {after['valid']})")
+            if not publish:
+                if published:
+                    problems.append(f"검증 실패 사이클에서 세대 {published}개 게시")
+                if after["departments"] != before["departments"]:
+                    problems.append(f"학과 수 변경 {before['departments']} -> {after['departments']}")
+                if after["valid"] is not False:
+                    problems.append(f"사이클 검증 결과 {after['valid']}")
+
+            failures += bool(problems)
+            print(
+                f"[{'FAIL' if problems else 'OK'}]   {label:24s} 세대 +{published}, "
+                f"성공 {job['success']}/{job['total']}, 학과 {after['departments']} - {after['message']}"
+            )
+            for problem in problems:
+                print(f"       -> {problem}")
+    await job_runner.unregister()
+    await engine.dispose()
+
+    print(f"\n{'='*60}")
+    print("검증을 통과한 사이클만 게시됩니다" if not failures else f"{failures}건 실패")
+    return 1 if failures else 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="크롤링 작업 사이클 검증 검사")
+    parser.add_argument("--pages", type=int, default=20, help="사용할 픽스처 페이지 수")
+    parser.add_argument("--keep", type=float, default=0.25, help="3단계에서 남길 대학 비율")
+    args = parser.parse_args()
+
+    # app 모듈 import 전에 임시 DB 지정
+    tmp_dir = tempfile.mkdtemp(prefix="check_cycle_validation_")
+    os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{tmp_dir}/check.db"
+    return asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,114 @@
+# -*- coding: utf-8 -*-
+"""
+API 프로세스 시작 시간(import) 검사
+
+APP_MODE 별로 새 인터프리터에서 app.main 을 import 하며 (python -X importtime)
+- 누적 import 시간 (여러 번 실행 후 중앙값 / 최솟값)
+- 조회 전용(api) 모드에서 크롤러 의존성이 불러와졌는지
+를 확인합니다. api 모드가 예산(--budget-ms)을 넘거나 금지 모듈을 불러오면 실패합니다.
+
+예산은 다른 프로세스 부하의 영향이 가장 적은 최솟값과 비교합니다.
+기본 예산(API_BUDGET_MS)은 api 모드 측정값(최솟값 약 750~830ms)에 10% 남짓 여유를 둔 값이라
+api 모드 import 가 그 이상 무거워지면 실패합니다. 의존성/모듈을 정리해 측정값이 바뀌면 함께 갱신합니다.
+
+사용법:
+    python check_import_time.py                  # 기본 예산
+    python check_import_time.py --budget-ms 800 --runs 7
+"""
+import argparse
+import io
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+
+# api 모드 import 시간 예산 (ms, 최솟값 기준)
+API_BUDGET_MS = 900.0
+
+# 조회 전용 모드에서 불러오면 안 되는 모듈 (크롤러/스케줄러)
+API_FORBIDDEN_MODULES = (
+    "bs4",
+    "lxml",
+    "httpx",
+    "apscheduler",
+    "app.crawler.ratio_crawler",
+    "app.services.crawl_service",
+    "app.api.crawl_routes",
+)
+
+_PROBE = (
+    "import sys, json; import app.main; "
+    "print(json.dumps(sorted(m for m in sys.modules if m.split('.')[0] in {roots!r} or m in {names!r})))"
+)
+
+
+def measure(mode: str) -> tuple[float, list[str]]:
+    """
+    새 프로세스에서 app.main import
+
+    Returns:
+        (app.main 누적 import 시간 ms, 불러온 금지 후보 모듈 목록)
+    """
+    roots = sorted({name.split(".")[0] for name in API_FORBIDDEN_MODULES})
+    env = {**os.environ, "APP_MODE": mode, "PYTHONDONTWRITEBYTECODE": "1"}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _PROBE.format(roots=roots, names=API_FORBIDDEN_MODULES)],
+        capture_output=True,
+        text=True,
+        encoding="utf-8",
+        env=env,
+        check=True
+    )
+
+    cumulative_us = None
+    for line in result.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if line.startswith("import time:") and line.rstrip().endswith("| app.main"):
+            cumulative_us = int(line.split("|")[1])
+    if cumulative_us is None:
+        raise RuntimeError(f"app.main import 시간을 찾을 수 없음 (APP_MODE={mode})")
+
+    loaded = json.loads(result.stdout.strip().splitlines()[-1])
+    return cumulative_us / 1000, [name for name in loaded if name in API_FORBIDDEN_MODULES]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="app.main import 시간 검사")
+    parser.add_argument("--budget-ms", type=float, default=API_BUDGET_MS, help="api 모드 import 시간 예산 (최솟값)")
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    medians, minimums = {}, {}
+    failures = 0
+    for mode in ("all", "crawler", "api"):
+        samples, loaded = [], []
+        for _ in range(args.runs):
+            elapsed, loaded = measure(mode)
+            samples.append(elapsed)
+        medians[mode] = statistics.median(samples)
+        minimums[mode] = min(samples)
+        print(f"[{mode:7}] median {medians[mode]:7.1f}ms  min {min(samples):7.1f}ms  ({args.runs} runs)")
+
+        if mode == "api" and loaded:
+            print(f"[FAIL] api 모드에서 크롤러 의존성 로드: {', '.join(loaded)}")
+            failures += 1
+
+    if minimums["api"] > args.budget_ms:
+        print(f"[FAIL] api 모드 import {minimums['api']:.1f}ms > 예산 {args.budget_ms:.0f}ms")
+        failures += 1
+
+    saved = 1 - medians["api"] / medians["all"]
+    print("\n" + "=" * 60)
+    print(f"api 모드: all 대비 {saved:.0%} 단축")
+    if failures:
+        print(f"{failures}건 실패")
+        return 1
+    print("import 예산 통과")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+"""
+적응형 동시 요청 제한(app/crawler/concurrency.py) 자리 넘김 검사
+
+창 크기 1인 limiter 에서 자리 1개를 잡아 두고 대기자 2개를 줄 세운 뒤 자리를 놓으면
+첫 대기자가 깨어납니다(set_result). 그 대기자가 실행되기 전에 취소되어도
+받은 자리가 두 번째 대기자에게 넘어가야 합니다 (넘어가지 않으면 두 번째 대기자는
+다른 요청이 자리를 놓을 때까지 멈춥니다).
+
+사용법:
+    python check_limiter.py
+"""
+import asyncio
+import io
+import sys
+
+sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+
+TIMEOUT = 1.0
+
+
+async def woken_then_cancelled() -> list[str]:
+    """깨운 대기자를 취소했을 때 남은 대기자가 자리를 잡는지 확인"""
+    from app.config import get_settings
+    from app.crawler.concurrency import AdaptiveLimiter
+
+    settings = get_settings()
+    settings.crawl_concurrency_initial = 1
+    settings.crawl_concurrency_min = 1
+    limiter = AdaptiveLimiter("check-limiter")
+
+    problems = []
+    await limiter.acquire()
+    first = asyncio.create_task(limiter.acquire())
+    second = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+    if len(limiter._waiters) != 2:
+        problems.append(f"대기자 {len(limiter._waiters)}개 (기대 2)")
+
+    # release 가 첫 대기자를 깨운 직후, 실행되기 전에 취소
+    limiter.release()
+    first.cancel()
+
+    try:
+        await asyncio.wait_for(second, TIMEOUT)
+    except asyncio.TimeoutError:
+        problems.append(f"깨운 대기자가 취소된 뒤 남은 대기자가 {TIMEOUT:g}초 안에 자리를 잡지 못함")
+    if not first.cancelled():
+        problems.append("첫 대기자가 취소되지 않음")
+    if not problems and limiter.inflight != 1:
+        problems.append(f"사용 중 자리 {limiter.inflight}개 (기대 1)")
+    return problems
+
+
+async def cancelled_while_waiting() -> list[str]:
+    """깨우기 전에 취소된 대기자는 자리를 가져가지도, 넘기지도 않음"""
+    from app.crawler.concurrency import AdaptiveLimiter
+
+    limiter = AdaptiveLimiter("check-limiter")
+    problems = []
+    await limiter.acquire()
+    first = asyncio.create_task(limiter.acquire())
+    second = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+    first.cancel()
+    await asyncio.sleep(0)
+    if limiter._waiters and len(limiter._waiters) != 1:
+        problems.append(f"취소 후 대기자 {len(limiter._waiters)}개 (기대 1)")
+    if second.done():
+        problems.append("자리가 없는데 남은 대기자가 자리를 잡음")
+
+    limiter.release()
+    try:
+        await asyncio.wait_for(second, TIMEOUT)
+    except asyncio.TimeoutError:
+        problems.append("자리를 놓은 뒤 남은 대기자가 자리를 잡지 못함")
+    if not problems and limiter.inflight != 1:
+        problems.append(f"사용 중 자리 {limiter.inflight}개 (기대 1)")
+    return problems
+
+
+async def run() -> int:
+    failures = 0
+    for label, case in [
+        ("깨운 뒤 취소", woken_then_cancelled),
+        ("대기 중 취소", cancelled_while_waiting),
+    ]:
+        problems = await case()
+        failures += bool(problems)
+        print(f"[{'FAIL' if problems else 'OK'}]   {label}")
+        for problem in problems:
+            print(f"       -> {problem}")
+
+    print(f"\n{'='*60}")
+    print("취소된 대기자가 받은 자리는 다음 대기자에게 넘어갑니다" if not failures else f"{failures}건 실패")
+    return 1 if failures else 0
+
+
+def main() -> int:
+    return asyncio.run(run())
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,193 @@
+# -*- coding: utf-8 -*-
+"""
+여러 페이지로 나뉜 대학 크롤링 검사
+
+한 대학의 전형이 여러 경쟁률 페이지(예: Ratio11720771.html, Ratio11720772.html)에
+나뉘어 있으면 두 페이지가 같은 대학 코드(1172)로 저장됩니다.
+픽스처 페이지(benchmarks/fixtures.py)를 로컬 mock 서버로 재생하면서 임시 DB에 대해
+전체 크롤링 사이클을 여러 번 실행하고, 사이클마다 다음을 확인합니다.
+
+- 두 페이지가 모두 같은 세대에 게시되는지 (대학의 모집단위 수 = 두 페이지 합계)
+- 페이지별 모집단위 수가 각 페이지 내용과 같은지 (admissions.page_code 기준)
+- 변경 없는 사이클에서 새 세대/격리가 생기지 않는지 (quality_accept_after 회 이상 반복)
+- 한 페이지에서만 모집단위가 사라지면 그 페이지에서만 지워지는지
+  (학과 행은 삭제 표시만 하고 경쟁률 변동 이력은 남는지)
+- 사라졌던 모집단위가 다시 나타나면 새 행 없이 원래 학과가 되살아나는지
+
+사용법:
+    python check_multi_page.py
+    python check_multi_page.py --pages 11720771,11720772 --cycles 5
+"""
+import argparse
+import asyncio
+import io
+import os
+import sys
+import tempfile
+
+sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+
+
+def expected_rows(pages: dict[str, bytes]) -> dict[str, int]:
+    """페이지별 모집단위 수 (파서 결과 기준, 중복 키는 1개)"""
+    from app.crawler.ratio_crawler import RatioCrawler
+    from app.services.ratio_diff import ratio_to_values
+
+    crawler = RatioCrawler()
+    return {
+        code: len(ratio_to_values(crawler.parse(crawler._decode(content), f"Ratio{code}.html")))
+        for code, content in pages.items()
+    }
+
+
+async def stored_rows(university_code: str) -> dict[str, int]:
+    """DB에 저장된 페이지별 모집단위 수"""
+    from sqlalchemy import func, select
+    from app.database import async_session
+    from app.models import Admission, Department, University
+
+    async with async_session() as db:
+        rows = (await db.execute(
+            select(Admission.page_code, func.count(Department.id))
+            .join(Department, Department.admission_id == Admission.id)
+            .join(University, University.id == Admission.university_id)
+            .where(University.code == university_code, Department.removed_at.is_(None))
+            .group_by(Admission.page_code)
+        )).all()
+    return {page: count for page, count in rows}
+
+
+async def stored_totals(university_code: str) -> dict[str, int]:
+    """삭제 표시 포함 학과 행 수 / 삭제 표시된 행 수 / 경쟁률 변동 이력 행 수"""
+    from sqlalchemy import func, select
+    from app.database import async_session
+    from app.models import Admission, Department, RatioHistory, University
+
+    departments = (
+        select(Department.id)
+        .join(Admission, Admission.id == Department.admission_id)
+        .join(University, University.id == Admission.university_id)
+        .where(University.code == university_code)
+    )
+    async with async_session() as db:
+        rows, removed = (await db.execute(
+            select(func.count(Department.id), func.count(Department.removed_at))
+            .where(Department.id.in_(departments))
+        )).one()
+        history = (await db.execute(
+            select(func.count(RatioHistory.id)).where(RatioHistory.department_id.in_(departments))
+        )).scalar_one()
+    return {"rows": rows, "removed": removed, "history": history}
+
+
+async def seed_history(university_code: str):
+    """학과마다 경쟁률 변동 이력 1행 (픽스처 페이지는 지원인원이 0이라 크롤링으로는 이력이 생기지 않음)"""
+    from sqlalchemy import insert, select
+    from app.database import async_session
+    from app.models import Admission, Department, RatioHistory, University
+
+    async with async_session() as db:
+        await db.execute(insert(RatioHistory).from_select(
+            ["department_id", "recruit_count", "apply_count", "competition_rate", "apply_delta"],
+            select(Department.id, Department.recruit_count, Department.apply_count, Department.competition_rate, 0)
+            .join(Admission, Admission.id == Department.admission_id)
+            .join(University, University.id == Admission.university_id)
+            .where(University.code == university_code)
+        ))
+        await db.commit()
+
+
+async def run(args) -> int:
+    from benchmarks.fixtures import drop_last_row, load_fixture_pages
+    from benchmarks.mock_server import MockRatioServer
+    from app.config import get_settings
+    from app.crawler.ratio_crawler import university_key
+    from app.database import async_session, engine, init_db
+    from app.services.crawl_service import CrawlService
+
+    codes = args.pages.split(",")
+    fixtures = load_fixture_pages()
+    missing = [code for code in codes if code not in fixtures]
+    if missing:
+        print(f"[FAIL] 픽스처 페이지 없음: {missing}")
+        return 1
+    keys = {university_key(code) for code in codes}
+    if len(keys) != 1:
+        print(f"[FAIL] 같은 대학의 페이지가 아닙니다: {codes}")
+        return 1
+    university_code = keys.pop()
+
+    pages = {code: fixtures[code] for code in codes}
+    # 마지막 두 단계에서 두 번째 페이지의 모집단위 1개를 없앴다가 되돌림
+    changed_page = codes[-1]
+    steps = [("cold", dict(pages))]
+    steps += [(f"warm {i + 1}", dict(pages)) for i in range(max(args.cycles, get_settings().quality_accept_after + 1))]
+    steps.append((f"{changed_page} 1행 삭제", {**pages, changed_page: drop_last_row(pages[changed_page])}))
+    steps.append((f"{changed_page} 1행 복원", dict(pages)))
+
+    await init_db()
+    failures = 0
+    previous = None
+    async with MockRatioServer(pages) as server:
+        for label, served in steps:
+            server.pages.clear()
+            server.pages.update(served)
+            expected = expected_rows(served)
+
+            async with async_session() as db:
+                service = CrawlService(db)
+                service.univ_crawler.base_url = server.listing_url
+                summary = await service.crawl_all_universities(delay=0)
+            if label == "cold":
+                await seed_history(university_code)
+            stored = await stored_rows(university_code)
+            totals = await stored_totals(university_code)
+
+            problems = []
+            if summary["success"] != len(served) or summary["quarantined"]:
+                problems.append(f"성공 {summary['success']}/{len(served)}, 격리 {summary['quarantined']}")
+            if stored != expected:
+                problems.append(f"페이지별 모집단위 {stored} != 기대값 {expected}")
+            if label.startswith("warm") and summary["generation"] is not None:
+                problems.append(f"변경 없는 사이클에서 새 세대 {summary['generation']} 게시")
+            if totals["rows"] - totals["removed"] != sum(stored.values()):
+                problems.append(f"학과 행 {totals} 과 모집단위 수 {sum(stored.values())} 불일치")
+            if previous:
+                if totals["history"] < previous["history"]:
+                    problems.append(f"경쟁률 변동 이력 감소 {previous['history']} -> {totals['history']}")
+                if "삭제" in label and totals["removed"] != previous["removed"] + 1:
+                    problems.append(f"삭제 표시된 학과 {previous['removed']} -> {totals['removed']} (기대 +1)")
+                if "복원" in label and (totals["removed"] or totals["rows"] != previous["rows"]):
+                    problems.append(f"학과 행 {previous} -> {totals} (새 행 없이 되살아나야 함)")
+            previous = totals
+
+            failures += bool(problems)
+            total = sum(stored.values())
+            print(
+                f"[{'FAIL' if problems else 'OK'}]   {label:24s} 대학 {university_code} 모집단위 {total} {stored}, "
+                f"삭제 표시 {totals['removed']}, 이력 {totals['history']}"
+            )
+            for problem in problems:
+                print(f"       -> {problem}")
+    await engine.dispose()
+
+    print(f"\n{'='*60}")
+    print("여러 페이지 대학이 페이지별로 저장됩니다" if not failures else f"{failures}건 실패")
+    return 1 if failures else 0
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="여러 페이지로 나뉜 대학 크롤링 검사")
+    parser.add_argument("--pages", default="11720771,11720772", help="같은 대학의 페이지 코드 (쉼표 구분)")
+    parser.add_argument("--cycles", type=int, default=4, help="변경 없는 사이클 반복 횟수")
+    args = parser.parse_args()
+
+    # app 모듈 import 전에 임시 DB 지정 (대학 2곳짜리 사이클도 검증 기준을 통과하도록)
+    tmp_dir = tempfile.mkdtemp(prefix="check_multi_page_")
+    os.environ["DATABASE_URL"] = f"sqlite+aiosqlite:///{tmp_dir}/check.db"
+    os.environ["CRAWL_MIN_UNIVERSITIES"] = "1"
+    return asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+"""
+API 라우트 쿼리 플랜 검사
+
+app/api/routes.py 의 조회(GET) 라우트를 실제 DB에 대해 호출하면서
+실행되는 SELECT 문을 수집하고, EXPLAIN QUERY PLAN 으로
+인덱스 없이 테이블을 풀스캔하는 쿼리가 있는지 확인합니다. 커버링이 아닌 인덱스의 전체
+순회(SCAN ... USING INDEX)도 풀스캔으로 보고, 정렬용으로 일부러 순회하는 조회만
+ORDERED_SCANS 에 라우트별로 적어 허용합니다.
+
+외부 사이트를 호출하는 SmartRatio 라우트와 POST 라우트는 대상에서 제외합니다.
+
+검사 전에 init_db(테이블 생성 + 마이그레이션, WAL 설정)를 실행하므로, 기본으로는
+저장소의 application_rate.db 를 임시 디렉터리에 복사해 그 사본에서 검사합니다
+(원본 DB 와 -wal/-shm 파일을 건드리지 않음).
+
+사용법:
+    python check_query_plans.py                                   # application_rate.db 임시 사본
+    python check_query_plans.py --database-url sqlite+aiosqlite:///./other.db
+"""
+import argparse
+import asyncio
+import io
+import os
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+
+from fastapi.routing import APIRoute
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, event
+
+SOURCE_DB = Path(__file__).resolve().parent / "application_rate.db"
+
+# 라우트별 검사용 쿼리 파라미터 (필터 조합별로 확인)
+ROUTE_PARAMS = {
+    "/universities": [{}, {"region": "서울"}],
+    "/universities/{university_id}": [{}],
+    "/competition-rates": [
+        {},
+        {"university_name": "대학"},
+        {"admission_type": "정시", "min_rate": 1.0},
+    ],
+    "/departments/{department_id}/history": [{}],
+    "/statistics/summary": [{}, {"admission_type": "정시"}],
+    "/statistics/top-competition": [{}, {"admission_type": "정시"}],
+    "/crawl/status": [{}],
+    "/crawl/logs": [{}, {"status": "success"}],
+    "/organized": [{}, {"region": "서울"}, {"gun": "가군", "min_rate": 1.0}],
+}
+
+PATH_VALUES = {"university_id": 1, "department_id": 1}
+
+# 정렬 순서를 얻으려고 일부러 인덱스 전체를 순회하는 조회 (라우트, 조건 이름) -> 허용 인덱스
+# 그 밖의 'SCAN ... USING INDEX' (커버링 아님)는 풀스캔으로 봄
+ORDERED_SCANS = {
+    # 대학 전체 목록 이름순 (결과가 테이블 전체라 정렬만 인덱스로 대신함)
+    ("/universities", ()): {"ix_university_name"},
+    # 최근 크롤링 로그 (LIMIT 만큼 읽고 멈춤)
+    ("/crawl/logs", ()): {"ix_crawl_logs_crawled_at"},
+}
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="API 라우트 쿼리 플랜 검사")
+    parser.add_argument("--database-url", help="검사할 DB (기본: application_rate.db 임시 사본)")
+    args = parser.parse_args()
+
+    # app 모듈 import 전에 검사 DB 지정
+    database_url = args.database_url
+    if database_url is None:
+        tmp_dir = tempfile.mkdtemp(prefix="check_query_plans_")
+        shutil.copyfile(SOURCE_DB, f"{tmp_dir}/{SOURCE_DB.name}")
+        database_url = f"sqlite+aiosqlite:///{tmp_dir}/{SOURCE_DB.name}"
+    os.environ["DATABASE_URL"] = database_url
+
+    from app.database import engine, init_db
+    from app.main import app
+    from app.api.routes import router
+    from app.migrations import explain_query_plan, find_unindexed_scans
+
+    async def prepare():
+        await init_db()
+        await engine.dispose()
+
+    asyncio.run(prepare())
+    # 플랜 확인은 동기 엔진으로 (TestClient 이벤트 루프와 분리)
+    plan_engine = create_engine(database_url.replace("+aiosqlite", ""))
+
+    captured: list[tuple[str, tuple]] = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            captured.append((statement, parameters))
+
+    event.listen(engine.sync_engine, "before_cursor_execute", capture)
+    client = TestClient(app)
+
+    failures = 0
+    for route in router.routes:
+        if not isinstance(route, APIRoute) or "GET" not in route.methods:
+            continue
+        if route.path not in ROUTE_PARAMS:
+            print(f"[SKIP] {route.path} (DB 조회 없음)")
+            continue
+
+        for params in ROUTE_PARAMS[route.path]:
+            captured.clear()
+            path = route.path.format(**PATH_VALUES)
+            response = client.get(f"/api/v1{path}", params=params)
+            if response.status_code >= 500:
+                print(f"[FAIL] {route.path} {params}: HTTP {response.status_code}")
+                failures += 1
+                continue
+
+            statements = list(captured)
+            allowed = ORDERED_SCANS.get((route.path, tuple(sorted(params))), ())
+            bad = []
+            for statement, parameters in statements:
+                with plan_engine.connect() as conn:
+                    plan = explain_query_plan(conn, statement, parameters)
+                scans = find_unindexed_scans(plan, allowed)
+                if scans:
+                    bad.append((statement, scans))
+
+            if bad:
+                failures += 1
+                print(f"[FAIL] {route.path} {params}")
+                for statement, scans in bad:
+                    print(f"       {' '.join(statement.split())[:120]}")
+                    for scan in scans:
+                        print(f"         -> {scan}")
+            else:
+                print(f"[OK]   {route.path} {params} ({len(statements)} queries)")
+
+    event.remove(engine.sync_engine, "before_cursor_execute", capture)
+    print(f"\n{'='*60}")
+    print("모든 라우트가 인덱스를 사용합니다" if not failures else f"{failures}건 인덱스 미사용")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,200 @@
+# -*- coding: utf-8 -*-
+"""
+조회 라우트 SQL 컴파일 캐시 검사
+
+1) 라우트별 조회문 준비 비용 (μs)
+   - 요청마다 select() 를 새로 만들고 캐시 키를 계산할 때 (이전 방식)
+   - 조건 조합별로 미리 만든 조회문(app/database.py StatementCache)을 쓸 때
+   - 컴파일 캐시를 못 맞혔을 때 드는 컴파일 시간
+2) 혼합 트래픽: 경쟁률 검색 / 통계 라우트를 무작위 조건 조합으로 호출하면서
+   실행된 문장의 컴파일 캐시 적중률을 라우트별로 집계합니다.
+   워밍업(--warmup 요청) 이후 적중률이 --min-hit-rate 미만이면 실패합니다
+   (값이 문장에 그대로 박혀 요청마다 새 문장이 되는 회귀를 잡음).
+
+응답/통계 캐시는 요청마다 비워 매번 DB 조회가 일어나게 합니다.
+
+검사 전에 init_db(테이블 생성 + 마이그레이션, WAL 설정)를 실행하므로, 기본으로는
+저장소의 application_rate.db 를 임시 디렉터리에 복사해 그 사본에서 검사합니다
+(check_query_plans.py 와 같음, 원본 DB 와 -wal/-shm 파일을 건드리지 않음).
+
+사용법:
+    python check_statement_cache.py            # application_rate.db 임시 사본
+    python check_statement_cache.py --requests 2000 --min-hit-rate 0.995
+    python check_statement_cache.py --database-url sqlite+aiosqlite:///./other.db
+"""
+import argparse
+import asyncio
+import io
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event, select
+from sqlalchemy.engine.interfaces import CacheStats
+
+SOURCE_DB = Path(__file__).resolve().parent / "application_rate.db"
+
+
+def prepare_cases() -> list:
+    """조회문 준비 비용 측정 대상 (라우트, 조회문 캐시, 대표 조건)"""
+    from app.api import routes
+
+    return [
+        ("/competition-rates", routes._competition_rates_stmts, {"university_name": "대학", "limit": 100, "offset": 0}),
+        ("/competition-rates", routes._competition_rates_stmts,
+         {"admission_type": "정시", "min_rate": 1.0, "max_rate": 10.0, "limit": 100, "offset": 0}),
+        ("/statistics/summary", routes._summary_stmt_sets, {"admission_type": "정시"}),
+        ("/statistics/top-competition", routes._top_competition_stmts, {"admission_type": "정시", "limit": 20}),
+    ]
+
+
+def _statements(prepared) -> tuple:
+    return prepared if isinstance(prepared, tuple) else (prepared,)
+
+
+def measure_prepare(repeat: int):
+    """라우트별 조회문 준비 비용 출력"""
+    from app.database import StatementCache, engine
+
+    print(f"\n{'='*72}")
+    print(f"  {'라우트 / 조건':62s} {'새로':>6s} {'미리':>6s} {'컴파일':>7s}")
+    for route, cache, params in prepare_cases():
+        filters = frozenset(StatementCache.bind(params))
+
+        start = time.perf_counter()
+        for _ in range(repeat):
+            for stmt in _statements(cache._build(filters)):
+                stmt._generate_cache_key()
+        fresh = (time.perf_counter() - start) / repeat * 1e6
+
+        start = time.perf_counter()
+        for _ in range(repeat):
+            for stmt in _statements(cache.get(params)):
+                stmt._generate_cache_key()
+        cached = (time.perf_counter() - start) / repeat * 1e6
+
+        compile_repeat = max(1, repeat // 20)
+        start = time.perf_counter()
+        for _ in range(compile_repeat):
+            for stmt in _statements(cache._build(filters)):
+                stmt.compile(dialect=engine.dialect)
+        compiled = (time.perf_counter() - start) / compile_repeat * 1e6
+
+        label = f"{route} {sorted(filters - {'limit', 'offset'})}"
+        print(f"  {label:62s} {fresh:>6.0f} {cached:>6.1f} {compiled:>7.0f}")
+    print("  (μs/요청: 새로=select() 생성 + 캐시 키, 미리=StatementCache + 캐시 키, 컴파일=캐시 miss 비용)")
+
+
+async def _sample_names() -> list[str]:
+    from app.database import async_session, engine
+    from app.models import University
+
+    async with async_session() as db:
+        names = (await db.execute(select(University.name).limit(50))).scalars().all()
+    await engine.dispose()
+    return [name[:2] for name in names] or ["대학"]
+
+
+def random_request(rng: random.Random, names: list[str]) -> tuple[str, dict]:
+    """무작위 라우트 + 조건 조합"""
+    route = rng.choice(["/competition-rates", "/competition-rates", "/statistics/summary", "/statistics/top-competition"])
+    admission_type = rng.choice([None, "정시", "수시"])
+    if route == "/statistics/summary":
+        return route, {"admission_type": admission_type}
+    if route == "/statistics/top-competition":
+        return route, {"admission_type": admission_type, "limit": rng.choice([10, 20, 50])}
+    return route, {
+        "university_name": rng.choice([None, *names]),
+        "department_name": rng.choice([None, None, "학과", "간호", "공학"]),
+        "admission_type": admission_type,
+        "min_rate": rng.choice([None, round(rng.uniform(0, 5), 2)]),
+        "max_rate": rng.choice([None, round(rng.uniform(5, 30), 2)]),
+        "limit": rng.choice([20, 100, 500]),
+        "offset": rng.choice([0, 0, 20]),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="조회 라우트 SQL 컴파일 캐시 검사")
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--warmup", type=int, default=200, help="적중률 판정에서 제외할 앞쪽 요청 수")
+    parser.add_argument("--min-hit-rate", type=float, default=0.99)
+    parser.add_argument("--prepare-repeat", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--database-url", help="검사할 DB (기본: application_rate.db 임시 사본)")
+    args = parser.parse_args()
+
+    # app 모듈 import 전에 검사 DB 지정
+    database_url = args.database_url
+    if database_url is None:
+        tmp_dir = tempfile.mkdtemp(prefix="check_statement_cache_")
+        shutil.copyfile(SOURCE_DB, f"{tmp_dir}/{SOURCE_DB.name}")
+        database_url = f"sqlite+aiosqlite:///{tmp_dir}/{SOURCE_DB.name}"
+    os.environ["DATABASE_URL"] = database_url
+
+    from app.database import engine, init_db
+    from app.main import app
+    from app.api import routes
+    from app.services.response_cache import response_cache
+
+    asyncio.run(init_db())
+    names = asyncio.run(_sample_names())
+    measure_prepare(args.prepare_repeat)
+
+    results: list = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        if context is not None and context.compiled is not None:
+            results.append(context.cache_hit)
+
+    event.listen(engine.sync_engine, "after_cursor_execute", record)
+
+    rng = random.Random(args.seed)
+    # 라우트별 [워밍업 이후 적중, 워밍업 이후 문장 수, 전체 miss]
+    stats: dict[str, list[int]] = {}
+    with TestClient(app) as client:
+        for i in range(args.requests):
+            route, params = random_request(rng, names)
+            response_cache.clear()
+            routes._summary_cache.clear()
+            results.clear()
+            response = client.get(f"/api/v1{route}", params={k: v for k, v in params.items() if v is not None})
+            if response.status_code != 200:
+                print(f"[FAIL] {route} {params} -> {response.status_code}")
+                return 1
+
+            route_stats = stats.setdefault(route, [0, 0, 0])
+            route_stats[2] += sum(1 for hit in results if hit is CacheStats.CACHE_MISS)
+            if i >= args.warmup:
+                route_stats[0] += sum(1 for hit in results if hit is CacheStats.CACHE_HIT)
+                route_stats[1] += len(results)
+    event.remove(engine.sync_engine, "after_cursor_execute", record)
+
+    print(f"\n{'='*72}")
+    print(f"  혼합 트래픽 {args.requests}건 (워밍업 {args.warmup}건 제외 적중률)")
+    failed = False
+    for route, (hits, total, misses) in sorted(stats.items()):
+        rate = hits / total if total else 1.0
+        ok = rate >= args.min_hit_rate
+        failed |= not ok
+        print(f"  [{'OK' if ok else 'FAIL'}] {route:32s} 적중률 {rate:7.2%} ({hits}/{total}), 전체 miss {misses}")
+    print(f"  조회문 조합: competition-rates {len(routes._competition_rates_stmts)}, "
+          f"summary {len(routes._summary_stmt_sets)}, top-competition {len(routes._top_competition_stmts)}")
+
+    print(f"\n{'='*72}")
+    if failed:
+        print(f"적중률이 {args.min_hit_rate:.0%} 미만인 라우트가 있습니다")
+        return 1
+    print("모든 라우트가 컴파일 캐시를 사용합니다")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -6,6 +6,7 @@ import type {
   AvailabilityCheck,
   DiscoverUrlsResult,
   CrawlProgress,
+  CrawlJobQueued,
 } from '../types';
 
 export const crawlApi = {
@@ -20,14 +21,14 @@ export const crawlApi = {
   },
 
   crawlAll: async (admissionType = '정시', year = 2026) => {
-    const response = await apiClient.post('/crawl/all', null, {
+    const response = await apiClient.post<CrawlJobQueued>('/crawl/all', null, {
       params: { admission_type: admissionType, year },
     });
     return response.data;
   },
 
   crawlUniversity: async (url: string, admissionType = '정시', year = 2026) => {
-    const response = await apiClient.post('/crawl/university', null, {
+    const response = await apiClient.post<CrawlJobQueued>('/crawl/university', null, {
       params: { url, admission_type: admissionType, year },
     });
     return response.data;
@@ -51,8 +52,8 @@ export const crawlApi = {
     return response.data;
   },
 
-  crawlAllFromSmartRatio: async (admissionType = '정시', year = 2026, delay = 1.0) => {
-    const response = await apiClient.post('/smartratio/crawl-all', null, {
+  crawlAllFromSmartRatio: async (admissionType = '정시', year = 2026, delay = 0) => {
+    const response = await apiClient.post<CrawlJobQueued>('/smartratio/crawl-all', null, {
       params: { admission_type: admissionType, year, delay },
     });
     return response.data;
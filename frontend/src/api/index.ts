@@ -3,3 +3,4 @@ export { universitiesApi } from './universities';
 export { competitionRatesApi } from './competitionRates';
 export { statisticsApi } from './statistics';
 export { crawlApi } from './crawl';
+export { organizedApi } from './organized';
@@ -0,0 +1,18 @@
+import { apiClient } from './client';
+import type { CrawlerData } from '../types';
+
+export interface OrganizedParams {
+  gun?: '가군' | '나군' | '다군' | '기타';
+  region?: string;
+  university?: string;
+  min_rate?: number;
+  max_rate?: number;
+}
+
+export const organizedApi = {
+  // 군별 정리 데이터 (organized_with_chuhap.json 과 같은 구조, 서버에서 조건별로 잘라서 압축 전송)
+  get: async (params?: OrganizedParams) => {
+    const response = await apiClient.get<CrawlerData>('/organized', { params });
+    return response.data;
+  },
+};
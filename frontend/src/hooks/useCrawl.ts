@@ -69,7 +69,7 @@ export function useSmartRatioCrawlAll() {
     mutationFn: ({
       admissionType = '정시',
       year = 2026,
-      delay = 1.0,
+      delay = 0,
     }: {
       admissionType?: string;
       year?: number;
@@ -191,7 +191,7 @@ export function Crawl() {
       </Card>
 
       {/* Progress Card (shown when crawling) */}
-      {(progress?.is_running || isMonitoring) && progress && (
+      {(progress?.is_running || isMonitoring) && progress && progress.job_id !== null && (
         <Card className="border-blue-500 border-2">
           <CardHeader>
             <CardTitle className="flex items-center gap-2">
@@ -205,47 +205,45 @@ export function Crawl() {
               <div>
                 <div className="flex justify-between text-sm mb-1">
                   <span>진행률</span>
-                  <span>{progress.progress} / {progress.total}</span>
+                  <span>{progress.finished} / {progress.total}</span>
                 </div>
                 <div className="w-full bg-gray-200 rounded-full h-3">
                   <div
                     className="bg-blue-500 h-3 rounded-full transition-all duration-300"
-                    style={{
-                      width: `${progress.total > 0 ? (progress.progress / progress.total) * 100 : 0}%`,
-                    }}
+                    style={{ width: `${progress.progress * 100}%` }}
                   />
                 </div>
               </div>
 
-              {/* Current University */}
-              {progress.current_university && (
-                <div className="flex items-center gap-2 text-sm">
-                  <Loader2 className="w-4 h-4 animate-spin text-blue-500" />
-                  <span>현재: <strong>{progress.current_university}</strong></span>
-                </div>
-              )}
+              {/* Job Status */}
+              <div className="flex items-center gap-2 text-sm">
+                {progress.is_running && <Loader2 className="w-4 h-4 animate-spin text-blue-500" />}
+                <span>
+                  작업 #{progress.job_id}: <strong>{progress.status}</strong>
+                  {progress.pending > 0 && ` (남은 대학 ${progress.pending}개)`}
+                </span>
+              </div>
 
               {/* Results Summary */}
               <div className="flex gap-4 text-sm">
                 <span className="text-green-600">
-                  성공: {progress.results.success}
+                  성공: {progress.success}
                 </span>
                 <span className="text-red-600">
-                  실패: {progress.results.failed}
+                  실패: {progress.failed}
                 </span>
                 <span className="text-yellow-600">
-                  스킵: {progress.results.skipped}
+                  스킵: {progress.skipped}
+                </span>
+                <span className="text-orange-600">
+                  격리: {progress.quarantined}
                 </span>
               </div>
 
-              {/* Recent Logs */}
-              {progress.recent_logs.length > 0 && (
-                <div className="bg-gray-900 text-gray-100 rounded-lg p-3 font-mono text-xs max-h-40 overflow-y-auto">
-                  {progress.recent_logs.map((log, index) => (
-                    <div key={index} className="py-0.5">
-                      {log}
-                    </div>
-                  ))}
+              {/* Job Message */}
+              {progress.message && (
+                <div className="bg-gray-900 text-gray-100 rounded-lg p-3 font-mono text-xs">
+                  {progress.message}
                 </div>
               )}
 
@@ -3,6 +3,7 @@ import { Clock, RefreshCw } from 'lucide-react';
 import { RegionSelector } from '../components/RegionSelector';
 import { UniversitySection, DepartmentSection, LowestRateSection } from '../components/sections';
 import { getRegionName } from '../constants/regions';
+import { organizedApi } from '../api';
 import type { RegionId } from '../constants/regions';
 import type { CrawlerData, CrawlerDataEntry, AdmissionGroup } from '../types';
 
@@ -26,14 +27,13 @@ export function Home() {
     return () => clearInterval(timer);
   }, []);
 
-  // 크롤러 데이터 로드 (지역 + 추합 매핑된 버전)
+  // 크롤러 데이터 로드 (지역 + 추합 매핑된 버전, 선택한 지역만 서버에서 받아옴)
   const loadData = async () => {
     setIsLoading(true);
     setError(null);
     try {
-      const response = await fetch('/organized_with_chuhap.json');
-      if (!response.ok) throw new Error('데이터를 불러올 수 없습니다');
-      const data = await response.json();
+      const region = selectedRegion === 'all' ? undefined : getRegionName(selectedRegion);
+      const data = await organizedApi.get({ region });
       setCrawlerData(data);
     } catch (err) {
       setError(err instanceof Error ? err.message : '알 수 없는 오류');
@@ -45,7 +45,7 @@ export function Home() {
 
   useEffect(() => {
     loadData();
-  }, []);
+  }, [selectedRegion]);
 
   // 지역 필터링된 데이터
   const filteredData = useMemo(() => {
@@ -143,20 +143,44 @@ export interface DiscoverUrlsResult {
   }[];
 }
 
-export interface CrawlProgress {
-  is_running: boolean;
-  progress: number;
+// 크롤링 작업 (crawl_jobs, 백엔드 job_summary)
+export interface CrawlJob {
+  job_id: number;
+  kind: 'all' | 'university' | 'smartratio';
+  status: 'pending' | 'running' | 'done' | 'failed';
+  admission_type: string;
+  year: number;
+  url: string | null;
   total: number;
-  current_university: string;
-  results: {
-    success: number;
-    failed: number;
-    skipped: number;
-  };
+  finished: number;
+  pending: number;
+  progress: number;  // 0~1 (finished / total)
+  success: number;
+  failed: number;
+  skipped: number;
+  quarantined: number;
+  generation_id: number | null;
+  attempts: number;
+  message: string | null;
+  created_at: string | null;
   started_at: string | null;
-  recent_logs: string[];
+  heartbeat_at: string | null;
+  finished_at: string | null;
+}
+
+// 크롤링 작업 추가 응답 (202)
+export interface CrawlJobQueued {
+  status: 'queued' | 'already_queued';
+  job_id: number;
+  job_status: CrawlJob['status'];
+  message: string;
 }
 
+// 마지막 SmartRatio 크롤링 작업 (작업이 없으면 job_id: null)
+export type CrawlProgress =
+  | { is_running: false; job_id: null }
+  | (CrawlJob & { is_running: boolean });
+
 // 크롤러 데이터 타입 (organized_with_chuhap.json)
 export interface CrawlerDataEntry {
   대학명: string;
@@ -6,6 +6,8 @@ import pandas as pd
 import sqlite3
 from datetime import datetime
 
+from app.services.generation import EXTERNAL_GENERATION_SQL
+
 DB_PATH = "application_rate.db"
 
 def import_data():
@@ -127,6 +129,8 @@ def import_data():
                 conn.commit()
                 print(f"  - {dept_count}건 처리 중...")
 
+        # 새 데이터 세대 기록 (실행 중인 API/크롤러 프로세스의 캐시 무효화)
+        cursor.execute(EXTERNAL_GENERATION_SQL, {"universities": len(univ_map), "departments": dept_count})
         conn.commit()
         print(f"  - {dept_count}개 학과 생성 완료 (스킵: {skipped}건)")
 
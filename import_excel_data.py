@@ -6,27 +6,20 @@ from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker
 import os
 
+from app.migrations import run_migrations
+from app.services.generation import EXTERNAL_GENERATION_SQL
+
 # 데이터베이스 연결
 DATABASE_URL = "sqlite:///./application_rate.db"
 engine = create_engine(DATABASE_URL)
 SessionLocal = sessionmaker(bind=engine)
 
 def add_columns_if_not_exist():
-    """새 컬럼이 없으면 추가"""
-    with engine.connect() as conn:
-        # Check if columns exist
-        result = conn.execute(text("PRAGMA table_info(departments)"))
-        columns = [row[1] for row in result.fetchall()]
-
-        if 'additional_recruit' not in columns:
-            conn.execute(text("ALTER TABLE departments ADD COLUMN additional_recruit INTEGER"))
-            print("Added additional_recruit column")
-
-        if 'actual_competition_rate' not in columns:
-            conn.execute(text("ALTER TABLE departments ADD COLUMN actual_competition_rate FLOAT"))
-            print("Added actual_competition_rate column")
-
-        conn.commit()
+    """새 컬럼이 없으면 추가 (app.migrations 버전 관리 사용)"""
+    with engine.begin() as conn:
+        applied = run_migrations(conn)
+        if applied:
+            print(f"Applied migrations: {applied}")
 
 def import_excel_data(excel_path: str):
     """엑셀 데이터 임포트"""
@@ -113,6 +106,8 @@ def import_excel_data(excel_path: str):
                     if similar:
                         print(f"    유사: {similar}")
 
+        # 새 데이터 세대 기록 (실행 중인 API/크롤러 프로세스의 캐시 무효화)
+        session.execute(text(EXTERNAL_GENERATION_SQL), {"universities": 0, "departments": updated_count})
         session.commit()
         print(f"\n완료: {updated_count}개 업데이트, {not_found_count}개 매칭 실패")
 
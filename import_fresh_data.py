@@ -7,6 +7,8 @@ from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker
 from datetime import datetime
 
+from app.services.generation import EXTERNAL_GENERATION_SQL
+
 DATABASE_URL = "sqlite:///./application_rate.db"
 engine = create_engine(DATABASE_URL)
 SessionLocal = sessionmaker(bind=engine)
@@ -149,6 +151,8 @@ def import_excel_data(excel_path: str):
                 'now': now
             })
 
+        # 새 데이터 세대 기록 (실행 중인 API/크롤러 프로세스의 캐시 무효화)
+        session.execute(text(EXTERNAL_GENERATION_SQL), {"universities": len(universities), "departments": len(df)})
         session.commit()
         print(f"[OK] 임포트 완료: {len(universities)}개 대학, {len(df)}개 학과")
 
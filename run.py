@@ -8,15 +8,27 @@ if sys.platform == "win32":
     sys.stdout.reconfigure(encoding='utf-8')
     sys.stderr.reconfigure(encoding='utf-8')
 
+# 실행 모드: python run.py [all | api | crawler | worker]
+#   worker: API 서버 없이 크롤러만 (app/worker.py)
+mode = sys.argv[1] if len(sys.argv) > 1 else None
+if mode and mode != "worker":
+    os.environ["APP_MODE"] = mode
+
 import uvicorn
 from app.config import get_settings
 
 settings = get_settings()
 
 if __name__ == "__main__":
+    if mode == "worker":
+        from app.worker import main
+        sys.argv = sys.argv[:1] + sys.argv[2:]
+        raise SystemExit(main())
+
     uvicorn.run(
         "app.main:app",
         host=settings.api_host,
         port=settings.api_port,
-        reload=True
+        # 코드 변경 시 재시작하면 진행 중인 크롤링이 끊기므로 조회 전용 모드에서만 사용
+        reload=settings.app_mode == "api"
     )